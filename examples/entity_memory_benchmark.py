@@ -0,0 +1,95 @@
+import argparse
+import csv
+import gc
+import itertools
+import tracemalloc
+from typing import Callable, Dict, List
+
+from nrel.hive.initialization.initialize_simulation import initialize, scenario_init_functions
+from nrel.hive.initialization.load import load_config
+from nrel.hive.model.request import Request
+from nrel.hive.model.vehicle.vehicle import Vehicle
+
+# this example script reports how much memory HIVE uses for each vehicle and each request
+# and can be called from the command line via
+# `$ python entity_memory_benchmark.py denver_demo.yaml --entities 10000`
+# the vehicles and requests are built from the rows of the scenario's vehicles and
+# requests files, repeated under new ids until there are enough of them.
+
+parser = argparse.ArgumentParser(description="entity memory benchmark")
+parser.add_argument(
+    "scenario_file",
+    nargs="?",
+    default="denver_demo.yaml",
+    help="the HIVE scenario whose vehicles and requests are measured",
+)
+parser.add_argument(
+    "--entities",
+    type=int,
+    default=10000,
+    help="how many vehicles and how many requests to build",
+)
+
+
+def bytes_per_entity(build: Callable[[Dict[str, str]], object], rows: List[Dict[str, str]], n: int):
+    """measures the memory allocated for each entity built from the rows
+
+    :param build: builds an entity from a row
+    :param rows: the rows to build from, given the id n_<i> for the i-th entity
+    :param n: how many entities to build
+    :return: the bytes allocated per entity
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [build(row) for row in itertools.islice(_numbered_rows(rows), n)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / n
+
+
+def _numbered_rows(rows: List[Dict[str, str]]):
+    for i, row in enumerate(itertools.cycle(rows)):
+        numbered = dict(row)
+        for key in ("vehicle_id", "request_id"):
+            if key in numbered:
+                numbered[key] = f"{numbered[key]}_{i}"
+        yield numbered
+
+
+def run_benchmark(scenario_file: str, n: int):
+    config = load_config(scenario_file).suppress_logging()
+    sim, env = initialize(config, scenario_init_functions(config))
+
+    with open(config.input_config.vehicles_file, encoding="utf-8-sig") as f:
+        vehicle_rows = list(csv.DictReader(f))
+    with open(config.input_config.requests_file, encoding="utf-8-sig") as f:
+        request_rows = list(csv.DictReader(f))
+
+    def build_vehicle(row: Dict[str, str]) -> Vehicle:
+        return Vehicle.from_row(row, sim.road_network, env)
+
+    def build_request(row: Dict[str, str]) -> Request:
+        error, request = Request.from_row(row, env, sim.road_network)
+        if error is not None:
+            raise error
+        elif request is None:
+            raise ValueError(f"no request was built from row {row}")
+        return request
+
+    # build one of each first, so that one-time allocations are not counted
+    build_vehicle(vehicle_rows[0])
+    build_request(request_rows[0])
+
+    vehicle_bytes = bytes_per_entity(build_vehicle, vehicle_rows, n)
+    request_bytes = bytes_per_entity(build_request, request_rows, n)
+    print(f"{n} entities of {scenario_file}")
+    print(f"bytes per vehicle: {vehicle_bytes:.0f}")
+    print(f"bytes per request: {request_bytes:.0f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    run_benchmark(args.scenario_file, args.entities)
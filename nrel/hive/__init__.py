@@ -19,24 +19,41 @@ infrastructure, levels of service, and additional energy outcomes. Developed in
 agent-based model that simulates MaaS operations over real world trip data.
 """
 
+import importlib
 import logging
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from tqdm import tqdm
+from rich.logging import RichHandler
 
-from nrel.hive.app import run
-from nrel.hive.config import HiveConfig
-from nrel.hive.dispatcher import *
-from nrel.hive.state.simulation_state.update.update import Update
-from nrel.hive.state.simulation_state.update.step_simulation import StepSimulation
+if TYPE_CHECKING:
+    from nrel.hive.app.run import run
+    from nrel.hive.config import HiveConfig
+    from nrel.hive.state.simulation_state.update.update import Update
+    from nrel.hive.state.simulation_state.update.step_simulation import StepSimulation
 
+# the attributes of this package which are imported on first use, so that importing hive
+# does not load the simulation modules and their dependencies until they are needed
+_LAZY_ATTRIBUTES = {
+    "run": "nrel.hive.app.run",
+    "HiveConfig": "nrel.hive.config",
+    "Update": "nrel.hive.state.simulation_state.update.update",
+    "StepSimulation": "nrel.hive.state.simulation_state.update.step_simulation",
+}
 
-def package_root() -> Path:
-    return Path(__file__).parent
 
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-from rich.logging import RichHandler
+
+def package_root() -> Path:
+    return Path(__file__).parent
 
 
 FORMAT = "%(message)s"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from nrel.hive.model.roadnetwork.osm.osm_road_network_arrays import OSMRoadNetworkArrays
+from nrel.hive.model.roadnetwork.osm.osm_roadnetwork import OSMRoadNetwork
+from nrel.hive.util.typealiases import H3Resolution
+from nrel.hive.util.units import Kmph
+
+parser = argparse.ArgumentParser(
+    description="compile an OSM road network json file for fast, memory-mapped loading in hive"
+)
+parser.add_argument("road_network_file", help="the node-link json road network file to compile")
+parser.add_argument(
+    "--output",
+    dest="output",
+    help="where to write the compiled network; defaults to the input file with a .npz suffix",
+)
+parser.add_argument(
+    "--sim-h3-resolution",
+    dest="sim_h3_resolution",
+    type=int,
+    default=15,
+    help="the sim_h3_resolution of the scenarios which will use this network",
+)
+parser.add_argument(
+    "--default-speed-kmph",
+    dest="default_speed_kmph",
+    type=float,
+    default=40.0,
+    help="the speed to use for links that have no speed information",
+)
+
+log = logging.getLogger("hive")
+
+
+def compile_road_network(
+    road_network_file: Union[Path, str],
+    output_file: Optional[Union[Path, str]] = None,
+    sim_h3_resolution: H3Resolution = 15,
+    default_speed_kmph: Kmph = 40.0,
+) -> Path:
+    """
+    validates an OSM road network and writes it as OSMRoadNetworkArrays, which hive
+    memory-maps without networkx when the compiled file is used as a scenario's road_network_file
+
+    :param road_network_file: the node-link json road network file
+    :param output_file: the compiled file to write; defaults to the input file with a .npz suffix
+    :param sim_h3_resolution: the h3 resolution of the scenarios which will use this network
+    :param default_speed_kmph: the network will fill in missing speed values with this
+    :return: the path of the compiled file
+    """
+    output_path = (
+        Path(output_file)
+        if output_file is not None
+        else Path(road_network_file).with_suffix(".npz")
+    )
+    if output_path.suffix != ".npz":
+        raise ValueError(f"compiled road network file {output_path} must have a .npz suffix")
+
+    road_network = OSMRoadNetwork.from_file(
+        road_network_file=road_network_file,
+        sim_h3_resolution=sim_h3_resolution,
+        default_speed_kmph=default_speed_kmph,
+    )
+    arrays = OSMRoadNetworkArrays.from_osm_road_network(road_network)
+    arrays.to_file(output_path)
+
+    return output_path
+
+
+def run() -> int:
+    """
+    entry point for compiling a road network
+    :return: 0 if success
+    """
+    args = parser.parse_args()
+
+    start = time.time()
+    output_path = compile_road_network(
+        args.road_network_file,
+        args.output,
+        sim_h3_resolution=args.sim_h3_resolution,
+        default_speed_kmph=args.default_speed_kmph,
+    )
+    log.info(
+        f"compiled {args.road_network_file} to {output_path} in {round(time.time() - start, 2)} seconds"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    run()
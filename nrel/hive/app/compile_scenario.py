@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from nrel.hive.initialization.load import load_config
+from nrel.hive.initialization.scenario_bundle import compile_scenario_bundle
+
+parser = argparse.ArgumentParser(
+    description="compile a hive scenario into a bundle of its initial simulation state, which "
+    "hive loads in place of the scenario input files for as long as they are unchanged, when "
+    "run with --use-bundle or with use_scenario_bundle set in .hive.yaml"
+)
+parser.add_argument("scenario_file", help="which scenario file to compile")
+parser.add_argument(
+    "--output",
+    dest="output",
+    help="where to write the bundle; defaults to the scenario file with a .bundle suffix",
+)
+
+log = logging.getLogger("hive")
+
+
+def run() -> int:
+    """
+    entry point for compiling a scenario
+    :return: 0 if success
+    """
+    args = parser.parse_args()
+
+    start = time.time()
+    config = load_config(args.scenario_file)
+    output_path = compile_scenario_bundle(config, args.output)
+    log.info(
+        f"compiled {args.scenario_file} to {output_path} in {round(time.time() - start, 2)} seconds"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    run()
@@ -12,6 +12,7 @@ from nrel.hive.initialization.initialize_simulation import InitFunction
 from nrel.hive.model.sim_time import SimTime
 from nrel.hive.reporting.handler.vehicle_charge_events_handler import VehicleChargeEventsHandler
 from nrel.hive.runner import RunnerPayload
+from nrel.hive.runner.observation import Observation, SimulationObserver
 from nrel.hive.util import SimulationStateError
 
 T = TypeVar("T", bound=InstructionGenerator)
@@ -75,6 +76,18 @@ def crank(
     return result
 
 
+def observe(runner_payload: RunnerPayload, observer: SimulationObserver) -> Observation:
+    """
+    builds array observations of the vehicles, stations and requests of the current HIVE state.
+    the same observer should be passed at each step so that entity indices stay stable and
+    only the rows of entities which changed are rewritten.
+    :param runner_payload: the current HIVE state
+    :param observer: the observer holding the observation arrays
+    :return: the observation arrays, which are overwritten by the next call
+    """
+    return observer.observe(runner_payload.s, runner_payload.e)
+
+
 def close(runner_payload: RunnerPayload):
     """
     closes a hive simulation, finalizing all logging.
@@ -0,0 +1,253 @@
+"""
+a client for a hive co-simulation server, mirroring the hive_cosim API.
+
+the client only depends on numpy and the standard library, so a co-simulator can drive
+hive from its own python environment. the server is started as a separate process which
+loads the scenario once; observations and station loads are read from shared memory.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Client, Connection
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+AUTHKEY_ENV_VAR = "HIVE_COSIM_AUTHKEY"
+
+
+class ServerObservation(NamedTuple):
+    """
+    the observation arrays of the server's simulation, as views of shared memory which
+    are overwritten by the next observation. rows with present == False are vacant.
+    """
+
+    sim_time: int
+    vehicles: np.ndarray
+    stations: np.ndarray
+    requests: np.ndarray
+
+
+class ServerCrankResult(NamedTuple):
+    sim_time: int
+    time_steps: int
+
+
+class HiveCosimClient:
+    """
+    a connection to a hive co-simulation server
+    """
+
+    def __init__(self, connection: Connection, process: Optional[subprocess.Popen] = None):
+        """
+        :param connection: an open connection to the server
+        :param process: the server process, if it was started by this client
+        """
+        self.connection = connection
+        self.process = process
+        description = self._send("describe")
+        self.sim_time: int = description["sim_time"]
+        self.end_time: int = description["end_time"]
+
+        self._shm: List[shared_memory.SharedMemory] = []
+        self._observation_buffers: Dict[str, np.ndarray] = {}
+        for name, layout in description["observations"].items():
+            shm = self._attach(layout["shared_memory_name"])
+            dtype = np.dtype([tuple(field) for field in layout["dtype"]])
+            self._observation_buffers[name] = np.ndarray(
+                (layout["capacity"],), dtype=dtype, buffer=shm.buf
+            )
+
+        load_layout = description["station_load"]
+        n_steps = load_layout["time_step_capacity"]
+        load_shm = self._attach(load_layout["shared_memory_name"])
+        self._load_times: np.ndarray = np.ndarray((n_steps,), dtype=np.int64, buffer=load_shm.buf)
+        self._station_load_kw: np.ndarray = np.ndarray(
+            (n_steps, load_layout["station_capacity"]),
+            dtype=np.float64,
+            buffer=load_shm.buf,
+            offset=n_steps * 8,
+        )
+        self._load_steps = 0
+
+    @classmethod
+    def connect(
+        cls, address: Union[str, Tuple[str, int]], authkey: Optional[bytes] = None
+    ) -> HiveCosimClient:
+        """
+        connects to a running server
+
+        :param address: the address the server is listening on
+        :param authkey: the key the server expects, from HIVE_COSIM_AUTHKEY or as printed
+                        by the server when it generated one
+        :return: a client
+        """
+        return cls(Client(address, authkey=authkey))
+
+    def _attach(self, name: str) -> shared_memory.SharedMemory:
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+        except TypeError:
+            # before python 3.13, attaching also registers the block with this process's
+            # resource tracker, which would unlink it when this process exits
+            shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+        self._shm.append(shm)
+        return shm
+
+    def _send(self, command: str, **arguments: Any) -> Any:
+        self.connection.send((command, arguments))
+        status, result = self.connection.recv()
+        if status != "ok":
+            raise RuntimeError(result)
+        return result
+
+    def crank(self, time_steps: int) -> ServerCrankResult:
+        """
+        advances the server's simulation some number of time steps
+
+        :param time_steps: the number of steps to take
+        :return: the sim time after the steps, and the number of time steps of station load
+        """
+        result = self._send("crank", time_steps=time_steps)
+        self.sim_time = result["sim_time"]
+        self._load_steps = result["time_steps"]
+        return ServerCrankResult(self.sim_time, self._load_steps)
+
+    def observe(self) -> ServerObservation:
+        """
+        observes the vehicles, stations and requests of the server's simulation
+
+        :return: the observation arrays
+        """
+        result = self._send("observe")
+        sizes = result["sizes"]
+        buffers = self._observation_buffers
+        return ServerObservation(
+            sim_time=result["sim_time"],
+            vehicles=buffers["vehicles"][: sizes["vehicles"]],
+            stations=buffers["stations"][: sizes["stations"]],
+            requests=buffers["requests"][: sizes["requests"]],
+        )
+
+    def station_load(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        the charging load of each station at each time step of the last crank
+
+        :return: the start time of each time step, and the kW load of each station at each
+                 time step, with one column per station observation index
+        """
+        n = self._load_steps
+        return self._load_times[:n], self._station_load_kw[:n]
+
+    def entity_ids(self) -> Dict[str, Tuple]:
+        """
+        :return: the entity id at each observation index, or None where vacant
+        """
+        return self._send("entity_ids")
+
+    def set_instruction_generators(self, instruction_generators: Sequence[Any]) -> Tuple[str, ...]:
+        """
+        replaces the instruction generators of the server's dispatcher. instruction
+        generators are pickled, so their classes must be importable by the server.
+
+        :param instruction_generators: the instruction generators, in the order they run
+        :return: the names of the instruction generators
+        """
+        result = self._send(
+            "set_instruction_generators", instruction_generators=tuple(instruction_generators)
+        )
+        return result["instruction_generators"]
+
+    def close(self, shutdown: bool = True):
+        """
+        disconnects from the server
+
+        :param shutdown: also shut down the server, finalizing its logging
+        """
+        if shutdown:
+            self._send("shutdown")
+        self._observation_buffers = {}
+        del self._load_times
+        del self._station_load_kw
+        for shm in self._shm:
+            shm.close()
+        self.connection.close()
+        if self.process is not None:
+            self.process.wait()
+
+
+def load_scenario(
+    scenario_file: Union[Path, str],
+    server_args: Sequence[str] = (),
+    python: str = sys.executable,
+    timeout_seconds: float = 300.0,
+) -> HiveCosimClient:
+    """
+    starts a hive co-simulation server for a scenario and connects to it once it has loaded
+
+    :param scenario_file: the HIVE scenario file to read
+    :param server_args: any additional command line arguments for the server
+    :param python: the python interpreter with hive installed
+    :param timeout_seconds: how long to wait for the server to load the scenario
+    :return: a client connected to the server
+    :raises: RuntimeError if the server exits or does not start listening in time
+    """
+    if sys.platform == "win32":
+        address = rf"\\.\pipe\hive-cosim-{os.urandom(8).hex()}"
+    else:
+        address = os.path.join(tempfile.mkdtemp(prefix="hive-cosim-"), "server.sock")
+    authkey = os.urandom(16)
+    env = dict(os.environ, **{AUTHKEY_ENV_VAR: authkey.hex()})
+    command = [
+        python,
+        "-m",
+        "nrel.hive.app.hive_cosim_server",
+        str(scenario_file),
+        "--address",
+        address,
+        *server_args,
+    ]
+    process = subprocess.Popen(command, env=env)
+
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            connection = Client(address, authkey=authkey)
+            return HiveCosimClient(connection, process)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if process.poll() is not None:
+                raise RuntimeError(
+                    f"hive co-simulation server exited with code {process.returncode}"
+                )
+            if time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError(
+                    f"hive co-simulation server did not start listening at {address}"
+                )
+            time.sleep(0.1)
+
+
+def crank(client: HiveCosimClient, time_steps: int) -> ServerCrankResult:
+    """
+    advances the server's simulation some number of time steps
+    :param client: the client connected to the server
+    :param time_steps: the number of steps to take
+    :return: the sim time after the steps, and the number of time steps of station load
+    """
+    return client.crank(time_steps)
+
+
+def close(client: HiveCosimClient):
+    """
+    shuts down the server, finalizing all logging
+    :param client: the client connected to the server
+    """
+    client.close()
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import secrets
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection, Listener
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from nrel.hive.app import hive_cosim
+from nrel.hive.dispatcher.instruction_generator.instruction_generator import InstructionGenerator
+from nrel.hive.reporting.handler.vehicle_charge_events_handler import VehicleChargeEventsHandler
+from nrel.hive.runner.observation import SimulationObserver
+from nrel.hive.runner.runner_payload import RunnerPayload
+from nrel.hive.state.simulation_state import simulation_state_ops
+
+parser = argparse.ArgumentParser(
+    description="run a hive co-simulation server, which loads a scenario once and steps it "
+    "on request from a local client"
+)
+parser.add_argument("scenario_file", help="which scenario file to load")
+parser.add_argument(
+    "--address",
+    dest="address",
+    help="the local socket or pipe to listen on; by default, one is chosen and printed",
+)
+parser.add_argument(
+    "--vehicle-capacity",
+    dest="vehicle_capacity",
+    type=int,
+    help="the number of vehicle rows to share; defaults to twice the initial fleet",
+)
+parser.add_argument(
+    "--station-capacity",
+    dest="station_capacity",
+    type=int,
+    help="the number of station rows to share; defaults to twice the initial stations",
+)
+parser.add_argument(
+    "--request-capacity",
+    dest="request_capacity",
+    type=int,
+    default=4096,
+    help="the number of request rows to share",
+)
+parser.add_argument(
+    "--time-step-capacity",
+    dest="time_step_capacity",
+    type=int,
+    default=1440,
+    help="the number of time steps of station load shared after each crank",
+)
+
+log = logging.getLogger("hive")
+
+AUTHKEY_ENV_VAR = "HIVE_COSIM_AUTHKEY"
+
+
+class CosimServer:
+    """
+    holds one loaded scenario and serves commands from a co-simulation client.
+
+    commands arrive over a multiprocessing connection as (command, arguments) tuples and
+    are answered with ("ok", result) or ("error", message). bulk data is not sent over
+    the connection: observations are written by a SimulationObserver into shared memory,
+    and the kW charging load of each station at each time step of the last crank is copied
+    into a shared memory block, with one column per station observation index.
+    """
+
+    def __init__(
+        self,
+        runner_payload: RunnerPayload,
+        vehicle_capacity: Optional[int] = None,
+        station_capacity: Optional[int] = None,
+        request_capacity: int = 4096,
+        time_step_capacity: int = 1440,
+    ) -> None:
+        # the observer reads the entities changed at each crank from the entity indices
+        sim = simulation_state_ops.track_entity_changes(runner_payload.s)
+        runner_payload = runner_payload._replace(s=sim)
+        self.runner_payload = runner_payload
+        # replaces the charge event handler added by load_scenario with one sized for sharing
+        reporter = runner_payload.e.reporter
+        self.charge_events = VehicleChargeEventsHandler(time_step_capacity=time_step_capacity)
+        reporter.handlers = [
+            h for h in reporter.handlers if not isinstance(h, VehicleChargeEventsHandler)
+        ]
+        reporter.add_handler(self.charge_events)
+
+        self.observer = SimulationObserver(
+            vehicle_capacity=vehicle_capacity or 2 * len(sim.vehicles),
+            station_capacity=station_capacity or 2 * len(sim.stations),
+            request_capacity=request_capacity,
+            shared_memory=True,
+        )
+        self.observer.observe(sim, runner_payload.e)
+
+        n_stations = self.observer.stations.capacity
+        self.load_shm = shared_memory.SharedMemory(
+            create=True, size=time_step_capacity * (n_stations + 1) * 8
+        )
+        self.load_times: np.ndarray = np.ndarray(
+            (time_step_capacity,), dtype=np.int64, buffer=self.load_shm.buf
+        )
+        self.station_load_kw: np.ndarray = np.ndarray(
+            (time_step_capacity, n_stations),
+            dtype=np.float64,
+            buffer=self.load_shm.buf,
+            offset=time_step_capacity * 8,
+        )
+        self.running = True
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        :return: the shared memory blocks along with the layout of the arrays in them
+        """
+        tables = {
+            "vehicles": self.observer.vehicles,
+            "stations": self.observer.stations,
+            "requests": self.observer.requests,
+        }
+        return {
+            "sim_time": int(self.runner_payload.s.sim_time),
+            "end_time": int(self.runner_payload.e.config.sim.end_time),
+            "observations": {
+                name: {
+                    "shared_memory_name": table.shm.name,
+                    "dtype": table.dtype.descr,
+                    "capacity": table.capacity,
+                }
+                for name, table in tables.items()
+                if table.shm is not None
+            },
+            "station_load": {
+                "shared_memory_name": self.load_shm.name,
+                "time_step_capacity": len(self.load_times),
+                "station_capacity": self.station_load_kw.shape[1],
+            },
+        }
+
+    def crank(self, time_steps: int) -> Dict[str, Any]:
+        """
+        advances the simulation and shares the station load of each time step taken,
+        keeping the last time_step_capacity time steps
+
+        :param time_steps: the number of time steps to take
+        :return: the sim time and the number of time steps of station load shared
+        """
+        self.charge_events.clear()
+        result = hive_cosim.crank(self.runner_payload, time_steps)
+        self.runner_payload = result.runner_payload
+
+        # load columns and station observation rows are both the s_index slots of the stations
+        self.observer.observe(self.runner_payload.s, self.runner_payload.e)
+        times, load = self.charge_events.get_station_load()
+        n_steps, n_stations = load.shape
+        self.load_times[:n_steps] = times
+        self.station_load_kw[:n_steps] = 0.0
+        self.station_load_kw[:n_steps, :n_stations] = load
+
+        return {"sim_time": int(result.sim_time), "time_steps": n_steps}
+
+    def observe(self) -> Dict[str, Any]:
+        """
+        writes the current observation into shared memory
+
+        :return: the sim time and the number of rows in use for each observation array
+        """
+        observation = self.observer.observe(self.runner_payload.s, self.runner_payload.e)
+        return {
+            "sim_time": observation.sim_time,
+            "sizes": {
+                "vehicles": len(observation.vehicles),
+                "stations": len(observation.stations),
+                "requests": len(observation.requests),
+            },
+        }
+
+    def entity_ids(self) -> Dict[str, Tuple]:
+        """
+        :return: the entity id at each observation index, or None where vacant
+        """
+        return {
+            "vehicles": tuple(self.observer.vehicles.ids),
+            "stations": tuple(self.observer.stations.ids),
+            "requests": tuple(self.observer.requests.ids),
+        }
+
+    def set_instruction_generators(
+        self, instruction_generators: Tuple[InstructionGenerator, ...]
+    ) -> Dict[str, Any]:
+        """
+        replaces the instruction generators of the dispatcher
+
+        :param instruction_generators: the instruction generators, in the order they run
+        :return: the names of the instruction generators
+        """
+        u = self.runner_payload.u
+        step_update = u.step_update.update_instruction_generators(instruction_generators)
+        self.runner_payload = self.runner_payload._replace(u=u._replace(step_update=step_update))
+        return {"instruction_generators": step_update.instruction_generator_order}
+
+    def shutdown(self) -> Dict[str, Any]:
+        self.running = False
+        return {}
+
+    def handle(self, command: str, arguments: Dict[str, Any]) -> Tuple[str, Any]:
+        """
+        runs one command from a client
+
+        :param command: the name of the command
+        :param arguments: the keyword arguments of the command
+        :return: ("ok", result), or ("error", message) if the command failed
+        """
+        commands: Dict[str, Callable[..., Any]] = {
+            "describe": self.describe,
+            "crank": self.crank,
+            "observe": self.observe,
+            "entity_ids": self.entity_ids,
+            "set_instruction_generators": self.set_instruction_generators,
+            "shutdown": self.shutdown,
+        }
+        fn = commands.get(command)
+        if fn is None:
+            return "error", f"unknown command {command}; expected one of {list(commands)}"
+        try:
+            return "ok", fn(**arguments)
+        except Exception as e:
+            log.exception(e)
+            return "error", f"{command} failed: {e!r}"
+
+    def serve_connection(self, connection: Connection):
+        """
+        answers commands from one client until it disconnects or shuts down the server
+        """
+        while self.running:
+            try:
+                command, arguments = connection.recv()
+            except EOFError:
+                return
+            connection.send(self.handle(command, arguments))
+
+    def close(self):
+        """
+        finalizes logging and releases the shared memory
+        """
+        hive_cosim.close(self.runner_payload)
+        self.observer.close()
+        del self.load_times
+        del self.station_load_kw
+        self.load_shm.close()
+        self.load_shm.unlink()
+
+
+def serve(
+    scenario_file: Union[Path, str],
+    address: Optional[Union[str, Tuple[str, int]]] = None,
+    authkey: Optional[bytes] = None,
+    **capacities: int,
+):
+    """
+    loads a scenario and serves clients, one at a time, until a client shuts down the server.
+    the address is printed once the server is ready, so a parent process can connect to it.
+
+    commands are unpickled from the connection, so only clients holding the authkey are
+    served. if no key is given or set in HIVE_COSIM_AUTHKEY, one is generated and printed
+    along with the address.
+
+    :param scenario_file: the scenario to load
+    :param address: the local socket or pipe to listen on; by default, one is chosen
+    :param authkey: the key clients must present; by default, read from HIVE_COSIM_AUTHKEY
+    :param capacities: the capacities of the shared arrays, see CosimServer
+    """
+    if authkey is None:
+        authkey_hex = os.environ.get(AUTHKEY_ENV_VAR)
+        authkey = bytes.fromhex(authkey_hex) if authkey_hex else None
+    if authkey is None:
+        authkey = secrets.token_bytes(16)
+        print(f"hive co-simulation server authkey {authkey.hex()}", flush=True)
+    runner_payload = hive_cosim.load_scenario(Path(scenario_file))
+    server = CosimServer(runner_payload, **capacities)
+    try:
+        with Listener(address, authkey=authkey) as listener:
+            print(f"hive co-simulation server listening on {listener.address}", flush=True)
+            while server.running:
+                with listener.accept() as connection:
+                    server.serve_connection(connection)
+    finally:
+        server.close()
+
+
+def run() -> int:
+    """
+    entry point for a hive co-simulation server
+    :return: 0 if success
+    """
+    args = parser.parse_args()
+    capacities = {
+        "vehicle_capacity": args.vehicle_capacity,
+        "station_capacity": args.station_capacity,
+        "request_capacity": args.request_capacity,
+        "time_step_capacity": args.time_step_capacity,
+    }
+    serve(args.scenario_file, args.address, **capacities)
+    return 0
+
+
+if __name__ == "__main__":
+    run()
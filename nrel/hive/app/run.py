@@ -6,16 +6,15 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable, Optional, Tuple, TypeVar, Union
 
-import pkg_resources
 import yaml
 
-from nrel.hive.initialization.load import load_simulation, load_config
-from nrel.hive.initialization.initialize_simulation import InitFunction
-from nrel.hive.dispatcher.instruction_generator.instruction_generator import InstructionGenerator
-from nrel.hive.runner.local_simulation_runner import LocalSimulationRunner
+from nrel.hive.util import fs
 
 if TYPE_CHECKING:
-    pass
+    from nrel.hive.initialization.initialize_simulation import InitFunction
+    from nrel.hive.dispatcher.instruction_generator.instruction_generator import (
+        InstructionGenerator,
+    )
 
 parser = argparse.ArgumentParser(description="run hive")
 parser.add_argument(
@@ -28,16 +27,24 @@ parser.add_argument(
     action="store_true",
     help="prints the default hive configuration values",
 )
+parser.add_argument(
+    "--use-bundle",
+    dest="use_bundle",
+    action="store_true",
+    help="load the scenario from its compiled bundle if it is up to date; bundles are "
+    "pickled, so only use this for scenarios you trust",
+)
 
 log = logging.getLogger("hive")
 
-T = TypeVar("T", bound=InstructionGenerator)
+T = TypeVar("T", bound="InstructionGenerator")
 
 
 def run_sim(
     scenario_file: Union[Path, str],
     custom_instruction_generators: Optional[Tuple[T, ...]] = None,
     custom_init_functions: Optional[Iterable[InitFunction]] = None,
+    use_scenario_bundle: bool = False,
 ):
     """
     runs a single sim and writes outputs
@@ -45,12 +52,21 @@ def run_sim(
     :param scenario_file: the scenario file to run
     :param custom_instruction_generators: a set of user defined instruction generators to override the defaults
     :param custom_init_functions: a set of user defined initialization functions to override the defaults
+    :param use_scenario_bundle: load the scenario from its compiled bundle, as if enabled in .hive.yaml
 
     :return: 0 for success
     """
+    # deferred so that the command line help and defaults do not load the simulation modules
+    from nrel.hive.initialization.load import load_simulation, load_config
+    from nrel.hive.runner.local_simulation_runner import LocalSimulationRunner
+
     _welcome_to_hive()
 
     config = load_config(scenario_file)
+    if use_scenario_bundle:
+        config = config._replace(
+            global_config=config.global_config._replace(use_scenario_bundle=True)
+        )
 
     initial_payload = load_simulation(
         config,
@@ -96,7 +112,12 @@ def run(
     if args.defaults:
         print_defaults()
 
-    return run_sim(args.scenario_file, custom_instruction_generators, custom_init_functions)
+    return run_sim(
+        args.scenario_file,
+        custom_instruction_generators,
+        custom_init_functions,
+        use_scenario_bundle=args.use_bundle,
+    )
 
 
 def _welcome_to_hive():
@@ -118,9 +139,7 @@ def _welcome_to_hive():
 
 def print_defaults():
     print()
-    defaults_file_str = pkg_resources.resource_filename(
-        "nrel.hive.resources.defaults", "hive_config.yaml"
-    )
+    defaults_file_str = fs.resource_filename("nrel.hive.resources.defaults", "hive_config.yaml")
     log.info(f"printing the default scenario configuration stored at {defaults_file_str}:\n")
     # start build using the Hive config defaults file
     defaults_file = Path(defaults_file_str)
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
 import argparse
+import gc
 import logging
+import multiprocessing
 import os
+import tempfile
+import time
 import traceback
 from multiprocessing import Pool
 from pathlib import Path
-from typing import TYPE_CHECKING, NamedTuple, List
+from typing import TYPE_CHECKING, Dict, NamedTuple, List, Optional
 
 import yaml
 
-from nrel.hive.initialization.load import load_config
+from nrel.hive.initialization.initialize_simulation import (
+    InitFunction,
+    default_init_functions,
+    shared_osm_init_function,
+)
+from nrel.hive.initialization.load import load_config, load_simulation, load_variant_simulation
 from nrel.hive.app.run import run_sim
+from nrel.hive.model.roadnetwork.osm.osm_road_network_arrays import OSMRoadNetworkArrays
+from nrel.hive.model.roadnetwork.osm.osm_roadnetwork import OSMRoadNetwork
+from nrel.hive.model.sim_time import SimTime
+from nrel.hive.runner.local_simulation_runner import LocalSimulationRunner
 from nrel.hive.util import fs
 
 if TYPE_CHECKING:
-    pass
+    from nrel.hive.runner.runner_payload import RunnerPayload
 
 parser = argparse.ArgumentParser(description="run hive")
 parser.add_argument("batch_config", help="which batch config file to use?")
@@ -23,8 +36,32 @@ parser.add_argument("batch_config", help="which batch config file to use?")
 log = logging.getLogger("hive")
 
 
+class WarmStartConfig(NamedTuple):
+    """
+    a shared prefix for a batch of scenario variants. the scenario_file is simulated once,
+    up to the until time, and each variant continues from there with its own config.
+    """
+
+    scenario_file: Path
+    until: SimTime
+
+    @classmethod
+    def from_dict(cls, d: dict) -> WarmStartConfig:
+        if "scenario_file" not in d:
+            raise KeyError(
+                "must specify a scenario_file in the warm_start section of the batch config"
+            )
+        if "until" not in d:
+            raise KeyError(
+                "must specify an until time in the warm_start section of the batch config"
+            )
+
+        return WarmStartConfig(fs.find_scenario(d["scenario_file"]), SimTime.build(d["until"]))
+
+
 class BatchConfig(NamedTuple):
     scenario_files: List[Path]
+    warm_start: Optional[WarmStartConfig] = None
 
     @classmethod
     def from_dict(cls, d: dict) -> BatchConfig:
@@ -32,17 +69,162 @@ class BatchConfig(NamedTuple):
             raise KeyError("must specify scenario_files in the batch config")
 
         scenario_files = [fs.find_scenario(f) for f in d["scenario_files"]]
+        warm_start = WarmStartConfig.from_dict(d["warm_start"]) if d.get("warm_start") else None
 
-        return BatchConfig(scenario_files)
+        return BatchConfig(scenario_files, warm_start)
 
 
 class SimArgs(NamedTuple):
     scenario_file: Path
+    road_network_file: Optional[Path] = None
+
+
+# the simulation state shared by all forked workers of a warm-started batch; it is set in
+# the parent process before the workers are forked and inherited (copy-on-write) by each worker
+_warm_start_payload: Optional[RunnerPayload] = None
+
+
+def share_road_networks(scenario_files: List[Path], directory: Path) -> Dict[Path, Path]:
+    """
+    loads each distinct OSM road network used by a batch of scenarios once, and writes it
+    to the directory as OSMRoadNetworkArrays which the workers memory-map read-only,
+    instead of each worker parsing its own copy of the road network.
+
+    :param scenario_files: the scenarios of this batch
+    :param directory: where to write the shared road network files
+    :return: the shared road network file for each scenario that uses one
+    """
+    shared_files: Dict[tuple, Path] = {}
+    scenario_networks: Dict[Path, Path] = {}
+    for scenario_file in scenario_files:
+        config = load_config(scenario_file)
+        road_network_file = config.input_config.road_network_file
+        if config.network.network_type != "osm_network" or road_network_file is None:
+            continue
+        elif Path(road_network_file).suffix == ".npz":
+            # already compiled; each worker memory-maps the file directly
+            continue
+
+        key = (
+            road_network_file,
+            config.sim.sim_h3_resolution,
+            config.network.default_speed_kmph,
+        )
+        if key not in shared_files:
+            road_network = OSMRoadNetwork.from_file(
+                sim_h3_resolution=config.sim.sim_h3_resolution,
+                road_network_file=Path(road_network_file),
+                default_speed_kmph=config.network.default_speed_kmph,
+            )
+            try:
+                arrays = OSMRoadNetworkArrays.from_osm_road_network(road_network)
+            except TypeError as e:
+                log.warning(f"unable to share road network {road_network_file}: {e}")
+                continue
+            shared_file = directory / f"road_network_{len(shared_files)}.npz"
+            arrays.to_file(shared_file)
+            shared_files[key] = shared_file
+            log.info(f"sharing road network {road_network_file} across batch workers")
+
+        scenario_networks[scenario_file] = shared_files[key]
+
+    return scenario_networks
+
+
+def _init_functions(road_network_file: Optional[Path]) -> Optional[List[InitFunction]]:
+    if road_network_file is None:
+        return None
+    else:
+        return [shared_osm_init_function(road_network_file), *default_init_functions()]
 
 
 def safe_sim(sim_args: SimArgs) -> int:
     try:
-        return run_sim(sim_args.scenario_file)
+        return run_sim(
+            sim_args.scenario_file,
+            custom_init_functions=_init_functions(sim_args.road_network_file),
+        )
+    except Exception:
+        log.error(f"{sim_args.scenario_file} failed, see traceback:")
+        log.error(traceback.format_exc())
+        return -1
+
+
+def run_warm_start_prefix(
+    warm_start: WarmStartConfig, road_network_file: Optional[Path] = None
+) -> RunnerPayload:
+    """
+    simulates the shared prefix of a batch of scenario variants
+
+    :param warm_start: the prefix scenario and the time at which the variants diverge
+    :param road_network_file: an optional shared road network for the prefix, which the variants inherit
+    :return: the simulation at the warm start time
+    """
+    base_config = load_config(warm_start.scenario_file)
+    if base_config.global_config.lazy_file_reading:
+        # forked workers would share the offsets of any open input files
+        log.info("disabling lazy file reading for the warm start prefix")
+        base_config = base_config._replace(
+            global_config=base_config.global_config._replace(lazy_file_reading=False)
+        )
+    config = base_config.set_scenario_output_directory(
+        base_config.scenario_output_directory.with_name(
+            base_config.scenario_output_directory.name + "_warm_start"
+        )
+    )
+    if not config.sim.start_time <= warm_start.until <= config.sim.end_time:
+        raise ValueError(
+            f"warm start time {warm_start.until} must be within the simulation time "
+            f"of {warm_start.scenario_file}"
+        )
+
+    initial_payload = load_simulation(
+        config, custom_init_functions=_init_functions(road_network_file)
+    )
+    log.info(f"running warm start prefix {config.sim.sim_name} until {warm_start.until}")
+    start = time.time()
+    prefix_payload = LocalSimulationRunner.run(initial_payload, end_time=warm_start.until)
+    log.info(f"warm start prefix done! time elapsed: {round(time.time() - start, 2)} seconds")
+
+    prefix_payload.e.reporter.close(prefix_payload)
+    if config.global_config.write_outputs:
+        config.to_yaml()
+
+    return prefix_payload
+
+
+def run_variant_sim(sim_args: SimArgs) -> int:
+    """
+    continues the warm start simulation inherited from the parent process using a scenario variant
+
+    :param sim_args: the variant scenario to run
+    :return: 0 for success
+    """
+    if _warm_start_payload is None:
+        raise Exception("no warm start simulation found in this process")
+
+    config = load_config(sim_args.scenario_file)
+    initial_payload = load_variant_simulation(_warm_start_payload, config)
+
+    log.info(
+        f"running {config.sim.sim_name} from warm start time {initial_payload.s.sim_time} "
+        f"to {config.sim.end_time}:"
+    )
+    start = time.time()
+    sim_result = LocalSimulationRunner.run(initial_payload)
+    log.info(f"done! time elapsed: {round(time.time() - start, 2)} seconds")
+
+    sim_result.e.reporter.close(sim_result)
+
+    if config.global_config.write_outputs:
+        config.to_yaml()
+
+    return 0
+
+
+def safe_variant_sim(sim_args: SimArgs) -> int:
+    try:
+        return run_variant_sim(sim_args)
     except Exception:
         log.error(f"{sim_args.scenario_file} failed, see traceback:")
         log.error(traceback.format_exc())
@@ -69,8 +251,6 @@ def run() -> int:
         d = yaml.safe_load(stream)
         config = BatchConfig.from_dict(d)
 
-    sim_args = [SimArgs(f) for f in config.scenario_files]
-
     # check to make sure we don't exceed system CPU
     os_cpu = os.cpu_count()
 
@@ -84,8 +264,38 @@ def run() -> int:
     else:
         cpu = len(config.scenario_files)
 
-    with Pool(cpu) as p:
-        results = p.map(safe_sim, sim_args)
+    with tempfile.TemporaryDirectory() as shared_directory:
+        if config.warm_start is not None and "fork" in multiprocessing.get_all_start_methods():
+            # the variants inherit the road network of the prefix simulation
+            shared_networks = share_road_networks(
+                [config.warm_start.scenario_file], Path(shared_directory)
+            )
+            global _warm_start_payload
+            _warm_start_payload = run_warm_start_prefix(
+                config.warm_start, shared_networks.get(config.warm_start.scenario_file)
+            )
+
+            # keep the garbage collector from touching (and copying) the inherited objects
+            gc.freeze()
+            try:
+                sim_args = [SimArgs(f) for f in config.scenario_files]
+                with multiprocessing.get_context("fork").Pool(cpu) as p:
+                    results = p.map(safe_variant_sim, sim_args)
+            finally:
+                gc.unfreeze()
+
+            _warm_start_payload = None
+        else:
+            if config.warm_start is not None:
+                log.warning(
+                    "warm start requires forking worker processes which is not supported on this "
+                    "platform; running each scenario from the start instead"
+                )
+
+            shared_networks = share_road_networks(config.scenario_files, Path(shared_directory))
+            sim_args = [SimArgs(f, shared_networks.get(f)) for f in config.scenario_files]
+            with Pool(cpu) as p:
+                results = p.map(safe_sim, sim_args)
 
     return 0
 
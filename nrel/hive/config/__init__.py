@@ -2,7 +2,17 @@
 # from nrel.hive.config.sim import Sim
 # from nrel.hive.config.io import IO
 # from nrel.hive.config.network import Network
-from nrel.hive.config.hive_config import HiveConfig
-
 # from nrel.hive.config.global_config import GlobalConfig
-#
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nrel.hive.config.hive_config import HiveConfig
+
+
+def __getattr__(name: str) -> Any:
+    # HiveConfig is imported on first use, since it imports much of the simulation model
+    if name == "HiveConfig":
+        from nrel.hive.config.hive_config import HiveConfig
+
+        return HiveConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
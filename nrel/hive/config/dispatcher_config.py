@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from typing import NamedTuple, Dict, Union, Tuple, Optional
+from typing import NamedTuple, Dict, Union, Tuple, Optional, FrozenSet
+
+import immutables
 
 from nrel.hive.config.config_builder import ConfigBuilder
+from nrel.hive.dispatcher.instruction_generator.assignment_algorithm import AssignmentAlgorithm
 from nrel.hive.dispatcher.instruction_generator.charging_search_type import ChargingSearchType
+from nrel.hive.dispatcher.instruction_generator.instruction_generator_schedule import (
+    InstructionGeneratorSchedule,
+    WakeEvent,
+)
 from nrel.hive.util.units import Ratio, Seconds, Kilometers
 
 
@@ -23,6 +30,16 @@ class DispatcherConfig(NamedTuple):
 
     valid_dispatch_states: Tuple[str, ...]
 
+    # instruction generators without a schedule run on every time step
+    instruction_generator_schedules: immutables.Map[
+        str, InstructionGeneratorSchedule
+    ] = immutables.Map()
+
+    assignment_algorithm: AssignmentAlgorithm = AssignmentAlgorithm.HUNGARIAN
+
+    # wall-clock seconds allowed per run, by instruction generator name; unlisted generators are unbounded
+    instruction_generator_time_budgets: immutables.Map[str, float] = immutables.Map()
+
     @classmethod
     def default_config(cls) -> Dict:
         return {}
@@ -48,7 +65,52 @@ class DispatcherConfig(NamedTuple):
         except ValueError:
             raise IOError("valid_dispatch_states and active_states must be in a list format")
 
+        schedules = d.get("instruction_generator_schedules") or {}
+        d["instruction_generator_schedules"] = immutables.Map(
+            {
+                name: InstructionGeneratorSchedule.from_dict(
+                    schedule or {}, d["default_update_interval_seconds"]
+                )
+                for name, schedule in schedules.items()
+            }
+        )
+
+        d["assignment_algorithm"] = AssignmentAlgorithm.from_string(
+            d.get("assignment_algorithm", "hungarian")
+        )
+
+        budgets = d.get("instruction_generator_time_budgets") or {}
+        for name, budget in budgets.items():
+            if budget is None or float(budget) < 0:
+                raise IOError(
+                    f"time budget for instruction generator {name} must be non-negative, found {budget}"
+                )
+        d["instruction_generator_time_budgets"] = immutables.Map(
+            {name: float(budget) for name, budget in budgets.items()}
+        )
+
         return DispatcherConfig(**d)
 
+    def low_soc_thresholds(self) -> FrozenSet[Ratio]:
+        """
+        the state of charge thresholds of the schedules which wake on LOW_SOC
+
+        :return: the thresholds a moving vehicle records a wake signal for
+        """
+        return frozenset(
+            schedule.low_soc_threshold
+            for schedule in self.instruction_generator_schedules.values()
+            if WakeEvent.LOW_SOC in schedule.wake_on
+        )
+
     def asdict(self) -> Dict:
-        return self._asdict()
+        out_dict = self._asdict()
+        out_dict["instruction_generator_schedules"] = {
+            name: schedule.asdict()
+            for name, schedule in self.instruction_generator_schedules.items()
+        }
+        out_dict["assignment_algorithm"] = self.assignment_algorithm.to_string()
+        out_dict["instruction_generator_time_budgets"] = dict(
+            self.instruction_generator_time_budgets.items()
+        )
+        return out_dict
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import NamedTuple, Tuple, Dict, Set
 
 from nrel.hive.config.config_builder import ConfigBuilder
-from nrel.hive.reporting.reporter import ReportType
+from nrel.hive.reporting.report_type import ReportType
 
 
 class GlobalConfig(NamedTuple):
@@ -23,6 +23,7 @@ class GlobalConfig(NamedTuple):
     log_time_step_stats: bool
     log_fleet_time_step_stats: bool
     lazy_file_reading: bool
+    use_scenario_bundle: bool
     wkt_x_y_ordering: bool
     verbose: bool
 
@@ -46,6 +47,7 @@ class GlobalConfig(NamedTuple):
             "log_time_step_stats",
             "log_fleet_time_step_stats",
             "lazy_file_reading",
+            "use_scenario_bundle",
             "wkt_x_y_ordering",
             "verbose",
         )
@@ -7,7 +7,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import NamedTuple, Dict, Union, Tuple, Optional
 
-import pkg_resources
 import yaml
 
 from nrel.hive.config.config_builder import ConfigBuilder
@@ -76,9 +75,7 @@ class HiveConfig(NamedTuple):
                 log.info(f"  {k}: {v}")
 
         # start build using the Hive config defaults file
-        defaults_file_str = pkg_resources.resource_filename(
-            "nrel.hive.resources.defaults", "hive_config.yaml"
-        )
+        defaults_file_str = fs.resource_filename("nrel.hive.resources.defaults", "hive_config.yaml")
         defaults_file = Path(defaults_file_str)
 
         with defaults_file.open("r") as f:
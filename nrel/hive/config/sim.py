@@ -17,6 +17,7 @@ class Sim(NamedTuple):
     sim_h3_search_resolution: int
     request_cancel_time_seconds: int
     schedule_type: ScheduleType
+    event_driven: bool = False
 
     @classmethod
     def default_config(cls) -> Dict:
@@ -62,6 +63,7 @@ class Sim(NamedTuple):
             sim_h3_search_resolution=sim_h3_search_resolution,
             request_cancel_time_seconds=int(d["request_cancel_time_seconds"]),
             schedule_type=schedule_type,
+            event_driven=bool(d.get("event_driven", False)),
         )
 
     def asdict(self) -> Dict:
@@ -1,3 +1,4 @@
 from nrel.hive.dispatcher.forecaster.basic_forecaster import BasicForecaster
+from nrel.hive.dispatcher.forecaster.demand_cube_forecaster import DemandCubeForecaster
 from nrel.hive.dispatcher.forecaster.forecast import Forecast, ForecastType
 from nrel.hive.dispatcher.forecaster.forecaster_interface import ForecasterInterface
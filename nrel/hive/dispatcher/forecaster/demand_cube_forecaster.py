@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple, TYPE_CHECKING
+
+import h3
+import immutables
+import numpy as np
+import pandas as pd
+
+from nrel.hive.dispatcher.forecaster.forecast import Forecast, ForecastType
+from nrel.hive.dispatcher.forecaster.forecaster_interface import ForecasterInterface
+from nrel.hive.model.sim_time import SimTime
+
+if TYPE_CHECKING:
+    from nrel.hive.state.simulation_state.simulation_state import SimulationState
+    from nrel.hive.util.typealiases import GeoId
+    from nrel.hive.util.units import Seconds
+
+
+@dataclass(frozen=True)
+class DemandCubeForecaster(ForecasterInterface):
+    """
+    A forecaster backed by a precomputed cube of expected requests by (time bin, search cell).
+
+    the cube is stored as a running sum over time bins, so that the demand expected over any
+    window of bins, for one cell or for all cells, is a single subtraction.
+
+    :param cumulative_demand: running sum of expected requests, shaped (time bins + 1, cells)
+    :param cells: the h3 search cell of each column of the cube
+    :param cell_index: the column of each search cell in the cube
+    :param start_time: the sim time at the start of the first time bin
+    :param bin_duration_seconds: the duration of each time bin
+    :param horizon_seconds: how far ahead generate_forecast looks
+    """
+
+    cumulative_demand: np.ndarray
+    cells: Tuple[GeoId, ...]
+    cell_index: immutables.Map[GeoId, int]
+    start_time: SimTime
+    bin_duration_seconds: Seconds
+    horizon_seconds: Seconds = 30 * 60
+
+    @classmethod
+    def build_from_requests(
+        cls,
+        request_file: str,
+        sim_h3_search_resolution: int,
+        bin_duration_seconds: Seconds = 15 * 60,
+        horizon_seconds: Seconds = 30 * 60,
+        sim_h3_location_resolution: int = 15,
+        scale: float = 1.0,
+    ) -> DemandCubeForecaster:
+        """
+        builds a forecaster from a file of historical requests, counting the requests which
+        depart from each search cell in each time bin
+
+        :param request_file: a request file with o_lat, o_lon and departure_time columns
+        :param sim_h3_search_resolution: the h3 resolution of the search cells
+        :param bin_duration_seconds: the duration of each time bin
+        :param horizon_seconds: how far ahead generate_forecast looks
+        :param sim_h3_location_resolution: the h3 resolution of entity locations
+        :param scale: a factor applied to the historical counts, such as 1 / (number of days)
+        :return: a DemandCubeForecaster
+        :raises: an exception if there were file loading issues
+        """
+        df = _read_csv(request_file, ("o_lat", "o_lon", "departure_time"))
+        times = _parse_sim_times(df["departure_time"])
+        weights = np.full(len(df), scale, dtype=np.float64)
+        geoids = _search_cells(
+            df["o_lat"], df["o_lon"], sim_h3_location_resolution, sim_h3_search_resolution
+        )
+        return cls._build(times, geoids, weights, bin_duration_seconds, horizon_seconds)
+
+    @classmethod
+    def build_from_forecast(
+        cls,
+        demand_forecast_file: str,
+        sim_h3_search_resolution: int,
+        bin_duration_seconds: Seconds = 15 * 60,
+        horizon_seconds: Seconds = 30 * 60,
+        sim_h3_location_resolution: int = 15,
+    ) -> DemandCubeForecaster:
+        """
+        builds a forecaster from a demand forecast file, which has a sim_time and a requests
+        column as read by the BasicForecaster, along with a lat and lon column locating each row
+
+        :param demand_forecast_file: the file source
+        :param sim_h3_search_resolution: the h3 resolution of the search cells
+        :param bin_duration_seconds: the duration of each time bin
+        :param horizon_seconds: how far ahead generate_forecast looks
+        :param sim_h3_location_resolution: the h3 resolution of entity locations
+        :return: a DemandCubeForecaster
+        :raises: an exception if there were file loading issues
+        """
+        df = _read_csv(demand_forecast_file, ("sim_time", "requests", "lat", "lon"))
+        times = _parse_sim_times(df["sim_time"])
+        weights = df["requests"].to_numpy(dtype=np.float64)
+        geoids = _search_cells(
+            df["lat"], df["lon"], sim_h3_location_resolution, sim_h3_search_resolution
+        )
+        return cls._build(times, geoids, weights, bin_duration_seconds, horizon_seconds)
+
+    @classmethod
+    def _build(
+        cls,
+        times: np.ndarray,
+        geoids: np.ndarray,
+        weights: np.ndarray,
+        bin_duration_seconds: Seconds,
+        horizon_seconds: Seconds,
+    ) -> DemandCubeForecaster:
+        if bin_duration_seconds <= 0:
+            raise ValueError(f"bin duration must be positive, found {bin_duration_seconds}")
+        if len(times) == 0:
+            return cls(
+                cumulative_demand=np.zeros((1, 0)),
+                cells=(),
+                cell_index=immutables.Map(),
+                start_time=SimTime(0),
+                bin_duration_seconds=bin_duration_seconds,
+                horizon_seconds=horizon_seconds,
+            )
+
+        start_time = int(times.min())
+        bins = (times - start_time) // bin_duration_seconds
+        cells, cell_columns = np.unique(geoids, return_inverse=True)
+
+        cube = np.zeros((int(bins.max()) + 1, len(cells)), dtype=np.float64)
+        np.add.at(cube, (bins, cell_columns), weights)
+        cumulative_demand = np.zeros((cube.shape[0] + 1, len(cells)), dtype=np.float64)
+        np.cumsum(cube, axis=0, out=cumulative_demand[1:])
+
+        cell_tuple = tuple(str(c) for c in cells)
+        return cls(
+            cumulative_demand=cumulative_demand,
+            cells=cell_tuple,
+            cell_index=immutables.Map(zip(cell_tuple, range(len(cell_tuple)))),
+            start_time=SimTime(start_time),
+            bin_duration_seconds=bin_duration_seconds,
+            horizon_seconds=horizon_seconds,
+        )
+
+    def _bin_range(self, start_time: int, end_time: int) -> Tuple[int, int]:
+        """
+        finds the rows of the running sum which bound a window. a window covers each time
+        bin that its start time falls in or that starts before its end time.
+
+        :return: the rows of the running sum to subtract
+        """
+        n_bins = self.cumulative_demand.shape[0] - 1
+        first = (start_time - self.start_time) // self.bin_duration_seconds
+        last = -((self.start_time - end_time) // self.bin_duration_seconds)
+        first = min(max(first, 0), n_bins)
+        last = min(max(last, first), n_bins)
+        return first, last
+
+    def demand_in_cell(self, geoid: GeoId, start_time: int, end_time: int) -> float:
+        """
+        the requests expected to depart from a search cell over a window of time
+
+        :param geoid: the search cell
+        :param start_time: the start of the window
+        :param end_time: the end of the window
+        :return: the expected number of requests, or zero for an unknown cell
+        """
+        column = self.cell_index.get(geoid)
+        if column is None:
+            return 0.0
+        first, last = self._bin_range(start_time, end_time)
+        return float(self.cumulative_demand[last, column] - self.cumulative_demand[first, column])
+
+    def demand_by_cell(self, start_time: int, end_time: int) -> np.ndarray:
+        """
+        the requests expected to depart from each search cell over a window of time
+
+        :param start_time: the start of the window
+        :param end_time: the end of the window
+        :return: the expected number of requests in each search cell, ordered as self.cells
+        """
+        first, last = self._bin_range(start_time, end_time)
+        return self.cumulative_demand[last] - self.cumulative_demand[first]
+
+    def generate_forecast(
+        self, simulation_state: SimulationState
+    ) -> Tuple[DemandCubeForecaster, Forecast]:
+        """
+        Generate a demand forecast for the horizon ahead, along with its spatial distribution.
+
+        :param simulation_state: The current simulation state
+        :return: the forecaster along with the forecast
+        """
+        current_demand = len(simulation_state.requests)
+
+        start_time = simulation_state.sim_time
+        by_cell = self.demand_by_cell(start_time, start_time + self.horizon_seconds)
+        nonzero = np.flatnonzero(by_cell)
+        spatial_distribution = immutables.Map(
+            zip((self.cells[i] for i in nonzero), by_cell[nonzero].tolist())
+        )
+        future_demand = int(round(by_cell.sum()))
+
+        demand_forecast = Forecast(
+            type=ForecastType.DEMAND,
+            value=current_demand + future_demand,
+            spatial_distribution=spatial_distribution,
+        )
+
+        return self, demand_forecast
+
+
+def _read_csv(file: str, columns: Tuple[str, ...]) -> pd.DataFrame:
+    if not Path(file).is_file():
+        raise IOError(f"{file} is not a valid path to a demand file")
+    df = pd.read_csv(file)
+    missing = [c for c in columns if c not in df.columns]
+    if len(missing) > 0:
+        raise IOError(f"demand file {file} is missing columns {missing}")
+    return df
+
+
+def _parse_sim_times(column: pd.Series) -> np.ndarray:
+    """
+    parses a column of times as SimTime.build does, either as integer epoch
+    seconds or as ISO datetime strings, in one vectorized step
+    """
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.int64)
+    times = pd.to_datetime(column)
+    if times.dt.tz is not None:
+        times = times.dt.tz_localize(None)
+    epoch_seconds = (times - pd.Timestamp(0)) // pd.Timedelta(seconds=1)
+    return epoch_seconds.to_numpy(dtype=np.int64)
+
+
+def _search_cells(
+    lat: pd.Series, lon: pd.Series, location_resolution: int, search_resolution: int
+) -> np.ndarray:
+    """
+    finds the search cell of each location the same way as the simulation state does,
+    as the parent of the location's cell, which may differ from the cell at the search
+    resolution containing the point
+    """
+    return np.array(
+        [
+            h3.h3_to_parent(h3.geo_to_h3(y, x, location_resolution), search_resolution)
+            for y, x in zip(lat.tolist(), lon.tolist())
+        ],
+        dtype=object,
+    )
@@ -1,6 +1,10 @@
 from enum import Enum
 from typing import NamedTuple
 
+import immutables
+
+from nrel.hive.util.typealiases import GeoId
+
 
 class ForecastType(Enum):
     DEMAND = 0
@@ -9,4 +13,5 @@ class ForecastType(Enum):
 class Forecast(NamedTuple):
     type: ForecastType
     value: int
-    # spatial_distribution
+    # the expected value in each h3 search cell, when the forecaster has a spatial dimension
+    spatial_distribution: immutables.Map[GeoId, float] = immutables.Map()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Callable, NamedTuple, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from nrel.hive.dispatcher.instruction_generator.assignment_ops import AssignmentSolution
+
+if TYPE_CHECKING:
+    from nrel.hive.dispatcher.instruction_generator.time_budget import TimeBudget
+    from nrel.hive.model.entity import Entity
+
+
+class AnytimePhase(Enum):
+    """
+    how far an anytime assignment progressed before its time budget expired
+    """
+
+    PARTIAL_GREEDY = 1
+    GREEDY = 2
+    OPTIMAL = 3
+
+    def to_string(self) -> str:
+        return self.name.lower()
+
+
+class AnytimeAssignmentSolution(NamedTuple):
+    """
+    the best assignment found within a time budget, along with measures of its quality
+
+    :param solution: the assignment found
+    :param phase: the last phase of the search which completed
+    :param greedy_cost: the cost of the greedy assignment, which the solution improves on
+    :param elapsed_seconds: the wall-clock time taken
+    :param over_budget: True if the search took longer than its time budget
+    """
+
+    solution: AssignmentSolution = AssignmentSolution()
+    phase: AnytimePhase = AnytimePhase.OPTIMAL
+    greedy_cost: float = 0.0
+    elapsed_seconds: float = 0.0
+    over_budget: bool = False
+
+
+def find_anytime_assignment(
+    assignees: Tuple[Entity, ...],
+    targets: Tuple[Entity, ...],
+    cost_fn: Callable[[Entity, Entity], float],
+    budget: TimeBudget,
+) -> AnytimeAssignmentSolution:
+    """
+    solves the assignment problem of assignment_ops.find_assignment progressively, returning
+    the best solution found once the time budget expires.
+
+    first, each target (in the order given, so callers should place the most important
+    targets first) is greedily matched to its cheapest remaining assignee. at least one target
+    is always matched. if time remains, the rest of the cost table is filled in and solved
+    optimally, exactly as find_assignment would have.
+
+    :param assignees: entities we are assigning to. assumed to have an id field.
+    :param targets: the different entities that each assignee can be assigned to. assumed to have an id field.
+    :param cost_fn: computes the cost of choosing a specific assignee (slot 1) with a specific target (slot 2)
+    :param budget: the running time budget
+    :return: the best solution found, with its quality
+    """
+    if len(assignees) == 0 or len(targets) == 0:
+        return AnytimeAssignmentSolution(
+            elapsed_seconds=budget.elapsed_seconds, over_budget=budget.is_over_budget
+        )
+
+    # costs are computed lazily; NaN marks a pair which has not been computed yet
+    table = np.full((len(assignees), len(targets)), np.nan)
+
+    # phase 1: greedily match targets in order to their cheapest unmatched assignee
+    greedy = AssignmentSolution()
+    available = np.ones(len(assignees), dtype=bool)
+    greedy_complete = True
+    for j, target in enumerate(targets):
+        if j > 0 and budget.is_expired:
+            greedy_complete = False
+            break
+        rows = np.flatnonzero(available)
+        if len(rows) == 0:
+            break
+        for i in rows.tolist():
+            table[i, j] = cost_fn(assignees[i], target)
+        costs = table[rows, j]
+        if not np.isfinite(costs).any():
+            continue
+        best = int(rows[np.argmin(costs)])
+        available[best] = False
+        greedy = greedy.add((assignees[best].id, target.id), table[best, j])
+
+    def _result(solution: AssignmentSolution, phase: AnytimePhase) -> AnytimeAssignmentSolution:
+        return AnytimeAssignmentSolution(
+            solution=solution,
+            phase=phase,
+            greedy_cost=greedy.solution_cost,
+            elapsed_seconds=budget.elapsed_seconds,
+            over_budget=budget.is_over_budget,
+        )
+
+    if not greedy_complete:
+        return _result(greedy, AnytimePhase.PARTIAL_GREEDY)
+
+    # phase 2: complete the cost table and refine the greedy solution to the optimal one
+    for i, assignee in enumerate(assignees):
+        if budget.is_expired:
+            return _result(greedy, AnytimePhase.GREEDY)
+        for j in np.flatnonzero(np.isnan(table[i])).tolist():
+            table[i, j] = cost_fn(assignee, targets[j])
+
+    # as in find_assignment, infinite costs are replaced with an upper bound beyond all finite costs
+    finite = table[np.isfinite(table)]
+    upper_bound = finite.max() + 1 if len(finite) > 0 else 0.0
+    table[~np.isfinite(table)] = upper_bound
+
+    from scipy.optimize import linear_sum_assignment
+
+    rows, cols = linear_sum_assignment(table)
+    optimal = AssignmentSolution()
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        optimal = optimal.add((assignees[i].id, targets[j].id), table[i, j])
+
+    return _result(optimal, AnytimePhase.OPTIMAL)
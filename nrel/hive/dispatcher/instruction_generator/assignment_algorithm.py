@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class AssignmentAlgorithm(Enum):
+    HUNGARIAN = 1
+    INCREMENTAL = 2
+
+    @staticmethod
+    def from_string(string: str) -> AssignmentAlgorithm:
+        """
+        parses an input configuration string as an AssignmentAlgorithm
+
+        :param string: the input string
+        :return: an AssignmentAlgorithm
+        :raises: NameError when the assignment algorithm is unknown
+        """
+        cleaned = string.lower()
+        if cleaned == "hungarian":
+            return AssignmentAlgorithm.HUNGARIAN
+        elif cleaned == "incremental":
+            return AssignmentAlgorithm.INCREMENTAL
+        else:
+            valid_names = "{hungarian|incremental}"
+            raise NameError(
+                f"assignment algorithm {string} is not known, must be one of {valid_names}"
+            )
+
+    def to_string(self) -> str:
+        return self.name.lower()
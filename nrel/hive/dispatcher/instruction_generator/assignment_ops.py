@@ -6,7 +6,6 @@ from typing import Dict, Tuple, Callable, NamedTuple, Optional, TYPE_CHECKING
 import logging
 import h3
 import numpy as np
-from scipy.optimize import linear_sum_assignment
 
 from nrel.hive.model.roadnetwork.route import (
     route_distance_km,
@@ -17,10 +16,8 @@ from nrel.hive.model.vehicle.mechatronics.powercurve import powercurve_ops
 from nrel.hive.model.vehicle.vehicle import Vehicle
 from nrel.hive.runner import Environment
 from nrel.hive.state.simulation_state.simulation_state import SimulationState
-from nrel.hive.state.vehicle_state.charge_queueing import ChargeQueueing
-from nrel.hive.state.vehicle_state.charging_station import ChargingStation
+from nrel.hive.util import h3_cell_ops
 from nrel.hive.util.h3_ops import H3Ops
-from nrel.hive.util.tuple_ops import TupleOps
 
 if TYPE_CHECKING:
     from nrel.hive.util.units import Ratio, Seconds
@@ -53,6 +50,9 @@ def find_assignment(
     assignees: Tuple[EntityABC, ...],
     targets: Tuple[EntityABC, ...],
     cost_fn: Callable[[EntityABC, EntityABC], float],
+    cost_table_fn: Optional[
+        Callable[[Tuple[EntityABC, ...], Tuple[EntityABC, ...]], np.ndarray]
+    ] = None,
 ) -> AssignmentSolution:
     """
 
@@ -60,29 +60,33 @@ def find_assignment(
     :param assignees: entities we are assigning to. assumed to have an id field.
     :param targets: the different entities that each assignee can be assigned to. assumed to have an id field.
     :param cost_fn: computes the cost of choosing a specific assignee (slot 1) with a specific target (slot 2)
+    :param cost_table_fn: optionally, computes cost_fn for every assignee (row) and target (column) at once
     :return: a collection of pairs of (AssigneeId, TargetId) indicating the solution, along with it's cost
     """
 
     if len(assignees) == 0 or len(targets) == 0:
         return AssignmentSolution()
     else:
-        initial_cost = float("inf")
-        table = np.full((len(assignees), len(targets)), initial_cost)
+        if cost_table_fn is not None:
+            table = np.array(cost_table_fn(assignees, targets), dtype=np.float64)
+        else:
+            # evaluate the cost of all possible assignments between each assignee/target pair
+            table = np.full((len(assignees), len(targets)), float("inf"))
+            for i in range(len(assignees)):
+                for j in range(len(targets)):
+                    table[i][j] = cost_fn(assignees[i], targets[j])
 
-        # evaluate the cost of all possible assignments between each assignee/target pair
-        upper_bound = float("-inf")
-        for i in range(len(assignees)):
-            for j in range(len(targets)):
-                cost = cost_fn(assignees[i], targets[j])
-                upper_bound = cost if cost > upper_bound and cost != float("inf") else upper_bound
-                table[i][j] = cost
+        finite = table[np.isfinite(table)]
+        upper_bound = finite.max() if len(finite) > 0 else float("-inf")
 
         # linear_sum_assignment borks with infinite values; this 2nd step replaces
         # float("inf") values with an upper-bound value which is 1 beyond our highest-observed value
         upper_bound += 1
         table[table == float("inf")] = upper_bound
 
-        # apply the Kuhn-Munkres algorithm
+        # apply the Kuhn-Munkres algorithm; scipy is imported here as it is slow to import
+        from scipy.optimize import linear_sum_assignment
+
         rows, cols = linear_sum_assignment(table)
 
         # interpret the row/column assignments back to EntityIds and compute the total cost of this assignment
@@ -108,6 +112,22 @@ def h3_distance_cost(a: EntityABC, b: EntityABC) -> float:
     return distance
 
 
+def h3_distance_cost_table(
+    assignees: Tuple[EntityABC, ...], targets: Tuple[EntityABC, ...]
+) -> np.ndarray:
+    """
+    h3_distance_cost for every pair of entities, computed over arrays of integer h3 cells
+
+    :param assignees: entities expected to have a geoid
+    :param targets: other entities expected to have a geoid
+    :return: the h3_distance from each assignee (row) to each target (column)
+    """
+    return h3_cell_ops.grid_distance_matrix(
+        h3_cell_ops.to_cells(a.geoid for a in assignees),
+        h3_cell_ops.to_cells(t.geoid for t in targets),
+    )
+
+
 def great_circle_distance_cost(a: EntityABC, b: EntityABC) -> float:
     """
     cost function based on the great circle distance between two entities.
@@ -266,118 +286,11 @@ def shortest_time_to_charge_ranking(
         # return a signal that demotes this Station alternative to the bottom of the ranking
         return None
     else:
-
-        def _veh_at_station(v: Vehicle) -> bool:
-            return (
-                isinstance(v.vehicle_state, ChargingStation)
-                and v.vehicle_state.station_id == station.id
-            )
-
-        def _veh_enqueued(v: Vehicle) -> bool:
-            return (
-                isinstance(v.vehicle_state, ChargeQueueing)
-                and v.vehicle_state.station_id == station.id
-            )
-
-        def _time_to_full_by_charger_id(c: ChargerId):
-            def _time_to_full(v: Vehicle) -> Seconds:
-                _mech = env.mechatronics.get(v.mechatronics_id)
-                _charger = env.chargers.get(c)
-                if not _mech or not _charger:
-                    return 0
-                else:
-                    time_est = powercurve_ops.time_to_full(
-                        v,
-                        _mech,
-                        _charger,
-                        target_soc,
-                        sim.sim_timestep_duration_seconds,
-                    )
-                    return time_est
-
-            return _time_to_full
-
-        def _sort_enqueue_time(v: Vehicle) -> int:
-            if isinstance(v.vehicle_state, ChargeQueueing):
-                enqueue_time = int(v.vehicle_state.enqueue_time)
-            else:
-                log.error(
-                    "calling _sort_enqueue_time on a vehicle state that is not ChargeQueueing"
-                )
-                enqueue_time = 0
-            return enqueue_time
-
-        def _greedy_assignment(
-            _charging: Tuple[Seconds, ...],
-            _enqueued: Tuple[Seconds, ...],
-            _charger_id: ChargerId,
-            time_passed: Seconds = 0,
-        ) -> Seconds:
-            """
-            computes the time estimated that a slot opens up for this vehicle to begin charging
-
-
-            :param _charging: a sorted list of remaining charge time estimates
-            :param _enqueued: a sorted list of charge time estimates for enqueued vehicles
-            :param _charger_id: the id of the charger these vehicles are competing for
-            :param time_passed: the amount of time that has been estimated
-            :return: the time in the future we should expect to begin charging, determined by a greedy assignment
-            """
-            total_chargers = station.get_total_chargers(_charger_id)
-            if total_chargers is None:
-                log.error(f"charger id {_charger_id} not found at station {station.id}")
-                total_chargers = 0
-
-            if len(_charging) == len(_enqueued) == 0:
-                return time_passed
-            elif len(_charging) < total_chargers:
-                return time_passed
-            else:
-                # advance time
-                next_released_charger_time = TupleOps.head(_charging)
-
-                updated_time_passed = time_passed + next_released_charger_time
-
-                # remove charging agents who are done
-                _charging_time_advanced = map(lambda t: t - next_released_charger_time, _charging)
-                _charging_vacated = tuple(filter(lambda t: t > 0, _charging_time_advanced))
-
-                vacancies = total_chargers - len(_charging_vacated)
-                if vacancies <= 0:
-                    # no space for any changes from enqueued -> charging
-                    return _greedy_assignment(
-                        _charging=_charging_vacated,
-                        _enqueued=_enqueued,
-                        _charger_id=_charger_id,
-                        time_passed=updated_time_passed,
-                    )
-                else:
-                    # dequeue longest-waiting agents
-                    _enqueued_to_dequeue = _enqueued[0:vacancies]
-                    _updated_enqueued = _enqueued[vacancies:]
-                    _updated_charging = tuple(sorted(_charging_vacated + _enqueued_to_dequeue))
-
-                    return _greedy_assignment(
-                        _charging=_updated_charging,
-                        _enqueued=_updated_enqueued,
-                        _charger_id=_charger_id,
-                        time_passed=updated_time_passed,
-                    )
-
-        # collect all vehicles that are either charging or enqueued at this station
-        vehicles_at_station = sim.get_vehicles(filter_function=_veh_at_station)
-        vehicles_enqueued = sim.get_vehicles(
-            filter_function=_veh_enqueued,
-            sort=True,
-            sort_key=_sort_enqueue_time,
-        )
-
         estimates: Dict[ChargerId, int] = {}
-        for charger_id in station.state.keys():
-            charger_state = station.state.get(charger_id)
-            charger = charger_state.charger if charger_state is not None else None
+        for charger_id, charger_state in station.state.items():
+            charger = charger_state.charger
 
-            if charger is None or not vehicle_mechatronics.valid_charger(charger):
+            if not vehicle_mechatronics.valid_charger(charger):
                 # vehicle can't use this charger so we skip it
                 continue
 
@@ -390,40 +303,11 @@ def shortest_time_to_charge_ranking(
                 sim.sim_timestep_duration_seconds,
             )
 
-            def _using_charger(charging_vehicle: Vehicle) -> bool:
-                if isinstance(charging_vehicle.vehicle_state, ChargingStation):
-                    if charging_vehicle.vehicle_state.charger_id == charger_id:
-                        return True
-                return False
-
-            def _waiting_for_charger(enqueued_vehicle: Vehicle) -> bool:
-                if isinstance(enqueued_vehicle.vehicle_state, ChargeQueueing):
-                    if enqueued_vehicle.vehicle_state.charger_id == charger_id:
-                        return True
-                return False
-
-            # collect all estimated remaining charge times for charging vehicles and sort them
-            charging = filter(
-                _using_charger,
-                vehicles_at_station,
-            )
-            charging_time_to_full: Tuple[Seconds, ...] = tuple(
-                sorted(map(_time_to_full_by_charger_id(charger_id), charging))
-            )
-
-            # collect estimated remaining charge times for vehicles enqueued for this charger
-            # leave them sorted by enqueue time
-            enqueued = filter(
-                _waiting_for_charger,
-                vehicles_enqueued,
-            )
-            enqueued_time_to_full: Tuple[Seconds, ...] = tuple(
-                map(_time_to_full_by_charger_id(charger_id), enqueued)
-            )
-
-            # compute the estimated wait time to access a charger for the vehicle we are ranking
-            wait_estimate_for_charger = _greedy_assignment(
-                charging_time_to_full, enqueued_time_to_full, charger_id
+            # the estimated wait to access a charger, maintained by the station as
+            # vehicles begin charging or join the queue; an occupied charger is not
+            # released before the next time step
+            wait_estimate_for_charger = charger_state.estimate_wait_seconds(
+                sim.sim_time, sim.sim_timestep_duration_seconds
             )
 
             # combine wait time with charge time
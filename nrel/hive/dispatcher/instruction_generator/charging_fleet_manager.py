@@ -4,6 +4,8 @@ from dataclasses import dataclass
 import logging
 from typing import Tuple, TYPE_CHECKING
 
+from nrel.hive.dispatcher.instruction_generator.charging_search_type import ChargingSearchType
+from nrel.hive.dispatcher.instruction_generator.time_budget import TimeBudget
 from nrel.hive.reporting import instruction_generator_event_ops
 from nrel.hive.state.vehicle_state.idle import Idle
 from nrel.hive.state.vehicle_state.repositioning import Repositioning
@@ -17,6 +19,7 @@ if TYPE_CHECKING:
 
 from nrel.hive.dispatcher.instruction_generator.instruction_generator import InstructionGenerator
 from nrel.hive.dispatcher.instruction_generator.instruction_generator_ops import (
+    assign_vehicles_to_chargers,
     instruct_vehicles_to_dispatch_to_station,
     get_nearest_valid_station_distance,
 )
@@ -40,6 +43,10 @@ class ChargingFleetManager(InstructionGenerator):
         """
         Generate fleet targets for the dispatcher to execute based on the simulation state.
 
+        with the nearest shortest queue search, all vehicles are screened and assigned to
+        chargers in one batch. otherwise, each vehicle is searched for in turn; if the manager
+        has a time budget, vehicles are searched in order of lowest remaining range, and any
+        vehicles not reached before the budget expires wait for the next run.
 
         :param simulation_state: The current simulation state
         :param environment: The simulation environment
@@ -48,7 +55,7 @@ class ChargingFleetManager(InstructionGenerator):
 
         # find vehicles that fall below the sum of the threshold distance and nearest valid station distance
 
-        def charge_candidate(v: Vehicle) -> bool:
+        def below_soft_threshold(v: Vehicle) -> bool:
             proper_state = isinstance(v.vehicle_state, Idle) or isinstance(
                 v.vehicle_state, Repositioning
             )
@@ -60,9 +67,16 @@ class ChargingFleetManager(InstructionGenerator):
                 log.error(f"mechatronics {v.mechatronics_id} missing for vehicle {v.id}")
                 return False
 
+            # don't even check station distance if vehicle range is over soft threshold
             range_remaining_km = mechatronics.range_remaining_km(v)
-            if range_remaining_km > environment.config.dispatcher.charging_range_km_soft_threshold:
-                # don't even check station distance if vehicle range is over soft threshold
+            return (
+                range_remaining_km <= environment.config.dispatcher.charging_range_km_soft_threshold
+            )
+
+        def charge_candidate(v: Vehicle) -> bool:
+            mechatronics = environment.mechatronics.get(v.mechatronics_id)
+            if mechatronics is None:
+                log.error(f"mechatronics {v.mechatronics_id} missing for vehicle {v.id}")
                 return False
 
             nearest_station_distance = get_nearest_valid_station_distance(
@@ -76,13 +90,54 @@ class ChargingFleetManager(InstructionGenerator):
             )
             is_charge_candidate = (
                 environment.config.dispatcher.charging_range_km_threshold + nearest_station_distance
-            ) >= range_remaining_km
+            ) >= mechatronics.range_remaining_km(v)
             return is_charge_candidate
 
-        low_soc_vehicles = simulation_state.get_vehicles(
-            filter_function=charge_candidate,
+        def _range_remaining_km(v: Vehicle) -> float:
+            mechatronics = environment.mechatronics.get(v.mechatronics_id)
+            return mechatronics.range_remaining_km(v) if mechatronics else float("inf")
+
+        time_budget_seconds = self.config.instruction_generator_time_budgets.get(self.name)
+        budget = TimeBudget.start(time_budget_seconds) if time_budget_seconds is not None else None
+        vehicles = simulation_state.get_vehicles(
+            filter_function=below_soft_threshold,
+            sort=budget is not None,
+            sort_key=_range_remaining_km,
         )
 
+        search_type = environment.config.dispatcher.charging_search_type
+        if search_type == ChargingSearchType.NEAREST_SHORTEST_QUEUE:
+            # screen and assign the vehicles together in one batch, lowest range first if budgeted
+            low_soc_vehicles, charge_instructions, searched = assign_vehicles_to_chargers(
+                vehicles=vehicles,
+                max_search_radius_km=self.config.max_search_radius_km,
+                charging_range_km_threshold=environment.config.dispatcher.charging_range_km_threshold,
+                simulation_state=simulation_state,
+                environment=environment,
+                budget=budget,
+            )
+        else:
+            candidates = []
+            searched = 0
+            for v in vehicles:
+                # the lowest range vehicle is always searched for
+                if budget is not None and searched > 0 and budget.is_expired:
+                    break
+                searched += 1
+                if charge_candidate(v):
+                    candidates.append(v)
+            low_soc_vehicles = tuple(candidates)
+
+            charge_instructions = instruct_vehicles_to_dispatch_to_station(
+                n=len(low_soc_vehicles),
+                max_search_radius_km=self.config.max_search_radius_km,
+                vehicles=low_soc_vehicles,
+                simulation_state=simulation_state,
+                environment=environment,
+                target_soc=environment.config.dispatcher.ideal_fastcharge_soc_limit,
+                charging_search_type=search_type,
+            )
+
         # for each low_soc_vehicle that will conduct a refuel search, report the search event
         for v in low_soc_vehicles:
             report = instruction_generator_event_ops.refuel_search_event(
@@ -90,14 +145,16 @@ class ChargingFleetManager(InstructionGenerator):
             )
             environment.reporter.file_report(report)
 
-        charge_instructions = instruct_vehicles_to_dispatch_to_station(
-            n=len(low_soc_vehicles),
-            max_search_radius_km=self.config.max_search_radius_km,
-            vehicles=low_soc_vehicles,
-            simulation_state=simulation_state,
-            environment=environment,
-            target_soc=environment.config.dispatcher.ideal_fastcharge_soc_limit,
-            charging_search_type=environment.config.dispatcher.charging_search_type,
-        )
+        if budget is not None:
+            report = instruction_generator_event_ops.instruction_generator_budget_event(
+                instruction_generator=self.name,
+                budget=budget,
+                sim=simulation_state,
+                quality={
+                    "vehicles_searched": str(searched),
+                    "vehicles_total": str(len(vehicles)),
+                },
+            )
+            environment.reporter.file_report(report)
 
         return self, charge_instructions
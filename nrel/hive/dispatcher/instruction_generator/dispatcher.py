@@ -1,11 +1,24 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 
 import logging
 import functools as ft
 from typing import Tuple, TYPE_CHECKING, Optional
 
+import immutables
+
 from nrel.hive.dispatcher.instruction_generator import assignment_ops
+from nrel.hive.dispatcher.instruction_generator.anytime_assignment_ops import (
+    find_anytime_assignment,
+)
+from nrel.hive.dispatcher.instruction_generator.assignment_algorithm import AssignmentAlgorithm
+from nrel.hive.dispatcher.instruction_generator.incremental_assignment_ops import (
+    IncrementalAssignmentState,
+    find_incremental_assignment,
+)
+from nrel.hive.dispatcher.instruction_generator.time_budget import TimeBudget
+from nrel.hive.model.membership import Membership
+from nrel.hive.reporting import instruction_generator_event_ops
 from nrel.hive.state.vehicle_state.charging_base import ChargingBase
 
 if TYPE_CHECKING:
@@ -31,6 +44,12 @@ class Dispatcher(InstructionGenerator):
 
     config: DispatcherConfig
 
+    # the incremental assignment state of each fleet; it only warm-starts the next solve,
+    # so it is left out of comparisons between dispatchers
+    assignment_states: immutables.Map[Optional[MembershipId], IncrementalAssignmentState] = field(
+        default=immutables.Map(), compare=False, repr=False
+    )
+
     def generate_instructions(
         self,
         simulation_state: SimulationState,
@@ -39,6 +58,10 @@ class Dispatcher(InstructionGenerator):
         """
         Generate fleet targets for the dispatcher to execute based on the simulation state.
 
+        if the dispatcher has a time budget, it is shared between the fleets, and each fleet is
+        matched greedily before being refined to the optimal assignment as time allows. a
+        budgeted match is always refined with the hungarian algorithm.
+
         :param environment:
         :param simulation_state: The current simulation state
         :return: the updated Dispatcher along with instructions
@@ -47,21 +70,28 @@ class Dispatcher(InstructionGenerator):
             environment.config.dispatcher.base_charging_range_km_threshold
         )
 
+        time_budget_seconds = self.config.instruction_generator_time_budgets.get(self.name)
+        budget = TimeBudget.start(time_budget_seconds) if time_budget_seconds is not None else None
+
         def _solve_assignment(
-            inst_acc: Tuple[DispatchTripInstruction, ...],
-            membership_id: Optional[MembershipId],
-        ) -> Tuple[DispatchTripInstruction, ...]:
+            accumulator: Tuple[
+                Tuple[DispatchTripInstruction, ...],
+                immutables.Map[Optional[MembershipId], IncrementalAssignmentState],
+            ],
+            fleet: Tuple[int, Optional[MembershipId]],
+        ) -> Tuple[
+            Tuple[DispatchTripInstruction, ...],
+            immutables.Map[Optional[MembershipId], IncrementalAssignmentState],
+        ]:
+            inst_acc, states = accumulator
+            fleet_index, membership_id = fleet
+
             def _is_valid_for_dispatch(vehicle: Vehicle) -> bool:
                 vehicle_state_str = vehicle.vehicle_state.__class__.__name__.lower()
                 if vehicle_state_str not in environment.config.dispatcher.valid_dispatch_states:
                     return False
                 elif not vehicle.driver_state.available:
                     return False
-                elif (
-                    membership_id is not None
-                    and not vehicle.membership.grant_access_to_membership_id(membership_id)
-                ):
-                    return False
 
                 mechatronics = environment.mechatronics.get(vehicle.mechatronics_id)
                 if mechatronics is None:
@@ -82,17 +112,15 @@ class Dispatcher(InstructionGenerator):
                 )
 
             def _valid_request(r: Request) -> bool:
-                not_already_dispatched = not r.dispatched_vehicle
-                valid_access = (
-                    r.membership.grant_access_to_membership_id(membership_id)
-                    if membership_id is not None
-                    else True
-                )
-                return not_already_dispatched and valid_access
+                return not r.dispatched_vehicle
 
-            # collect the vehicles and requests for the assignment algorithm
+            # collect the vehicles and requests of this fleet for the assignment algorithm
+            fleet_membership = (
+                Membership.single_membership(membership_id) if membership_id is not None else None
+            )
             available_vehicles = simulation_state.get_vehicles(
                 filter_function=_is_valid_for_dispatch,
+                membership=fleet_membership,
             )
 
             unassigned_requests = simulation_state.get_requests(
@@ -100,14 +128,47 @@ class Dispatcher(InstructionGenerator):
                 sort_key=lambda r: r.value,
                 sort_reversed=True,
                 filter_function=_valid_request,
+                membership=fleet_membership,
             )
 
             # select assignment of vehicles to requests
-            solution = assignment_ops.find_assignment(
-                available_vehicles,
-                unassigned_requests,
-                assignment_ops.h3_distance_cost,
-            )
+            if budget is not None:
+                fleet_budget = budget.share(len(fleet_ids) - fleet_index)
+                anytime_solution = find_anytime_assignment(
+                    available_vehicles,
+                    unassigned_requests,
+                    assignment_ops.h3_distance_cost,
+                    fleet_budget,
+                )
+                solution = anytime_solution.solution
+                report = instruction_generator_event_ops.instruction_generator_budget_event(
+                    instruction_generator=self.name,
+                    budget=fleet_budget,
+                    sim=simulation_state,
+                    quality={
+                        "phase": anytime_solution.phase.to_string(),
+                        "assignments": str(len(solution.solution)),
+                        "solution_cost": str(solution.solution_cost),
+                        "greedy_cost": str(anytime_solution.greedy_cost),
+                    },
+                    membership_id=membership_id,
+                )
+                environment.reporter.file_report(report)
+            elif self.config.assignment_algorithm == AssignmentAlgorithm.INCREMENTAL:
+                solution, state = find_incremental_assignment(
+                    available_vehicles,
+                    unassigned_requests,
+                    assignment_ops.h3_distance_cost,
+                    states.get(membership_id, IncrementalAssignmentState()),
+                )
+                states = states.set(membership_id, state)
+            else:
+                solution = assignment_ops.find_assignment(
+                    available_vehicles,
+                    unassigned_requests,
+                    assignment_ops.h3_distance_cost,
+                    assignment_ops.h3_distance_cost_table,
+                )
             instructions = ft.reduce(
                 lambda acc, pair: (
                     *acc,
@@ -117,19 +178,22 @@ class Dispatcher(InstructionGenerator):
                 inst_acc,
             )
 
-            return instructions
+            return instructions, states
 
         if len(environment.fleet_ids) > 0:
-            fleet_ids = environment.fleet_ids
+            fleet_ids: Tuple[Optional[MembershipId], ...] = tuple(environment.fleet_ids)
         else:
-            fleet_ids = frozenset([None])
+            fleet_ids = (None,)
 
         initial_instructions: Tuple[DispatchTripInstruction, ...] = tuple()
 
-        all_instructions = ft.reduce(
+        all_instructions, updated_states = ft.reduce(
             _solve_assignment,
-            fleet_ids,
-            initial_instructions,
+            enumerate(fleet_ids),
+            (initial_instructions, self.assignment_states),
         )
 
-        return self, all_instructions
+        if updated_states is self.assignment_states:
+            return self, all_instructions
+        else:
+            return replace(self, assignment_states=updated_states), all_instructions
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, NamedTuple, Tuple, TYPE_CHECKING
+
+import immutables
+import numpy as np
+
+from nrel.hive.dispatcher.instruction_generator.assignment_ops import AssignmentSolution
+
+if TYPE_CHECKING:
+    from nrel.hive.model.entity import Entity
+    from nrel.hive.util.typealiases import EntityId, GeoId
+
+# relative tolerance when testing if a restored pair is still a least reduced cost pair
+DUAL_TOLERANCE = 1e-9
+
+
+class IncrementalAssignmentState(NamedTuple):
+    """
+    the solver state carried between calls to find_incremental_assignment.
+
+    the costs of assignee/target pairs where neither entity has moved are reused, and the
+    matching and column prices (dual variables) of the previous solve are restored, so that
+    only the pairs which were invalidated since the previous solve are searched for again.
+
+    like scipy's linear_sum_assignment, the problem is solved with the smaller side as rows,
+    so the prices belong to the assignees when there are more assignees than targets.
+
+    :param assignee_ids: the assignee of each row of the cost table
+    :param assignee_geoids: the location of each assignee when its costs were computed
+    :param target_ids: the target of each column of the cost table
+    :param target_geoids: the location of each target when its costs were computed
+    :param costs: the cost of each assignee/target pair
+    :param transposed: True if the targets were the rows of the previous solve
+    :param prices: the dual price of each entity on the column side of the previous solve
+    :param matching: the target matched to each assignee by the previous solve
+    """
+
+    assignee_ids: Tuple[EntityId, ...] = ()
+    assignee_geoids: Tuple[GeoId, ...] = ()
+    target_ids: Tuple[EntityId, ...] = ()
+    target_geoids: Tuple[GeoId, ...] = ()
+    costs: np.ndarray = np.zeros((0, 0))
+    transposed: bool = False
+    prices: immutables.Map[EntityId, float] = immutables.Map()
+    matching: immutables.Map[EntityId, EntityId] = immutables.Map()
+
+
+def find_incremental_assignment(
+    assignees: Tuple[Entity, ...],
+    targets: Tuple[Entity, ...],
+    cost_fn: Callable[[Entity, Entity], float],
+    state: IncrementalAssignmentState = IncrementalAssignmentState(),
+) -> Tuple[AssignmentSolution, IncrementalAssignmentState]:
+    """
+    solves the same assignment problem as assignment_ops.find_assignment, warm-started from
+    the state of a previous solve.
+
+    pairs from the previous solve are kept while they remain consistent with the stored
+    prices, and each remaining row is matched by a shortest augmenting path search (the
+    Jonker-Volgenant method also used by linear_sum_assignment), so the solution is optimal
+    while the work done scales with the number of pairs invalidated since the last solve.
+
+    costs are cached by the location of each entity, so cost_fn must only depend on
+    the geoids of the entities.
+
+    :param assignees: entities we are assigning to. assumed to have an id field.
+    :param targets: the different entities that each assignee can be assigned to. assumed to have an id field.
+    :param cost_fn: computes the cost of choosing a specific assignee (slot 1) with a specific target (slot 2)
+    :param state: the solver state returned by the previous solve
+    :return: the solution, along with the solver state for the next solve
+    """
+    if len(assignees) == 0 or len(targets) == 0:
+        return AssignmentSolution(), IncrementalAssignmentState()
+
+    costs = _update_costs(assignees, targets, cost_fn, state)
+
+    # as in find_assignment, infinite costs are replaced with an upper bound beyond all finite costs
+    finite = costs[np.isfinite(costs)]
+    upper_bound = finite.max() + 1 if len(finite) > 0 else 0.0
+    table = np.where(np.isfinite(costs), costs, upper_bound)
+
+    # solve with the smaller side as rows, so that every row is matched
+    transposed = len(assignees) > len(targets)
+    if transposed:
+        matrix = table.T
+        rows, cols = targets, assignees
+        partners = {target_id: assignee_id for assignee_id, target_id in state.matching.items()}
+    else:
+        matrix = table
+        rows, cols = assignees, targets
+        partners = dict(state.matching.items())
+
+    # prices only carry over while the same side is on the columns
+    is_warm = state.transposed == transposed
+    prices, col4row, row_duals = _warm_start(
+        matrix,
+        tuple(r.id for r in rows),
+        tuple(c.id for c in cols),
+        partners if is_warm else {},
+        state.prices if is_warm else immutables.Map(),
+    )
+    col4row = _solve(matrix, prices, col4row, row_duals)
+
+    pairs = sorted((j, i) if transposed else (i, j) for i, j in enumerate(col4row.tolist()))
+    solution = AssignmentSolution()
+    for assignee_index, target_index in pairs:
+        pair = (assignees[assignee_index].id, targets[target_index].id)
+        solution = solution.add(pair, table[assignee_index, target_index])
+
+    updated_state = IncrementalAssignmentState(
+        assignee_ids=tuple(a.id for a in assignees),
+        assignee_geoids=tuple(a.geoid for a in assignees),
+        target_ids=tuple(t.id for t in targets),
+        target_geoids=tuple(t.geoid for t in targets),
+        costs=costs,
+        transposed=transposed,
+        prices=immutables.Map(zip((c.id for c in cols), prices.tolist())),
+        matching=immutables.Map({assignees[a].id: targets[t].id for a, t in pairs}),
+    )
+    return solution, updated_state
+
+
+def _update_costs(
+    assignees: Tuple[Entity, ...],
+    targets: Tuple[Entity, ...],
+    cost_fn: Callable[[Entity, Entity], float],
+    state: IncrementalAssignmentState,
+) -> np.ndarray:
+    """
+    builds the cost table, only calling the cost function for pairs where either
+    entity is new or has moved since the previous solve
+
+    :return: the cost of each assignee/target pair
+    """
+
+    def _reused(
+        entities: Tuple[Entity, ...], ids: Tuple[EntityId, ...], geoids: Tuple[GeoId, ...]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        previous = {entity_id: index for index, entity_id in enumerate(ids)}
+        new_indices, old_indices = [], []
+        for index, entity in enumerate(entities):
+            old_index = previous.get(entity.id)
+            if old_index is not None and geoids[old_index] == entity.geoid:
+                new_indices.append(index)
+                old_indices.append(old_index)
+        return np.array(new_indices, dtype=np.int64), np.array(old_indices, dtype=np.int64)
+
+    rows, old_rows = _reused(assignees, state.assignee_ids, state.assignee_geoids)
+    cols, old_cols = _reused(targets, state.target_ids, state.target_geoids)
+
+    costs = np.full((len(assignees), len(targets)), np.nan)
+    costs[np.ix_(rows, cols)] = state.costs[np.ix_(old_rows, old_cols)]
+
+    reused_rows = np.zeros(len(assignees), dtype=bool)
+    reused_rows[rows] = True
+    new_cols = np.setdiff1d(np.arange(len(targets)), cols)
+    for i, assignee in enumerate(assignees):
+        columns = new_cols if reused_rows[i] else np.arange(len(targets))
+        for j in columns.tolist():
+            costs[i, j] = cost_fn(assignee, targets[j])
+
+    return costs
+
+
+def _warm_start(
+    matrix: np.ndarray,
+    row_ids: Tuple[EntityId, ...],
+    col_ids: Tuple[EntityId, ...],
+    partners: Dict[EntityId, EntityId],
+    prices_by_id: immutables.Map[EntityId, float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    restores the prices and matching of the previous solve for the entities which remain.
+
+    the augmenting path search needs every matched row to sit on a least reduced cost column.
+    when there are more columns than rows, the unmatched columns must also all have the
+    highest price, zero, so released columns are raised to zero. any restored pair which
+    is no longer a least reduced cost pair is released, until both conditions hold.
+
+    on a square problem there is no condition on the unmatched columns, so new columns
+    are priced as low as possible without drawing any matched row away from its pair.
+
+    :return: the price of each column, the column matched to each row or -1, and the row duals
+    """
+    n_rows, n_cols = matrix.shape
+    is_square = n_rows == n_cols
+    is_new = np.array([col_id not in prices_by_id for col_id in col_ids], dtype=bool)
+    prices = np.array([prices_by_id.get(col_id, 0.0) for col_id in col_ids], dtype=np.float64)
+    if is_square:
+        # new columns are left out until the restored pairs are settled
+        prices[is_new] = -np.inf
+
+    col4row = np.full(n_rows, -1, dtype=np.int64)
+    columns = {col_id: j for j, col_id in enumerate(col_ids)}
+    for i, row_id in enumerate(row_ids):
+        partner = partners.get(row_id)
+        j = columns.get(partner) if partner is not None else None
+        if j is not None:
+            col4row[i] = j
+
+    tolerance = DUAL_TOLERANCE * max(1.0, float(np.abs(matrix).max()))
+    while True:
+        matched = np.flatnonzero(col4row >= 0)
+        if not is_square:
+            owned = np.zeros(n_cols, dtype=bool)
+            owned[col4row[matched]] = True
+            prices[~owned] = 0.0
+
+        matched_reduced = matrix[matched, col4row[matched]] - prices[col4row[matched]]
+        least_reduced = (matrix[matched] - prices).min(axis=1)
+        released = matched_reduced > least_reduced + tolerance
+        if not released.any():
+            break
+        col4row[matched[released]] = -1
+
+    row_duals = np.zeros(n_rows)
+    row_duals[matched] = matched_reduced
+    if is_square and is_new.any():
+        if len(matched) > 0:
+            reduced = matrix[matched][:, is_new] - matched_reduced[:, None]
+            prices[is_new] = reduced.min(axis=0)
+        else:
+            prices[is_new] = 0.0
+
+    return prices, col4row, row_duals
+
+
+def _solve(
+    matrix: np.ndarray, prices: np.ndarray, col4row: np.ndarray, row_duals: np.ndarray
+) -> np.ndarray:
+    """
+    completes a partial matching with one shortest augmenting path search per unmatched row,
+    following Crouse's formulation of the Jonker-Volgenant algorithm (as in scipy's
+    linear_sum_assignment), for a problem with no more rows than columns.
+
+    :param matrix: the cost of each row/column pair
+    :param prices: the dual price of each column, updated in place
+    :param col4row: the column matched to each row, or -1, updated in place
+    :param row_duals: the dual variable of each matched row, updated in place
+    :return: the column matched to each row
+    """
+    n_cols = matrix.shape[1]
+    row4col = np.full(n_cols, -1, dtype=np.int64)
+    matched = np.flatnonzero(col4row >= 0)
+    row4col[col4row[matched]] = matched
+
+    for current_row in np.flatnonzero(col4row < 0).tolist():
+        shortest = np.full(n_cols, np.inf)
+        path = np.full(n_cols, -1, dtype=np.int64)
+        remaining = np.ones(n_cols, dtype=bool)
+        visited_rows = []
+        min_value = 0.0
+        i = current_row
+        sink = -1
+        while sink < 0:
+            visited_rows.append(i)
+            reduced = min_value + matrix[i] - row_duals[i] - prices
+            improved = remaining & (reduced < shortest)
+            shortest[improved] = reduced[improved]
+            path[improved] = i
+
+            # take the nearest unscanned column, preferring an unmatched column among ties
+            candidates = np.where(remaining, shortest, np.inf)
+            min_value = candidates.min()
+            ties = np.flatnonzero(candidates == min_value)
+            free = ties[row4col[ties] < 0]
+            j = int(free[0]) if len(free) > 0 else int(ties[0])
+            remaining[j] = False
+            if row4col[j] < 0:
+                sink = j
+            else:
+                i = int(row4col[j])
+
+        # update the dual variables
+        row_duals[current_row] += min_value
+        for i in visited_rows[1:]:
+            row_duals[i] += min_value - shortest[col4row[i]]
+        scanned = ~remaining
+        prices[scanned] -= min_value - shortest[scanned]
+
+        # augment along the shortest path
+        j = sink
+        while True:
+            i = int(path[j])
+            row4col[j] = i
+            col4row[i], j = j, int(col4row[i])
+            if i == current_row:
+                break
+
+    return col4row
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import functools as ft
 import random
-from typing import List, Callable, NamedTuple
+from typing import Dict, List, Callable, NamedTuple, Optional
 
 import immutables
+import numpy as np
 
 from nrel.hive.dispatcher.instruction.instructions import *
 from nrel.hive.dispatcher.instruction_generator import assignment_ops
@@ -24,7 +25,9 @@ if TYPE_CHECKING:
     from nrel.hive.dispatcher.instruction_generator.instruction_generator import (
         InstructionGenerator,
     )
-    from nrel.hive.util.typealiases import GeoId
+    from nrel.hive.dispatcher.instruction_generator.time_budget import TimeBudget
+    from nrel.hive.model.membership import Membership
+    from nrel.hive.util.typealiases import GeoId, MechatronicsId
     from nrel.hive.util.units import Ratio
 
 i_map: immutables.Map[VehicleId, List[Instruction]] = immutables.Map()
@@ -186,9 +189,7 @@ def instruct_vehicles_to_dispatch_to_station(
         if len(instructions) >= n:
             break
 
-        valid_stations = simulation_state.get_stations(
-            filter_function=lambda s: s.membership.grant_access_to_membership(veh.membership)
-        )
+        valid_stations = simulation_state.get_stations(membership=veh.membership)
         if len(valid_stations) == 0:
             break
 
@@ -268,6 +269,160 @@ def instruct_vehicles_to_dispatch_to_station(
     return instructions
 
 
+def assign_vehicles_to_chargers(
+    vehicles: Tuple[Vehicle, ...],
+    max_search_radius_km: float,
+    charging_range_km_threshold: Kilometers,
+    simulation_state: SimulationState,
+    environment: Environment,
+    budget: Optional[TimeBudget] = None,
+) -> Tuple[Tuple[Vehicle, ...], Tuple[Instruction, ...], int]:
+    """
+    a batched alternative to screening each vehicle with get_nearest_valid_station_distance and
+    then instructing it with instruct_vehicles_to_dispatch_to_station, for the nearest shortest
+    queue charging search.
+
+    a vehicle x (station, charger) ranking is built at once, using the nearest shortest queue
+    ranking with great circle distance. each vehicle is screened against the great circle
+    distance to its best ranked charger, and the vehicles which need to charge are then assigned
+    together by a minimum cost assignment. each charger offers a slot per available plug and a
+    few queue slots, ranked as if the vehicle had to join its queue, so that vehicles spread
+    across chargers instead of all choosing the same one. the queue slots are shared out so
+    that there is a slot for every vehicle, keeping the assignment to
+    O(vehicles x (available plugs + vehicles)) costs rather than one slot per vehicle at
+    every charger.
+
+    with a time budget, vehicles are screened in the order given until the budget expires,
+    and only the screened vehicles are assigned. the first vehicle is always screened.
+
+    :param vehicles: the vehicles which may need to charge, lowest range first if budgeted
+    :param max_search_radius_km: the max kilometers to search for a station
+    :param charging_range_km_threshold: vehicles charge when their range is below this plus the distance to their best station
+    :param simulation_state: the simulation state
+    :param environment: the simulation environment
+    :param budget: optionally, the running time budget for screening vehicles
+    :return: the vehicles which need to charge, instructions for those that found a charger,
+             and the number of vehicles screened
+    """
+    if len(vehicles) == 0:
+        return (), (), 0
+    stations = simulation_state.get_stations()
+
+    # one column per on-shift charger at each station
+    col_station, col_charger_id, col_charger = [], [], []
+    col_total, col_enqueued, col_available = [], [], []
+    for station_index, station in enumerate(stations):
+        for charger_id in station.on_shift_access_chargers:
+            charger_state = station.state.get(charger_id)
+            charger = environment.chargers.get(charger_id)
+            if charger_state is None or charger is None or charger_state.total_chargers == 0:
+                continue
+            col_station.append(station_index)
+            col_charger_id.append(charger_id)
+            col_charger.append(charger)
+            col_total.append(charger_state.total_chargers)
+            col_enqueued.append(charger_state.enqueued_vehicles)
+            col_available.append(charger_state.available_chargers)
+    if len(col_station) == 0:
+        # as with get_nearest_valid_station_distance, a vehicle with no station must charge
+        return vehicles, (), len(vehicles)
+
+    stations_by_col = np.array(col_station, dtype=np.int64)
+    total = np.array(col_total, dtype=np.float64)
+    enqueued = np.array(col_enqueued, dtype=np.float64)
+    available = np.array(col_available, dtype=np.int64)
+
+    # which columns each vehicle may use, computed once per membership and mechatronics type
+    access_by_membership: Dict[Membership, np.ndarray] = {}
+    chargers_by_mechatronics: Dict[MechatronicsId, np.ndarray] = {}
+    valid = np.zeros((len(vehicles), len(col_station)), dtype=bool)
+    for i, vehicle in enumerate(vehicles):
+        access = access_by_membership.get(vehicle.membership)
+        if access is None:
+            station_access = np.array(
+                [s.membership.grant_access_to_membership(vehicle.membership) for s in stations]
+            )
+            access = station_access[stations_by_col]
+            access_by_membership[vehicle.membership] = access
+        usable = chargers_by_mechatronics.get(vehicle.mechatronics_id)
+        if usable is None:
+            mechatronics = environment.mechatronics.get(vehicle.mechatronics_id)
+            usable = np.array(
+                [mechatronics is not None and mechatronics.valid_charger(c) for c in col_charger]
+            )
+            chargers_by_mechatronics[vehicle.mechatronics_id] = usable
+        valid[i] = access & usable
+
+    station_distance = H3Ops.great_circle_distance_matrix(
+        [v.geoid for v in vehicles], [s.geoid for s in stations]
+    )
+    distance = station_distance[:, stations_by_col]
+    valid &= distance <= max_search_radius_km
+    rank = np.where(valid, distance * (1 + enqueued / total), np.inf)
+
+    # screen each vehicle against the distance to its best ranked station
+    best_col = np.argmin(rank, axis=1)
+    best_rank = rank[np.arange(len(vehicles)), best_col]
+    has_station = np.isfinite(best_rank)
+    screen_distance = np.where(
+        has_station, distance[np.arange(len(vehicles)), best_col], 99999999999999
+    )
+    candidates, candidate_rows = [], []
+    searched = 0
+    for i, vehicle in enumerate(vehicles):
+        if budget is not None and searched > 0 and budget.is_expired:
+            break
+        searched += 1
+        mechatronics = environment.mechatronics.get(vehicle.mechatronics_id)
+        if mechatronics is None:
+            log.error(f"mechatronics {vehicle.mechatronics_id} missing for vehicle {vehicle.id}")
+            continue
+        range_remaining_km = mechatronics.range_remaining_km(vehicle)
+        if charging_range_km_threshold + screen_distance[i] >= range_remaining_km:
+            candidates.append(vehicle)
+            if has_station[i]:
+                candidate_rows.append(i)
+
+    if len(candidate_rows) == 0:
+        return tuple(candidates), (), searched
+
+    # expand each charger into a slot per available plug and a share of queue slots, enough
+    # for every candidate across all chargers. the queue slots of a charger are ranked as if
+    # the vehicle had joined the end of its queue
+    n = len(candidate_rows)
+    n_cols = len(col_station)
+    queue_slots = -(-n // n_cols)
+    slots_per_col = np.minimum(n, np.maximum(available, 0) + queue_slots)
+    slot_col = np.repeat(np.arange(n_cols), slots_per_col)
+    slot_start = np.cumsum(slots_per_col) - slots_per_col
+    slot_position = np.arange(len(slot_col)) - slot_start[slot_col]
+    queued = np.maximum(0, slot_position - available[slot_col] + 1)
+    slot_factor = 1 + (enqueued[slot_col] + queued) / total[slot_col]
+    candidate_distance = np.where(valid[candidate_rows], distance[candidate_rows], np.inf)
+    slot_rank = candidate_distance[:, slot_col] * slot_factor[np.newaxis, :]
+
+    # as in find_assignment, infinite costs are replaced with an upper bound beyond all finite costs
+    finite = np.isfinite(slot_rank)
+    upper_bound = slot_rank[finite].max() + 1
+    from scipy.optimize import linear_sum_assignment
+
+    rows, cols = linear_sum_assignment(np.where(finite, slot_rank, upper_bound))
+
+    instructions: List[Instruction] = []
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        if not finite[row, col]:
+            continue
+        charger_col = slot_col[col]
+        instruction = DispatchStationInstruction(
+            vehicle_id=vehicles[candidate_rows[row]].id,
+            station_id=stations[stations_by_col[charger_col]].id,
+            charger_id=col_charger_id[charger_col],
+        )
+        instructions.append(instruction)
+
+    return tuple(candidates), tuple(instructions), searched
+
+
 def get_nearest_valid_station_distance(
     max_search_radius_km: float,
     vehicle: Vehicle,
@@ -290,9 +445,7 @@ def get_nearest_valid_station_distance(
     :return: the distance in km to the nearest valid station
     """
 
-    valid_stations = simulation_state.get_stations(
-        filter_function=lambda s: s.membership.grant_access_to_membership(vehicle.membership)
-    )
+    valid_stations = simulation_state.get_stations(membership=vehicle.membership)
     if len(valid_stations) == 0:
         return 99999999999999
 
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Dict, FrozenSet, NamedTuple, Optional, TYPE_CHECKING
+
+from nrel.hive.model.sim_time import SimTime
+from nrel.hive.util.units import Ratio, Seconds
+
+if TYPE_CHECKING:
+    from nrel.hive.runner.environment import Environment
+    from nrel.hive.state.simulation_state.simulation_state import SimulationState
+
+
+class WakeEvent(Enum):
+    NEW_REQUESTS = 1
+    LOW_SOC = 2
+
+    @staticmethod
+    def from_string(string: str) -> WakeEvent:
+        """
+        parses an input configuration string as a WakeEvent
+
+        :param string: the input string
+        :return: a WakeEvent
+        :raises: NameError when the wake event is unknown
+        """
+        cleaned = string.lower()
+        if cleaned == "new_requests":
+            return WakeEvent.NEW_REQUESTS
+        elif cleaned == "low_soc":
+            return WakeEvent.LOW_SOC
+        else:
+            valid_names = "{new_requests|low_soc}"
+            raise NameError(f"wake event {string} is not known, must be one of {valid_names}")
+
+    def to_string(self) -> str:
+        return self.name.lower()
+
+
+class InstructionGeneratorSchedule(NamedTuple):
+    """
+    the cadence at which an InstructionGenerator runs. a generator runs on the first time step
+    of each update interval, counted from the offset, and additionally on any time step where one
+    of its wake events has occurred since it last ran. on all other time steps it is skipped.
+
+    :param update_interval_seconds: the time between scheduled runs
+    :param offset_seconds: the sim time of the first scheduled run
+    :param wake_on: events which run the generator between scheduled runs
+    :param low_soc_threshold: the state of charge a moving vehicle falls below to raise a LOW_SOC event
+    """
+
+    update_interval_seconds: Seconds
+    offset_seconds: Seconds = 0
+    wake_on: FrozenSet[WakeEvent] = frozenset()
+    low_soc_threshold: Ratio = 0.2
+
+    @classmethod
+    def from_dict(
+        cls, d: Dict, default_update_interval_seconds: Seconds
+    ) -> InstructionGeneratorSchedule:
+        """
+        builds a schedule from a scenario configuration entry
+
+        :param d: the configuration entry
+        :param default_update_interval_seconds: the interval used if the entry does not set one
+        :return: the schedule
+        :raises IOError: if the update interval is not positive
+        """
+        interval = int(d.get("update_interval_seconds", default_update_interval_seconds))
+        if interval <= 0:
+            raise IOError(
+                f"instruction generator update interval must be positive, found {interval}"
+            )
+        return InstructionGeneratorSchedule(
+            update_interval_seconds=interval,
+            offset_seconds=int(d.get("offset_seconds", 0)),
+            wake_on=frozenset(WakeEvent.from_string(e) for e in d.get("wake_on", ())),
+            low_soc_threshold=float(d.get("low_soc_threshold", 0.2)),
+        )
+
+    def asdict(self) -> Dict:
+        return {
+            "update_interval_seconds": self.update_interval_seconds,
+            "offset_seconds": self.offset_seconds,
+            "wake_on": sorted(e.to_string() for e in self.wake_on),
+            "low_soc_threshold": self.low_soc_threshold,
+        }
+
+    def is_scheduled(self, sim_time: SimTime, last_run_time: Optional[SimTime]) -> bool:
+        """
+        tests if an update interval has begun since the generator last ran
+
+        :param sim_time: the current sim time
+        :param last_run_time: the sim time the generator last ran, or None if it has never run
+        :return: True if the generator is scheduled to run
+        """
+        if sim_time < self.offset_seconds:
+            return False
+        elif last_run_time is None or last_run_time < self.offset_seconds:
+            return True
+        else:
+            interval = self.update_interval_seconds
+            this_interval = (sim_time - self.offset_seconds) // interval
+            last_interval = (last_run_time - self.offset_seconds) // interval
+            return this_interval > last_interval
+
+    def next_scheduled_time(self, last_run_time: Optional[SimTime]) -> SimTime:
+        """
+        the start of the next update interval after the generator last ran
+
+        :param last_run_time: the sim time the generator last ran, or None if it has never run
+        :return: the sim time of the next scheduled run
+        """
+        if last_run_time is None or last_run_time < self.offset_seconds:
+            return SimTime(self.offset_seconds)
+        else:
+            interval = self.update_interval_seconds
+            last_interval = (last_run_time - self.offset_seconds) // interval
+            return SimTime(self.offset_seconds + (last_interval + 1) * interval)
+
+    def is_woken(
+        self, sim: SimulationState, env: Environment, last_run_time: Optional[SimTime]
+    ) -> bool:
+        """
+        tests if any of the wake events of this schedule occurred since the generator last ran.
+
+        the events are read from signals which the simulation state records as it changes:
+        the sim time a request was last added, and the sim time a moving vehicle last fell
+        below the low state of charge threshold, so this test does not visit any entity.
+
+        :param sim: the current simulation state
+        :param env: the simulation environment
+        :param last_run_time: the sim time the generator last ran, or None if it has never run
+        :return: True if the generator should run before its next scheduled time
+        """
+        if last_run_time is None:
+            return False
+        if WakeEvent.NEW_REQUESTS in self.wake_on:
+            # requests are added before the generators run, so a request added at
+            # last_run_time was already seen
+            added_time = sim.last_request_added_time
+            if added_time is not None and added_time > last_run_time:
+                return True
+        if WakeEvent.LOW_SOC in self.wake_on:
+            # vehicles move after the generators run, so a vehicle which fell below the
+            # threshold at last_run_time has not been seen
+            low_soc_time = sim.low_soc_times.get(self.low_soc_threshold)
+            if low_soc_time is not None and low_soc_time >= last_run_time:
+                return True
+        return False
+
+    def should_run(
+        self, sim: SimulationState, env: Environment, last_run_time: Optional[SimTime]
+    ) -> bool:
+        """
+        tests if the generator should run on this time step
+
+        :param sim: the current simulation state
+        :param env: the simulation environment
+        :param last_run_time: the sim time the generator last ran, or None if it has never run
+        :return: True if the generator should run
+        """
+        return self.is_scheduled(sim.sim_time, last_run_time) or self.is_woken(
+            sim, env, last_run_time
+        )
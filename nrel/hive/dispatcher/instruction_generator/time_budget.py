@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+from typing import NamedTuple
+
+
+class TimeBudget(NamedTuple):
+    """
+    a wall-clock allowance for one run of an instruction generator, measured from when it
+    was started. a budgeted generator checks the budget between units of work and returns
+    the best result found so far once the budget has expired.
+
+    :param time_budget_seconds: the wall-clock seconds allowed, which may be fractional
+    :param start_time: the performance counter value when the budget was started
+    """
+
+    time_budget_seconds: float
+    start_time: float
+
+    @classmethod
+    def start(cls, time_budget_seconds: float) -> TimeBudget:
+        """
+        starts a budget running from now
+
+        :param time_budget_seconds: the wall-clock seconds allowed
+        :return: the running budget
+        """
+        return TimeBudget(time_budget_seconds, time.perf_counter())
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    @property
+    def remaining_seconds(self) -> float:
+        return max(0.0, self.time_budget_seconds - self.elapsed_seconds)
+
+    @property
+    def is_expired(self) -> bool:
+        return self.elapsed_seconds >= self.time_budget_seconds
+
+    @property
+    def is_over_budget(self) -> bool:
+        """
+        True if more time was used than allowed, which can happen as a unit of work is
+        never interrupted once begun
+        """
+        return self.elapsed_seconds > self.time_budget_seconds
+
+    def share(self, n: int) -> TimeBudget:
+        """
+        splits the remaining time evenly between n pieces of work, returning the budget
+        of the next piece, which starts now
+
+        :param n: the number of pieces of work left, including the next one
+        :return: the budget for the next piece of work
+        """
+        return TimeBudget.start(self.remaining_seconds / max(1, n))
@@ -19,9 +19,7 @@ from nrel.hive.reporting.handler.eventful_handler import EventfulHandler
 from nrel.hive.reporting.handler.instruction_handler import InstructionHandler
 from nrel.hive.reporting.handler.stateful_handler import StatefulHandler
 from nrel.hive.reporting.handler.stats_handler import StatsHandler
-from nrel.hive.reporting.handler.time_step_stats_handler import TimeStepStatsHandler
 from nrel.hive.reporting.reporter import Reporter
-from nrel.hive.model.roadnetwork.osm.osm_roadnetwork import OSMRoadNetwork
 from nrel.hive.model.station.station import Station
 from nrel.hive.model.vehicle.mechatronics import build_mechatronics_table
 from nrel.hive.model.vehicle.schedules import build_schedules_table
@@ -32,6 +30,7 @@ from nrel.hive.state.simulation_state.simulation_state import SimulationState
 from nrel.hive.util.dict_ops import DictOps
 
 if TYPE_CHECKING:
+    from nrel.hive.model.entity_position import EntityPosition
     from nrel.hive.util.typealiases import ScheduleId
     from nrel.hive.model.vehicle.schedules import ScheduleFunction
 
@@ -201,6 +200,9 @@ def initialize_environment_reporting(
     if config.global_config.log_stats:
         reporter.add_handler(StatsHandler())
     if config.global_config.log_time_step_stats or config.global_config.log_fleet_time_step_stats:
+        # imported here since the time step stats are built with pandas, which is slow to import
+        from nrel.hive.reporting.handler.time_step_stats_handler import TimeStepStatsHandler
+
         reporter.add_handler(
             TimeStepStatsHandler(config, config.scenario_output_directory, environment.fleet_ids)
         )
@@ -210,9 +212,9 @@ def initialize_environment_reporting(
     return simulation_state, environment
 
 
-def default_init_functions() -> Iterable[InitFunction]:
+def environment_init_functions() -> Iterable[InitFunction]:
     """
-    Returns the defaul initialization functions in the proper order.
+    Returns the initialization functions which only build the environment, in the proper order.
     """
     return [
         initialize_environment_fleets,
@@ -220,17 +222,37 @@ def default_init_functions() -> Iterable[InitFunction]:
         initialize_environment_mechatronics,
         initialize_environment_chargers,
         initialize_environment_reporting,
+    ]
+
+
+def default_init_functions() -> Iterable[InitFunction]:
+    """
+    Returns the defaul initialization functions in the proper order.
+    """
+    return [
+        *environment_init_functions(),
         vehicle_init_function,
         station_init_function,
         base_init_function,
     ]
 
 
+def scenario_init_functions(config: HiveConfig) -> Iterable[InitFunction]:
+    """
+    Returns the initialization functions for the road network type of a scenario, in the proper order.
+    """
+    if config.network.network_type == "osm_network":
+        return [osm_init_function, *default_init_functions()]
+    else:
+        return default_init_functions()
+
+
 def osm_init_function(
     config: HiveConfig, simulation_state: SimulationState, environment: Environment
 ) -> Tuple[SimulationState, Environment]:
     """
-    Initialize an OSMRoadNetwork and add to the simulation
+    Initialize an OSMRoadNetwork and add to the simulation. a road network file compiled
+    with `hive-compile-network` (.npz) is memory-mapped as an OSMCompactRoadNetwork instead.
 
     :param config: the hive config
     :param simulation_state: the partially-constructed simulation state
@@ -243,9 +265,16 @@ def osm_init_function(
     if config.input_config.road_network_file is None:
         raise IOError("Must supply a road network file when using the osm_network")
 
+    road_network_file = Path(config.input_config.road_network_file)
+    if road_network_file.suffix == ".npz":
+        return shared_osm_init_function(road_network_file)(config, simulation_state, environment)
+
+    # imported here since the OSM road network is built with networkx, which is slow to import
+    from nrel.hive.model.roadnetwork.osm.osm_roadnetwork import OSMRoadNetwork
+
     road_network = OSMRoadNetwork.from_file(
         sim_h3_resolution=config.sim.sim_h3_resolution,
-        road_network_file=Path(config.input_config.road_network_file),
+        road_network_file=road_network_file,
         default_speed_kmph=config.network.default_speed_kmph,
     )
 
@@ -254,6 +283,45 @@ def osm_init_function(
     return sim_w_osm, environment
 
 
+def shared_osm_init_function(road_network_arrays_file: Path) -> InitFunction:
+    """
+    builds an init function which attaches to a road network previously written by
+    OSMRoadNetworkArrays.to_file, such as a network compiled with `hive-compile-network`.
+    the file is memory-mapped, so that all processes which attach to the same file share
+    a single read-only copy of the road network.
+
+    :param road_network_arrays_file: the road network arrays file to attach to
+
+    :return: an init function which adds the shared OSM road network to the simulation
+    """
+
+    def _init(
+        config: HiveConfig, simulation_state: SimulationState, environment: Environment
+    ) -> Tuple[SimulationState, Environment]:
+        from nrel.hive.model.roadnetwork.osm.osm_compact_roadnetwork import (
+            OSMCompactRoadNetwork,
+        )
+
+        road_network = OSMCompactRoadNetwork.from_file(road_network_arrays_file)
+        if road_network.sim_h3_resolution != config.sim.sim_h3_resolution:
+            raise ValueError(
+                f"shared road network {road_network_arrays_file} was built with h3 resolution "
+                f"{road_network.sim_h3_resolution} but the scenario uses {config.sim.sim_h3_resolution}"
+            )
+        if road_network.default_speed_kmph != config.network.default_speed_kmph:
+            raise ValueError(
+                f"shared road network {road_network_arrays_file} was built with default speed "
+                f"{road_network.default_speed_kmph} kmph but the scenario uses "
+                f"{config.network.default_speed_kmph} kmph"
+            )
+
+        sim_w_osm = simulation_state._replace(road_network=road_network)
+
+        return sim_w_osm, environment
+
+    return _init
+
+
 def vehicle_init_function(
     config: HiveConfig, simulation_state: SimulationState, environment: Environment
 ) -> Tuple[SimulationState, Environment]:
@@ -274,8 +342,10 @@ def vehicle_init_function(
         else None
     )
 
-    def _collect_vehicle(row: Dict[str, str]) -> Optional[Vehicle]:
-        veh = Vehicle.from_row(row, simulation_state.road_network, environment)
+    def _collect_vehicle(
+        row: Dict[str, str], position: Optional[EntityPosition]
+    ) -> Optional[Vehicle]:
+        veh = Vehicle.from_row(row, simulation_state.road_network, environment, position)
 
         if vehicle_member_ids is not None:
             if veh.id in vehicle_member_ids:
@@ -283,10 +353,11 @@ def vehicle_init_function(
 
         return veh
 
-    # open vehicles file and add each row
+    # open vehicles file, snap all vehicles to the road network at once and add each row
     with open(vehicles_file, "r", encoding="utf-8-sig") as vf:
-        reader = csv.DictReader(vf)
-        vehicles_or_none = [_collect_vehicle(row) for row in reader]
+        rows = list(csv.DictReader(vf))
+        positions = simulation_state.road_network.positions_from_rows(rows)
+        vehicles_or_none = [_collect_vehicle(row, pos) for row, pos in zip(rows, positions)]
         vehicles = [v for v in vehicles_or_none if v is not None]
         sim_with_vehicles = simulation_state_ops.add_entities(simulation_state, vehicles)
 
@@ -313,8 +384,8 @@ def base_init_function(
         else None
     )
 
-    def _collect_base(row: Dict[str, str]) -> Optional[Base]:
-        base = Base.from_row(row, simulation_state.road_network)
+    def _collect_base(row: Dict[str, str], position: Optional[EntityPosition]) -> Optional[Base]:
+        base = Base.from_row(row, simulation_state.road_network, position)
 
         if base_member_ids is not None:
             if base.id in base_member_ids:
@@ -323,8 +394,9 @@ def base_init_function(
 
     # add all bases from the base file
     with open(config.input_config.bases_file, "r", encoding="utf-8-sig") as bf:
-        reader = csv.DictReader(bf)
-        bases_or_none = [_collect_base(row) for row in reader]
+        rows = list(csv.DictReader(bf))
+        positions = simulation_state.road_network.positions_from_rows(rows)
+        bases_or_none = [_collect_base(row, pos) for row, pos in zip(rows, positions)]
         bases = [b for b in bases_or_none if b is not None]
 
     sim_w_bases = simulation_state_ops.add_entities(simulation_state, bases)
@@ -419,9 +491,13 @@ def station_init_function(
     )
 
     def _add_row_unsafe(
-        builder: immutables.Map[str, Station], row: Dict[str, str]
+        builder: immutables.Map[str, Station],
+        row_and_position: Tuple[Dict[str, str], Optional[EntityPosition]],
     ) -> immutables.Map[str, Station]:
-        station = Station.from_row(row, builder, simulation_state.road_network, environment)
+        row, position = row_and_position
+        station = Station.from_row(
+            row, builder, simulation_state.road_network, environment, position
+        )
 
         if station_member_ids is not None:
             if station.id in station_member_ids:
@@ -432,9 +508,10 @@ def station_init_function(
 
     # grab all stations (some may exist on multiple rows)
     with open(config.input_config.stations_file, "r", encoding="utf-8-sig") as bf:
-        reader = csv.DictReader(bf)
+        rows = list(csv.DictReader(bf))
+        positions = simulation_state.road_network.positions_from_rows(rows)
         stations_builder: immutables.Map[str, Station] = ft.reduce(
-            _add_row_unsafe, reader, immutables.Map()
+            _add_row_unsafe, zip(rows, positions), immutables.Map()
         )
 
     # add all stations to the simulation once we know they are complete
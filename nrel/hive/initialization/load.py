@@ -1,3 +1,4 @@
+import functools as ft
 import logging
 import os
 from pathlib import Path
@@ -8,14 +9,19 @@ import yaml
 from nrel.hive.config import HiveConfig
 from nrel.hive.reporting import reporter_ops
 from nrel.hive.initialization.initialize_simulation import (
-    default_init_functions,
-    osm_init_function,
+    environment_init_functions,
+    scenario_init_functions,
     initialize,
     InitFunction,
 )
+from nrel.hive.initialization.scenario_bundle import load_scenario_bundle
 from nrel.hive.dispatcher.instruction_generator.instruction_generator import InstructionGenerator
 from nrel.hive.util.fp import throw_on_failure
+from nrel.hive.runner.environment import Environment
 from nrel.hive.runner.runner_payload import RunnerPayload
+from nrel.hive.state.simulation_state.simulation_state import SimulationState
+from nrel.hive.state.simulation_state.update.charging_price_update import ChargingPriceUpdate
+from nrel.hive.state.simulation_state.update.step_simulation import StepSimulation
 from nrel.hive.state.simulation_state.update.update import Update
 from nrel.hive.dispatcher.instruction_generator.charging_fleet_manager import ChargingFleetManager
 from nrel.hive.dispatcher.instruction_generator.dispatcher import Dispatcher
@@ -75,15 +81,14 @@ def load_simulation(
 
     if custom_init_functions is not None:
         # prefer the custom init functions
-        init_functions = custom_init_functions
-    elif config.network.network_type == "osm_network":
-        init_functions = [osm_init_function]
-        init_functions.extend(default_init_functions())
+        sim, env = initialize(config, custom_init_functions)
     else:
-        # just use defaults
-        init_functions = default_init_functions()
-
-    sim, env = initialize(config, init_functions)
+        # use the compiled scenario bundle if enabled and up to date, see hive-compile-scenario
+        bundle = load_scenario_bundle(config) if config.global_config.use_scenario_bundle else None
+        if bundle is not None:
+            sim, env = bundle
+        else:
+            sim, env = initialize(config, scenario_init_functions(config))
 
     if config.global_config.log_station_capacities:
         result = reporter_ops.log_station_capacities(sim, env)
@@ -99,3 +104,100 @@ def load_simulation(
         update = Update.build(env.config, custom_instruction_generators)
 
     return RunnerPayload(sim, env, update)
+
+
+# inputs which must be shared by a warm-start prefix and all of its variants, since
+# the state built from them is carried over into each variant at the fork point
+WARM_START_SHARED_INPUTS = (
+    "vehicles_file",
+    "requests_file",
+    "bases_file",
+    "stations_file",
+    "road_network_file",
+    "rate_structure_file",
+    "fleets_file",
+    "schedules_file",
+    "chargers_file",
+)
+
+
+def load_variant_simulation(
+    prefix_payload: RunnerPayload,
+    config: HiveConfig,
+    custom_instruction_generators: Optional[Tuple[T, ...]] = None,
+) -> RunnerPayload:
+    """
+    continues a partially-run simulation under the configuration of a scenario variant.
+
+    the simulation state and the request stream of the prefix are kept, while the
+    environment (schedules, mechatronics, chargers, reporting), the charging prices
+    and the instruction generators are rebuilt from the variant config. the inputs in
+    WARM_START_SHARED_INPUTS, whose ids and memberships are part of the prefix state, must
+    match those of the prefix. outputs of the variant only cover the period after the prefix.
+
+    :param prefix_payload: the simulation, run up to the point where the variants diverge
+    :param config: the hive config of the variant
+    :param custom_instruction_generators: a set of user defined instruction generators to override the defaults
+
+    :return: the assets required to run the remainder of the variant scenario
+    :raises: Exception if the variant is not compatible with the prefix
+    """
+    prefix_config = prefix_payload.e.config
+    if config.sim.start_time != prefix_config.sim.start_time:
+        raise ValueError(
+            f"variant {config.sim.sim_name} start time {config.sim.start_time} does not match "
+            f"the warm start scenario start time {prefix_config.sim.start_time}"
+        )
+    if config.sim.timestep_duration_seconds != prefix_config.sim.timestep_duration_seconds:
+        raise ValueError(
+            f"variant {config.sim.sim_name} must use the same timestep duration as the warm start scenario"
+        )
+    if config.network.network_type != prefix_config.network.network_type:
+        raise ValueError(
+            f"variant {config.sim.sim_name} must use the same network type as the warm start scenario"
+        )
+    for field in WARM_START_SHARED_INPUTS:
+        variant_file = getattr(config.input_config, field)
+        prefix_file = getattr(prefix_config.input_config, field)
+        if variant_file != prefix_file:
+            raise ValueError(
+                f"variant {config.sim.sim_name} input {field} {variant_file} does not match "
+                f"the warm start scenario input {prefix_file}"
+            )
+    if prefix_payload.s.sim_time >= config.sim.end_time:
+        raise ValueError(
+            f"variant {config.sim.sim_name} ends at {config.sim.end_time} which is not after "
+            f"the warm start time {prefix_payload.s.sim_time}"
+        )
+
+    if config.global_config.write_outputs:
+        config.scenario_output_directory.mkdir()
+
+    initial_env = Environment(config=config)
+
+    def _init(acc: Tuple[SimulationState, Environment], fn: InitFunction):
+        return fn(config, *acc)
+
+    sim, env = ft.reduce(_init, environment_init_functions(), (prefix_payload.s, initial_env))
+
+    if custom_instruction_generators is None:
+        instruction_generators: Tuple[InstructionGenerator, ...] = (
+            Dispatcher(env.config.dispatcher),
+            ChargingFleetManager(env.config.dispatcher),
+        )
+    else:
+        instruction_generators = custom_instruction_generators
+
+    # a fresh price update catches up to the current sim time on the first step, while the
+    # remaining pre-step updates (request stream, cancellation) continue where the prefix left off
+    price_update = ChargingPriceUpdate.build(
+        config.input_config.charging_price_file,
+        config.input_config.chargers_file,
+        lazy_file_reading=config.global_config.lazy_file_reading,
+    )
+    pre_step_update = (price_update,) + tuple(
+        fn for fn in prefix_payload.u.pre_step_update if not isinstance(fn, ChargingPriceUpdate)
+    )
+    update = Update(pre_step_update, StepSimulation.from_tuple(instruction_generators))
+
+    return RunnerPayload(sim, env, update)
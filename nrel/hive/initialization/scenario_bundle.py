@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pickle
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union, TYPE_CHECKING
+
+import yaml
+
+from nrel.hive.initialization.initialize_simulation import (
+    initialize,
+    initialize_environment_reporting,
+    scenario_init_functions,
+    shared_osm_init_function,
+)
+from nrel.hive.model.roadnetwork.haversine_roadnetwork import HaversineRoadNetwork
+from nrel.hive.reporting.reporter import Reporter
+from nrel.hive.util import fs
+
+if TYPE_CHECKING:
+    from nrel.hive.config import HiveConfig
+    from nrel.hive.runner.environment import Environment
+    from nrel.hive.state.simulation_state.simulation_state import SimulationState
+
+log = logging.getLogger(__name__)
+
+# incremented whenever the contents of a bundle change, so that older bundles are rebuilt
+SCENARIO_BUNDLE_VERSION = 8
+SCENARIO_BUNDLE_FORMAT = "hive-scenario-bundle"
+SCENARIO_BUNDLE_SUFFIX = ".bundle"
+# the header is a single line of json, so it is read without unpickling anything
+MAX_SCENARIO_BUNDLE_HEADER_BYTES = 1 << 16
+
+# inputs which are read as the simulation runs, and so are not part of the bundle
+STREAMED_INPUTS = frozenset(
+    {"scenario_directory", "scenario_file", "requests_file", "charging_price_file"}
+)
+
+
+def scenario_bundle_file(config: HiveConfig) -> Path:
+    """
+    :param config: the hive config
+    :return: where the bundle of a scenario is stored, next to the scenario file
+    """
+    scenario_file = Path(config.input_config.scenario_file)
+    return Path(config.input_config.scenario_directory) / (
+        scenario_file.stem + SCENARIO_BUNDLE_SUFFIX
+    )
+
+
+def scenario_source_hashes(config: HiveConfig) -> Dict[str, str]:
+    """
+    hashes everything the initial simulation state and environment are built from: the sim
+    and network configuration, and the contents of each input file, including the powertrain
+    and powercurve files referenced by the mechatronics file. the request and charging price
+    files are not included, as they are read as the simulation runs.
+
+    :param config: the hive config
+    :return: the md5 hash of each source, by name
+    """
+    hashes = {
+        "sim": _md5(json.dumps(config.sim.asdict(), sort_keys=True, default=str).encode()),
+        "network": _md5(json.dumps(config.network.asdict(), sort_keys=True, default=str).encode()),
+    }
+    for name, path in config.input_config.asdict().items():
+        if path and name not in STREAMED_INPUTS:
+            hashes[name] = _md5_file(path)
+
+    with open(config.input_config.mechatronics_file) as f:
+        mechatronics_config = yaml.safe_load(f)
+    for mechatronics_id, mechatronics in mechatronics_config.items():
+        for key in ("powertrain_file", "powercurve_file"):
+            if key in mechatronics:
+                resource_directory = key.replace("_file", "")
+                path = fs.construct_asset_path(
+                    mechatronics[key],
+                    config.input_config.scenario_directory,
+                    resource_directory,
+                    resource_directory,
+                )
+                hashes[f"{mechatronics_id}.{key}"] = _md5_file(path)
+
+    return hashes
+
+
+def hive_version() -> str:
+    """
+    :return: the installed version of the hive package, or "unknown" if it is not installed
+    """
+    try:
+        return metadata.version("nrel.hive")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def scenario_bundle_header(config: HiveConfig) -> Dict[str, Any]:
+    """
+    :param config: the hive config
+    :return: the header identifying a bundle of this scenario built by this version of hive
+    """
+    return {
+        "format": SCENARIO_BUNDLE_FORMAT,
+        "version": SCENARIO_BUNDLE_VERSION,
+        "hive_version": hive_version(),
+        "source_hashes": scenario_source_hashes(config),
+    }
+
+
+def compile_scenario_bundle(
+    config: HiveConfig, output_file: Optional[Union[Path, str]] = None
+) -> Path:
+    """
+    initializes a scenario from its input files and writes the resulting simulation state
+    and environment to a single bundle file, along with the hashes of the sources it was
+    built from. when use_scenario_bundle is set in the global config, load_simulation uses
+    the bundle in place of the input files for as long as the hashes match.
+
+    the bundle starts with a single line json header, followed by the pickled state.
+
+    reporting is not part of the bundle, as it depends on the output directory of each run.
+    a road network compiled with `hive-compile-network` is also left out, since it is
+    memory-mapped from its own file when the bundle is loaded.
+
+    :param config: the hive config of the scenario
+    :param output_file: the bundle file to write; defaults to scenario_bundle_file(config)
+    :return: the path of the bundle file
+    """
+    output_path = Path(output_file) if output_file is not None else scenario_bundle_file(config)
+
+    sim, env = initialize(config.suppress_logging(), scenario_init_functions(config))
+    if _has_shared_road_network(config):
+        sim = sim._replace(road_network=HaversineRoadNetwork())
+    env = env.set_reporter(Reporter())
+
+    header = json.dumps(scenario_bundle_header(config), sort_keys=True)
+    with output_path.open("wb") as f:
+        f.write(header.encode() + b"\n")
+        pickle.dump((sim, env), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return output_path
+
+
+def load_scenario_bundle(
+    config: HiveConfig, bundle_file: Optional[Union[Path, str]] = None
+) -> Optional[Tuple[SimulationState, Environment]]:
+    """
+    loads the simulation state and environment of a scenario from its bundle, if the bundle
+    exists and was built from the current sources by this version of hive. the environment
+    is given this config and reporting is set up for it.
+
+    the header is checked before anything is unpickled, but the state itself is pickled, so
+    only load bundles from a trusted source.
+
+    :param config: the hive config of the scenario
+    :param bundle_file: the bundle file to read; defaults to scenario_bundle_file(config)
+    :return: the simulation state and environment, or None if there is no up-to-date bundle
+    """
+    bundle_path = Path(bundle_file) if bundle_file is not None else scenario_bundle_file(config)
+    if not bundle_path.is_file():
+        return None
+
+    try:
+        with bundle_path.open("rb") as f:
+            header = _read_header(f.readline(MAX_SCENARIO_BUNDLE_HEADER_BYTES))
+            if header is None or header.get("format") != SCENARIO_BUNDLE_FORMAT:
+                log.warning(f"{bundle_path} is not a hive scenario bundle; ignoring it")
+                return None
+            expected = scenario_bundle_header(config)
+            if any(header.get(k) != expected[k] for k in ("version", "hive_version")):
+                log.info(f"scenario bundle {bundle_path} is from another version of hive")
+                return None
+            if header.get("source_hashes") != expected["source_hashes"]:
+                log.info(f"scenario bundle {bundle_path} is out of date with its source files")
+                return None
+            sim, env = pickle.load(f)
+    except Exception as e:
+        log.warning(f"unable to read scenario bundle {bundle_path}: {e!r}")
+        return None
+
+    env = env._replace(config=config)
+    if _has_shared_road_network(config):
+        road_network_file = Path(str(config.input_config.road_network_file))
+        sim, env = shared_osm_init_function(road_network_file)(config, sim, env)
+    sim, env = initialize_environment_reporting(config, sim, env)
+
+    log.info(f"loaded scenario from bundle {bundle_path}")
+    return sim, env
+
+
+def _read_header(line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        header = json.loads(line)
+    except ValueError:
+        return None
+    return header if isinstance(header, dict) else None
+
+
+def _has_shared_road_network(config: HiveConfig) -> bool:
+    road_network_file = config.input_config.road_network_file
+    return (
+        config.network.network_type == "osm_network"
+        and road_network_file is not None
+        and Path(road_network_file).suffix == ".npz"
+    )
+
+
+def _md5(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+def _md5_file(path: Union[Path, str]) -> str:
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
@@ -10,12 +10,13 @@ from nrel.hive.model.entity_position import EntityPosition
 from nrel.hive.model.membership import Membership
 from nrel.hive.model.roadnetwork.roadnetwork import RoadNetwork
 from nrel.hive.util.exception import SimulationStateError
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.util.typealiases import *
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Base(Entity):
     """
     Represents a base within the simulation.
@@ -58,8 +59,10 @@ class Base(Entity):
         station_id: Optional[StationId],
         stall_count: int,
         membership: Membership = Membership(),
+        position: Optional[EntityPosition] = None,
     ):
-        position = road_network.position_from_geoid(geoid)
+        if position is None:
+            position = road_network.position_from_geoid(geoid)
         if position is None:
             raise ValueError("cannot position base on road network")
 
@@ -77,12 +80,14 @@ class Base(Entity):
         cls,
         row: Dict[str, str],
         road_network: RoadNetwork,
+        position: Optional[EntityPosition] = None,
     ) -> Base:
         """
         converts a csv row to a base
 
         :param row:
         :param road_network:
+        :param position: the base location if it was already snapped to the road network
         :return:
         """
         if "base_id" not in row:
@@ -112,6 +117,7 @@ class Base(Entity):
                     road_network=road_network,
                     station_id=station_id,
                     stall_count=stall_count,
+                    position=position,
                 )
 
             except ValueError:
@@ -1,2 +1,3 @@
 from nrel.hive.model.energy.charger import Charger
 from nrel.hive.model.energy.energytype import EnergyType
+from nrel.hive.model.energy.single_energy import SingleEnergy
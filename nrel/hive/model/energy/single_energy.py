@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+import immutables
+
+from nrel.hive.model.energy.energytype import EnergyType
+from nrel.hive.util.slots import SLOTS
+
+
+@dataclass(frozen=True, eq=False, **SLOTS)
+class SingleEnergy(Mapping):
+    """
+    the energy of a vehicle with a single energy type, such as a BEV or an ICE vehicle.
+
+    a read-only mapping from the one energy type to the amount of energy, which can be used
+    anywhere the immutables.Map of Vehicle.energy is read. it holds the energy type and the
+    amount directly, taking a third of the memory of a single-entry immutables.Map.
+
+    :param energy_type: the energy type of the vehicle
+    :param amount: the amount of energy, in the units of the energy type
+    """
+
+    energy_type: EnergyType
+    amount: float
+
+    def __getitem__(self, energy_type: EnergyType) -> float:
+        if energy_type == self.energy_type:
+            return self.amount
+        raise KeyError(energy_type)
+
+    def get(self, energy_type: EnergyType, default: Optional[Any] = None) -> Optional[Any]:
+        return self.amount if energy_type == self.energy_type else default
+
+    def __contains__(self, energy_type: object) -> bool:
+        return energy_type == self.energy_type
+
+    def __iter__(self) -> Iterator[EnergyType]:
+        yield self.energy_type
+
+    def __len__(self) -> int:
+        return 1
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SingleEnergy):
+            return self.energy_type == other.energy_type and self.amount == other.amount
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        # hashed as the immutables.Map it compares equal to
+        return hash(immutables.Map({self.energy_type: self.amount}))
@@ -8,9 +8,10 @@ from typing import Tuple
 from nrel.hive.model.entity_position import EntityPosition
 from nrel.hive.model.membership import Membership
 from nrel.hive.util.typealiases import MembershipId
+from nrel.hive.util.slots import SLOTS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class EntityMixin:
     id: str
     position: EntityPosition
@@ -22,6 +23,8 @@ class EntityABC(ABC):
     Interface for creating a generic entity
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def geoid(self) -> str:
@@ -52,3 +55,5 @@ class EntityABC(ABC):
 
 class Entity(EntityMixin, EntityABC):
     """"""
+
+    __slots__ = ()
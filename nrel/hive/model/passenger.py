@@ -6,12 +6,13 @@ from dataclasses import dataclass, replace
 
 from nrel.hive.model.membership import Membership
 from nrel.hive.model.sim_time import SimTime
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.util.typealiases import *
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Passenger:
     """
     A tuple representing a passenger in the simulation.
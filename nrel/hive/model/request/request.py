@@ -13,6 +13,7 @@ from nrel.hive.model.roadnetwork.roadnetwork import RoadNetwork
 from nrel.hive.model.sim_time import SimTime
 from nrel.hive.util.exception import TimeParseError
 from nrel.hive.util.units import Currency, KM_TO_MILE
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.model.request import RequestRateStructure
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
     from nrel.hive.util.typealiases import *
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Request(Entity):
     """
     A ride hail request which is alive in the simulation but not yet serviced.
@@ -33,7 +34,7 @@ class Request(Entity):
     :param origin: The geoid of the request origin.
     :param destination: The geoid of the request destination.
     :param departure_time: The time of departure.
-    :param passengers: A tuple of passengers associated with this request.
+    :param num_passengers: The number of passengers associated with this request.
     :param membership: the membership of the fleet.
     :param dispatched_vehicle: The id of the vehicle dispatched to service this request.
     :param dispatched_vehicle_time: Time time which a vehicle was dispatched for this request.
@@ -45,7 +46,7 @@ class Request(Entity):
 
     destination_position: EntityPosition
     departure_time: SimTime
-    passengers: Tuple[Passenger, ...]
+    num_passengers: int
     allows_pooling: bool
     value: Currency = 0
     dispatched_vehicle: Optional[VehicleId] = None
@@ -63,6 +64,25 @@ class Request(Entity):
     def destination(self):
         return self.destination_position.geoid
 
+    @property
+    def passengers(self) -> Tuple[Passenger, ...]:
+        """
+        the passengers of this request, which share its origin, destination, departure time
+        and membership. they are derived from the request on each access rather than stored.
+
+        :return: a tuple of num_passengers passengers
+        """
+        return tuple(
+            Passenger(
+                id=create_passenger_id(self.id, pass_idx),
+                origin=self.origin,
+                destination=self.destination,
+                departure_time=self.departure_time,
+                membership=self.membership,
+            )
+            for pass_idx in range(0, self.num_passengers)
+        )
+
     @classmethod
     def build(
         cls,
@@ -75,15 +95,19 @@ class Request(Entity):
         allows_pooling: bool,
         fleet_id: Optional[MembershipId] = None,
         value: Currency = 0,
+        origin_position: Optional[EntityPosition] = None,
+        destination_position: Optional[EntityPosition] = None,
     ) -> Request:
         assert departure_time >= 0
         assert passengers > 0
-        origin_position = road_network.position_from_geoid(origin)
+        if origin_position is None:
+            origin_position = road_network.position_from_geoid(origin)
         if origin_position is None:
             raise ValueError(
                 f"request {request_id} origin cannot be positioned on the road network"
             )
-        destination_position = road_network.position_from_geoid(destination)
+        if destination_position is None:
+            destination_position = road_network.position_from_geoid(destination)
         if destination_position is None:
             raise ValueError(
                 f"request {request_id} destination cannot be positioned on the road network"
@@ -93,23 +117,12 @@ class Request(Entity):
         else:
             membership = Membership()
 
-        request_as_passengers = [
-            Passenger(
-                id=create_passenger_id(request_id, pass_idx),
-                origin=origin_position.geoid,
-                destination=destination_position.geoid,
-                departure_time=departure_time,
-                membership=membership,
-            )
-            for pass_idx in range(0, passengers)
-        ]
-
         request = Request(
             id=request_id,
             position=origin_position,
             destination_position=destination_position,
             departure_time=departure_time,
-            passengers=tuple(request_as_passengers),
+            num_passengers=passengers,
             allows_pooling=allows_pooling,
             membership=membership,
             value=value,
@@ -118,7 +131,12 @@ class Request(Entity):
 
     @classmethod
     def from_row(
-        cls, row: Dict[str, str], env: Environment, road_network: RoadNetwork
+        cls,
+        row: Dict[str, str],
+        env: Environment,
+        road_network: RoadNetwork,
+        origin_position: Optional[EntityPosition] = None,
+        destination_position: Optional[EntityPosition] = None,
     ) -> Tuple[Optional[Exception], Optional[Request]]:
         """
         takes a csv row and turns it into a Request
@@ -129,6 +147,8 @@ class Request(Entity):
         :param env: the static environment variables
 
         :param road_network: the road network
+        :param origin_position: the origin if it was already snapped to the road network
+        :param destination_position: the destination if it was already snapped to the road network
         :return: a Request, or an error
         """
         if "request_id" not in row:
@@ -194,6 +214,8 @@ class Request(Entity):
                     departure_time=departure_time_result,
                     passengers=passengers,
                     allows_pooling=allows_pooling,
+                    origin_position=origin_position,
+                    destination_position=destination_position,
                 )
                 return None, request
             except ValueError:
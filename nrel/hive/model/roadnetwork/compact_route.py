@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from nrel.hive.model.roadnetwork.linktraversal import LinkTraversal
+from nrel.hive.util.slots import SLOTS
+from nrel.hive.util.units import Kilometers, Seconds
+
+
+@dataclass(frozen=True, eq=False, **SLOTS)
+class CompactRoute(Sequence):
+    """
+    a route held as a window over the links of a planned route, along with the cumulative
+    distance and travel time of those links. advancing along the route moves the window
+    instead of copying the links left behind, and the window's distance and travel time
+    are read from the cumulative arrays without visiting each link.
+
+    a read-only sequence of LinkTraversals, which can be used anywhere a Route is read.
+    the first and last links of the window may be replaced by a part of that link, where
+    a time step ended partway along it.
+
+    :param links: the links of the planned route, shared by every window over it
+    :param cumulative_distance_km: the distance from the start of the planned route to the
+                                   start of each link, followed by the total distance
+    :param cumulative_time_seconds: the travel time from the start of the planned route to
+                                    the start of each link, followed by the total time
+    :param start: the index of the first link of the window
+    :param stop: the index after the last link of the window
+    :param first: the part of links[start] in the window, if not all of it
+    :param last: the part of links[stop - 1] in the window, if not all of it
+    """
+
+    links: Tuple[LinkTraversal, ...]
+    cumulative_distance_km: np.ndarray
+    cumulative_time_seconds: np.ndarray
+    start: int
+    stop: int
+    first: Optional[LinkTraversal] = None
+    last: Optional[LinkTraversal] = None
+
+    @classmethod
+    def build(cls, route: Sequence[LinkTraversal]) -> CompactRoute:
+        """
+        builds a CompactRoute over all of a route
+
+        :param route: the route
+        :return: the route as a CompactRoute, or the route itself if it already is one
+        """
+        if isinstance(route, CompactRoute):
+            return route
+        links = tuple(route)
+        n = len(links)
+        distance = np.zeros(n + 1, dtype=np.float64)
+        travel_time = np.zeros(n + 1, dtype=np.int64)
+        distance[1:] = np.cumsum(np.fromiter((l.distance_km for l in links), np.float64, n))
+        travel_time[1:] = np.cumsum(
+            np.fromiter((l.travel_time_seconds for l in links), np.int64, n)
+        )
+        return cls(links, distance, travel_time, 0, n)
+
+    def window(
+        self,
+        start: int,
+        stop: int,
+        first: Optional[LinkTraversal] = None,
+        last: Optional[LinkTraversal] = None,
+    ) -> Union[CompactRoute, Tuple[LinkTraversal, ...]]:
+        """
+        takes another window over the same planned route
+
+        :param start: the index of the first link of the window in the planned route
+        :param stop: the index after the last link of the window in the planned route
+        :param first: the part of the first link in the window, if not all of it
+        :param last: the part of the last link in the window, if not all of it
+        :return: the window, or an empty route if it holds no links
+        """
+        if start >= stop:
+            return ()
+        elif stop - start == 1:
+            # a single link is replaced by the part given for it
+            first = last = first if first is not None else last
+        return CompactRoute(
+            self.links,
+            self.cumulative_distance_km,
+            self.cumulative_time_seconds,
+            start,
+            stop,
+            first,
+            last,
+        )
+
+    @property
+    def distance_km(self) -> Kilometers:
+        """
+        :return: the distance of the route, without visiting each link
+        """
+        return self._total(self.cumulative_distance_km, lambda l: l.distance_km)
+
+    @property
+    def travel_time_seconds(self) -> Seconds:
+        """
+        :return: the travel time of the route, without visiting each link
+        """
+        return int(self._total(self.cumulative_time_seconds, lambda l: l.travel_time_seconds))
+
+    def _total(self, cumulative: np.ndarray, measure: Callable[[LinkTraversal], Any]) -> float:
+        if len(self) == 1:
+            return float(measure(self[0]))
+        total = float(cumulative[self.stop] - cumulative[self.start])
+        if self.first is not None:
+            total += measure(self.first) - measure(self.links[self.start])
+        if self.last is not None:
+            total += measure(self.last) - measure(self.links[self.stop - 1])
+        return total
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        n = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step != 1:
+                return tuple(self)[index]
+            return self.window(
+                self.start + start,
+                self.start + stop,
+                self.first if start == 0 else None,
+                self.last if stop == n else None,
+            )
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("CompactRoute index out of range")
+        elif index == 0 and self.first is not None:
+            return self.first
+        elif index == n - 1 and self.last is not None:
+            return self.last
+        return self.links[self.start + index]
+
+    def __iter__(self) -> Iterator[LinkTraversal]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        # hashed as the tuple of links it compares equal to
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"CompactRoute({tuple(self)!r})"
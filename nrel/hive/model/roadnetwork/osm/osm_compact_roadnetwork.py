@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import heapq
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import h3
+import numpy as np
+
+from nrel.hive.model.entity_position import EntityPosition
+from nrel.hive.model.roadnetwork.link import Link
+from nrel.hive.model.roadnetwork.link_id import create_link_id, extract_node_ids
+from nrel.hive.model.roadnetwork.osm.osm_road_network_arrays import OSMRoadNetworkArrays
+from nrel.hive.model.roadnetwork.osm.osm_roadnetwork_ops import resolve_route_src_dst_positions
+from nrel.hive.model.roadnetwork.roadnetwork import RoadNetwork
+from nrel.hive.model.roadnetwork.route import Route, route_distance_km, empty_route
+from nrel.hive.model.sim_time import SimTime
+from nrel.hive.util.typealiases import GeoId, LinkId
+from nrel.hive.util.units import Kilometers
+
+log = logging.getLogger(__name__)
+
+
+class OSMCompactRoadNetwork(RoadNetwork):
+    """
+    an OSM road network backed by OSMRoadNetworkArrays instead of a networkx graph.
+    when loaded from file, the arrays are memory-mapped, so that many processes can
+    share a single copy of a large road network.
+    """
+
+    def __init__(self, arrays: OSMRoadNetworkArrays):
+        self.arrays = arrays
+        self.sim_h3_resolution = int(arrays.sim_h3_resolution)
+        self.default_speed_kmph = float(arrays.default_speed_kmph)
+        self.links_spatial_lookup = arrays.spatial_index()
+
+    @classmethod
+    def from_file(cls, road_network_file: Union[Path, str]) -> OSMCompactRoadNetwork:
+        """
+        memory-maps a road network written by OSMRoadNetworkArrays.to_file
+        """
+        return OSMCompactRoadNetwork(OSMRoadNetworkArrays.from_file(road_network_file))
+
+    def _node_index(self, node_id: int) -> Optional[int]:
+        if not isinstance(node_id, int):
+            return None
+        index = int(np.searchsorted(self.arrays.node_ids, node_id))
+        if index < self.arrays.node_count and self.arrays.node_ids[index] == node_id:
+            return index
+        else:
+            return None
+
+    def _link_index(self, src_index: int, dst_index: int) -> Optional[int]:
+        start = int(self.arrays.link_indptr[src_index])
+        end = int(self.arrays.link_indptr[src_index + 1])
+        matches = np.flatnonzero(self.arrays.link_dst[start:end] == dst_index)
+        return start + int(matches[0]) if len(matches) > 0 else None
+
+    def _link(self, link_index: int) -> Link:
+        src_id = int(self.arrays.node_ids[self.arrays.link_src[link_index]])
+        dst_id = int(self.arrays.node_ids[self.arrays.link_dst[link_index]])
+        return Link(
+            link_id=create_link_id(src_id, dst_id),
+            start=h3.h3_to_string(int(self.arrays.link_start[link_index])),
+            end=h3.h3_to_string(int(self.arrays.link_end[link_index])),
+            distance_km=float(self.arrays.link_distance_km[link_index]),
+            speed_kmph=float(self.arrays.link_speed_kmph[link_index]),
+        )
+
+    def _shortest_path(self, src_index: int, dst_index: int) -> Optional[List[int]]:
+        """
+        bidirectional dijkstra's algorithm over the CSR adjacency arrays, weighted by link
+        travel time, following the networkx implementation used by the OSMRoadNetwork
+
+        :param src_index: the node index to start from
+        :param dst_index: the node index to search for
+        :return: the link indices along the shortest path, or None if no path exists
+        """
+        if src_index == dst_index:
+            return []
+
+        arrays = self.arrays
+        weights = arrays.link_travel_time_seconds
+
+        def _forward(node: int):
+            start, end = arrays.link_indptr[node : node + 2].tolist()
+            neighbors = arrays.link_dst[start:end].tolist()
+            return zip(range(start, end), neighbors, weights[start:end].tolist())
+
+        def _backward(node: int):
+            start, end = arrays.link_reverse_indptr[node : node + 2].tolist()
+            links = arrays.link_reverse_index[start:end]
+            return zip(links.tolist(), arrays.link_src[links].tolist(), weights[links].tolist())
+
+        neighbors = (_forward, _backward)
+        distances: Tuple[Dict[int, float], Dict[int, float]] = ({}, {})
+        seen: Tuple[Dict[int, float], Dict[int, float]] = ({src_index: 0.0}, {dst_index: 0.0})
+        previous_link: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+        frontier: Tuple[list, list] = ([(0.0, src_index)], [(0.0, dst_index)])
+        best_distance, meeting_node = float("inf"), None
+
+        direction = 1
+        while frontier[0] and frontier[1]:
+            # alternate between the forward and backward search
+            direction = 1 - direction
+            distance, node = heapq.heappop(frontier[direction])
+            if node in distances[direction]:
+                continue
+            distances[direction][node] = distance
+            if node in distances[1 - direction]:
+                # the searches have met, so the best path found so far is the shortest path
+                break
+            for link_index, neighbor, weight in neighbors[direction](node):
+                next_distance = distance + weight
+                if neighbor in distances[direction]:
+                    continue
+                elif next_distance < seen[direction].get(neighbor, float("inf")):
+                    seen[direction][neighbor] = next_distance
+                    previous_link[direction][neighbor] = link_index
+                    heapq.heappush(frontier[direction], (next_distance, neighbor))
+                    if neighbor in seen[1 - direction]:
+                        total_distance = next_distance + seen[1 - direction][neighbor]
+                        if total_distance < best_distance:
+                            best_distance, meeting_node = total_distance, neighbor
+
+        if meeting_node is None:
+            return None
+
+        path = []
+        node = meeting_node
+        while node != src_index:
+            link_index = previous_link[0][node]
+            path.append(link_index)
+            node = int(arrays.link_src[link_index])
+        path.reverse()
+        node = meeting_node
+        while node != dst_index:
+            link_index = previous_link[1][node]
+            path.append(link_index)
+            node = int(arrays.link_dst[link_index])
+        return path
+
+    def route(self, origin: EntityPosition, destination: EntityPosition) -> Route:
+        """
+        Returns a route containing road network links between the origin and destination geoids.
+
+        :param origin: the origin Link
+        :param destination: the destination Link
+        :return: a route between the origin and destination on the OSM road network
+        """
+        if origin == destination:
+            return empty_route()
+
+        extract_src_err, src_nodes = extract_node_ids(origin.link_id)
+        extract_dst_err, dst_nodes = extract_node_ids(destination.link_id)
+        if extract_src_err:
+            log.error(extract_src_err)
+            return empty_route()
+        elif extract_dst_err:
+            log.error(extract_dst_err)
+            return empty_route()
+        elif src_nodes is None or dst_nodes is None:
+            return empty_route()
+
+        # node-oriented shortest path from the end of the origin link to the beginning of the destination link
+        _, origin_node_id = src_nodes
+        destination_node_id, _ = dst_nodes
+        origin_index = self._node_index(origin_node_id)
+        destination_index = self._node_index(destination_node_id)
+        if origin_index is None or destination_index is None:
+            log.error(f"unable to build route from {origin} to {destination}: unknown node id")
+            return empty_route()
+
+        link_path = self._shortest_path(origin_index, destination_index)
+        if link_path is None:
+            log.error(f"unable to build route from {origin} to {destination}: no path found")
+            return empty_route()
+
+        inner_link_path = tuple(self._link(i).to_link_traversal() for i in link_path)
+        resolved_route = resolve_route_src_dst_positions(inner_link_path, origin, destination, self)
+        if not resolved_route:
+            log.error(
+                f"unable to resolve the route from/to/via:\n {origin}\n{destination}\n{inner_link_path}"
+            )
+            return empty_route()
+        else:
+            return resolved_route
+
+    def distance_by_geoid_km(self, origin: GeoId, destination: GeoId) -> Kilometers:
+        """
+        Returns the road network distance between the origin and destination
+
+        :param origin: the geoid of the origin
+        :param destination: the geoid of the destination
+        :return: the road network distance in kilometers
+        """
+        o = self.position_from_geoid(origin)
+        d = self.position_from_geoid(destination)
+        if not o or not d:
+            log.error(
+                f"failed finding nearest links to distance query between GeoIds {origin}, {destination}"
+            )
+            return 0.0
+        else:
+            return route_distance_km(self.route(o, d))
+
+    def link_from_geoid(self, geoid: GeoId) -> Optional[Link]:
+        """
+        Returns the closest link to a geoid.
+
+        :param geoid: the geoid to snap to the road newtork
+        :return: the link on the road network that is closest to the geoid
+        """
+        try:
+            _, index = self.links_spatial_lookup.query(h3.h3_to_geo(geoid))
+            return self._link(int(index))
+        except Exception as e:
+            log.warning(f"unable to find nearest link to geoid {geoid}")
+            log.error(e)
+            return None
+
+    def links_from_geoids(self, geoids: Sequence[GeoId]) -> Tuple[Optional[Link], ...]:
+        """
+        Returns the closest link to each of a batch of geoids, using one spatial index query.
+
+        :param geoids: the geoids to snap to the road network
+        :return: the link on the road network that is closest to each geoid
+        """
+        if len(geoids) == 0:
+            return ()
+        try:
+            query = np.array([h3.h3_to_geo(geoid) for geoid in geoids], dtype=np.float64)
+            _, indices = self.links_spatial_lookup.query(query)
+            return tuple(self._link(index) for index in indices.tolist())
+        except Exception as e:
+            log.warning(f"unable to find nearest links to {len(geoids)} geoids")
+            log.error(e)
+            return tuple(None for _ in geoids)
+
+    def link_from_link_id(self, link_id: LinkId) -> Optional[Link]:
+        """
+        look up the provided LinkId in the road network arrays
+        :param link_id: the LinkId to look up
+        :return: the Link if it exists, otherwise None
+        """
+        error, nodes = extract_node_ids(link_id)
+        if error or nodes is None:
+            return None
+        src_id, dst_id = nodes
+        src_index = self._node_index(src_id)
+        dst_index = self._node_index(dst_id)
+        if src_index is None or dst_index is None:
+            return None
+        link_index = self._link_index(src_index, dst_index)
+        return self._link(link_index) if link_index is not None else None
+
+    def geoid_within_geofence(self, geoid: GeoId) -> bool:
+        return True
+
+    def update(self, sim_time: SimTime) -> RoadNetwork:
+        raise NotImplementedError("updates are not implemented")
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import mmap
+import zipfile
+from pathlib import Path
+from typing import NamedTuple, Union, TYPE_CHECKING
+
+import h3
+import numpy as np
+from scipy.spatial import cKDTree
+
+from nrel.hive.model.roadnetwork.link_id import extract_node_ids
+
+if TYPE_CHECKING:
+    from nrel.hive.model.roadnetwork.osm.osm_roadnetwork import OSMRoadNetwork
+
+# incremented whenever the arrays stored in a road network file change
+ROAD_NETWORK_ARRAYS_VERSION = 3
+
+# the leaf size of the cKDTree over the link midpoints
+SPATIAL_INDEX_LEAFSIZE = 16
+
+# the fixed-size part of a zip local file header, which precedes the name and extra fields
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+class OSMRoadNetworkArrays(NamedTuple):
+    """
+    a compact, array-based representation of an OSM road network. links are stored in
+    compressed sparse row (CSR) order by their source node, so that the outgoing links
+    of the node at index i are the links in the range [link_indptr[i], link_indptr[i+1]).
+    the incoming links of each node are indexed the same way by the reverse arrays, for
+    searches which run backwards from a destination.
+
+    since none of these arrays hold python objects, they can be memory-mapped from a file
+    and shared read-only between processes.
+
+    :param node_ids: the (integer) OSM node ids, sorted ascending; a node's index is its position here
+    :param link_indptr: CSR row pointers into the link arrays by source node index
+    :param link_reverse_indptr: CSR row pointers into link_reverse_index by destination node index
+    :param link_reverse_index: the link indices, ordered by destination node index
+    :param link_src: the source node index of each link
+    :param link_dst: the destination node index of each link
+    :param link_distance_km: the length of each link
+    :param link_speed_kmph: the speed of each link
+    :param link_travel_time_seconds: the travel time of each link, used as the routing weight
+    :param link_start: the h3 cell of each link's source node, as an integer
+    :param link_end: the h3 cell of each link's destination node, as an integer
+    :param link_midpoints: the (lat, lon) coordinates used for nearest link lookup
+    :param sim_h3_resolution: the h3 resolution of the link_start and link_end cells
+    :param default_speed_kmph: the speed given to links without speed information
+    :param spatial_index_leafsize: the leaf size of the cKDTree over the link_midpoints
+    :param version: the ROAD_NETWORK_ARRAYS_VERSION which wrote these arrays
+    """
+
+    node_ids: np.ndarray
+    link_indptr: np.ndarray
+    link_reverse_indptr: np.ndarray
+    link_reverse_index: np.ndarray
+    link_src: np.ndarray
+    link_dst: np.ndarray
+    link_distance_km: np.ndarray
+    link_speed_kmph: np.ndarray
+    link_travel_time_seconds: np.ndarray
+    link_start: np.ndarray
+    link_end: np.ndarray
+    link_midpoints: np.ndarray
+    sim_h3_resolution: np.ndarray
+    default_speed_kmph: np.ndarray
+    spatial_index_leafsize: np.ndarray
+    version: np.ndarray
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def link_count(self) -> int:
+        return len(self.link_src)
+
+    @classmethod
+    def from_osm_road_network(cls, road_network: OSMRoadNetwork) -> OSMRoadNetworkArrays:
+        """
+        builds the array representation of an OSMRoadNetwork. the links and the nearest link
+        lookup points are taken from the road network's link helper so that both representations
+        snap and route over the same links.
+
+        :param road_network: the road network to convert
+        :return: the road network as arrays
+        :raises TypeError: if the road network uses tuple node ids, which have no array representation
+        """
+        helper = road_network.link_helper
+        graph = road_network.graph
+
+        if not all(isinstance(n, int) for n in graph.nodes()):
+            raise TypeError("only road networks with integer node ids can be stored as arrays")
+
+        node_ids = np.array(sorted(graph.nodes()), dtype=np.int64)
+
+        # the link helper may list a link id more than once for parallel edges;
+        # keep the first midpoint for each link id, matching the link stored in the helper
+        midpoints = {}
+        for link_id, midpoint in zip(helper.links_linkid_lookup, helper.links_spatial_lookup.data):
+            if link_id not in midpoints:
+                midpoints[link_id] = midpoint
+
+        link_ids = list(midpoints.keys())
+        src_ids, dst_ids, travel_times = [], [], []
+        for link_id in link_ids:
+            error, nodes = extract_node_ids(link_id)
+            if error:
+                raise error
+            elif nodes is None:
+                raise Exception(f"unable to extract node ids from link id {link_id}")
+            src_id, dst_id = nodes
+            # route by the same edge attribute as the networkx shortest path search, which takes
+            # the fastest of any parallel edges, falling back to the travel time implied by the link speed
+            fallback = helper.links[link_id].travel_time_seconds
+            edges = graph.get_edge_data(src_id, dst_id, default={})
+            travel_time = min(
+                (d.get("travel_time", fallback) for d in edges.values()), default=fallback
+            )
+            src_ids.append(src_id)
+            dst_ids.append(dst_id)
+            travel_times.append(travel_time)
+
+        src = np.searchsorted(node_ids, np.array(src_ids, dtype=np.int64))
+        dst = np.searchsorted(node_ids, np.array(dst_ids, dtype=np.int64))
+        order = np.lexsort((dst, src))
+
+        links = [helper.links[link_ids[i]] for i in order]
+        reverse_index = np.lexsort((src[order], dst[order]))
+        node_range = np.arange(len(node_ids) + 1)
+        link_midpoints = np.array([midpoints[link_ids[i]] for i in order], dtype=np.float64)
+
+        return OSMRoadNetworkArrays(
+            node_ids=node_ids,
+            link_indptr=np.searchsorted(src[order], node_range).astype(np.int64),
+            link_reverse_indptr=np.searchsorted(dst[order][reverse_index], node_range).astype(
+                np.int64
+            ),
+            link_reverse_index=reverse_index.astype(np.int64),
+            link_src=src[order].astype(np.int64),
+            link_dst=dst[order].astype(np.int64),
+            link_distance_km=np.array([l.distance_km for l in links], dtype=np.float64),
+            link_speed_kmph=np.array([l.speed_kmph for l in links], dtype=np.float64),
+            link_travel_time_seconds=np.array(travel_times, dtype=np.float64)[order],
+            link_start=np.array([h3.string_to_h3(l.start) for l in links], dtype=np.uint64),
+            link_end=np.array([h3.string_to_h3(l.end) for l in links], dtype=np.uint64),
+            link_midpoints=link_midpoints,
+            sim_h3_resolution=np.array(road_network.sim_h3_resolution, dtype=np.int64),
+            default_speed_kmph=np.array(road_network.default_speed_kmph, dtype=np.float64),
+            spatial_index_leafsize=np.array(SPATIAL_INDEX_LEAFSIZE, dtype=np.int64),
+            version=np.array(ROAD_NETWORK_ARRAYS_VERSION, dtype=np.int64),
+        )
+
+    def spatial_index(self) -> cKDTree:
+        """
+        builds the cKDTree over the link midpoints from the stored points and leaf size.
+        the tree references the midpoints directly, so memory-mapped points are not copied.
+
+        :return: a cKDTree where each point index is a link index
+        """
+        return cKDTree(self.link_midpoints, leafsize=int(self.spatial_index_leafsize))
+
+    def to_file(self, file: Union[str, Path]):
+        """
+        writes the arrays to a single uncompressed .npz file, which can be memory-mapped
+
+        :param file: the file to write to
+        """
+        path = Path(file)
+        with path.open("wb") as f:
+            np.savez(f, **self._asdict())
+
+    @classmethod
+    def from_file(cls, file: Union[str, Path]) -> OSMRoadNetworkArrays:
+        """
+        memory-maps the arrays of a file written by OSMRoadNetworkArrays.to_file, read-only.
+        the operating system shares the pages of the file between all processes which load it.
+
+        :param file: the file to load
+        :return: the memory-mapped arrays
+        :raises IOError: if the file is missing an array, was written with compression,
+                         or was written by an incompatible version of hive
+        """
+        path = Path(file)
+        arrays = {}
+        with zipfile.ZipFile(path) as archive, path.open("rb") as f:
+            # a single read-only mapping of the whole file backs every array
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            for info in archive.infolist():
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise IOError(f"{path} is compressed and cannot be memory-mapped")
+                # skip the zip local file header to find the start of the .npy data
+                f.seek(info.header_offset)
+                local_header = f.read(_ZIP_LOCAL_HEADER_SIZE)
+                name_length = int.from_bytes(local_header[26:28], "little")
+                extra_length = int.from_bytes(local_header[28:30], "little")
+                f.seek(info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length)
+
+                format_version = np.lib.format.read_magic(f)
+                if format_version == (1, 0):
+                    header = np.lib.format.read_array_header_1_0(f)
+                else:
+                    header = np.lib.format.read_array_header_2_0(f)
+                shape, fortran_order, dtype = header
+                count = int(np.prod(shape))
+                array = np.frombuffer(buffer, dtype=dtype, count=count, offset=f.tell())
+                name = info.filename[: -len(".npy")]
+                arrays[name] = array.reshape(shape, order="F" if fortran_order else "C")
+
+        version = arrays.get("version")
+        if version is None or int(version) != ROAD_NETWORK_ARRAYS_VERSION:
+            raise IOError(
+                f"{path} was compiled by an incompatible version of hive, please compile it again"
+            )
+        missing = set(cls._fields).difference(arrays.keys())
+        if missing:
+            raise IOError(f"{path} is missing road network arrays {', '.join(sorted(missing))}")
+
+        return OSMRoadNetworkArrays(**{k: arrays[k] for k in cls._fields})
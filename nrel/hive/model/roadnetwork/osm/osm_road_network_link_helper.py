@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import functools as ft
-from typing import Tuple, Optional, NamedTuple
+from typing import Tuple, Optional, NamedTuple, Sequence
 
 import h3
 import immutables
+import numpy as np
 from networkx import MultiDiGraph
 from scipy.spatial import cKDTree
 
@@ -56,6 +57,37 @@ class OSMRoadNetworkLinkHelper(NamedTuple):
         except Exception as e:
             return e, None
 
+    def links_by_geoids(
+        self, geoids: Sequence[GeoId]
+    ) -> Tuple[Optional[Exception], Optional[Tuple[Link, ...]]]:
+        """
+        uses a single vectorized CKDTree query to find the nearest Link to each geoid
+
+        :param geoids: the geoids to query
+        :return: an error or the nearest link to each GeoId, in the same order
+        """
+        if len(geoids) == 0:
+            return None, ()
+        try:
+            query = np.array([h3.h3_to_geo(geoid) for geoid in geoids], dtype=np.float64)
+            _, index_result = self.links_spatial_lookup.query(query)
+            links = []
+            for geoid, index in zip(geoids, index_result.tolist()):
+                link_id = self.links_linkid_lookup[index] if 0 <= index < self.link_count else None
+                link = self.links.get(link_id) if link_id else None
+                if not link_id or not link:
+                    return (
+                        Exception(
+                            f"internal error on nearest link for geoid {geoid}: resulting spatial index value '{index}' is invalid"
+                        ),
+                        None,
+                    )
+                links.append(link)
+            return None, tuple(links)
+
+        except Exception as e:
+            return e, None
+
     @classmethod
     def build(
         cls,
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 import networkx as nx
 
@@ -45,6 +45,7 @@ class OSMRoadNetwork(RoadNetwork):
         default_speed_kmph: Kmph = 40.0,
     ):
         self.sim_h3_resolution = sim_h3_resolution
+        self.default_speed_kmph = default_speed_kmph
 
         # validate network
 
@@ -229,6 +230,21 @@ class OSMRoadNetwork(RoadNetwork):
         else:
             return link
 
+    def links_from_geoids(self, geoids: Sequence[GeoId]) -> Tuple[Optional[Link], ...]:
+        """
+        Returns the closest link to each of a batch of geoids, using one spatial index query.
+
+        :param geoids: the geoids to snap to the road network
+        :return: the link on the road network that is closest to each geoid
+        """
+        error, links = self.link_helper.links_by_geoids(geoids)
+        if error or links is None:
+            log.warning(f"unable to find nearest links to {len(geoids)} geoids")
+            log.error(error)
+            return tuple(None for _ in geoids)
+        else:
+            return links
+
     def link_from_link_id(self, link_id: LinkId) -> Optional[Link]:
         """
         look up the provided LinkId in the LinkHelper table
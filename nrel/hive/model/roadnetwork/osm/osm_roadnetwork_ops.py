@@ -4,7 +4,6 @@ import functools as ft
 from typing import Union, TYPE_CHECKING
 
 import immutables
-from networkx.classes.reportviews import NodeView
 
 from nrel.hive.model.entity_position import EntityPosition
 from nrel.hive.model.roadnetwork.link import Link
@@ -13,7 +12,8 @@ from nrel.hive.model.roadnetwork.linktraversal import LinkTraversal
 from nrel.hive.model.roadnetwork.route import Route
 
 if TYPE_CHECKING:
-    from nrel.hive.model.roadnetwork.osm.osm_roadnetwork import OSMRoadNetwork
+    from networkx.classes.reportviews import NodeView
+    from nrel.hive.model.roadnetwork.roadnetwork import RoadNetwork
 
 
 def safe_get_node_coordinates(
@@ -86,7 +86,7 @@ def resolve_route_src_dst_positions(
     inner_route: Route,
     src_link_pos: EntityPosition,
     dst_link_pos: EntityPosition,
-    road_network: OSMRoadNetwork,
+    road_network: RoadNetwork,
 ) -> Optional[Route]:
     """
     our inner_route is a shortest path from the destination of the source link to the start
@@ -111,5 +111,5 @@ def resolve_route_src_dst_positions(
         # align with the search start/end locations
         src_link_traversal = src_link.to_link_traversal().update_start(src_link_pos.geoid)
         dst_link_traversal = dst_link.to_link_traversal().update_end(dst_link_pos.geoid)
-        updated_route = (src_link_traversal,) + inner_route + (dst_link_traversal,)
+        updated_route = (src_link_traversal, *inner_route, dst_link_traversal)
         return updated_route
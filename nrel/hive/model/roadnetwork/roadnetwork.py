@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 import h3
+import numpy as np
 
 from nrel.hive.model.roadnetwork.link import Link
 from nrel.hive.model.roadnetwork.geofence import GeoFence
@@ -61,29 +62,93 @@ class RoadNetwork(ABC):
         :return: The nearest road network link to the provided GeoId
         """
 
+    def links_from_geoids(self, geoids: Sequence[GeoId]) -> Tuple[Optional[Link], ...]:
+        """
+        finds the nearest link to each of a batch of GeoIds. road networks with a
+        spatial index should override this with a single vectorized query.
+
+        :param geoids: the physical locations
+        :return: the nearest road network link to each GeoId, in the same order
+        """
+        return tuple(self.link_from_geoid(geoid) for geoid in geoids)
+
     def position_from_geoid(self, geoid: GeoId) -> Optional[EntityPosition]:
         """
         returns a position from a GeoId.
-        if the provided GeoId does not exist on the line of GeoIds coincident with the Link,
-        then the nearest one is selected
+        the GeoId is projected onto the nearest Link, so if it does not lie on the Link,
+        the nearest point along the Link is selected
 
         :param geoid: the location for the stationary entity
 
         :return: the position on the link nearest to the GeoId
         """
-        link = self.link_from_geoid(geoid)
-        if not link:
-            return None
-        else:
-            hexes_on_link = h3.h3_line(link.start, link.end)
-            if geoid in hexes_on_link:
-                position = EntityPosition(link.link_id, geoid)
-                return position
+        return self.positions_from_geoids((geoid,))[0]
+
+    def positions_from_geoids(
+        self, geoids: Sequence[GeoId]
+    ) -> Tuple[Optional[EntityPosition], ...]:
+        """
+        snaps a batch of GeoIds to the road network. each GeoId is projected onto the
+        segment between the start and end of its nearest Link, using an equirectangular
+        approximation, which is accurate at the scale of a single road network link.
+
+        :param geoids: the locations to snap to the road network
+        :return: the position nearest to each GeoId, or None where no link was found
+        """
+        links = self.links_from_geoids(geoids)
+        found = [(i, link) for i, link in enumerate(links) if link is not None]
+        positions: list = [None] * len(geoids)
+        if not found:
+            return tuple(positions)
+
+        points = np.array([h3.h3_to_geo(geoids[i]) for i, _ in found], dtype=np.float64)
+        starts = np.array([h3.h3_to_geo(link.start) for _, link in found], dtype=np.float64)
+        ends = np.array([h3.h3_to_geo(link.end) for _, link in found], dtype=np.float64)
+
+        # scale longitude by the cosine of the latitude so the projection is orthogonal
+        scale = np.stack([np.ones(len(found)), np.cos(np.radians(points[:, 0]))], axis=1)
+        segments = (ends - starts) * scale
+        offsets = (points - starts) * scale
+        length_squared = np.sum(segments * segments, axis=1)
+        nonzero = length_squared > 0
+        t = np.zeros(len(found))
+        t[nonzero] = np.sum(offsets * segments, axis=1)[nonzero] / length_squared[nonzero]
+        t = np.clip(t, 0.0, 1.0)
+        projected = starts + t[:, np.newaxis] * (ends - starts)
+
+        for (i, link), (lat, lon), fraction in zip(found, projected.tolist(), t.tolist()):
+            if fraction <= 0.0:
+                geoid = link.start
+            elif fraction >= 1.0:
+                geoid = link.end
             else:
-                hexes_by_dist = sorted(hexes_on_link, key=lambda h: h3.h3_distance(geoid, h))
-                closest_hex_to_query = hexes_by_dist[0]
-                position = EntityPosition(link.link_id, closest_hex_to_query)
-                return position
+                geoid = h3.geo_to_h3(lat, lon, h3.h3_get_resolution(link.start))
+            positions[i] = EntityPosition(link.link_id, geoid)
+
+        return tuple(positions)
+
+    def positions_from_rows(
+        self, rows: Sequence[Dict[str, str]], lat_key: str = "lat", lon_key: str = "lon"
+    ) -> Tuple[Optional[EntityPosition], ...]:
+        """
+        snaps the coordinates of a batch of csv rows to the road network
+
+        :param rows: rows as interpreted by csv.DictReader
+        :param lat_key: the column holding the latitude
+        :param lon_key: the column holding the longitude
+        :return: the position for each row, or None where the row's coordinates are missing,
+                 invalid, or could not be snapped to the road network
+        """
+        geoids = []
+        for row in rows:
+            try:
+                lat, lon = float(row[lat_key]), float(row[lon_key])
+                geoids.append(h3.geo_to_h3(lat, lon, self.sim_h3_resolution))
+            except (KeyError, TypeError, ValueError):
+                geoids.append(None)
+
+        positions = iter(self.positions_from_geoids([g for g in geoids if g is not None]))
+        return tuple(next(positions) if g is not None else None for g in geoids)
 
     @abstractmethod
     def geoid_within_geofence(self, geoid: GeoId) -> bool:
@@ -1,16 +1,17 @@
 import functools as ft
-from typing import Any, Tuple, Optional
+from typing import Optional, Sequence, Tuple
 
 import h3
 
 from nrel.hive.model.entity_position import EntityPosition
+from nrel.hive.model.roadnetwork.compact_route import CompactRoute
 from nrel.hive.model.roadnetwork.link import Link
 from nrel.hive.model.roadnetwork.linktraversal import LinkTraversal
 from nrel.hive.runner import Environment
 from nrel.hive.util import TupleOps, wkt
 from nrel.hive.util.units import Kilometers, Seconds
 
-Route = Tuple[LinkTraversal, ...]
+Route = Sequence[LinkTraversal]
 
 
 def empty_route() -> Route:
@@ -26,6 +27,8 @@ def route_distance_km(route: Route) -> Kilometers:
     :rtype: :py:obj:`kilometers`
     :return: the distance in kilometers
     """
+    if isinstance(route, CompactRoute):
+        return route.distance_km
     distance_km = 0.0
     for l in route:
         distance_km += l.distance_km
@@ -40,6 +43,8 @@ def route_travel_time_seconds(route: Route) -> Seconds:
     :param route: route to calculate time from
     :return: the travel time, in seconds
     """
+    if isinstance(route, CompactRoute):
+        return route.travel_time_seconds
     tt = ft.reduce(lambda acc, l: acc + l.travel_time_seconds, route, 0.0)
     return int(tt)
 
@@ -89,12 +94,7 @@ def to_linestring(route: Route, env: Environment) -> str:
         linestring = wkt.linestring_2d((src, dst), env.config.global_config.wkt_x_y_ordering)
         return linestring
     else:
-        inital: Tuple[Any, ...] = ()
-        points = ft.reduce(
-            lambda acc, l: acc + (h3.h3_to_geo(l.start), h3.h3_to_geo(l.end)),
-            route,
-            inital,
-        )
+        points = tuple(h3.h3_to_geo(g) for l in route for g in (l.start, l.end))
         linestring = wkt.linestring_2d(points, env.config.global_config.wkt_x_y_ordering)
         return linestring
 
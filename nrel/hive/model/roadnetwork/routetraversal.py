@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import functools as ft
 from typing import Optional, NamedTuple
 
+import numpy as np
+
+from nrel.hive.model.roadnetwork.compact_route import CompactRoute
 from nrel.hive.model.roadnetwork.linktraversal import (
     LinkTraversalResult,
     LinkTraversal,
@@ -56,10 +58,10 @@ class RouteTraversal(NamedTuple):
         updated_experienced_route = (
             self.experienced_route
             if t.traversed is None
-            else self.experienced_route + (t.traversed,)
+            else (*self.experienced_route, t.traversed)
         )
         updated_remaining_route = (
-            self.remaining_route if t.remaining is None else self.remaining_route + (t.remaining,)
+            self.remaining_route if t.remaining is None else (*self.remaining_route, t.remaining)
         )
         if t.traversed:
             traversal_distance = self.traversal_distance_km + t.traversed.distance_km
@@ -80,7 +82,7 @@ class RouteTraversal(NamedTuple):
         :param link: a link traversal for the remaining route
         :return: the updated RouteTraversal
         """
-        return self._replace(remaining_route=self.remaining_route + (link,))
+        return self._replace(remaining_route=(*self.remaining_route, link))
 
 
 def traverse(
@@ -102,39 +104,90 @@ def traverse(
         return None, RouteTraversal()
     elif TupleOps.head(route_estimate).start == TupleOps.last(route_estimate).end:
         return None, RouteTraversal()
-    else:
-        # function that steps through the route
-        def _traverse(
-            acc: Tuple[Optional[Exception], Optional[RouteTraversal]],
-            link: LinkTraversal,
-        ) -> Tuple[Optional[Exception], Optional[RouteTraversal]]:
-            acc_failures, acc_traversal = acc
-            if acc_failures:
-                return acc
-            elif acc_traversal is None:
-                return acc
-
-            if acc_traversal.no_time_left():
-                return acc_failures, acc_traversal.add_link_not_traversed(link)
-            # traverse this link as far as we can go
-            error, traverse_result = traverse_up_to(link, acc_traversal.remaining_time_seconds)
-            if error:
-                response = Exception(f"failure during traverse")
-                response.__cause__ = error
-                return response, None
-            elif traverse_result is None:
-                response = Exception(f"failure during traverse")
-                return response, None
-            else:
-                updated_experienced_route = acc_traversal.add_traversal(traverse_result)
-                return acc_failures, updated_experienced_route
-
-        # initial search state has a route traversal and an Optional[Exception]
-        initial: Tuple[Optional[Exception], Optional[RouteTraversal]] = (
-            None,
-            RouteTraversal(remaining_time_seconds=duration_seconds),
-        )
 
-        result = ft.reduce(_traverse, route_estimate, initial)
+    # the route is held as a CompactRoute, a window over the links of the planned route
+    # along with their cumulative travel times. the head link, which may be partly traversed
+    # already, is stepped over first; the number of links completed after it is then found
+    # by binary search, and only the link where the time step ends is split. the experienced
+    # and remaining routes are windows over the same links, so no links are copied here.
+    route = CompactRoute.build(route_estimate)
+    if route.last is not None and len(route) > 1:
+        # only a window ending partway along a link has a last part; rebuild it as a route
+        route = CompactRoute.build(tuple(route))
+
+    error, head_result = traverse_up_to(route[0], duration_seconds)
+    if error:
+        response = Exception(f"failure during traverse")
+        response.__cause__ = error
+        return response, None
+    elif head_result is None:
+        response = Exception(f"failure during traverse")
+        return response, None
+
+    head = head_result.traversed
+    head_distance_km = head.distance_km if head is not None else 0.0
+    experienced_start = route.start if head is not None else route.start + 1
+    if head_result.remaining is not None:
+        # the time step ends on the head link
+        return None, RouteTraversal(
+            remaining_time_seconds=head_result.remaining_time_seconds,
+            traversal_distance_km=head_distance_km,
+            experienced_route=route.window(experienced_start, route.start + 1, first=head),
+            remaining_route=route.window(
+                route.start, route.stop, first=head_result.remaining, last=route.last
+            ),
+        )
 
-        return result
+    # the links after the head which are completed within the remaining time
+    cumulative_time = route.cumulative_time_seconds
+    cumulative_distance = route.cumulative_distance_km
+    body_start = route.start + 1
+    reached_time = cumulative_time[body_start] + head_result.remaining_time_seconds
+    # where the time runs out exactly at the end of a link, the links after it are not
+    # started, even those which take no time
+    end = int(np.searchsorted(cumulative_time, reached_time, side="left"))
+    if end > route.stop or cumulative_time[end] > reached_time:
+        end -= 1
+    end = max(body_start, min(end, route.stop))
+    remaining_time_seconds = int(reached_time - cumulative_time[end])
+    traversal_distance_km = head_distance_km + float(
+        cumulative_distance[end] - cumulative_distance[body_start]
+    )
+
+    last: Optional[LinkTraversal] = None
+    remaining_first: Optional[LinkTraversal] = None
+    experienced_stop = end
+    if end < route.stop and remaining_time_seconds > 0:
+        # the time step ends partway along this link, so it is split
+        error, end_result = traverse_up_to(route.links[end], remaining_time_seconds)
+        if error:
+            response = Exception(f"failure during traverse")
+            response.__cause__ = error
+            return response, None
+        elif end_result is None:
+            response = Exception(f"failure during traverse")
+            return response, None
+        remaining_time_seconds = end_result.remaining_time_seconds
+        if end_result.traversed is not None:
+            last = end_result.traversed
+            traversal_distance_km += last.distance_km
+            experienced_stop = end + 1
+        remaining_first = end_result.remaining
+        if remaining_first is None:
+            end += 1
+
+    # links with no length are not experienced, as when traversing them one at a time
+    while (
+        last is None
+        and experienced_stop > experienced_start + 1
+        and route.links[experienced_stop - 1].start == route.links[experienced_stop - 1].end
+    ):
+        experienced_stop -= 1
+
+    route_traversal = RouteTraversal(
+        remaining_time_seconds=remaining_time_seconds,
+        traversal_distance_km=traversal_distance_km,
+        experienced_route=route.window(experienced_start, experienced_stop, head, last),
+        remaining_route=route.window(end, route.stop, first=remaining_first),
+    )
+    return None, route_traversal
@@ -1,24 +1,44 @@
 from __future__ import annotations
 
-from typing import NamedTuple
+import bisect
+import heapq
+from typing import NamedTuple, Tuple
 
+import immutables
 from returns.result import ResultE, Success, Failure
 
 from nrel.hive.model.energy.charger.charger import Charger
-from nrel.hive.util.typealiases import ChargerId
-from nrel.hive.util.units import Currency, KwH
+from nrel.hive.util.typealiases import ChargerId, VehicleId
+from nrel.hive.util.units import Currency, KwH, Seconds
 from nrel.hive.util.error_or_result import ErrorOr
 from nrel.hive.runner.environment import Environment
 from nrel.hive.util.exception import SimulationStateError
 
 
 class ChargerState(NamedTuple):
+    """
+    the state of one charger type at a station.
+
+    along with the charger counts, the ChargerState tracks the projected release time of
+    each vehicle charging and the charge duration of each vehicle enqueued, in order to keep a
+    sorted projection of the time at which each charger becomes free once the queue is served.
+    the projection is updated as vehicles begin/end charging or join/leave the queue, so that
+    estimating the wait for a charger does not require revisiting the vehicles at the station.
+
+    :param charging_release_times: the projected sim time at which each charging vehicle finishes
+    :param enqueued_charge_durations: the charge duration of each enqueued vehicle, in queue order
+    :param projected_release_times: the sorted sim time at which each charger is projected to be free
+    """
+
     id: ChargerId
     charger: Charger
     total_chargers: int
     available_chargers: int
     price_per_kwh: Currency
     enqueued_vehicles: int
+    charging_release_times: immutables.Map[VehicleId, int] = immutables.Map()
+    enqueued_charge_durations: Tuple[Tuple[VehicleId, Seconds], ...] = ()
+    projected_release_times: Tuple[int, ...] = ()
 
     @classmethod
     def build(cls, charger: Charger, count: int) -> ChargerState:
@@ -37,6 +57,7 @@ class ChargerState(NamedTuple):
             available_chargers=count,
             price_per_kwh=0.0,
             enqueued_vehicles=0,
+            projected_release_times=(0,) * count,
         )
 
     def add_chargers(self, charger_count: int) -> ChargerState:
@@ -49,6 +70,7 @@ class ChargerState(NamedTuple):
         return self._replace(
             total_chargers=self.total_chargers + charger_count,
             available_chargers=self.available_chargers + charger_count,
+            projected_release_times=(0,) * charger_count + self.projected_release_times,
         )
 
     def has_available_charger(self) -> bool:
@@ -145,3 +167,113 @@ class ChargerState(NamedTuple):
         else:
             updated = self._replace(charger=self.charger._replace(rate=self.charger.rate * factor))
             return Success(updated)
+
+    def add_charging_vehicle(
+        self, vehicle_id: VehicleId, release_time: int, sim_time: int
+    ) -> ChargerState:
+        """
+        tracks a vehicle which began charging with this charger type
+
+        :param vehicle_id: the vehicle charging
+        :param release_time: the sim time at which the vehicle is expected to finish charging
+        :param sim_time: the current sim time
+        :return: updated charger state
+        """
+        updated = self._replace(
+            charging_release_times=self.charging_release_times.set(vehicle_id, release_time)
+        )
+        return updated._project(sim_time)
+
+    def remove_charging_vehicle(self, vehicle_id: VehicleId, sim_time: int) -> ChargerState:
+        """
+        stops tracking a vehicle charging with this charger type
+
+        :param vehicle_id: the vehicle which stopped charging
+        :param sim_time: the current sim time
+        :return: updated charger state
+        """
+        if vehicle_id not in self.charging_release_times:
+            return self
+        updated = self._replace(
+            charging_release_times=self.charging_release_times.delete(vehicle_id)
+        )
+        return updated._project(sim_time)
+
+    def add_enqueued_vehicle(
+        self, vehicle_id: VehicleId, charge_duration: Seconds, sim_time: int
+    ) -> ChargerState:
+        """
+        tracks a vehicle joining the back of the queue for this charger type. the vehicle
+        is projected to take the first charger to become free after the vehicles ahead of it.
+
+        :param vehicle_id: the vehicle enqueued
+        :param charge_duration: the time the vehicle is expected to charge for
+        :param sim_time: the current sim time
+        :return: updated charger state
+        """
+        enqueued = self.enqueued_charge_durations + ((vehicle_id, charge_duration),)
+        if len(self.projected_release_times) == 0:
+            return self._replace(enqueued_charge_durations=enqueued)
+        first_free, *remaining = self.projected_release_times
+        release_time = max(first_free, sim_time) + charge_duration
+        projected = list(remaining)
+        bisect.insort(projected, release_time)
+        return self._replace(
+            enqueued_charge_durations=enqueued,
+            projected_release_times=tuple(projected),
+        )
+
+    def remove_enqueued_vehicle(self, vehicle_id: VehicleId, sim_time: int) -> ChargerState:
+        """
+        stops tracking a vehicle enqueued for this charger type
+
+        :param vehicle_id: the vehicle which left the queue
+        :param sim_time: the current sim time
+        :return: updated charger state
+        """
+        enqueued = tuple(e for e in self.enqueued_charge_durations if e[0] != vehicle_id)
+        if len(enqueued) == len(self.enqueued_charge_durations):
+            return self
+        updated = self._replace(enqueued_charge_durations=enqueued)
+        return updated._project(sim_time)
+
+    def estimate_wait_seconds(
+        self, sim_time: int, min_occupied_wait_seconds: Seconds = 1
+    ) -> Seconds:
+        """
+        estimates the time a vehicle arriving now would wait for a charger of this type,
+        once the vehicles charging have finished and the vehicles enqueued have been served.
+
+        a vehicle still charging past its projected release time is projected to be released
+        now, and while every charger is occupied the estimate is never less than
+        min_occupied_wait_seconds, since an occupied charger is not free until it is released.
+
+        :param sim_time: the current sim time
+        :param min_occupied_wait_seconds: the least wait while no charger is available,
+                                          such as the duration of a time step
+        :return: the estimated wait, in seconds
+        """
+        projected = self.projected_release_times
+        if len(projected) > 0 and projected[0] < sim_time:
+            projected = self._project(sim_time).projected_release_times
+        wait = max(0, projected[0] - sim_time) if len(projected) > 0 else 0
+        if self.available_chargers == 0:
+            return max(wait, min_occupied_wait_seconds)
+        return wait
+
+    def _project(self, sim_time: int) -> ChargerState:
+        """
+        rebuilds the projected release time of each charger, by assigning the enqueued
+        vehicles in queue order to whichever charger is projected to be free first
+
+        :param sim_time: the current sim time, before which no charger can be released
+        :return: updated charger state
+        """
+        charging = [max(t, sim_time) for t in self.charging_release_times.values()]
+        free = [sim_time] * max(0, self.total_chargers - len(charging))
+        projected = charging + free
+        heapq.heapify(projected)
+        if len(projected) > 0:
+            for _, charge_duration in self.enqueued_charge_durations:
+                heapq.heapreplace(projected, projected[0] + charge_duration)
+        return self._replace(projected_release_times=tuple(sorted(projected)))
@@ -26,13 +26,14 @@ from nrel.hive.model.station.station_ops import (
 from nrel.hive.util.error_or_result import ErrorOr
 from nrel.hive.util.typealiases import *
 from nrel.hive.util.exception import H3Error, SimulationStateError
-from nrel.hive.util.units import Currency, KwH
+from nrel.hive.util.units import Currency, KwH, Seconds
 from nrel.hive.util.validation import validate_fields
+from nrel.hive.util.slots import SLOTS
 
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Station(Entity):
     """
     A station that vehicles can use to refuel
@@ -75,6 +76,7 @@ class Station(Entity):
         on_shift_access: FrozenSet[ChargerId],
         membership: Membership,
         env: Environment,
+        position: Optional[EntityPosition] = None,
     ):
         # TODO
         # problems with this
@@ -115,7 +117,8 @@ class Station(Entity):
             msg = f"internal error after building station chargers for station {id}"
             raise Exception(msg)
 
-        position = road_network.position_from_geoid(geoid)
+        if position is None:
+            position = road_network.position_from_geoid(geoid)
         if position is None:
             msg = (
                 "could not find a road network position matching the position "
@@ -174,6 +177,7 @@ class Station(Entity):
         builder: Union[immutables.Map[StationId, Station], Dict[StationId, Station]],
         road_network: RoadNetwork,
         env: Environment,
+        position: Optional[EntityPosition] = None,
     ) -> Station:
         """
         takes a csv row and turns it into a Station
@@ -184,6 +188,7 @@ class Station(Entity):
         that there already was a row parsed for this station
 
         :param road_network: the road network
+        :param position: the station location if it was already snapped to the road network
         :return: a Station, or an error
         """
         _EXPECTED_FIELDS = [
@@ -224,6 +229,7 @@ class Station(Entity):
                 on_shift_access=frozenset([charger_id]) if on_shift_access else frozenset(),
                 membership=Membership(),
                 env=env,
+                position=position,
             )
         else:
             # add this charger to the existing station
@@ -436,6 +442,101 @@ class Station(Entity):
 
         return station_state_update(station=self, charger_id=charger_id, op=_dequeue)
 
+    def add_charging_vehicle(
+        self,
+        charger_id: ChargerId,
+        vehicle_id: VehicleId,
+        release_time: int,
+        sim_time: int,
+    ) -> ErrorOr[Station]:
+        """
+        tracks the projected release time of a vehicle charging with a specific charger_id type
+
+        :param charger_id: the charger_id type
+        :param vehicle_id: the vehicle charging
+        :param release_time: the sim time at which the vehicle is expected to finish charging
+        :param sim_time: the current sim time
+        :return: the updated Station
+        """
+
+        def _add(cs: ChargerState) -> ErrorOr[ChargerState]:
+            return None, cs.add_charging_vehicle(vehicle_id, release_time, sim_time)
+
+        return station_state_update(station=self, charger_id=charger_id, op=_add)
+
+    def remove_charging_vehicle(
+        self, charger_id: ChargerId, vehicle_id: VehicleId, sim_time: int
+    ) -> ErrorOr[Station]:
+        """
+        stops tracking a vehicle charging with a specific charger_id type
+
+        :param charger_id: the charger_id type
+        :param vehicle_id: the vehicle which stopped charging
+        :param sim_time: the current sim time
+        :return: the updated Station
+        """
+
+        def _remove(cs: ChargerState) -> ErrorOr[ChargerState]:
+            return None, cs.remove_charging_vehicle(vehicle_id, sim_time)
+
+        return station_state_update(station=self, charger_id=charger_id, op=_remove)
+
+    def add_enqueued_vehicle(
+        self,
+        charger_id: ChargerId,
+        vehicle_id: VehicleId,
+        charge_duration: Seconds,
+        sim_time: int,
+    ) -> ErrorOr[Station]:
+        """
+        tracks the charge duration of a vehicle enqueued for a specific charger_id type
+
+        :param charger_id: the charger_id type
+        :param vehicle_id: the vehicle enqueued
+        :param charge_duration: the time the vehicle is expected to charge for
+        :param sim_time: the current sim time
+        :return: the updated Station
+        """
+
+        def _add(cs: ChargerState) -> ErrorOr[ChargerState]:
+            return None, cs.add_enqueued_vehicle(vehicle_id, charge_duration, sim_time)
+
+        return station_state_update(station=self, charger_id=charger_id, op=_add)
+
+    def remove_enqueued_vehicle(
+        self, charger_id: ChargerId, vehicle_id: VehicleId, sim_time: int
+    ) -> ErrorOr[Station]:
+        """
+        stops tracking a vehicle enqueued for a specific charger_id type
+
+        :param charger_id: the charger_id type
+        :param vehicle_id: the vehicle which left the queue
+        :param sim_time: the current sim time
+        :return: the updated Station
+        """
+
+        def _remove(cs: ChargerState) -> ErrorOr[ChargerState]:
+            return None, cs.remove_enqueued_vehicle(vehicle_id, sim_time)
+
+        return station_state_update(station=self, charger_id=charger_id, op=_remove)
+
+    def estimate_wait_seconds(
+        self, charger_id: ChargerId, sim_time: int, min_occupied_wait_seconds: Seconds = 1
+    ) -> Optional[Seconds]:
+        """
+        estimates the time a vehicle arriving now would wait for a specific charger_id type
+
+        :param charger_id: the charger_id type
+        :param sim_time: the current sim time
+        :param min_occupied_wait_seconds: the least wait while no charger is available
+        :return: the estimated wait, or None if the charger_id is not found at this station
+        """
+        state = self.state.get(charger_id)
+        if state is None:
+            return None
+        else:
+            return state.estimate_wait_seconds(sim_time, min_occupied_wait_seconds)
+
     def enqueued_vehicle_count_for_charger(self, charger_id: ChargerId) -> Optional[int]:
         """
         gets the current count of vehicles enqueued for a specific charger_id at this station
@@ -3,11 +3,11 @@ from dataclasses import dataclass
 
 import logging
 
-from typing import Any, Callable, Dict, NamedTuple, TYPE_CHECKING, Optional, Tuple
+from typing import Any, Callable, Dict, Mapping, NamedTuple, TYPE_CHECKING, Optional, Tuple
 
-import immutables
 
 from nrel.hive.model.energy.energytype import EnergyType
+from nrel.hive.model.energy.single_energy import SingleEnergy
 from nrel.hive.model.vehicle.mechatronics.mechatronics_interface import MechatronicsInterface
 from nrel.hive.model.vehicle.mechatronics.powercurve import build_powercurve
 from nrel.hive.model.vehicle.mechatronics.powertrain import build_powertrain
@@ -100,14 +100,14 @@ class BEV(MechatronicsInterface):
         """
         return charger.energy_type == EnergyType.ELECTRIC
 
-    def initial_energy(self, percent_full: Ratio) -> immutables.Map[EnergyType, float]:
+    def initial_energy(self, percent_full: Ratio) -> Mapping[EnergyType, float]:
         """
         return an energy dictionary from an initial soc
 
         :param percent_full:
         :return:
         """
-        return immutables.Map({EnergyType.ELECTRIC: self.battery_capacity_kwh * percent_full})
+        return SingleEnergy(EnergyType.ELECTRIC, self.battery_capacity_kwh * percent_full)
 
     def range_remaining_km(self, vehicle: Vehicle) -> Kilometers:
         """
@@ -171,9 +171,7 @@ class BEV(MechatronicsInterface):
         )
         vehicle_energy_kwh = vehicle.energy[EnergyType.ELECTRIC]
         new_energy_kwh = max(0.0, vehicle_energy_kwh - energy_used_kwh)
-        updated_vehicle = vehicle.modify_energy(
-            immutables.Map({EnergyType.ELECTRIC: new_energy_kwh})
-        )
+        updated_vehicle = vehicle.modify_energy(SingleEnergy(EnergyType.ELECTRIC, new_energy_kwh))
         return updated_vehicle
 
     def idle(self, vehicle: Vehicle, time_seconds: Seconds) -> Vehicle:
@@ -189,9 +187,7 @@ class BEV(MechatronicsInterface):
         idle_energy_kwh = self.idle_kwh_per_hour * time_seconds * SECONDS_TO_HOURS
         vehicle_energy_kwh = vehicle.energy[EnergyType.ELECTRIC]
         new_energy_kwh = max(0.0, vehicle_energy_kwh - idle_energy_kwh)
-        updated_vehicle = vehicle.modify_energy(
-            immutables.Map({EnergyType.ELECTRIC: new_energy_kwh})
-        )
+        updated_vehicle = vehicle.modify_energy(SingleEnergy(EnergyType.ELECTRIC, new_energy_kwh))
 
         return updated_vehicle
 
@@ -232,8 +228,6 @@ class BEV(MechatronicsInterface):
             )
             new_energy_kwh = min(self.battery_capacity_kwh, charger_energy_kwh)
 
-        updated_vehicle = vehicle.modify_energy(
-            immutables.Map({EnergyType.ELECTRIC: new_energy_kwh})
-        )
+        updated_vehicle = vehicle.modify_energy(SingleEnergy(EnergyType.ELECTRIC, new_energy_kwh))
 
         return updated_vehicle, time_charging_seconds
@@ -3,11 +3,11 @@ from dataclasses import dataclass
 
 import logging
 
-from typing import Any, Callable, Dict, NamedTuple, TYPE_CHECKING, Optional, Tuple
+from typing import Any, Callable, Dict, Mapping, NamedTuple, TYPE_CHECKING, Optional, Tuple
 
-import immutables
 
 from nrel.hive.model.energy.energytype import EnergyType
+from nrel.hive.model.energy.single_energy import SingleEnergy
 from nrel.hive.model.vehicle.mechatronics.mechatronics_interface import MechatronicsInterface
 from nrel.hive.model.vehicle.mechatronics.powertrain import build_powertrain
 from nrel.hive.util.typealiases import MechatronicsId
@@ -77,14 +77,14 @@ class ICE(MechatronicsInterface):
         """
         return charger.energy_type == EnergyType.GASOLINE
 
-    def initial_energy(self, percent_full: Ratio) -> immutables.Map[EnergyType, float]:
+    def initial_energy(self, percent_full: Ratio) -> Mapping[EnergyType, float]:
         """
         return an energy dictionary from an initial soc
 
         :param percent_full:
         :return:
         """
-        return immutables.Map({EnergyType.GASOLINE: self.tank_capacity_gallons * percent_full})
+        return SingleEnergy(EnergyType.GASOLINE, self.tank_capacity_gallons * percent_full)
 
     def range_remaining_km(self, vehicle: Vehicle) -> Kilometers:
         """
@@ -149,7 +149,7 @@ class ICE(MechatronicsInterface):
         vehicle_energy_gal_gas = vehicle.energy[EnergyType.GASOLINE]
         new_energy_gal_gas = max(0.0, vehicle_energy_gal_gas - energy_used_gal_gas)
         updated_vehicle = vehicle.modify_energy(
-            immutables.Map({EnergyType.GASOLINE: new_energy_gal_gas})
+            SingleEnergy(EnergyType.GASOLINE, new_energy_gal_gas)
         )
         return updated_vehicle
 
@@ -167,7 +167,7 @@ class ICE(MechatronicsInterface):
         vehicle_energy_gal_gas = vehicle.energy[EnergyType.GASOLINE]
         new_energy_gal_gas = max(0.0, vehicle_energy_gal_gas - idle_energy_gal_gas)
         updated_vehicle = vehicle.modify_energy(
-            immutables.Map({EnergyType.GASOLINE: new_energy_gal_gas})
+            SingleEnergy(EnergyType.GASOLINE, new_energy_gal_gas)
         )
 
         return updated_vehicle
@@ -196,6 +196,6 @@ class ICE(MechatronicsInterface):
         pump_gal_gas = start_gal_gas + charger.rate * time_seconds
         new_gal_gas = min(self.tank_capacity_gallons, pump_gal_gas)
 
-        updated_vehicle = vehicle.modify_energy(immutables.Map({EnergyType.GASOLINE: new_gal_gas}))
+        updated_vehicle = vehicle.modify_energy(SingleEnergy(EnergyType.GASOLINE, new_gal_gas))
 
         return updated_vehicle, time_seconds
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from abc import abstractmethod, ABC
 from dataclasses import dataclass
-from typing import Dict, TYPE_CHECKING, Tuple
+from typing import Dict, Mapping, TYPE_CHECKING, Tuple
 
-import immutables
 
 from nrel.hive.model.energy import EnergyType, Charger
 
@@ -46,7 +45,7 @@ class MechatronicsInterfaceABC(ABC):
         """
 
     @abstractmethod
-    def initial_energy(self, percent_full: Ratio) -> immutables.Map[EnergyType, float]:
+    def initial_energy(self, percent_full: Ratio) -> Mapping[EnergyType, float]:
         """
         construct an initial energy state for a Vehicle
 
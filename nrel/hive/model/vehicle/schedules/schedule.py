@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from nrel.hive.state.simulation_state.simulation_state import SimulationState
 from nrel.hive.util.typealiases import VehicleId
@@ -6,3 +6,22 @@ from nrel.hive.util.typealiases import VehicleId
 # if we create a DriverId type, and it has a lookup table on SimulationState, we may
 # want to change this from VehicleId to DriverId
 ScheduleFunction = Callable[[SimulationState, VehicleId], bool]
+
+
+def next_schedule_update_time(
+    schedule_function: ScheduleFunction, sim: SimulationState
+) -> Optional[int]:
+    """
+    finds the next sim time that a schedule may change. schedules may provide a
+    next_transition_time method to report this; other schedule functions are
+    assumed to change at any time step.
+
+    :param schedule_function: the schedule
+    :param sim: the simulation state
+    :return: the sim time the schedule should be evaluated next, or None if it never changes
+    """
+    next_transition_time = getattr(schedule_function, "next_transition_time", None)
+    if next_transition_time is None:
+        return sim.sim_time + sim.sim_timestep_duration_seconds
+    else:
+        return next_transition_time(sim.sim_time)
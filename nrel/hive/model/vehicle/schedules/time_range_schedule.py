@@ -1,14 +1,63 @@
+from __future__ import annotations
+
 import functools as ft
 from csv import DictReader
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, TYPE_CHECKING
 
 from immutables import Map
 
 from nrel.hive.util.time_helpers import read_time_string, time_in_range
 from nrel.hive.util.typealiases import VehicleId, ScheduleId
 from nrel.hive.model.vehicle.schedules.schedule import ScheduleFunction
+from nrel.hive.model.sim_time import SimTime
+
+if TYPE_CHECKING:
+    from nrel.hive.state.simulation_state.simulation_state import SimulationState
+
+SECONDS_IN_DAY = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class TimeRangeSchedule:
+    """
+    a ScheduleFunction which is active during the same time range each day.
+
+    :param start_time: the time of day the range starts (inclusive)
+    :param end_time: the time of day the range ends (exclusive); may wrap past midnight
+    """
+
+    start_time: time
+    end_time: time
+
+    def __call__(self, sim: SimulationState, vehicle_id: VehicleId) -> bool:
+        sim_time = datetime.utcfromtimestamp(sim.sim_time).time()
+        within_scheduled_time = time_in_range(self.start_time, self.end_time, sim_time)
+        return within_scheduled_time
+
+    def next_transition_time(self, sim_time: SimTime) -> Optional[SimTime]:
+        """
+        finds the next time after sim_time that this schedule switches between active
+        and inactive, which is the next start or end of the time range
+
+        :param sim_time: the current sim time
+        :return: the sim time of the next transition, or None if the schedule never changes
+        """
+        if self.start_time == self.end_time:
+            # an empty range is never active
+            return None
+
+        time_of_day = sim_time % SECONDS_IN_DAY
+
+        def _seconds_until(t: time) -> int:
+            boundary = t.hour * 3600 + t.minute * 60 + t.second
+            wait = (boundary - time_of_day) % SECONDS_IN_DAY
+            return wait if wait > 0 else SECONDS_IN_DAY
+
+        wait = min(_seconds_until(self.start_time), _seconds_until(self.end_time))
+        return SimTime(sim_time + wait)
 
 
 def time_range_schedules_from_file(
@@ -68,10 +117,5 @@ def read_time_range_row(acc: Map[ScheduleId, ScheduleFunction], row: Dict):
     start_time = read_time_string(start_time_string)
     end_time = read_time_string(end_time_string)
 
-    def _schedule_fn(sim, vehicle_id: VehicleId) -> bool:
-        sim_time = datetime.utcfromtimestamp(sim.sim_time).time()
-        within_scheduled_time = time_in_range(start_time, end_time, sim_time)
-        return within_scheduled_time
-
-    updated_schedules = acc.set(schedule_id, _schedule_fn)
+    updated_schedules = acc.set(schedule_id, TimeRangeSchedule(start_time, end_time))
     return updated_schedules
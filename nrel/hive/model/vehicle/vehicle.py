@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Mapping, Optional
 from dataclasses import dataclass, replace
 
 import h3
-import immutables
 
 from nrel.hive.model.entity import Entity
 from nrel.hive.model.energy.energytype import EnergyType
@@ -17,9 +16,10 @@ from nrel.hive.state.vehicle_state.idle import Idle
 from nrel.hive.state.vehicle_state.vehicle_state import VehicleState
 from nrel.hive.util.typealiases import *
 from nrel.hive.util.units import Kilometers, Currency
+from nrel.hive.util.slots import SLOTS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Vehicle(Entity):
     """
     Tuple that represents a vehicle in the simulation.
@@ -44,7 +44,7 @@ class Vehicle(Entity):
 
     # mechatronic properties
     mechatronics_id: MechatronicsId
-    energy: immutables.Map[EnergyType, float]
+    energy: Mapping[EnergyType, float]
 
     # vehicle planning/operational properties
     vehicle_state: VehicleState
@@ -66,6 +66,7 @@ class Vehicle(Entity):
         row: Dict[str, str],
         road_network: RoadNetwork,
         environment: Environment,
+        position: Optional[EntityPosition] = None,
     ) -> Vehicle:
         """
         reads a csv row from file to generate a Vehicle
@@ -76,6 +77,7 @@ class Vehicle(Entity):
         this string will be stripped of whitespace characters (no spaces allowed in names!)
 
         :param road_network: the road network, used to find the vehicle's location in the sim
+        :param position: the vehicle's location if it was already snapped to the road network
         :return: a vehicle, or, an IOError if failure occurred.
         """
 
@@ -118,8 +120,11 @@ class Vehicle(Entity):
                     vehicle_id, schedule_id, home_base_id, allows_pooling
                 )
 
-                geoid = h3.geo_to_h3(lat, lon, road_network.sim_h3_resolution)
-                start_position = road_network.position_from_geoid(geoid)
+                if position is not None:
+                    start_position: Optional[EntityPosition] = position
+                else:
+                    geoid = h3.geo_to_h3(lat, lon, road_network.sim_h3_resolution)
+                    start_position = road_network.position_from_geoid(geoid)
 
                 if start_position is None:
                     raise IOError(
@@ -144,7 +149,7 @@ class Vehicle(Entity):
     def __repr__(self) -> str:
         return f"Vehicle({self.id},{self.vehicle_state})"
 
-    def modify_energy(self, energy: immutables.Map[EnergyType, float]) -> Vehicle:
+    def modify_energy(self, energy: Mapping[EnergyType, float]) -> Vehicle:
         """
         modify the energy level of the vehicle. should only be used by the mechatronics ops
 
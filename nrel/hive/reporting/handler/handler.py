@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Sequence
 
 from abc import ABC, abstractmethod
 
 if TYPE_CHECKING:
+    from nrel.hive.model.sim_time import SimTime
     from nrel.hive.reporting.reporter import Report
     from nrel.hive.runner.runner_payload import RunnerPayload
 
@@ -26,6 +27,20 @@ class Handler(ABC):
         :return:
         """
 
+    def handle_quiet_steps(self, runner_payload: RunnerPayload, sim_times: Sequence[SimTime]):
+        """
+        called for a run of time steps which change nothing but the sim time and file no
+        reports. by default, each time step is handled in turn; handlers can override this
+        to handle the run at once.
+
+
+        :param runner_payload: the runner payload before the quiet time steps
+        :param sim_times: the sim time at the end of each quiet time step
+        :return:
+        """
+        for sim_time in sim_times:
+            self.handle([], runner_payload._replace(s=runner_payload.s._replace(sim_time=sim_time)))
+
     @abstractmethod
     def close(self, runner_payload: RunnerPayload):
         """
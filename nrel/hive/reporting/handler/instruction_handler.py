@@ -4,7 +4,7 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Sequence
 
 from nrel.hive.reporting import vehicle_event_ops
 from nrel.hive.reporting.handler.handler import Handler
@@ -12,6 +12,7 @@ from nrel.hive.reporting.report_type import ReportType
 
 if TYPE_CHECKING:
     from nrel.hive.config.global_config import GlobalConfig
+    from nrel.hive.model.sim_time import SimTime
     from nrel.hive.runner.runner_payload import RunnerPayload
     from nrel.hive.reporting.reporter import Report
 
@@ -39,5 +40,9 @@ class InstructionHandler(Handler):
                 entry = json.dumps(report_json, default=str)
                 self.log_file.write(entry + "\n")
 
+    def handle_quiet_steps(self, runner_payload: RunnerPayload, sim_times: Sequence[SimTime]):
+        # no instructions are issued on a quiet time step
+        pass
+
     def close(self, runner_payload: RunnerPayload):
         self.log_file.close()
@@ -7,7 +7,7 @@ from collections import Counter
 from dataclasses import dataclass, field
 from functools import reduce
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Dict
+from typing import TYPE_CHECKING, List, Dict, Sequence
 
 import numpy as np
 
@@ -16,6 +16,7 @@ from nrel.hive.reporting.handler.summary_stats import SummaryStats
 from nrel.hive.reporting.report_type import ReportType
 
 if TYPE_CHECKING:
+    from nrel.hive.model.sim_time import SimTime
     from nrel.hive.reporting.reporter import Report
     from nrel.hive.runner.runner_payload import RunnerPayload
 
@@ -74,6 +75,23 @@ class StatsHandler(Handler):
         self.stats.requests += c[ReportType.ADD_REQUEST_EVENT]
         self.stats.cancelled_requests += c[ReportType.CANCEL_REQUEST_EVENT]
 
+    def handle_quiet_steps(self, runner_payload: RunnerPayload, sim_times: Sequence[SimTime]):
+        """
+        the vehicles hold the same states over each quiet time step, and nothing moves
+
+        :param runner_payload: the runner payload before the quiet time steps
+        :param sim_times: the sim time at the end of each quiet time step
+        :return:
+        """
+        state_counts = Counter(
+            map(
+                lambda v: v.vehicle_state.__class__.__name__,
+                runner_payload.s.get_vehicles(),
+            )
+        )
+        for state, count in state_counts.items():
+            self.stats.state_count[state] += count * len(sim_times)
+
     def close(self, runner_payload: RunnerPayload):
         """
         wrap up anything here. called at the end of the simulation
@@ -8,7 +8,7 @@ import os
 import pandas as pd
 from pandas import DataFrame
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Sequence
 
 from nrel.hive.reporting.handler.handler import Handler
 from nrel.hive.reporting.report_type import ReportType
@@ -16,6 +16,7 @@ from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 
 if TYPE_CHECKING:
     from nrel.hive.config import HiveConfig
+    from nrel.hive.model.sim_time import SimTime
     from nrel.hive.model.vehicle.vehicle import Vehicle
     from nrel.hive.runner.runner_payload import RunnerPayload
     from nrel.hive.reporting.reporter import Report
@@ -366,6 +367,34 @@ class TimeStepStatsHandler(Handler):
                 # append the statistics row to the fleet's data list
                 self.fleets_data[fleet_id].append(fleet_stats_row)
 
+    def handle_quiet_steps(self, runner_payload: RunnerPayload, sim_times: Sequence[SimTime]):
+        """
+        the statistics of each quiet time step are the same, so the row of the first
+        is computed and copied for the rest with their own time step and sim time
+
+        :param runner_payload: the runner payload before the quiet time steps
+        :param sim_times: the sim time at the end of each quiet time step
+        :return:
+        """
+        if len(sim_times) == 0:
+            return
+        first, rest = sim_times[0], sim_times[1:]
+        self.handle([], runner_payload._replace(s=runner_payload.s._replace(sim_time=first)))
+
+        tables = []
+        if self.log_time_step_stats:
+            tables.append(self.data)
+        if self.log_fleet_time_step_stats:
+            tables.extend(self.fleets_data.values())
+        for table in tables:
+            row = table[-1]
+            for sim_time in rest:
+                time_step = int(
+                    (sim_time.as_epoch_time() - self.start_time.as_epoch_time())
+                    / self.timestep_duration_seconds
+                )
+                table.append({**row, "time_step": time_step, "sim_time": sim_time.as_iso_time()})
+
     def close(self, runner_payload: RunnerPayload):
         """
         saves all time step stat DataFrames as csv files to the scenario output directory.
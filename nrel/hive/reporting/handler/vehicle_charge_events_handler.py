@@ -1,56 +1,234 @@
-from typing import List, Dict
+from __future__ import annotations
 
+import logging
+from typing import Dict, Hashable, List, Optional, Tuple, TypeVar
+
+import numpy as np
 import pandas as pd
+
+from nrel.hive.model.energy.energytype import EnergyType
 from nrel.hive.reporting.handler.handler import Handler
 from nrel.hive.reporting.report_type import ReportType
 from nrel.hive.reporting.reporter import Report
 from nrel.hive.runner import RunnerPayload
+from nrel.hive.state.simulation_state.entity_index import EntityIndex
 from nrel.hive.util import SimulationStateError
+from nrel.hive.util.typealiases import StationId, VehicleId
+
+log = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+SECONDS_PER_HOUR = 3600
 
 
 class VehicleChargeEventsHandler(Handler):
     """
-    allows grid co-simulation to observe the charging events within a time delta of hive
+    allows grid co-simulation to observe the charging events within a time delta of hive.
+
+    events are stored in preallocated column arrays used as a ring buffer, and the charging
+    load of each station is aggregated in kW at each time step. vehicles and stations are
+    stored by their slots in SimulationState.v_index and s_index, which are also the rows of
+    a SimulationObserver, and their ids are read from the last simulation state handled, see
+    vehicle_ids and station_ids. energy units are stored by index, in the order they are
+    first seen, see units. once a buffer is full, its oldest rows are overwritten, so callers
+    should read and clear the handler more often than the buffer capacity.
     """
 
-    def __init__(self) -> None:
-        self.prototype: Dict[str, List] = {
-            "vehicle_id": [],
-            "sim_time_start": [],
-            "sim_time_end": [],
-            "energy": [],
-            "units": [],
+    def __init__(self, event_capacity: int = 4096, time_step_capacity: int = 1440) -> None:
+        """
+        :param event_capacity: the number of charge events held before overwriting the oldest
+        :param time_step_capacity: the number of time steps of station load held before
+                                   overwriting the oldest
+        """
+        self.v_index = EntityIndex()
+        self.s_index = EntityIndex()
+        self.units: List[str] = []
+        self._units_index: Dict[str, int] = {}
+
+        self.events: Dict[str, np.ndarray] = {
+            "vehicle_index": np.zeros(event_capacity, dtype=np.int32),
+            "station_index": np.zeros(event_capacity, dtype=np.int32),
+            "sim_time_start": np.zeros(event_capacity, dtype=np.int64),
+            "sim_time_end": np.zeros(event_capacity, dtype=np.int64),
+            "energy": np.zeros(event_capacity, dtype=np.float64),
+            "units_index": np.zeros(event_capacity, dtype=np.int16),
         }
-        self.events = self.prototype.copy()
+        self._event_start = 0
+        self._event_count = 0
+
+        self.load_times = np.zeros(time_step_capacity, dtype=np.int64)
+        self.station_load_kw = np.zeros((time_step_capacity, 0), dtype=np.float64)
+        self._load_start = 0
+        self._load_count = 0
+
+    @property
+    def vehicle_ids(self) -> Tuple[Optional[VehicleId], ...]:
+        """
+        :return: the id of the vehicle in each slot, or None where the slot is vacant
+        """
+        return tuple(self.v_index.entity_id(i) for i in range(self.v_index.size))
+
+    @property
+    def station_ids(self) -> Tuple[Optional[StationId], ...]:
+        """
+        :return: the id of the station in each slot, or None where the slot is vacant
+        """
+        return tuple(self.s_index.entity_id(i) for i in range(self.s_index.size))
+
+    @property
+    def event_capacity(self) -> int:
+        return len(self.events["energy"])
+
+    @property
+    def time_step_capacity(self) -> int:
+        return len(self.load_times)
 
     def handle(self, reports: List[Report], runner_payload: RunnerPayload):
+        sim = runner_payload.s
+        self.v_index = sim.v_index
+        self.s_index = sim.s_index
+        self._grow_station_columns(sim.s_index.size)
+        load_row = self._next_load_row(runner_payload)
+        kwh_units = self._index_of(EnergyType.ELECTRIC.units, self._units_index, self.units)
         for report in reports:
             if report.report_type == ReportType.VEHICLE_CHARGE_EVENT:
                 try:
-                    self.events["vehicle_id"].append(report.report["vehicle_id"])
-                    self.events["sim_time_start"].append(report.report["sim_time_start"])
-                    self.events["sim_time_end"].append(report.report["sim_time_end"])
-                    self.events["energy"].append(report.report["energy"])
-                    self.events["units"].append(report.report["energy_units"])
+                    vehicle_index = sim.v_index.index_of(report.report["vehicle_id"])
+                    station_index = sim.s_index.index_of(report.report["station_id"])
+                    units_index = self._index_of(
+                        report.report["energy_units"], self._units_index, self.units
+                    )
+                    sim_time_start = int(report.report["sim_time_start"])
+                    sim_time_end = int(report.report["sim_time_end"])
+                    energy = float(report.report["energy"])
                 except KeyError as e:
                     raise SimulationStateError(
                         f"unable to parse charge event from report {report}, missing entry for {e}"
                     )
 
+                row = self._next_event_row()
+                self.events["vehicle_index"][row] = vehicle_index
+                self.events["station_index"][row] = station_index
+                self.events["sim_time_start"][row] = sim_time_start
+                self.events["sim_time_end"][row] = sim_time_end
+                self.events["energy"][row] = energy
+                self.events["units_index"][row] = units_index
+
+                duration_seconds = sim_time_end - sim_time_start
+                if units_index == kwh_units and duration_seconds > 0 and station_index >= 0:
+                    kw = energy * SECONDS_PER_HOUR / duration_seconds
+                    self.station_load_kw[load_row, station_index] += kw
+
+    def _index_of(self, key: K, index: Dict[K, int], keys: List[K]) -> int:
+        i = index.get(key)
+        if i is None:
+            i = len(keys)
+            index[key] = i
+            keys.append(key)
+        return i
+
+    def _grow_station_columns(self, n_stations: int):
+        n_columns = self.station_load_kw.shape[1]
+        if n_stations > n_columns:
+            grown = np.zeros(
+                (self.time_step_capacity, max(2 * n_columns, n_stations)), dtype=np.float64
+            )
+            grown[:, :n_columns] = self.station_load_kw
+            self.station_load_kw = grown
+
+    def _next_event_row(self) -> int:
+        row, self._event_start, self._event_count = _ring_push(
+            self._event_start, self._event_count, self.event_capacity, "charge event"
+        )
+        return row
+
+    def _next_load_row(self, runner_payload: RunnerPayload) -> int:
+        row, self._load_start, self._load_count = _ring_push(
+            self._load_start, self._load_count, self.time_step_capacity, "station load"
+        )
+        sim = runner_payload.s
+        self.load_times[row] = sim.sim_time - sim.sim_timestep_duration_seconds
+        self.station_load_kw[row] = 0.0
+        return row
+
+    def get_event_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        grabs the events as a column array for each field, oldest first. the arrays are
+        views of the buffer unless it has wrapped around since the last clear, in which
+        case they are copies. views are overwritten once the handler is cleared.
+
+        :return: the vehicle_index, station_index, sim_time_start, sim_time_end, energy
+                 and units_index of each event, where the vehicle and station indices are
+                 slots of v_index and s_index, or -1 if the entity had left the simulation
+        """
+        return {
+            k: _ring_read(v, self._event_start, self._event_count) for k, v in self.events.items()
+        }
+
+    def get_station_load(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        grabs the charging load of each station at each time step, oldest first, as views
+        of the buffer unless it has wrapped around since the last clear.
+
+        :return: the start time of each time step, and the kW load of each station at each
+                 time step, with one column per s_index slot, see station_ids
+        """
+        n_stations = self.s_index.size
+        times = _ring_read(self.load_times, self._load_start, self._load_count)
+        load = _ring_read(self.station_load_kw, self._load_start, self._load_count)
+        return times, load[:, :n_stations]
+
     def get_events(self):
         """
         grabs the events as a pandas dataframe
         :return: a pandas dataframe containing charge events
         """
-        df = pd.DataFrame(data=self.events)
+        events = self.get_event_arrays()
+        df = pd.DataFrame(
+            data={
+                "vehicle_id": [self.v_index.entity_id(int(i)) for i in events["vehicle_index"]],
+                "station_id": [self.s_index.entity_id(int(i)) for i in events["station_index"]],
+                "sim_time_start": events["sim_time_start"],
+                "sim_time_end": events["sim_time_end"],
+                "energy": events["energy"],
+                "units": np.array(self.units, dtype=object)[events["units_index"]],
+            }
+        )
         return df
 
     def clear(self):
         """
-        clears the stored events
+        clears the stored events and station loads
         :return:
         """
-        self.events = self.prototype.copy()
+        self._event_start = 0
+        self._event_count = 0
+        self._load_start = 0
+        self._load_count = 0
 
     def close(self, runner_payload: RunnerPayload):
         pass
+
+
+def _ring_push(start: int, count: int, capacity: int, name: str) -> Tuple[int, int, int]:
+    """
+    finds the row for a new entry of a ring buffer, overwriting the oldest entry if full
+
+    :return: the row to write, and the updated start and count of the ring buffer
+    """
+    if count < capacity:
+        return (start + count) % capacity, start, count + 1
+    if start == 0:
+        log.warning(f"{name} buffer is full at {capacity} entries; overwriting the oldest")
+    return start, (start + 1) % capacity, count
+
+
+def _ring_read(array: np.ndarray, start: int, count: int) -> np.ndarray:
+    """
+    reads the entries of a ring buffer in order, as a view if they are contiguous
+    """
+    end = start + count
+    if end <= len(array):
+        return array[start:end]
+    return np.concatenate([array[start:], array[: end - len(array)]])
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
 
 import h3
 
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from nrel.hive.model.vehicle.vehicle import Vehicle
     from nrel.hive.runner import Environment
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
+    from nrel.hive.dispatcher.instruction_generator.time_budget import TimeBudget
+    from nrel.hive.util.typealiases import MembershipId
 
 
 def refuel_search_event(vehicle: Vehicle, sim: SimulationState, env: Environment) -> Report:
@@ -40,3 +42,37 @@ def refuel_search_event(vehicle: Vehicle, sim: SimulationState, env: Environment
         },
     )
     return report
+
+
+def instruction_generator_budget_event(
+    instruction_generator: str,
+    budget: TimeBudget,
+    sim: SimulationState,
+    quality: Dict[str, str],
+    membership_id: Optional[MembershipId] = None,
+) -> Report:
+    """
+    report how an instruction generator with a time budget used it, and the quality of the
+    result it produced within it
+
+    :param instruction_generator: the name of the instruction generator
+    :param budget: the time budget, read at the end of the run
+    :param sim: the simulation state the generator ran on
+    :param quality: generator-specific measures of the result
+    :param membership_id: the fleet the run was for, if it was for a single fleet
+    :return: a report of this event
+    """
+    elapsed_seconds = budget.elapsed_seconds
+    report = Report(
+        report_type=ReportType.INSTRUCTION_GENERATOR_BUDGET_EVENT,
+        report={
+            "instruction_generator": instruction_generator,
+            "membership_id": str(membership_id) if membership_id is not None else "",
+            "sim_time": str(sim.sim_time),
+            "time_budget_seconds": str(budget.time_budget_seconds),
+            "elapsed_seconds": str(elapsed_seconds),
+            "over_budget": str(elapsed_seconds > budget.time_budget_seconds),
+            **quality,
+        },
+    )
+    return report
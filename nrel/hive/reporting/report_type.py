@@ -21,6 +21,7 @@ class ReportType(Enum):
     STATION_LOAD_EVENT = 11
     REFUEL_SEARCH_EVENT = 12
     DRIVER_SCHEDULE_EVENT = 13
+    INSTRUCTION_GENERATOR_BUDGET_EVENT = 14
 
     @classmethod
     def from_string(cls, s: str) -> ReportType:
@@ -38,6 +39,7 @@ class ReportType(Enum):
             "station_load_event": cls.STATION_LOAD_EVENT,
             "refuel_search_event": cls.REFUEL_SEARCH_EVENT,
             "driver_schedule_event": cls.DRIVER_SCHEDULE_EVENT,
+            "instruction_generator_budget_event": cls.INSTRUCTION_GENERATOR_BUDGET_EVENT,
         }
         try:
             return values[s]
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 from immutables import Map
-from pandas import DataFrame
-from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from nrel.hive.reporting.report_type import ReportType
 from nrel.hive.reporting.handler.stats_handler import StatsHandler
-from nrel.hive.reporting.handler.time_step_stats_handler import TimeStepStatsHandler
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
     from nrel.hive.model.membership import MembershipId
+    from nrel.hive.model.sim_time import SimTime
     from nrel.hive.runner.runner_payload import RunnerPayload
     from nrel.hive.reporting.handler.handler import Handler
 
@@ -49,6 +49,20 @@ class Reporter:
 
         self.reports = []
 
+    def flush_quiet_steps(self, runner_payload: RunnerPayload, sim_times: Sequence[SimTime]):
+        """
+        called in place of flush for a run of time steps which change nothing but the sim time,
+        such as those skipped by an event-driven run.
+
+        :param runner_payload: the runner payload before the quiet time steps
+        :param sim_times: the sim time at the end of each quiet time step
+        :return: Does not return a value.
+        """
+        for handler in self.handlers:
+            handler.handle_quiet_steps(runner_payload, sim_times)
+
+        self.reports = []
+
     def file_report(self, report: Report):
         """
         files a single report to be handled later.
@@ -77,6 +91,9 @@ class Reporter:
         if a TimeStepStatsHandler exists, return the time step stats DataFrame and the fleet time step stats DataFrames
         :return: the time step stats DataFrame and the fleet time step stats collection of DataFrames if they exist
         """
+        # imported here since the time step stats are built with pandas, which is slow to import
+        from nrel.hive.reporting.handler.time_step_stats_handler import TimeStepStatsHandler
+
         time_step_stats, fleet_time_step_stats = None, None
         for handler in self.handlers:
             if isinstance(handler, TimeStepStatsHandler):
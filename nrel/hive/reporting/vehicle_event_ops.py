@@ -14,7 +14,7 @@ from nrel.hive.model.roadnetwork.routetraversal import RouteTraversal
 from nrel.hive.reporting.reporter import Report, ReportType
 from nrel.hive.runner.environment import Environment
 from nrel.hive.state.simulation_state.simulation_state import SimulationState
-from nrel.hive.util import StationId, TupleOps
+from nrel.hive.util import StationId
 from nrel.hive.util.time_helpers import time_diff
 
 if TYPE_CHECKING:
@@ -31,7 +31,8 @@ def vehicle_move_event(
     env: Environment,
 ) -> Report:
     """
-    creates a vehicle move report based on the effect of one time step of moving
+    creates a vehicle move report based on the effect of one time step of moving. the
+    experienced route is only drawn as a linestring when move events are logged.
 
     :param move_result: the result of a move
     :param env: the simulation environment
@@ -61,7 +62,10 @@ def vehicle_move_event(
 
     geoid = next_vehicle.geoid
     lat, lon = h3.h3_to_geo(geoid)
-    geom = route.to_linestring(route_traversal.experienced_route, env)
+    if ReportType.VEHICLE_MOVE_EVENT in env.config.global_config.log_sim_config:
+        geom = route.to_linestring(route_traversal.experienced_route, env)
+    else:
+        geom = ""
     report_data = {
         "sim_time_start": sim_time_start,
         "sim_time_end": sim_time_end,
@@ -206,8 +210,7 @@ def report_dropoff_request(vehicle: Vehicle, sim: SimulationState, request: Requ
 
     geoid = vehicle.geoid
     lat, lon = h3.h3_to_geo(geoid)
-    # somewhat a hack, we just grab the membership from the first passenger
-    membership = TupleOps.head(request.passengers).membership
+    membership = request.membership
     travel_time = time_diff(
         request.departure_time.as_datetime_time(),
         sim.sim_time.as_datetime_time(),
@@ -5,7 +5,7 @@ from typing import Dict, Union, Callable
 import h3
 import immutables
 import yaml
-from pkg_resources import resource_filename
+from nrel.hive.util.fs import resource_filename
 
 
 from nrel.hive.config import HiveConfig
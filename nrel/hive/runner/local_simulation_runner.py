@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools as ft
 import logging
-from typing import NamedTuple, TYPE_CHECKING, Callable, Optional
+from typing import NamedTuple, TYPE_CHECKING, Callable, Optional, Tuple
 
 from tqdm import tqdm
 
@@ -12,6 +12,7 @@ log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from nrel.hive.runner.environment import Environment
+    from nrel.hive.model.sim_time import SimTime
 
 
 class LocalSimulationRunner(NamedTuple):
@@ -23,18 +24,25 @@ class LocalSimulationRunner(NamedTuple):
     def run(
         cls,
         runner_payload: RunnerPayload,
+        end_time: Optional[SimTime] = None,
     ) -> RunnerPayload:
         """
         steps through time, running a simulation, and producing a simulation result
 
         :param runner_payload: the initial state of the simulation
+        :param end_time: optionally stop before the configured end time, such as when
+                         warm-starting a set of scenario variants from a shared prefix
         :return: the final simulation state and dispatcher state
         """
+        stop_time = runner_payload.e.config.sim.end_time if end_time is None else end_time
+
+        if runner_payload.e.config.sim.event_driven:
+            return _run_event_driven(runner_payload, stop_time)
 
         time_steps = tqdm(
             range(
-                int(runner_payload.e.config.sim.start_time),
-                int(runner_payload.e.config.sim.end_time),
+                int(runner_payload.s.sim_time),
+                int(stop_time),
                 runner_payload.e.config.sim.timestep_duration_seconds,
             )
         )
@@ -69,3 +77,82 @@ def _run_step_in_context(env: Environment) -> Callable:
         return updated_payload
 
     return _run_step
+
+
+def _run_event_driven(runner_payload: RunnerPayload, stop_time: SimTime) -> RunnerPayload:
+    """
+    steps through time like the fixed time step loop, but whenever a time step changes nothing
+    except the sim time, jumps ahead to the next time step where an update function, a scheduled
+    instruction generator or a driver has an event. since such a quiet time step would repeat
+    until then, the result matches a fixed time step run. the reports of the skipped time steps
+    are handled in bulk.
+
+    :param runner_payload: the initial state of the simulation
+    :param stop_time: the time to run until
+    :return: the final simulation state and dispatcher state
+    """
+    dt = runner_payload.e.config.sim.timestep_duration_seconds
+    run_step = _run_step_in_context(runner_payload.e)
+    start_time = int(runner_payload.s.sim_time)
+    progress = tqdm(total=len(range(start_time, int(stop_time), dt)))
+
+    payload = runner_payload
+    while payload.s.sim_time < stop_time:
+        next_payload = run_step(payload)
+        progress.update(1)
+        if _is_quiet_step(payload, next_payload):
+            next_payload, skipped = _skip_quiet_time_steps(next_payload, stop_time)
+            progress.update(skipped)
+        payload = next_payload
+
+    progress.close()
+    return payload
+
+
+def _is_quiet_step(payload: RunnerPayload, next_payload: RunnerPayload) -> bool:
+    """
+    tests if a time step changed nothing but the sim time. the simulation state is immutable,
+    so an entity collection which was not modified is the same object after the time step.
+
+    :param payload: the payload before the time step
+    :param next_payload: the payload after the time step
+    :return: True if the time step was quiet
+    """
+    sim, next_sim = payload.s, next_payload.s
+    return (
+        len(next_sim.applied_instructions) == 0
+        and next_sim.vehicles is sim.vehicles
+        and next_sim.requests is sim.requests
+        and next_sim.stations is sim.stations
+        and next_sim.bases is sim.bases
+        and next_sim.road_network is sim.road_network
+        and next_payload.u.pre_step_update == payload.u.pre_step_update
+        and next_payload.u.step_update.instruction_generators
+        == payload.u.step_update.instruction_generators
+    )
+
+
+def _skip_quiet_time_steps(payload: RunnerPayload, stop_time: SimTime) -> Tuple[RunnerPayload, int]:
+    """
+    advances the sim time over the time steps which would repeat a quiet time step, up to the
+    next event time, and hands the reports of those time steps to the reporter at once
+
+    :param payload: the payload after the quiet time step
+    :param stop_time: the time to run until
+    :return: the payload at the next time step which may change the simulation,
+             along with the number of time steps skipped
+    """
+    sim = payload.s
+    dt = sim.sim_timestep_duration_seconds
+    next_event_time = payload.u.next_event_time(payload)
+    horizon = stop_time if next_event_time is None else min(next_event_time, stop_time)
+    skipped = max(0, -(-(horizon - sim.sim_time) // dt))
+    if skipped == 0:
+        return payload, 0
+
+    # each skipped time step would be reported at the end of the step
+    report_times = tuple(sim.sim_time + i * dt for i in range(1, skipped + 1))
+    skipped_payload = payload._replace(s=sim._replace(sim_time=report_times[-1]))
+    payload.e.reporter.flush_quiet_steps(payload, report_times)
+
+    return skipped_payload, skipped
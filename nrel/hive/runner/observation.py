@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Generic, List, NamedTuple, Optional, Tuple, TypeVar
+from typing import TYPE_CHECKING
+
+import h3
+import immutables
+import numpy as np
+
+from nrel.hive.state.simulation_state.entity_index import EntityIndex
+from nrel.hive.state.vehicle_state.servicing_pooling_trip import ServicingPoolingTrip
+from nrel.hive.state.vehicle_state.servicing_trip import ServicingTrip
+from nrel.hive.util.exception import SimulationStateError
+from nrel.hive.util.typealiases import EntityId
+
+if TYPE_CHECKING:
+    from nrel.hive.model.request import Request
+    from nrel.hive.model.station.station import Station
+    from nrel.hive.model.vehicle.vehicle import Vehicle
+    from nrel.hive.runner.environment import Environment
+    from nrel.hive.state.simulation_state.simulation_state import SimulationState
+
+E = TypeVar("E")
+
+VEHICLE_OBSERVATION_DTYPE = np.dtype(
+    [
+        ("present", np.bool_),
+        ("soc", np.float64),
+        ("lat", np.float64),
+        ("lon", np.float64),
+        ("vehicle_state", np.int16),
+        ("station_index", np.int32),
+        ("available_seats", np.int16),
+        ("balance", np.float64),
+    ]
+)
+
+STATION_OBSERVATION_DTYPE = np.dtype(
+    [
+        ("present", np.bool_),
+        ("lat", np.float64),
+        ("lon", np.float64),
+        ("total_chargers", np.int32),
+        ("available_chargers", np.int32),
+        ("enqueued_vehicles", np.int32),
+        ("balance", np.float64),
+    ]
+)
+
+REQUEST_OBSERVATION_DTYPE = np.dtype(
+    [
+        ("present", np.bool_),
+        ("origin_lat", np.float64),
+        ("origin_lon", np.float64),
+        ("destination_lat", np.float64),
+        ("destination_lon", np.float64),
+        ("departure_time", np.int64),
+        ("passengers", np.int16),
+        ("vehicle_index", np.int32),
+        ("value", np.float64),
+    ]
+)
+
+
+class Observation(NamedTuple):
+    """
+    the observation arrays of one simulation state. each array is a view of the observer's
+    buffer with one row per entity index in use, where rows with present == False are
+    vacant. the views are overwritten by the next call to SimulationObserver.observe.
+
+    :param sim_time: the sim time of the observed state
+    :param vehicles: the vehicle rows, with dtype VEHICLE_OBSERVATION_DTYPE
+    :param stations: the station rows, with dtype STATION_OBSERVATION_DTYPE
+    :param requests: the request rows, with dtype REQUEST_OBSERVATION_DTYPE
+    """
+
+    sim_time: int
+    vehicles: np.ndarray
+    stations: np.ndarray
+    requests: np.ndarray
+
+
+class ObservationTable(Generic[E]):
+    """
+    the observation rows of one type of entity, one row per slot of the entity's
+    EntityIndex in the simulation state.
+
+    an entity keeps its slot for as long as it is in the simulation; the slot of a removed
+    entity is reused by the next new entity, most recently released first. the table keeps
+    the entities it last observed so that only the rows of entities which have changed are
+    rewritten, read from the change journal of the EntityIndex when changes are tracked,
+    see simulation_state_ops.track_entity_changes.
+    """
+
+    def __init__(
+        self,
+        dtype: np.dtype,
+        capacity: int,
+        shared: bool,
+    ) -> None:
+        self.dtype = dtype
+        self.shared = shared
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        self.buffer = self._allocate(max(capacity, 1))
+        self.entity_index: Optional[EntityIndex] = None
+        self.entities: immutables.Map[EntityId, E] = immutables.Map()
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if not self.shared:
+            return np.zeros(capacity, dtype=self.dtype)
+        self.shm = shared_memory.SharedMemory(create=True, size=capacity * self.dtype.itemsize)
+        buffer: np.ndarray = np.ndarray((capacity,), dtype=self.dtype, buffer=self.shm.buf)
+        buffer[:] = np.zeros(1, dtype=self.dtype)
+        return buffer
+
+    @property
+    def capacity(self) -> int:
+        return len(self.buffer)
+
+    @property
+    def size(self) -> int:
+        return self.entity_index.size if self.entity_index is not None else 0
+
+    @property
+    def ids(self) -> Tuple[Optional[EntityId], ...]:
+        """
+        :return: the id of the entity at each index, or None where the index is vacant
+        """
+        return tuple(self.entity_id(index) for index in range(self.size))
+
+    def index_of(self, entity_id: Optional[EntityId]) -> int:
+        """
+        :return: the index of an entity, or -1 if it is not observed
+        """
+        return self.entity_index.index_of(entity_id) if self.entity_index is not None else -1
+
+    def entity_id(self, index: int) -> Optional[EntityId]:
+        """
+        :return: the id of the entity at an index, or None if the index is vacant
+        """
+        return self.entity_index.entity_id(index) if self.entity_index is not None else None
+
+    def _grow(self, size: int):
+        if size <= self.capacity:
+            return
+        if self.shared:
+            raise SimulationStateError(
+                f"observation buffer with capacity {self.capacity} is full; shared memory "
+                "buffers cannot grow, so build the SimulationObserver with a larger capacity"
+            )
+        grown = np.zeros(max(self.capacity * 2, size), dtype=self.dtype)
+        grown[: self.capacity] = self.buffer
+        self.buffer = grown
+
+    def update(
+        self,
+        entities: immutables.Map[EntityId, E],
+        entity_index: EntityIndex,
+        to_row: Callable[[E], Tuple],
+    ):
+        """
+        rewrites the rows of the entities which were added, modified or removed since the
+        last update. when the entity_index tracks changes and follows from the last one
+        observed, only the slots it lists as changed are visited. otherwise, entities are
+        compared by identity, since the simulation state replaces an entity whenever it
+        changes, and by slot, in case the entity_index did not follow from the last one
+        observed, such as for a different simulation.
+
+        :param entities: the entities in the simulation state
+        :param entity_index: the EntityIndex of the entities
+        :param to_row: builds the row of an entity, as a tuple following the table dtype
+        :raises: SimulationStateError if a shared memory buffer is out of capacity
+        """
+        previous_entities = self.entities
+        previous_index = self.entity_index
+        if entities is previous_entities and entity_index is previous_index:
+            return
+        self._grow(entity_index.size)
+
+        if (
+            previous_index is not None
+            and previous_index.tracked
+            and entity_index.tracked
+            and entity_index.version > previous_index.version
+        ):
+            vacated, indices, rows = _changed_rows(
+                entities, entity_index, previous_index.version, to_row
+            )
+        else:
+            vacated, indices, rows = _compared_rows(
+                entities, entity_index, previous_entities, previous_index, to_row
+            )
+
+        if vacated:
+            self.buffer[vacated] = np.zeros(1, dtype=self.dtype)
+        if indices:
+            self.buffer[indices] = np.array(rows, dtype=self.dtype)
+        self.entities = entities
+        self.entity_index = entity_index
+
+    def view(self) -> np.ndarray:
+        return self.buffer[: self.size]
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.unlink()
+            try:
+                self.buffer = np.zeros(0, dtype=self.dtype)
+                self.shm.close()
+            except BufferError:
+                # views of the buffer are still held by the caller; the memory is released
+                # once they are dropped
+                pass
+            self.shm = None
+
+
+class SimulationObserver:
+    """
+    builds array observations of the vehicles, stations and requests of a simulation,
+    such as for reinforcement learning agents or grid co-simulation.
+
+    each entity's row is its slot in the EntityIndex of the simulation state, which is
+    stable for as long as it remains in the simulation, and the arrays are updated in
+    place, only rewriting the rows of entities which changed since the last observation.
+    observing a simulation whose entity changes are tracked, see
+    simulation_state_ops.track_entity_changes, visits only the changed entities.
+    when built with shared_memory=True, the arrays live in named shared memory blocks which
+    another process can read without copying, see attach_observation_buffer; shared buffers
+    cannot grow past their capacity.
+    """
+
+    def __init__(
+        self,
+        vehicle_capacity: int = 0,
+        station_capacity: int = 0,
+        request_capacity: int = 0,
+        shared_memory: bool = False,
+    ) -> None:
+        """
+        :param vehicle_capacity: the initial number of vehicle rows
+        :param station_capacity: the initial number of station rows
+        :param request_capacity: the initial number of request rows
+        :param shared_memory: allocate the arrays in shared memory
+        """
+        self.vehicles: ObservationTable = ObservationTable(
+            VEHICLE_OBSERVATION_DTYPE, vehicle_capacity, shared_memory
+        )
+        self.stations: ObservationTable = ObservationTable(
+            STATION_OBSERVATION_DTYPE, station_capacity, shared_memory
+        )
+        self.requests: ObservationTable = ObservationTable(
+            REQUEST_OBSERVATION_DTYPE, request_capacity, shared_memory
+        )
+
+    @property
+    def shared_memory_names(self) -> Dict[str, str]:
+        """
+        :return: the shared memory block name of each array, if allocated in shared memory
+        """
+        tables = {"vehicles": self.vehicles, "stations": self.stations, "requests": self.requests}
+        return {k: t.shm.name for k, t in tables.items() if t.shm is not None}
+
+    def observe(self, sim: SimulationState, env: Environment) -> Observation:
+        """
+        updates the observation arrays to match a simulation state, rewriting the rows of
+        the entities added, modified or removed since the last observation.
+
+        :param sim: the simulation state
+        :param env: the simulation environment
+        :return: the observation arrays
+        :raises: SimulationStateError if a shared memory buffer is out of capacity
+        """
+        self.stations.update(sim.stations, sim.s_index, _station_row)
+        self.vehicles.update(sim.vehicles, sim.v_index, lambda v: _vehicle_row(v, env, sim))
+        self.requests.update(sim.requests, sim.r_index, lambda r: _request_row(r, sim))
+        return Observation(
+            sim_time=int(sim.sim_time),
+            vehicles=self.vehicles.view(),
+            stations=self.stations.view(),
+            requests=self.requests.view(),
+        )
+
+    def close(self):
+        """
+        releases any shared memory held by the observer
+        """
+        self.vehicles.close()
+        self.stations.close()
+        self.requests.close()
+
+
+def _changed_rows(
+    entities: immutables.Map[EntityId, E],
+    entity_index: EntityIndex,
+    since_version: int,
+    to_row: Callable[[E], Tuple],
+) -> Tuple[List[int], List[int], List[Tuple]]:
+    """
+    lists the vacated slots and the rows to rewrite from the change journal of entity_index
+    """
+    vacated = []
+    indices = []
+    rows = []
+    for slot in entity_index.changed_slots(since_version):
+        entity_id = entity_index.entity_id(slot)
+        if entity_id is None:
+            vacated.append(slot)
+        else:
+            indices.append(slot)
+            rows.append(to_row(entities[entity_id]))
+    return vacated, indices, rows
+
+
+def _compared_rows(
+    entities: immutables.Map[EntityId, E],
+    entity_index: EntityIndex,
+    previous_entities: immutables.Map[EntityId, E],
+    previous_index: Optional[EntityIndex],
+    to_row: Callable[[E], Tuple],
+) -> Tuple[List[int], List[int], List[Tuple]]:
+    """
+    lists the vacated slots and the rows to rewrite by comparing each entity with the one
+    last observed
+    """
+    vacated = []
+    if previous_index is not None:
+        vacated = [
+            previous_index.index_of(entity_id)
+            for entity_id in previous_entities.keys()
+            if entity_index.index_of(entity_id) != previous_index.index_of(entity_id)
+        ]
+
+    indices = []
+    rows = []
+    for entity_id, entity in entities.items():
+        slot = entity_index.index_of(entity_id)
+        if (
+            previous_entities.get(entity_id) is entity
+            and previous_index is not None
+            and previous_index.index_of(entity_id) == slot
+        ):
+            continue
+        indices.append(slot)
+        rows.append(to_row(entity))
+    return vacated, indices, rows
+
+
+def _vehicle_row(vehicle: Vehicle, env: Environment, sim: SimulationState) -> Tuple:
+    mechatronics = env.mechatronics.get(vehicle.mechatronics_id)
+    soc = mechatronics.fuel_source_soc(vehicle) if mechatronics is not None else np.nan
+    lat, lon = h3.h3_to_geo(vehicle.geoid)
+    vehicle_state = vehicle.vehicle_state
+    station_index = sim.s_index.index_of(getattr(vehicle_state, "station_id", None))
+    if isinstance(vehicle_state, ServicingPoolingTrip):
+        occupied_seats = vehicle_state.num_passengers
+    elif isinstance(vehicle_state, ServicingTrip):
+        occupied_seats = vehicle_state.request.num_passengers
+    else:
+        occupied_seats = 0
+    return (
+        True,
+        soc,
+        lat,
+        lon,
+        vehicle_state.vehicle_state_type.value,
+        station_index,
+        max(vehicle.total_seats - occupied_seats, 0),
+        vehicle.balance,
+    )
+
+
+def _station_row(station: Station) -> Tuple:
+    lat, lon = h3.h3_to_geo(station.geoid)
+    total_chargers = 0
+    available_chargers = 0
+    enqueued_vehicles = 0
+    for charger_state in station.state.values():
+        total_chargers += charger_state.total_chargers
+        available_chargers += charger_state.available_chargers
+        enqueued_vehicles += charger_state.enqueued_vehicles
+    return (
+        True,
+        lat,
+        lon,
+        total_chargers,
+        available_chargers,
+        enqueued_vehicles,
+        station.balance,
+    )
+
+
+def _request_row(request: Request, sim: SimulationState) -> Tuple:
+    origin_lat, origin_lon = h3.h3_to_geo(request.origin)
+    destination_lat, destination_lon = h3.h3_to_geo(request.destination)
+    vehicle_index = sim.v_index.index_of(request.dispatched_vehicle)
+    return (
+        True,
+        origin_lat,
+        origin_lon,
+        destination_lat,
+        destination_lon,
+        int(request.departure_time),
+        request.num_passengers,
+        vehicle_index,
+        request.value,
+    )
+
+
+def attach_observation_buffer(
+    name: str, dtype: np.dtype, capacity: int
+) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    attaches to an observation array in shared memory from another process. the caller
+    should close the returned SharedMemory once done, after dropping the array.
+
+    :param name: the shared memory block name, from SimulationObserver.shared_memory_names
+    :param dtype: the dtype of the array, such as VEHICLE_OBSERVATION_DTYPE
+    :param capacity: the capacity of the array
+    :return: the shared memory block and an array backed by it
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    buffer: np.ndarray = np.ndarray((capacity,), dtype=dtype, buffer=shm.buf)
+    return shm, buffer
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+from typing import Optional, Sequence, Tuple, TYPE_CHECKING
+
+import immutables
+
+from nrel.hive.reporting.reporter import Reporter
+from nrel.hive.runner.observation import Observation, SimulationObserver
+from nrel.hive.runner.runner_payload import RunnerPayload
+from nrel.hive.state.simulation_state import simulation_state_ops
+from nrel.hive.state.simulation_state.update.step_simulation_ops import apply_instructions
+from nrel.hive.state.simulation_state.update.update import Update
+from nrel.hive.util.exception import SimulationStateError
+
+log = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from nrel.hive.dispatcher.instruction.instruction import Instruction
+    from nrel.hive.model.sim_time import SimTime
+    from nrel.hive.state.simulation_state.update.simulation_update import (
+        SimulationUpdateFunction,
+    )
+
+
+class VectorizedSimulationRunner:
+    """
+    steps several copies of one scenario in lock-step, such as the environments of a
+    reinforcement learning policy.
+
+    the copies share one Environment and road network, so the scenario is only loaded once,
+    and reset simply returns each copy to the initial simulation state. since the copies are
+    always at the same sim time, the updates which read requests and charging prices from
+    file are shared between them, reading and snapping each input once per time step. the
+    dispatcher runs separately in each copy, as the copies diverge once instructions differ.
+
+    the shared Environment has a Reporter without handlers, so reports are discarded at
+    each time step. use the LocalSimulationRunner for runs that write outputs.
+    """
+
+    def __init__(
+        self,
+        runner_payload: RunnerPayload,
+        num_envs: int,
+        vehicle_capacity: int = 0,
+        station_capacity: int = 0,
+        request_capacity: int = 0,
+        shared_memory: bool = False,
+    ) -> None:
+        """
+        :param runner_payload: the initial state of the scenario, as loaded by load_simulation
+        :param num_envs: the number of copies of the scenario to step
+        :param vehicle_capacity: the initial number of vehicle rows of each observation
+        :param station_capacity: the initial number of station rows of each observation
+        :param request_capacity: the initial number of request rows of each observation
+        :param shared_memory: allocate the observations in shared memory
+        """
+        if num_envs < 1:
+            raise ValueError(f"num_envs must be positive, found {num_envs}")
+        self.env = runner_payload.e.set_reporter(Reporter())
+        # the observers read the entities changed at each step from the entity indices
+        sim = simulation_state_ops.track_entity_changes(runner_payload.s)
+        self.initial_payload = runner_payload._replace(s=sim, e=self.env)
+        self.observers = tuple(
+            SimulationObserver(vehicle_capacity, station_capacity, request_capacity, shared_memory)
+            for _ in range(num_envs)
+        )
+        self.payloads: Tuple[RunnerPayload, ...] = ()
+        self.pre_step_update: Tuple[SimulationUpdateFunction, ...] = ()
+        self.reset()
+
+    @property
+    def num_envs(self) -> int:
+        return len(self.observers)
+
+    @property
+    def sim_time(self) -> SimTime:
+        return self.payloads[0].s.sim_time
+
+    @property
+    def done(self) -> bool:
+        """
+        :return: True if the copies have reached the end time of the scenario
+        """
+        return self.sim_time >= self.env.config.sim.end_time
+
+    def reset(self) -> Tuple[Observation, ...]:
+        """
+        returns every copy to the initial simulation state. the pre-step updates of the
+        initial payload are reset, so that those which read requests and charging prices
+        from file read them again from the start, and the files of the replaced updates
+        are closed.
+
+        :return: the observation of each copy
+        :raises: SimulationStateError if a pre-step update of the initial payload cannot be reset
+        """
+        initial_pre_step_update = self.initial_payload.u.pre_step_update
+        if len(self.payloads) == 0:
+            # the initial payload's updates have not been applied yet
+            pre_step_update = initial_pre_step_update
+        else:
+            pre_step_update = tuple(fn.reset() for fn in initial_pre_step_update)
+        for fn in self.pre_step_update:
+            fn.close()
+        self.pre_step_update = pre_step_update
+        self.payloads = (self.initial_payload,) * self.num_envs
+        return self.observe()
+
+    def step(
+        self, instructions: Optional[Sequence[Tuple[Instruction, ...]]] = None
+    ) -> Tuple[Tuple[Observation, ...], bool]:
+        """
+        advances every copy by one time step. any instructions are applied to their copy after
+        the requests and prices are updated and before the dispatcher runs, so they may be
+        overridden by the dispatcher's own instructions.
+
+        :param instructions: optionally, the instructions to apply to each copy
+        :return: the observation of each copy, and whether the copies reached the end time
+        :raises: SimulationStateError if the copies are already at the end time
+        """
+        if self.done:
+            raise SimulationStateError("cannot step past the end time; call reset first")
+        if instructions is not None and len(instructions) != self.num_envs:
+            raise ValueError(
+                f"expected instructions for {self.num_envs} environments, found {len(instructions)}"
+            )
+
+        # clear the cache of applied instructions from each SimulationState
+        sims = tuple(p.s._replace(applied_instructions=immutables.Map()) for p in self.payloads)
+
+        # run each pre_step_update once across all copies
+        updated_pre_step_fns = []
+        for fn in self.pre_step_update:
+            sims, updated_fn = fn.update_many(sims, self.env)
+            updated_pre_step_fns.append(updated_fn if updated_fn else fn)
+        self.pre_step_update = tuple(updated_pre_step_fns)
+
+        next_payloads = []
+        for i, (payload, sim) in enumerate(zip(self.payloads, sims)):
+            if instructions is not None and len(instructions[i]) > 0:
+                sim = apply_instructions(sim, self.env, instructions[i])
+            updated_sim, updated_step_fn = payload.u.step_update.update(sim, self.env)
+            next_update = Update(self.pre_step_update, updated_step_fn)
+            next_payloads.append(payload._replace(s=updated_sim, u=next_update))
+        self.payloads = tuple(next_payloads)
+
+        self.env.reporter.flush(self.payloads[0])
+
+        return self.observe(), self.done
+
+    def observe(self) -> Tuple[Observation, ...]:
+        """
+        :return: the observation of each copy at the current sim time
+        """
+        return tuple(o.observe(p.s, p.e) for o, p in zip(self.observers, self.payloads))
+
+    def close(self):
+        """
+        releases any shared memory held by the observations, along with any files held by
+        the pre-step updates
+        """
+        for fn in self.pre_step_update:
+            fn.close()
+        for observer in self.observers:
+            observer.close()
@@ -19,6 +19,7 @@ from nrel.hive.state.vehicle_state.charging_station import ChargingStation
 from nrel.hive.state.vehicle_state.idle import Idle
 from nrel.hive.state.vehicle_state.reserve_base import ReserveBase
 from nrel.hive.util import BaseId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -28,7 +29,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class AutonomousAvailable(DriverState):
     """
     an autonomous driver that is available to work
@@ -78,3 +79,7 @@ class AutonomousAvailable(DriverState):
     ) -> Tuple[Optional[Exception], Optional[SimulationState]]:
         # there is no other state for an autonomous driver, so, this is a noop
         return None, sim
+
+    def next_update_time(self, sim: SimulationState, env: Environment) -> Optional[int]:
+        # the update is a noop, so it never needs to be called
+        return None
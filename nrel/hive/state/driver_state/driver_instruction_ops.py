@@ -4,7 +4,7 @@ import logging
 from turtle import home
 from typing import Optional, TYPE_CHECKING, Tuple
 
-import h3
+import numpy as np
 
 from nrel.hive.dispatcher.instruction.instruction import Instruction
 from nrel.hive.dispatcher.instruction.instructions import (
@@ -34,6 +34,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# the number of dense request search hexes a looking human driver chooses between
+REPOSITION_SEARCH_HEXES = 5
+
 
 def human_charge_at_home(
     veh: Vehicle,
@@ -147,22 +150,23 @@ def human_look_for_requests(
 
     def _get_reposition_location() -> Optional[EntityPosition]:
         """
-        takes the most dense request search hex as a proxy for high demand areas
+        takes the most dense request search hexes as a proxy for high demand areas,
+        choosing the nearest of them so that drivers in different places spread out
+        over the dense hexes instead of all heading for the single densest one
         :return:
         """
-        if len(sim.r_search) == 0:
+        dense_search_hexes = sim.r_search_density.top_k(REPOSITION_SEARCH_HEXES, veh.geoid)
+        if len(dense_search_hexes) == 0:
             # no requests in system, do nothing
             return None
+        elif len(dense_search_hexes) == 1:
+            best_search_hex, _ = dense_search_hexes[0]
         else:
-            # find the most dense request search hex and sends vehicles to the center
-            best_search_hex = sorted(
-                [(k, len(v)) for k, v in sim.r_search.items()],
-                key=lambda t: t[1],
-                reverse=True,
-            )[0][0]
-        destination = h3.h3_to_center_child(best_search_hex, sim.sim_h3_location_resolution)
-        destination_link = sim.road_network.position_from_geoid(destination)
-        return destination_link
+            hexes = tuple(search_hex for search_hex, _ in dense_search_hexes)
+            distances = H3Ops.great_circle_distance_matrix((veh.geoid,), hexes)[0]
+            best_search_hex = hexes[int(np.argmin(distances))]
+        # sends vehicles to the center of the chosen request search hex
+        return sim.r_search_density.position(best_search_hex)
 
     dest = _get_reposition_location()
     if dest:
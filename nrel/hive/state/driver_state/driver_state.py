@@ -18,6 +18,8 @@ class DriverState(ABC):
     superclass for all driver state instances
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def schedule_id(cls) -> Optional[ScheduleId]:
@@ -48,6 +50,17 @@ class DriverState(ABC):
     ) -> Tuple[Optional[Exception], Optional[SimulationState]]:
         pass
 
+    def next_update_time(self, sim: SimulationState, env: Environment) -> Optional[int]:
+        """
+        the next sim time at which calling update may change this driver state. by default,
+        a driver state is updated at every time step.
+
+        :param sim: the simulation state
+        :param env: the simulation environment
+        :return: the sim time of the next update, or None if an update would never change it
+        """
+        return sim.sim_time + sim.sim_timestep_duration_seconds
+
     @abstractmethod
     def generate_instruction(
         self,
@@ -9,6 +9,7 @@ from nrel.hive.dispatcher.instruction.instructions import (
     DispatchBaseInstruction,
     ReserveBaseInstruction,
 )
+from nrel.hive.model.vehicle.schedules.schedule import next_schedule_update_time
 from nrel.hive.reporting.driver_event_ops import (
     driver_schedule_event,
     ScheduleEventType,
@@ -35,6 +36,7 @@ from nrel.hive.state.vehicle_state.servicing_trip import ServicingTrip
 from nrel.hive.state.vehicle_state.idle import Idle
 from nrel.hive.state.vehicle_state.reserve_base import ReserveBase
 from nrel.hive.util import SimulationStateError, BaseId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -47,7 +49,7 @@ log = logging.getLogger(__name__)
 # these two classes (HumanAvailable, HumanUnavailable) are in the same file in order to avoid circular references
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class HumanAvailable(DriverState):
     """
     a human driver that is available to work as the current simulation state is consistent with
@@ -142,8 +144,22 @@ class HumanAvailable(DriverState):
             result = DriverState.apply_new_driver_state(sim, self.attributes.vehicle_id, next_state)
             return result
 
+    def next_update_time(self, sim: SimulationState, env: Environment) -> Optional[int]:
+        """
+        an available driver only changes state when its schedule ends
+
+        :param sim: the simulation state
+        :param env: the simulation environment
+        :return: the sim time of the next update, or None if the driver has no schedule
+        """
+        schedule_function = env.schedules.get(self.attributes.schedule_id)
+        if schedule_function is None:
+            return None
+        else:
+            return next_schedule_update_time(schedule_function, sim)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class HumanUnavailable(DriverState):
     """
     a human driver that is not available to work
@@ -293,3 +309,17 @@ class HumanUnavailable(DriverState):
         else:
             # stay unavailable
             return None, sim
+
+    def next_update_time(self, sim: "SimulationState", env: "Environment") -> Optional[int]:
+        """
+        an unavailable driver only changes state when its schedule begins
+
+        :param sim: the simulation state
+        :param env: the simulation environment
+        :return: the sim time of the next update, or None if the driver has no schedule
+        """
+        schedule_function = env.schedules.get(self.attributes.schedule_id)
+        if schedule_function is None:
+            return None
+        else:
+            return next_schedule_update_time(schedule_function, sim)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import bisect
+from typing import NamedTuple, Optional, Tuple
+
+import immutables
+
+from nrel.hive.util.typealiases import VehicleId
+
+
+class DriverUpdateQueue(NamedTuple):
+    """
+    a priority queue of the sim times at which each driver state next needs an update.
+
+    driver availability only changes at shift boundaries, so each driver is only updated
+    at the first time step at or after its next boundary. drivers are bucketed by update
+    time, and the distinct update times are kept sorted; there are few distinct times
+    since drivers share schedules.
+
+    :param times: the distinct update times, in ascending order
+    :param vehicles_by_time: the drivers to update at each update time
+    :param update_times: the update time of each driver in the queue
+    """
+
+    times: Tuple[int, ...] = ()
+    vehicles_by_time: immutables.Map[int, immutables.Map[VehicleId, None]] = immutables.Map()
+    update_times: immutables.Map[VehicleId, int] = immutables.Map()
+
+    def schedule(self, vehicle_id: VehicleId, update_time: Optional[int]) -> DriverUpdateQueue:
+        """
+        sets the next time a driver needs an update, replacing any previous time
+
+        :param vehicle_id: the vehicle of the driver
+        :param update_time: the sim time of the next update, or None if it never needs one
+        :return: the updated queue
+        """
+        previous_time = self.update_times.get(vehicle_id)
+        if previous_time == update_time:
+            return self
+        queue = self.unschedule(vehicle_id)
+        if update_time is None:
+            return queue
+
+        times = queue.times
+        bucket = queue.vehicles_by_time.get(update_time)
+        if bucket is None:
+            bucket = immutables.Map()
+            index = bisect.bisect_left(times, update_time)
+            times = times[:index] + (update_time,) + times[index:]
+        return queue._replace(
+            times=times,
+            vehicles_by_time=queue.vehicles_by_time.set(update_time, bucket.set(vehicle_id, None)),
+            update_times=queue.update_times.set(vehicle_id, update_time),
+        )
+
+    def unschedule(self, vehicle_id: VehicleId) -> DriverUpdateQueue:
+        """
+        removes a driver from the queue
+
+        :param vehicle_id: the vehicle of the driver
+        :return: the updated queue
+        """
+        update_time = self.update_times.get(vehicle_id)
+        if update_time is None:
+            return self
+        bucket = self.vehicles_by_time[update_time].delete(vehicle_id)
+        if len(bucket) == 0:
+            index = bisect.bisect_left(self.times, update_time)
+            times = self.times[:index] + self.times[index + 1 :]
+            vehicles_by_time = self.vehicles_by_time.delete(update_time)
+        else:
+            times = self.times
+            vehicles_by_time = self.vehicles_by_time.set(update_time, bucket)
+        return self._replace(
+            times=times,
+            vehicles_by_time=vehicles_by_time,
+            update_times=self.update_times.delete(vehicle_id),
+        )
+
+    def pop_due(self, sim_time: int) -> Tuple[Tuple[VehicleId, ...], DriverUpdateQueue]:
+        """
+        removes the drivers whose update time is at or before the sim time
+
+        :param sim_time: the current sim time
+        :return: the drivers due for an update, in order of update time, and the updated queue
+        """
+        n_due = bisect.bisect_right(self.times, sim_time)
+        if n_due == 0:
+            return (), self
+        due_times = self.times[:n_due]
+        due = tuple(
+            vehicle_id
+            for update_time in due_times
+            for vehicle_id in sorted(self.vehicles_by_time[update_time].keys())
+        )
+        vehicles_by_time = self.vehicles_by_time
+        update_times = self.update_times
+        for update_time in due_times:
+            vehicles_by_time = vehicles_by_time.delete(update_time)
+        for vehicle_id in due:
+            update_times = update_times.delete(vehicle_id)
+        updated = self._replace(
+            times=self.times[n_due:],
+            vehicles_by_time=vehicles_by_time,
+            update_times=update_times,
+        )
+        return due, updated
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, TYPE_CHECKING
+
+import immutables
+import numpy as np
+
+from nrel.hive.util import h3_cell_ops
+from nrel.hive.util.exception import SimulationStateError
+from nrel.hive.util.typealiases import MembershipId
+
+if TYPE_CHECKING:
+    from nrel.hive.model.membership import Membership
+    from nrel.hive.runner.environment import Environment
+    from nrel.hive.state.simulation_state.simulation_state import SimulationState
+
+MAX_MEMBERSHIP_BITS = 64
+
+
+class VehicleArrays(NamedTuple):
+    """
+    the hot attributes of every vehicle, indexed by the slots of SimulationState.v_index.
+    rows of vacant slots have present == False.
+
+    :param present: whether a vehicle holds the slot
+    :param geoid: the h3 cell of the vehicle, as an integer
+    :param soc: the state of charge of the vehicle's fuel source
+    :param vehicle_state: the VehicleStateType value of the vehicle state
+    :param station: the s_index slot of the station the vehicle state refers to, or -1
+    :param membership: the membership bitmask of the vehicle, see membership_bits
+    """
+
+    present: np.ndarray
+    geoid: np.ndarray
+    soc: np.ndarray
+    vehicle_state: np.ndarray
+    station: np.ndarray
+    membership: np.ndarray
+
+
+class RequestArrays(NamedTuple):
+    """
+    the hot attributes of every request, indexed by the slots of SimulationState.r_index.
+    rows of vacant slots have present == False.
+
+    :param present: whether a request holds the slot
+    :param origin: the h3 cell of the origin, as an integer
+    :param destination: the h3 cell of the destination, as an integer
+    :param departure_time: the departure time of the request
+    :param passengers: the number of passengers
+    :param value: the value of the request
+    :param dispatched_vehicle: the v_index slot of the dispatched vehicle, or -1
+    :param membership: the membership bitmask of the request, see membership_bits
+    """
+
+    present: np.ndarray
+    origin: np.ndarray
+    destination: np.ndarray
+    departure_time: np.ndarray
+    passengers: np.ndarray
+    value: np.ndarray
+    dispatched_vehicle: np.ndarray
+    membership: np.ndarray
+
+
+class StationArrays(NamedTuple):
+    """
+    the hot attributes of every station, indexed by the slots of SimulationState.s_index.
+    rows of vacant slots have present == False.
+
+    :param present: whether a station holds the slot
+    :param geoid: the h3 cell of the station, as an integer
+    :param total_chargers: the number of chargers of all types at the station
+    :param available_chargers: the number of available chargers of all types at the station
+    :param membership: the membership bitmask of the station, see membership_bits
+    """
+
+    present: np.ndarray
+    geoid: np.ndarray
+    total_chargers: np.ndarray
+    available_chargers: np.ndarray
+    membership: np.ndarray
+
+
+def membership_bits(fleet_ids: FrozenSet[Optional[MembershipId]]) -> Dict[MembershipId, int]:
+    """
+    assigns each fleet a bit of a membership bitmask, in sorted order. public entities
+    have no bits set, and an entity grants access to a membership bitmask m when its own
+    bitmask is 0 or shares a bit with m.
+
+    :param fleet_ids: the fleets of the simulation, from Environment.fleet_ids
+    :return: the bit of each fleet
+    :raises: SimulationStateError if there are more fleets than bits
+    """
+    fleets = sorted(f for f in fleet_ids if f is not None)
+    if len(fleets) > MAX_MEMBERSHIP_BITS:
+        raise SimulationStateError(
+            f"membership bitmasks support up to {MAX_MEMBERSHIP_BITS} fleets, found {len(fleets)}"
+        )
+    return {fleet_id: 1 << i for i, fleet_id in enumerate(fleets)}
+
+
+def membership_mask(membership: Membership, bits: Dict[MembershipId, int]) -> int:
+    """
+    :param membership: the membership of an entity
+    :param bits: the bit of each fleet, from membership_bits
+    :return: the membership bitmask of the entity
+    """
+    mask = 0
+    for membership_id in membership.memberships:
+        mask |= bits.get(membership_id, 0)
+    return mask
+
+
+def vehicle_arrays(sim: SimulationState, env: Environment) -> VehicleArrays:
+    """
+    builds the arrays of the vehicle attributes, indexed by vehicle slot
+
+    :param sim: the simulation state
+    :param env: the simulation environment
+    :return: the vehicle arrays
+    """
+    n = sim.v_index.size
+    arrays = VehicleArrays(
+        present=np.zeros(n, dtype=np.bool_),
+        geoid=np.zeros(n, dtype=np.uint64),
+        soc=np.full(n, np.nan, dtype=np.float64),
+        vehicle_state=np.full(n, -1, dtype=np.int16),
+        station=np.full(n, -1, dtype=np.int32),
+        membership=np.zeros(n, dtype=np.uint64),
+    )
+    bits = membership_bits(env.fleet_ids)
+    slots = _slots(sim.v_index.slots, sim.vehicles.keys())
+    for slot, vehicle in zip(slots.tolist(), sim.vehicles.values()):
+        mechatronics = env.mechatronics.get(vehicle.mechatronics_id)
+        if mechatronics is not None:
+            arrays.soc[slot] = mechatronics.fuel_source_soc(vehicle)
+        arrays.vehicle_state[slot] = vehicle.vehicle_state.vehicle_state_type.value
+        station_id = getattr(vehicle.vehicle_state, "station_id", None)
+        arrays.station[slot] = sim.s_index.index_of(station_id)
+        arrays.membership[slot] = membership_mask(vehicle.membership, bits)
+    arrays.present[slots] = True
+    arrays.geoid[slots] = h3_cell_ops.to_cells(v.geoid for v in sim.vehicles.values())
+    return arrays
+
+
+def request_arrays(sim: SimulationState, env: Environment) -> RequestArrays:
+    """
+    builds the arrays of the request attributes, indexed by request slot
+
+    :param sim: the simulation state
+    :param env: the simulation environment
+    :return: the request arrays
+    """
+    n = sim.r_index.size
+    arrays = RequestArrays(
+        present=np.zeros(n, dtype=np.bool_),
+        origin=np.zeros(n, dtype=np.uint64),
+        destination=np.zeros(n, dtype=np.uint64),
+        departure_time=np.zeros(n, dtype=np.int64),
+        passengers=np.zeros(n, dtype=np.int16),
+        value=np.zeros(n, dtype=np.float64),
+        dispatched_vehicle=np.full(n, -1, dtype=np.int32),
+        membership=np.zeros(n, dtype=np.uint64),
+    )
+    bits = membership_bits(env.fleet_ids)
+    slots = _slots(sim.r_index.slots, sim.requests.keys())
+    for slot, request in zip(slots.tolist(), sim.requests.values()):
+        arrays.departure_time[slot] = int(request.departure_time)
+        arrays.passengers[slot] = request.num_passengers
+        arrays.value[slot] = request.value
+        arrays.dispatched_vehicle[slot] = sim.v_index.index_of(request.dispatched_vehicle)
+        arrays.membership[slot] = membership_mask(request.membership, bits)
+    arrays.present[slots] = True
+    arrays.origin[slots] = h3_cell_ops.to_cells(r.origin for r in sim.requests.values())
+    arrays.destination[slots] = h3_cell_ops.to_cells(r.destination for r in sim.requests.values())
+    return arrays
+
+
+def station_arrays(sim: SimulationState, env: Environment) -> StationArrays:
+    """
+    builds the arrays of the station attributes, indexed by station slot
+
+    :param sim: the simulation state
+    :param env: the simulation environment
+    :return: the station arrays
+    """
+    n = sim.s_index.size
+    arrays = StationArrays(
+        present=np.zeros(n, dtype=np.bool_),
+        geoid=np.zeros(n, dtype=np.uint64),
+        total_chargers=np.zeros(n, dtype=np.int32),
+        available_chargers=np.zeros(n, dtype=np.int32),
+        membership=np.zeros(n, dtype=np.uint64),
+    )
+    bits = membership_bits(env.fleet_ids)
+    slots = _slots(sim.s_index.slots, sim.stations.keys())
+    for slot, station in zip(slots.tolist(), sim.stations.values()):
+        for charger_state in station.state.values():
+            arrays.total_chargers[slot] += charger_state.total_chargers
+            arrays.available_chargers[slot] += charger_state.available_chargers
+        arrays.membership[slot] = membership_mask(station.membership, bits)
+    arrays.present[slots] = True
+    arrays.geoid[slots] = h3_cell_ops.to_cells(s.geoid for s in sim.stations.values())
+    return arrays
+
+
+def _slots(index: immutables.Map, entity_ids: Iterable) -> np.ndarray:
+    return np.array([index[entity_id] for entity_id in entity_ids], dtype=np.int64)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+import immutables
+import numpy as np
+
+from nrel.hive.util.typealiases import EntityId
+
+
+class EntityIndex(NamedTuple):
+    """
+    assigns each entity of one type a dense integer slot, so that entity attributes can be
+    held in arrays indexed by slot alongside the string ids. kept in step with the entity
+    collections of the SimulationState by the add/remove entity operations.
+
+    an entity keeps its slot for as long as it remains in the simulation. the slot of a
+    removed entity is reused by the next entity added, most recently released first, so
+    that size stays close to the number of entities even as requests come and go.
+
+    once tracked, each slot whose entity is added, modified or removed is recorded under the
+    next version, keeping only the latest version of each slot, so that arrays indexed by slot
+    can be kept up to date by rewriting only the slots changed since the version they were
+    built from. tracking is off by default, so simulations which keep no such arrays do not
+    pay for recording changes.
+
+    :param slots: the slot of each entity
+    :param ids: the entity in each occupied slot
+    :param free: the released slots, available for reuse, as a stack keyed by position
+    :param size: the number of slots in use or released; arrays indexed by slot need this length
+    :param tracked: whether changes are recorded
+    :param version: the number of changes recorded
+    :param changes: the slot changed at each version, for the latest change of each slot
+    :param slot_versions: the version of the latest change of each slot
+    """
+
+    slots: immutables.Map[EntityId, int] = immutables.Map()
+    ids: immutables.Map[int, EntityId] = immutables.Map()
+    free: immutables.Map[int, int] = immutables.Map()
+    size: int = 0
+    tracked: bool = False
+    version: int = 0
+    changes: immutables.Map[int, int] = immutables.Map()
+    slot_versions: immutables.Map[int, int] = immutables.Map()
+
+    def add(self, entity_id: EntityId) -> EntityIndex:
+        """
+        assigns a slot to an entity, unless it already has one
+
+        :param entity_id: the entity to add
+        :return: the updated EntityIndex
+        """
+        if entity_id in self.slots:
+            return self
+        elif self.free:
+            top = len(self.free) - 1
+            slot, free, size = self.free[top], self.free.delete(top), self.size
+        else:
+            slot, free, size = self.size, self.free, self.size + 1
+        return self._record(slot)._replace(
+            slots=self.slots.set(entity_id, slot),
+            ids=self.ids.set(slot, entity_id),
+            free=free,
+            size=size,
+        )
+
+    def remove(self, entity_id: EntityId) -> EntityIndex:
+        """
+        releases the slot of an entity
+
+        :param entity_id: the entity to remove
+        :return: the updated EntityIndex
+        """
+        slot = self.slots.get(entity_id)
+        if slot is None:
+            return self
+        return self._record(slot)._replace(
+            slots=self.slots.delete(entity_id),
+            ids=self.ids.delete(slot),
+            free=self.free.set(len(self.free), slot),
+        )
+
+    def track(self) -> EntityIndex:
+        """
+        starts recording changes, as from version 0, where every occupied slot has changed
+
+        :return: the updated EntityIndex
+        """
+        if self.tracked:
+            return self
+        index = self._replace(
+            tracked=True, version=0, changes=immutables.Map(), slot_versions=immutables.Map()
+        )
+        for slot in sorted(self.ids.keys()):
+            index = index._record(slot)
+        return index
+
+    def touch(self, entity_id: EntityId) -> EntityIndex:
+        """
+        records that an entity was modified, if changes are tracked
+
+        :param entity_id: the entity modified
+        :return: the updated EntityIndex
+        """
+        if not self.tracked:
+            return self
+        slot = self.slots.get(entity_id)
+        if slot is None:
+            return self
+        return self._record(slot)
+
+    def changed_slots(self, since_version: int) -> Iterator[int]:
+        """
+        lists the slots changed after a version, each once, in the order of their latest change.
+        this takes time in the number of versions since since_version, not the number of slots.
+
+        :param since_version: a version of this EntityIndex, such as 0 for every slot changed
+        :return: the slots whose latest change came after since_version
+        """
+        for version in range(since_version + 1, self.version + 1):
+            slot = self.changes.get(version)
+            if slot is not None:
+                yield slot
+
+    def _record(self, slot: int) -> EntityIndex:
+        if not self.tracked:
+            return self
+        version = self.version + 1
+        previous = self.slot_versions.get(slot)
+        changes = self.changes if previous is None else self.changes.delete(previous)
+        return self._replace(
+            version=version,
+            changes=changes.set(version, slot),
+            slot_versions=self.slot_versions.set(slot, version),
+        )
+
+    def index_of(self, entity_id: Optional[EntityId]) -> int:
+        """
+        :param entity_id: an entity id
+        :return: the slot of the entity, or -1 if it is not in the index
+        """
+        if entity_id is None:
+            return -1
+        return self.slots.get(entity_id, -1)
+
+    def indices_of(self, entity_ids: Iterable[Optional[EntityId]]) -> np.ndarray:
+        """
+        :param entity_ids: entity ids
+        :return: the slot of each entity, or -1 where an entity is not in the index
+        """
+        return np.array([self.index_of(e) for e in entity_ids], dtype=np.int64)
+
+    def entity_id(self, index: int) -> Optional[EntityId]:
+        """
+        :param index: a slot
+        :return: the entity in the slot, or None if the slot is vacant
+        """
+        return self.ids.get(index)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import math
+from typing import List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import h3
+import immutables
+
+from nrel.hive.util.h3_ops import H3Ops
+from nrel.hive.util.typealiases import GeoId
+
+if TYPE_CHECKING:
+    from nrel.hive.model.entity_position import EntityPosition
+    from nrel.hive.model.roadnetwork.roadnetwork import RoadNetwork
+
+
+# search cells are grouped under their parent this many resolutions coarser,
+# so that the cells near a location can be found by walking rings of nearby groups
+GROUP_RESOLUTION_OFFSET = 2
+
+# hex rings are not circles: a group in ring d is at least d * cos(30°) group spacings away
+RING_DISTANCE_FACTOR = math.sqrt(3) / 2
+
+# rings past the ring where a cell was found which may still hold a closer cell,
+# as the cells and the location may each sit off the center of their group
+RING_MARGIN = 3
+
+Bucket = immutables.Map[GeoId, immutables.Map[GeoId, None]]
+
+
+class RequestDensity(NamedTuple):
+    """
+    the count of requests in each request search cell, bucketed by count so that the
+    densest cells can be found without sorting every cell. kept in step with
+    SimulationState.r_search by the add/remove/modify request operations.
+
+    within each bucket, cells are grouped by a coarser parent cell, so the cells of a bucket
+    nearest to some location are found by searching outward from that location instead of
+    ranking every cell sharing the count.
+
+    the road network position at the center of each search cell is snapped once, the first
+    time a request appears in that cell, and kept for the remainder of the simulation.
+
+    :param counts: the number of requests in each search cell
+    :param cells_by_count: the search cells which hold each number of requests, by parent cell
+    :param max_count: the largest number of requests in any search cell
+    :param positions: the road network position at the center of each search cell seen so far
+    """
+
+    counts: immutables.Map[GeoId, int] = immutables.Map()
+    cells_by_count: immutables.Map[int, Bucket] = immutables.Map()
+    max_count: int = 0
+    positions: immutables.Map[GeoId, EntityPosition] = immutables.Map()
+
+    def add_request(
+        self,
+        search_geoid: GeoId,
+        road_network: RoadNetwork,
+        sim_h3_location_resolution: int,
+    ) -> RequestDensity:
+        """
+        counts a request added to a search cell
+
+        :param search_geoid: the search cell of the request
+        :param road_network: the road network, used to snap the center of a new search cell
+        :param sim_h3_location_resolution: the resolution of road network positions
+        :return: the updated RequestDensity
+        """
+        count = self.counts.get(search_geoid, 0)
+        positions = self.positions
+        if search_geoid not in positions:
+            center = h3.h3_to_center_child(search_geoid, sim_h3_location_resolution)
+            position = road_network.position_from_geoid(center)
+            if position is not None:
+                positions = positions.set(search_geoid, position)
+        return self._replace(
+            counts=self.counts.set(search_geoid, count + 1),
+            cells_by_count=self._move(search_geoid, count, count + 1),
+            max_count=max(self.max_count, count + 1),
+            positions=positions,
+        )
+
+    def remove_request(self, search_geoid: GeoId) -> RequestDensity:
+        """
+        counts a request removed from a search cell
+
+        :param search_geoid: the search cell of the request
+        :return: the updated RequestDensity
+        """
+        count = self.counts.get(search_geoid, 0)
+        if count == 0:
+            return self
+        cells_by_count = self._move(search_geoid, count, count - 1)
+        # counts only step down by one, so an emptied top bucket leaves the next one as the max
+        max_count = self.max_count
+        if count == max_count and max_count not in cells_by_count:
+            max_count -= 1
+        updated_counts = (
+            self.counts.delete(search_geoid)
+            if count == 1
+            else self.counts.set(search_geoid, count - 1)
+        )
+        return self._replace(
+            counts=updated_counts,
+            cells_by_count=cells_by_count,
+            max_count=max_count,
+        )
+
+    def top_k(self, k: int, geoid: GeoId) -> Tuple[Tuple[GeoId, int], ...]:
+        """
+        lists the k densest search cells, ties going to the cells nearest some location
+
+        :param k: the number of search cells to list
+        :param geoid: the location to measure from
+        :return: the search cells along with their request counts, densest first
+        """
+        result: List[Tuple[GeoId, int]] = []
+        count = self.max_count
+        while count > 0 and len(result) < k:
+            bucket = self.cells_by_count.get(count)
+            if bucket is not None:
+                for cell in _nearest_cells(bucket, geoid, k - len(result)):
+                    result.append((cell, count))
+            count -= 1
+        return tuple(result)
+
+    def nearest_densest(self, geoid: GeoId) -> Optional[GeoId]:
+        """
+        finds the search cell with the most requests, choosing the one closest
+        to some location when several cells share the highest count
+
+        :param geoid: the location to measure from
+        :return: the densest search cell, or None if there are no requests
+        """
+        densest = self.top_k(1, geoid)
+        return densest[0][0] if densest else None
+
+    def position(self, search_geoid: GeoId) -> Optional[EntityPosition]:
+        """
+        gets the road network position at the center of a search cell
+
+        :param search_geoid: the search cell
+        :return: the snapped position, or None if the cell center could not be snapped
+        """
+        return self.positions.get(search_geoid)
+
+    def _move(
+        self, search_geoid: GeoId, from_count: int, to_count: int
+    ) -> immutables.Map[int, Bucket]:
+        """
+        moves a search cell between count buckets, dropping empty buckets and groups
+        and never storing a bucket for a count of zero
+        """
+        group = _group_of(search_geoid)
+        cells_by_count = self.cells_by_count
+        if from_count > 0:
+            from_bucket: Bucket = cells_by_count.get(from_count, immutables.Map())
+            from_cells = from_bucket.get(group, immutables.Map()).delete(search_geoid)
+            if len(from_cells) > 0:
+                cells_by_count = cells_by_count.set(from_count, from_bucket.set(group, from_cells))
+            elif len(from_bucket) > 1:
+                cells_by_count = cells_by_count.set(from_count, from_bucket.delete(group))
+            else:
+                cells_by_count = cells_by_count.delete(from_count)
+        if to_count > 0:
+            to_bucket: Bucket = cells_by_count.get(to_count, immutables.Map())
+            to_cells = to_bucket.get(group, immutables.Map()).set(search_geoid, None)
+            cells_by_count = cells_by_count.set(to_count, to_bucket.set(group, to_cells))
+        return cells_by_count
+
+
+def _group_of(search_geoid: GeoId) -> GeoId:
+    """
+    the parent cell which groups a search cell within its bucket
+    """
+    resolution = h3.h3_get_resolution(search_geoid)
+    return h3.h3_to_parent(search_geoid, max(resolution - GROUP_RESOLUTION_OFFSET, 0))
+
+
+def _nearest_cells(bucket: Bucket, geoid: GeoId, k: int) -> Tuple[GeoId, ...]:
+    """
+    finds the k cells of a bucket nearest to a location, ties ordered by GeoId.
+
+    walks rings of groups outward from the group of the location until k cells are found,
+    then far enough past that ring that no closer cell is left unvisited. when the rings
+    would visit more groups than the bucket holds, every group of the bucket is read instead.
+
+    :param bucket: the cells sharing a count, by group
+    :param geoid: the location to measure from
+    :param k: the number of cells to find
+    :return: up to k cells, nearest first
+    """
+    group_resolution = h3.h3_get_resolution(next(iter(bucket.keys())))
+    origin = h3.h3_to_parent(geoid, group_resolution)
+
+    candidates: List[GeoId] = []
+    visited = 0
+    distance = 0
+    last_ring: Optional[int] = None
+    while last_ring is None or distance <= last_ring:
+        ring = h3.hex_ring(origin, distance)
+        visited += len(ring)
+        if visited > len(bucket):
+            candidates = [cell for cells in bucket.values() for cell in cells.keys()]
+            break
+        for group in ring:
+            cells = bucket.get(group)
+            if cells is not None:
+                candidates.extend(cells.keys())
+        if last_ring is None and len(candidates) >= k:
+            last_ring = math.ceil((distance + RING_MARGIN) / RING_DISTANCE_FACTOR)
+        distance += 1
+
+    if len(candidates) <= 1:
+        return tuple(candidates)
+    distances = H3Ops.great_circle_distance_matrix((geoid,), candidates)[0]
+    ranked = sorted(range(len(candidates)), key=lambda i: (distances[i], candidates[i]))
+    return tuple(candidates[i] for i in ranked[:k])
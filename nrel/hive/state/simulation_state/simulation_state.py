@@ -8,11 +8,17 @@ from typing import (
     Callable,
     TYPE_CHECKING,
     FrozenSet,
+    Iterable,
+    TypeVar,
 )
 
 import immutables
 
+from nrel.hive.model.membership import PUBLIC_MEMBERSHIP_ID
 from nrel.hive.state.simulation_state.at_location_response import AtLocationResponse
+from nrel.hive.state.simulation_state.driver_update_queue import DriverUpdateQueue
+from nrel.hive.state.simulation_state.entity_index import EntityIndex
+from nrel.hive.state.simulation_state.request_density import RequestDensity
 from nrel.hive.model.sim_time import SimTime
 from nrel.hive.model.roadnetwork.haversine_roadnetwork import HaversineRoadNetwork
 from nrel.hive.util import geo
@@ -22,16 +28,52 @@ from nrel.hive.util.typealiases import (
     BaseId,
     StationId,
     GeoId,
+    EntityId,
+    MembershipId,
 )
 
 if TYPE_CHECKING:
     from nrel.hive.model.roadnetwork.roadnetwork import RoadNetwork
-    from nrel.hive.util.units import Seconds
+    from nrel.hive.util.units import Ratio, Seconds
     from nrel.hive.model.base import Base
     from nrel.hive.model.request import Request
     from nrel.hive.model.station.station import Station
     from nrel.hive.model.vehicle.vehicle import Vehicle
     from nrel.hive.dispatcher.instruction.instruction import Instruction
+    from nrel.hive.model.membership import Membership
+
+E = TypeVar("E")
+
+
+def _with_access(
+    entities: immutables.Map[EntityId, E],
+    membership_collection: immutables.Map[MembershipId, immutables.Map[EntityId, None]],
+    membership: Optional[Membership],
+) -> Iterable[E]:
+    """
+    uses a membership collection to find the entities which grant access to a membership,
+    matching Membership.grant_access_to_membership, without visiting any other entities
+
+    :param entities: all entities of one type
+    :param membership_collection: the membership collection of that entity type
+    :param membership: the membership seeking access, or None to return all entities
+    :return: the entities which grant access to the membership
+    """
+    if membership is None:
+        return entities.values()
+    public_ids = membership_collection.get(PUBLIC_MEMBERSHIP_ID, immutables.Map())
+    if len(membership.memberships) == 0:
+        return (entities[entity_id] for entity_id in public_ids)
+    elif len(membership.memberships) == 1:
+        (membership_id,) = membership.memberships
+        member_ids = membership_collection.get(membership_id, immutables.Map())
+        return (entities[entity_id] for entity_id in (*public_ids, *member_ids))
+    else:
+        # an entity may share more than one membership, so drop duplicates
+        ids = dict.fromkeys(public_ids)
+        for membership_id in membership.memberships:
+            ids.update(membership_collection.get(membership_id, immutables.Map()))
+        return (entities[entity_id] for entity_id in ids)
 
 
 class SimulationState(NamedTuple):
@@ -72,12 +114,40 @@ class SimulationState(NamedTuple):
     s_search: immutables.Map[GeoId, FrozenSet[StationId]] = immutables.Map()
     b_search: immutables.Map[GeoId, FrozenSet[BaseId]] = immutables.Map()
 
+    # the count of requests in each search cell, for finding the areas of highest demand
+    r_search_density: RequestDensity = RequestDensity()
+
+    # the vehicles which are not in a dormant state; only these are stepped by the vehicle update
+    active_vehicles: immutables.Map[VehicleId, None] = immutables.Map()
+
+    # the next sim time each driver state needs an update; only these are stepped by the driver update
+    driver_update_queue: DriverUpdateQueue = DriverUpdateQueue()
+
+    # membership collections - the entities of each membership, with public entities listed under
+    # PUBLIC_MEMBERSHIP_ID, so that each fleet only visits the entities it has access to
+    v_membership: immutables.Map[MembershipId, immutables.Map[VehicleId, None]] = immutables.Map()
+    r_membership: immutables.Map[MembershipId, immutables.Map[RequestId, None]] = immutables.Map()
+    s_membership: immutables.Map[MembershipId, immutables.Map[StationId, None]] = immutables.Map()
+    b_membership: immutables.Map[MembershipId, immutables.Map[BaseId, None]] = immutables.Map()
+
+    # wake signals for scheduled instruction generators - the sim time a request was last added,
+    # and the sim time a moving vehicle last fell below each low state of charge threshold
+    last_request_added_time: Optional[SimTime] = None
+    low_soc_times: immutables.Map[Ratio, SimTime] = immutables.Map()
+
+    # entity indexes - a dense integer slot for each entity, for arrays of entity attributes
+    v_index: EntityIndex = EntityIndex()
+    r_index: EntityIndex = EntityIndex()
+    s_index: EntityIndex = EntityIndex()
+    b_index: EntityIndex = EntityIndex()
+
     def get_stations(
         self,
         filter_function: Optional[Callable[[Station], bool]] = None,
         sort: bool = False,
         sort_key: Callable = lambda k: k,
         sort_reversed: bool = False,
+        membership: Optional[Membership] = None,
     ) -> Tuple[Station, ...]:
         """
         returns a tuple of stations.
@@ -88,9 +158,10 @@ class SimulationState(NamedTuple):
         :param sort: whether or not to sort the results
         :param sort_key: the key to sort the results by
         :param sort_reversed: the order of the resulting sort
+        :param membership: only return stations which grant access to this membership
         :return: tuple of sorted and filtered stations
         """
-        stations = self.stations.values()
+        stations = _with_access(self.stations, self.s_membership, membership)
         if filter_function and sort:
             return tuple(
                 filter(
@@ -111,6 +182,7 @@ class SimulationState(NamedTuple):
         sort: bool = False,
         sort_key: Callable = lambda k: k,
         sort_reversed: bool = False,
+        membership: Optional[Membership] = None,
     ) -> Tuple[Base, ...]:
         """
         returns a tuple of bases.
@@ -121,9 +193,10 @@ class SimulationState(NamedTuple):
         :param sort: whether or not to sort the results
         :param sort_key: the key to sort the results by
         :param sort_reversed: the order of the resulting sort
+        :param membership: only return bases which grant access to this membership
         :return: tuple of sorted and filtered bases
         """
-        bases = self.bases.values()
+        bases = _with_access(self.bases, self.b_membership, membership)
 
         if filter_function and sort:
             return tuple(
@@ -145,6 +218,7 @@ class SimulationState(NamedTuple):
         sort: bool = False,
         sort_key: Callable = lambda k: k,
         sort_reversed: bool = False,
+        membership: Optional[Membership] = None,
     ) -> Tuple[Vehicle, ...]:
         """
         returns a tuple of vehicles.
@@ -155,9 +229,10 @@ class SimulationState(NamedTuple):
         :param sort: whether or not to sort the results
         :param sort_key: the key to sort the results by
         :param sort_reversed: the order of the resulting sort
+        :param membership: only return vehicles which grant access to this membership
         :return: tuple of sorted and filtered vehicles
         """
-        vehicles = self.vehicles.values()
+        vehicles = _with_access(self.vehicles, self.v_membership, membership)
 
         if filter_function and sort:
             return tuple(
@@ -180,6 +255,7 @@ class SimulationState(NamedTuple):
         sort: bool = False,
         sort_key: Callable = lambda k: k,
         sort_reversed: bool = False,
+        membership: Optional[Membership] = None,
     ) -> Tuple[Request, ...]:
         """
         returns a tuple of requests.
@@ -190,9 +266,10 @@ class SimulationState(NamedTuple):
         :param sort: whether or not to sort the results
         :param sort_key: the key to sort the results by
         :param sort_reversed: the order of the resulting sort
+        :param membership: only return requests which grant access to this membership
         :return: tuple of sorted and filtered requests
         """
-        requests = self.requests.values()
+        requests = _with_access(self.requests, self.r_membership, membership)
         if filter_function and sort:
             return tuple(
                 filter(
@@ -6,15 +6,24 @@ import h3
 import immutables
 from returns.result import Success, Failure, ResultE
 
+from nrel.hive.model.membership import PUBLIC_MEMBERSHIP_ID
 from nrel.hive.model.sim_time import SimTime
 from nrel.hive.util.dict_ops import DictOps
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.fp import apply_op_to_accumulator, throw_or_return
-from nrel.hive.util.typealiases import RequestId, StationId, VehicleId, BaseId
+from nrel.hive.util.typealiases import (
+    RequestId,
+    StationId,
+    VehicleId,
+    BaseId,
+    EntityId,
+    MembershipId,
+)
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
     from nrel.hive.model.entity import Entity
+    from nrel.hive.model.membership import Membership
     from nrel.hive.model.base import Base
     from nrel.hive.model.request import Request
     from nrel.hive.model.station.station import Station
@@ -39,6 +48,23 @@ def tick(sim: SimulationState) -> SimulationState:
     return sim._replace(sim_time=sim.sim_time + sim.sim_timestep_duration_seconds)
 
 
+def track_entity_changes(sim: SimulationState) -> SimulationState:
+    """
+    starts recording the slots of the entities added, modified or removed in the
+    EntityIndex of each entity type, such as for keeping observation arrays up to date.
+
+
+    :param sim: the simulation state
+    :return: the simulation with entity changes tracked from here on
+    """
+    return sim._replace(
+        v_index=sim.v_index.track(),
+        r_index=sim.r_index.track(),
+        s_index=sim.s_index.track(),
+        b_index=sim.b_index.track(),
+    )
+
+
 def add_entity(sim: SimulationState, entity: Entity) -> SimulationState:
     """
     helper for adding an entity to the simulation
@@ -175,6 +201,75 @@ def modify_entities_safe(
     return apply_op_to_accumulator(_mod, entities, sim)
 
 
+def _membership_keys(membership: Membership) -> Iterable[MembershipId]:
+    return membership.memberships if len(membership.memberships) > 0 else (PUBLIC_MEMBERSHIP_ID,)
+
+
+def _add_to_membership_collection(
+    collection: immutables.Map[MembershipId, immutables.Map[EntityId, None]],
+    membership: Membership,
+    entity_id: EntityId,
+) -> immutables.Map[MembershipId, immutables.Map[EntityId, None]]:
+    """
+    lists an entity under each of its memberships, or under PUBLIC_MEMBERSHIP_ID if it has none
+
+    :param collection: the membership collection
+    :param membership: the membership of the entity
+    :param entity_id: the id of the entity
+    :return: the updated membership collection
+    """
+    for membership_id in _membership_keys(membership):
+        members = collection.get(membership_id, immutables.Map())
+        collection = collection.set(membership_id, members.set(entity_id, None))
+    return collection
+
+
+def _remove_from_membership_collection(
+    collection: immutables.Map[MembershipId, immutables.Map[EntityId, None]],
+    membership: Membership,
+    entity_id: EntityId,
+) -> immutables.Map[MembershipId, immutables.Map[EntityId, None]]:
+    """
+    removes an entity from the membership collection, dropping any membership left empty
+
+    :param collection: the membership collection
+    :param membership: the membership of the entity
+    :param entity_id: the id of the entity
+    :return: the updated membership collection
+    """
+    for membership_id in _membership_keys(membership):
+        members = collection.get(membership_id)
+        if members is None or entity_id not in members:
+            continue
+        updated_members = members.delete(entity_id)
+        if len(updated_members) == 0:
+            collection = collection.delete(membership_id)
+        else:
+            collection = collection.set(membership_id, updated_members)
+    return collection
+
+
+def _update_membership_collection(
+    collection: immutables.Map[MembershipId, immutables.Map[EntityId, None]],
+    previous_membership: Membership,
+    membership: Membership,
+    entity_id: EntityId,
+) -> immutables.Map[MembershipId, immutables.Map[EntityId, None]]:
+    """
+    moves a modified entity between memberships, if its membership has changed
+
+    :param collection: the membership collection
+    :param previous_membership: the membership of the entity before it was modified
+    :param membership: the membership of the modified entity
+    :param entity_id: the id of the entity
+    :return: the updated membership collection
+    """
+    if previous_membership is membership or previous_membership == membership:
+        return collection
+    removed = _remove_from_membership_collection(collection, previous_membership, entity_id)
+    return _add_to_membership_collection(removed, membership, entity_id)
+
+
 def add_request_safe(sim: SimulationState, request: Request) -> ResultE[SimulationState]:
     """
     adds a request to the SimulationState
@@ -196,6 +291,14 @@ def add_request_safe(sim: SimulationState, request: Request) -> ResultE[Simulati
             requests=DictOps.add_to_dict(sim.requests, request.id, request),
             r_locations=DictOps.add_to_collection_dict(sim.r_locations, request.geoid, request.id),
             r_search=DictOps.add_to_collection_dict(sim.r_search, search_geoid, request.id),
+            r_search_density=sim.r_search_density.add_request(
+                search_geoid, sim.road_network, sim.sim_h3_location_resolution
+            ),
+            r_membership=_add_to_membership_collection(
+                sim.r_membership, request.membership, request.id
+            ),
+            r_index=sim.r_index.add(request.id),
+            last_request_added_time=sim.sim_time,
         )
         return Success(updated_sim)
 
@@ -232,6 +335,11 @@ def remove_request_safe(sim: SimulationState, request_id: RequestId) -> ResultE[
             requests=updated_requests,
             r_locations=updated_r_locations,
             r_search=updated_r_search,
+            r_search_density=sim.r_search_density.remove_request(search_geoid),
+            r_membership=_remove_from_membership_collection(
+                sim.r_membership, request.membership, request.id
+            ),
+            r_index=sim.r_index.remove(request.id),
         )
 
         return Success(updated_sim)
@@ -281,10 +389,26 @@ def modify_request_safe(sim: SimulationState, updated_request: Request) -> Resul
             sim.sim_h3_search_resolution,
         )
 
+        r_search_density = sim.r_search_density
+        if result.search:
+            # the request moved between search cells
+            r_search_density = r_search_density.remove_request(
+                h3.h3_to_parent(request.geoid, sim.sim_h3_search_resolution)
+            ).add_request(
+                h3.h3_to_parent(updated_request.geoid, sim.sim_h3_search_resolution),
+                sim.road_network,
+                sim.sim_h3_location_resolution,
+            )
+
         updated_sim = sim._replace(
             requests=result.entities if result.entities else sim.requests,  # type: ignore
             r_locations=result.locations if result.locations else sim.r_locations,
             r_search=result.search if result.search else sim.r_search,
+            r_search_density=r_search_density,
+            r_membership=_update_membership_collection(
+                sim.r_membership, request.membership, updated_request.membership, request.id
+            ),
+            r_index=sim.r_index if updated_request is request else sim.r_index.touch(request.id),
         )
         return Success(updated_sim)
 
@@ -300,6 +424,27 @@ def modify_request(
         return None, result.unwrap()
 
 
+def _update_active_vehicles(
+    active_vehicles: immutables.Map[VehicleId, None], vehicle: Vehicle
+) -> immutables.Map[VehicleId, None]:
+    """
+    keeps a vehicle in the active vehicles collection only while its state is not dormant
+
+    :param active_vehicles: the active vehicles collection
+    :param vehicle: the added or modified vehicle
+    :return: the updated active vehicles collection
+    """
+    if vehicle.vehicle_state.is_dormant:
+        if vehicle.id in active_vehicles:
+            return active_vehicles.delete(vehicle.id)
+        else:
+            return active_vehicles
+    elif vehicle.id in active_vehicles:
+        return active_vehicles
+    else:
+        return active_vehicles.set(vehicle.id, None)
+
+
 def add_vehicle_safe(sim: SimulationState, vehicle: Vehicle) -> ResultE[SimulationState]:
     """
     adds a vehicle into the region supported by the RoadNetwork in this SimulationState
@@ -324,6 +469,13 @@ def add_vehicle_safe(sim: SimulationState, vehicle: Vehicle) -> ResultE[Simulati
             vehicles=DictOps.add_to_dict(sim.vehicles, vehicle.id, vehicle),
             v_locations=updated_v_locations,
             v_search=updated_v_search,
+            active_vehicles=_update_active_vehicles(sim.active_vehicles, vehicle),
+            # a new driver is updated at the next driver update, which finds its next update time
+            driver_update_queue=sim.driver_update_queue.schedule(vehicle.id, sim.sim_time),
+            v_membership=_add_to_membership_collection(
+                sim.v_membership, vehicle.membership, vehicle.id
+            ),
+            v_index=sim.v_index.add(vehicle.id),
         )
         return Success(updated_sim)
 
@@ -368,6 +520,14 @@ def modify_vehicle_safe(sim: SimulationState, updated_vehicle: Vehicle) -> Resul
             if updated_dictionaries.locations
             else sim.v_locations,
             v_search=updated_dictionaries.search if updated_dictionaries.search else sim.v_search,
+            active_vehicles=_update_active_vehicles(sim.active_vehicles, updated_vehicle),
+            driver_update_queue=sim.driver_update_queue
+            if updated_vehicle.driver_state is vehicle.driver_state
+            else sim.driver_update_queue.schedule(vehicle.id, sim.sim_time),
+            v_membership=_update_membership_collection(
+                sim.v_membership, vehicle.membership, updated_vehicle.membership, vehicle.id
+            ),
+            v_index=sim.v_index if updated_vehicle is vehicle else sim.v_index.touch(vehicle.id),
         )
         return Success(updated_sim)
 
@@ -412,6 +572,14 @@ def remove_vehicle_safe(sim: SimulationState, vehicle_id: VehicleId) -> ResultE[
                 sim.v_locations, vehicle.geoid, vehicle_id
             ),
             v_search=DictOps.remove_from_collection_dict(sim.v_search, search_geoid, vehicle_id),
+            active_vehicles=sim.active_vehicles.delete(vehicle_id)
+            if vehicle_id in sim.active_vehicles
+            else sim.active_vehicles,
+            driver_update_queue=sim.driver_update_queue.unschedule(vehicle_id),
+            v_membership=_remove_from_membership_collection(
+                sim.v_membership, vehicle.membership, vehicle_id
+            ),
+            v_index=sim.v_index.remove(vehicle_id),
         )
         return Success(updated_sim)
 
@@ -490,6 +658,10 @@ def add_station_safe(sim: SimulationState, station: Station) -> ResultE[Simulati
             stations=DictOps.add_to_dict(sim.stations, station.id, station),
             s_locations=updated_s_locations,
             s_search=updated_s_search,
+            s_membership=_add_to_membership_collection(
+                sim.s_membership, station.membership, station.id
+            ),
+            s_index=sim.s_index.add(station.id),
         )
         return Success(updated_sim)
 
@@ -520,6 +692,10 @@ def remove_station_safe(sim: SimulationState, station_id: StationId) -> ResultE[
             stations=DictOps.remove_from_dict(sim.stations, station_id),
             s_locations=updated_s_locations,
             s_search=updated_s_search,
+            s_membership=_remove_from_membership_collection(
+                sim.s_membership, station.membership, station_id
+            ),
+            s_index=sim.s_index.remove(station_id),
         )
         return Success(updated_sim)
 
@@ -561,7 +737,11 @@ def modify_station_safe(sim: SimulationState, updated_station: Station) -> Resul
         return Failure(error)
     else:
         updated_sim = sim._replace(
-            stations=DictOps.add_to_dict(sim.stations, updated_station.id, updated_station)
+            stations=DictOps.add_to_dict(sim.stations, updated_station.id, updated_station),
+            s_membership=_update_membership_collection(
+                sim.s_membership, station.membership, updated_station.membership, station.id
+            ),
+            s_index=sim.s_index if updated_station is station else sim.s_index.touch(station.id),
         )
         return Success(updated_sim)
 
@@ -600,6 +780,8 @@ def add_base_safe(sim: SimulationState, base: Base) -> ResultE[SimulationState]:
             bases=DictOps.add_to_dict(sim.bases, base.id, base),
             b_locations=updated_b_locations,
             b_search=updated_b_search,
+            b_membership=_add_to_membership_collection(sim.b_membership, base.membership, base.id),
+            b_index=sim.b_index.add(base.id),
         )
         return Success(updated_sim)
 
@@ -627,6 +809,10 @@ def remove_base_safe(sim: SimulationState, base_id: BaseId) -> ResultE[Simulatio
             bases=DictOps.remove_from_dict(sim.bases, base_id),
             b_locations=updated_b_locations,
             b_search=updated_b_search,
+            b_membership=_remove_from_membership_collection(
+                sim.b_membership, base.membership, base_id
+            ),
+            b_index=sim.b_index.remove(base_id),
         )
         return Success(updated_sim)
 
@@ -669,7 +855,11 @@ def modify_base_safe(sim: SimulationState, updated_base: Base) -> ResultE[Simula
         return Failure(error)
     else:
         updated_sim = sim._replace(
-            bases=DictOps.add_to_dict(sim.bases, updated_base.id, updated_base)
+            bases=DictOps.add_to_dict(sim.bases, updated_base.id, updated_base),
+            b_membership=_update_membership_collection(
+                sim.b_membership, base.membership, updated_base.membership, base.id
+            ),
+            b_index=sim.b_index if updated_base is base else sim.b_index.touch(base.id),
         )
         return Success(updated_sim)
 
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import functools as ft
 from typing import Tuple, Optional, NamedTuple
 
+from nrel.hive.model.sim_time import SimTime
 from nrel.hive.runner.environment import Environment
 from nrel.hive.state.simulation_state import simulation_state_ops
 from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -68,6 +69,25 @@ class CancelRequests(SimulationUpdateFunction):
 
         return updated, None
 
+    def next_event_time(
+        self, simulation_state: SimulationState, env: Environment
+    ) -> Optional[SimTime]:
+        """
+        the earliest cancel time of any request in the simulation
+
+        :param simulation_state: the current simulation state
+        :param env: the scenario environment
+        :return: the next cancel time, or None if there are no requests
+        """
+        cancel_time_seconds = env.config.sim.request_cancel_time_seconds
+        return min(
+            (
+                SimTime(r.departure_time + cancel_time_seconds)
+                for r in simulation_state.requests.values()
+            ),
+            default=None,
+        )
+
 
 def _gen_report(r_id: RequestId, sim: SimulationState) -> Report:
     """
@@ -16,6 +16,7 @@ from nrel.hive.runner.environment import Environment
 from nrel.hive.state.simulation_state import simulation_state_ops
 from nrel.hive.state.simulation_state.simulation_state import SimulationState
 from nrel.hive.state.simulation_state.update.simulation_update import SimulationUpdateFunction
+from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.iterators import DictReaderStepper
 from nrel.hive.util import DictOps
 from nrel.hive.util.typealiases import StationId, ChargerId
@@ -28,10 +29,16 @@ log = logging.getLogger(__name__)
 class ChargingPriceUpdate(SimulationUpdateFunction):
     """
     loads charging prices from a file or sets all prices to zero if none provided
+
+    the files it was built from are kept so that it can be reset to read them again
+    from the start.
     """
 
     reader: DictReaderStepper
     use_defaults: bool
+    charging_price_file: Optional[str] = None
+    chargers_file: Optional[str] = None
+    lazy_file_reading: bool = False
 
     @classmethod
     def build(
@@ -73,7 +80,13 @@ class ChargingPriceUpdate(SimulationUpdateFunction):
             stepper = DictReaderStepper.from_iterator(
                 iter(fallback_values), "time", parser=SimTime.build
             )
-            return ChargingPriceUpdate(reader=stepper, use_defaults=True)
+            return ChargingPriceUpdate(
+                reader=stepper,
+                use_defaults=True,
+                charging_price_file=charging_price_file,
+                chargers_file=chargers_file,
+                lazy_file_reading=lazy_file_reading,
+            )
         else:
             charging_path = Path(charging_price_file)
             if not charging_path.is_file():
@@ -94,7 +107,33 @@ class ChargingPriceUpdate(SimulationUpdateFunction):
                         reader = iter(tuple(DictReader(f)))
                     stepper = DictReaderStepper.from_iterator(reader, "time", parser=SimTime.build)
 
-                return ChargingPriceUpdate(stepper, False)
+                return ChargingPriceUpdate(
+                    reader=stepper,
+                    use_defaults=False,
+                    charging_price_file=charging_price_file,
+                    chargers_file=chargers_file,
+                    lazy_file_reading=lazy_file_reading,
+                )
+
+    def reset(self) -> ChargingPriceUpdate:
+        """
+        builds a new ChargingPriceUpdate which reads the charging price file from the start
+
+        :return: the new update function
+        :raises: SimulationStateError if this update function was not built from the chargers file
+        """
+        if self.chargers_file is None:
+            raise SimulationStateError(
+                "cannot reset a ChargingPriceUpdate which was not built from a chargers file"
+            )
+        return ChargingPriceUpdate.build(
+            self.charging_price_file,
+            self.chargers_file,
+            lazy_file_reading=self.lazy_file_reading,
+        )
+
+    def close(self):
+        self.reader.close()
 
     def update(
         self, sim_state: SimulationState, env: Environment
@@ -108,33 +147,63 @@ class ChargingPriceUpdate(SimulationUpdateFunction):
         :return: sim state plus new requests
         """
 
-        current_sim_time = sim_state.sim_time
+        charger_update = self._read_prices(sim_state.sim_time)
+        return self._apply_prices(charger_update, sim_state), self
+
+    def update_many(
+        self, simulation_states: Tuple[SimulationState, ...], env: Environment
+    ) -> Tuple[Tuple[SimulationState, ...], Optional[ChargingPriceUpdate]]:
+        """
+        update charging prices of several simulations at the same sim time, reading the
+        price file once
+
+        :param simulation_states: the sim states, all at the same sim time
+        :param env: static environment variables
+        :return: the sim states with updated prices
+        """
+        if len(simulation_states) == 0:
+            return (), self
+        charger_update = self._read_prices(simulation_states[0].sim_time)
+        return tuple(self._apply_prices(charger_update, s) for s in simulation_states), self
+
+    def _read_prices(
+        self, current_sim_time: SimTime
+    ) -> immutables.Map[str, immutables.Map[ChargerId, Currency]]:
+        """
+        parse the most recently available charger_id price data up to the current sim time
+        """
 
         def stop_condition(value: int) -> bool:
             return value < current_sim_time
 
-        # parse the most recently available charger_id price data up to the current sim time
         initial: immutables.Map[str, immutables.Map[ChargerId, Currency]] = immutables.Map()
-        charger_update = ft.reduce(
+        return ft.reduce(
             _add_row_to_this_update,
             self.reader.read_until_stop_condition(stop_condition),
             initial,
         )
 
+    def _apply_prices(
+        self,
+        charger_update: immutables.Map[str, immutables.Map[ChargerId, Currency]],
+        sim_state: SimulationState,
+    ) -> SimulationState:
+        """
+        applies the price data to the stations of a simulation
+        """
         if len(charger_update) == 0:
             # no update
-            return sim_state, self
+            return sim_state
 
         elif self.use_defaults:
             # we are applying the same values across all Stations
             # the default constructor creates one station_id called "default" and we
             # apply it to every station here.
-            result = ft.reduce(
+            return ft.reduce(
                 lambda sim, s_id: _update_station_prices(sim, s_id, charger_update["default"]),
                 sim_state.stations.keys(),
                 sim_state,
             )
-            return result, self
 
         else:
             # apply update to all stations
@@ -143,12 +212,22 @@ class ChargingPriceUpdate(SimulationUpdateFunction):
             station_ids_to_update = set(sim_state.stations.keys()).union(as_station_updates.keys())
 
             # we are applying only the updates related to valid StationIds with updates
-            result = ft.reduce(
+            return ft.reduce(
                 lambda sim, s_id: _update_station_prices(sim, s_id, as_station_updates[s_id]),
                 station_ids_to_update,
                 sim_state,
             )
-            return result, self
+
+    def next_event_time(self, sim_state: SimulationState, env: Environment) -> Optional[SimTime]:
+        """
+        the next price update is applied on the first time step after its time
+
+        :param sim_state: the current sim state
+        :param env: static environment variables
+        :return: the time the next prices are applied, or None if all prices have been applied
+        """
+        price_time = self.reader.peek()
+        return SimTime(price_time + 1) if price_time is not None else None
 
 
 def _add_row_to_this_update(
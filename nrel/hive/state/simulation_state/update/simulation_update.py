@@ -4,6 +4,7 @@ from abc import abstractmethod, ABC
 from typing import Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from nrel.hive.model.sim_time import SimTime
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
     from nrel.hive.runner.environment import Environment
 
@@ -22,3 +23,56 @@ class SimulationUpdateFunction(ABC):
         :return: the updated sim state, along with any reporting;
         as well, an Optionally-updated SimulationUpdate function
         """
+
+    def next_event_time(
+        self, simulation_state: SimulationState, env: Environment
+    ) -> Optional[SimTime]:
+        """
+        the earliest sim time at which this update may change the simulation. time steps
+        before this time are guaranteed to be unaffected by this update, which allows
+        event-driven runs to skip over them. by default, any time step may be affected.
+
+        :param simulation_state: the current simulation state
+        :param env: the environmental variables for this run
+        :return: the time of the next event, or None if this update will make no further changes
+        """
+        return simulation_state.sim_time
+
+    def update_many(
+        self, simulation_states: Tuple[SimulationState, ...], env: Environment
+    ) -> Tuple[Tuple[SimulationState, ...], Optional[SimulationUpdateFunction]]:
+        """
+        applies this update to several simulations stepped in lock-step, which share the
+        same sim time and environment. by default, each simulation is updated in turn by the
+        same update function, which holds for update functions that do not change as they
+        are applied. update functions that read inputs as time advances override this to
+        read each input once and apply it to every simulation.
+
+        :param simulation_states: the states to modify, all at the same sim time
+        :param env: the environmental variables shared by these runs
+        :return: the updated sim states, along with an Optionally-updated SimulationUpdate function
+        """
+        updated_fn: Optional[SimulationUpdateFunction] = None
+        updated_states = []
+        for simulation_state in simulation_states:
+            updated_state, updated_fn = self.update(simulation_state, env)
+            updated_states.append(updated_state)
+        return tuple(updated_states), updated_fn
+
+    def reset(self) -> SimulationUpdateFunction:
+        """
+        builds this update function as it was before any time steps were applied, such as
+        to run a scenario again from the start. by default this update function is returned
+        unchanged, which holds for update functions that do not change as they are applied.
+        update functions that consume their inputs as time advances override this to
+        restart those inputs.
+
+        :return: the update function, ready to apply from the start of the scenario
+        :raises: SimulationStateError if the update function cannot restart its inputs
+        """
+        return self
+
+    def close(self):
+        """
+        releases any files held by this update function. by default there are none.
+        """
@@ -17,6 +17,7 @@ from nrel.hive.dispatcher.instruction_generator.instruction_generator import (
 from nrel.hive.dispatcher.instruction_generator.instruction_generator_ops import (
     generate_instructions,
 )
+from nrel.hive.model.sim_time import SimTime
 from nrel.hive.state.simulation_state import simulation_state_ops
 from nrel.hive.state.simulation_state.simulation_state import SimulationState
 from nrel.hive.state.simulation_state.update.simulation_update import SimulationUpdateFunction
@@ -38,6 +39,9 @@ log = logging.getLogger(__name__)
 class StepSimulation(SimulationUpdateFunction):
     instruction_generators: immutables.Map[InstructionGeneratorId, InstructionGenerator]
     instruction_generator_order: Tuple[InstructionGeneratorId, ...]
+    instruction_generator_last_run: immutables.Map[
+        InstructionGeneratorId, SimTime
+    ] = immutables.Map()
 
     @property
     def ordered_instruction_generators(
@@ -72,6 +76,56 @@ class StepSimulation(SimulationUpdateFunction):
             instruction_generator_order=tuple(i_gen.name for i_gen in updated_i_gens),
         )
 
+    def scheduled_instruction_generators(
+        self, simulation_state: SimulationState, env: Environment
+    ) -> Tuple[InstructionGenerator, ...]:
+        """
+        selects the instruction generators which should run on this time step, in order.
+        generators without a schedule in the dispatcher config run on every time step.
+
+        :param simulation_state: the current simulation state
+        :param env: the sim environment
+        :return: the instruction generators to run
+        """
+        schedules = env.config.dispatcher.instruction_generator_schedules
+        if len(schedules) == 0:
+            return self.ordered_instruction_generators
+
+        def _should_run(i_gen: InstructionGenerator) -> bool:
+            schedule = schedules.get(i_gen.name)
+            if schedule is None:
+                return True
+            last_run_time = self.instruction_generator_last_run.get(i_gen.name)
+            return schedule.should_run(simulation_state, env, last_run_time)
+
+        return tuple(filter(_should_run, self.ordered_instruction_generators))
+
+    def update_scheduled_instruction_generators(
+        self, updated_i_gens: Tuple[InstructionGenerator, ...], sim_time: SimTime
+    ) -> StepSimulation:
+        """
+        replaces the instruction generators which ran on this time step, keeping the order
+        and the generators which were skipped, and records when they ran.
+
+        :param updated_i_gens: the updated instruction generators which ran
+        :param sim_time: the sim time they ran at
+        :return: the updated StepSimulation
+        """
+        if len(updated_i_gens) == len(self.instruction_generator_order):
+            updated = self.update_instruction_generators(updated_i_gens)
+        else:
+            updated_by_name = {i_gen.name: i_gen for i_gen in updated_i_gens}
+            updated = self.update_instruction_generators(
+                tuple(
+                    updated_by_name.get(i_gen.name, i_gen)
+                    for i_gen in self.ordered_instruction_generators
+                )
+            )
+        last_run = self.instruction_generator_last_run.update(
+            {i_gen.name: sim_time for i_gen in updated_i_gens}
+        )
+        return replace(updated, instruction_generator_last_run=last_run)
+
     def update(
         self,
         simulation_state: SimulationState,
@@ -85,6 +139,9 @@ class StepSimulation(SimulationUpdateFunction):
         before beginning, it first calls a provided update function on the set of InstructionGenerators for any
         control models injected by the user
 
+        instruction generators with a schedule in the dispatcher config are skipped on time steps
+        where they are not scheduled to run
+
 
         :param simulation_state: state to modify
         :param env: the sim environment
@@ -92,8 +149,9 @@ class StepSimulation(SimulationUpdateFunction):
         """
         sim_with_drivers_updated = perform_driver_state_updates(simulation_state, env)
 
-        i_stack, updated_i_gens = generate_instructions(
-            self.ordered_instruction_generators, sim_with_drivers_updated, env
+        scheduled_i_gens = self.scheduled_instruction_generators(sim_with_drivers_updated, env)
+        i_stack, updated_scheduled_i_gens = generate_instructions(
+            scheduled_i_gens, sim_with_drivers_updated, env
         )
 
         # pops the top instruction from the stack. this could be replaced with something like a priority queue
@@ -118,9 +176,36 @@ class StepSimulation(SimulationUpdateFunction):
         # advance the simulation one time step
         sim_next_time_step = simulation_state_ops.tick(sim_vehicles_updated)
 
-        updated_step_simulation = self.update_instruction_generators(updated_i_gens)
+        updated_step_simulation = self.update_scheduled_instruction_generators(
+            updated_scheduled_i_gens, simulation_state.sim_time
+        )
         return sim_next_time_step, updated_step_simulation
 
+    def next_event_time(
+        self, simulation_state: SimulationState, env: Environment
+    ) -> Optional[SimTime]:
+        """
+        the next time any scheduled instruction generator is scheduled to run, or any driver
+        is due for an update. instruction generators without a schedule run every time step
+        and only depend on the time through the simulation state, so they do not produce
+        events of their own.
+
+        :param simulation_state: the current simulation state
+        :param env: the sim environment
+        :return: the next event, or None if no instruction generators have schedules and
+                 no drivers are queued for an update
+        """
+        schedules = env.config.dispatcher.instruction_generator_schedules
+        event_times = [
+            schedule.next_scheduled_time(self.instruction_generator_last_run.get(name))
+            for name, schedule in schedules.items()
+            if name in self.instruction_generators
+        ]
+        driver_update_times = simulation_state.driver_update_queue.times
+        if len(driver_update_times) > 0:
+            event_times.append(SimTime(driver_update_times[0]))
+        return min(event_times, default=None)
+
     def get_instruction_generator(
         self,
         identifier: Union[InstructionGeneratorId, Type[InstructionGenerator]],
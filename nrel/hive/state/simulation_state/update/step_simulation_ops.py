@@ -54,25 +54,38 @@ def perform_driver_state_updates(
     simulation_state: SimulationState, env: Environment
 ) -> SimulationState:
     """
-    helper function for StepSimulation which runs the update function for all driver states
+    helper function for StepSimulation which runs the update function for the driver states
+    which are due for an update. after each update, the driver is queued again at the next
+    sim time its update may change its state, such as the next boundary of its schedule.
 
     :param simulation_state: the simulation state to update
     :param env: the simulation environment
-    :return: the sim after all vehicle update functions have been called
+    :return: the sim after all due driver update functions have been called
     """
 
-    def _step_drivers(s: SimulationState, vehicle: Vehicle) -> SimulationState:
-        driver_state = vehicle.driver_state
-        error, updated_sim = driver_state.update(s, env)
+    def _step_driver(s: SimulationState, vehicle_id: VehicleId) -> SimulationState:
+        vehicle = s.vehicles.get(vehicle_id)
+        if vehicle is None:
+            return s
+        error, updated_sim = vehicle.driver_state.update(s, env)
         if error:
             log.error(error)
-            return simulation_state
-        elif not updated_sim:
-            return simulation_state
+            # try again at the next time step
+            next_update_time: Optional[int] = s.sim_time + s.sim_timestep_duration_seconds
         else:
-            return updated_sim
-
-    next_state = ft.reduce(_step_drivers, simulation_state.vehicles.values(), simulation_state)
+            if updated_sim is not None:
+                s = updated_sim
+            updated_vehicle = s.vehicles.get(vehicle_id)
+            if updated_vehicle is None:
+                return s
+            next_update_time = updated_vehicle.driver_state.next_update_time(s, env)
+        updated_queue = s.driver_update_queue.schedule(vehicle_id, next_update_time)
+        return s._replace(driver_update_queue=updated_queue)
+
+    due, queue = simulation_state.driver_update_queue.pop_due(simulation_state.sim_time)
+    if len(due) == 0:
+        return simulation_state
+    next_state = ft.reduce(_step_driver, due, simulation_state._replace(driver_update_queue=queue))
     return next_state
 
 
@@ -80,7 +93,8 @@ def perform_vehicle_state_updates(
     simulation_state: SimulationState, env: Environment
 ) -> SimulationState:
     """
-    helper function for StepSimulation which applies a vehicle state update to each vehicle
+    helper function for StepSimulation which applies a vehicle state update to each vehicle.
+    vehicles in a dormant state are skipped, since their update would not change the simulation.
 
     :param simulation_state: the simulation state to update
     :param env: the simulation environment
@@ -115,7 +129,10 @@ def perform_vehicle_state_updates(
         return other_vehicles + sorted_charge_queueing_vehicles
 
     # why sort here? see _sort_by_vehicle_state for an explanation
-    vehicles = _sort_by_vehicle_state(tuple(simulation_state.vehicles.values()))
+    active_vehicles = tuple(
+        simulation_state.vehicles[vehicle_id] for vehicle_id in simulation_state.active_vehicles
+    )
+    vehicles = _sort_by_vehicle_state(active_vehicles)
 
     for veh in vehicles:
         simulation_state = step_vehicle(simulation_state, env, veh)
@@ -15,6 +15,7 @@ from nrel.hive.state.simulation_state.update.step_simulation import StepSimulati
 from nrel.hive.state.simulation_state.update.update_requests_from_file import UpdateRequestsFromFile
 
 if TYPE_CHECKING:
+    from nrel.hive.model.sim_time import SimTime
     from nrel.hive.runner import RunnerPayload
 
 
@@ -91,6 +92,18 @@ class Update(NamedTuple):
 
         return updated_payload
 
+    def next_event_time(self, runner_payload: RunnerPayload) -> Optional[SimTime]:
+        """
+        the earliest sim time at which any of the update functions may change the simulation
+
+        :param runner_payload: the current SimulationState and assets at the current simtime
+        :return: the time of the next event, or None if no update function has further events
+        """
+        sim, env = runner_payload.s, runner_payload.e
+        event_times = [fn.next_event_time(sim, env) for fn in self.pre_step_update]
+        event_times.append(self.step_update.next_event_time(sim, env))
+        return min((t for t in event_times if t is not None), default=None)
+
 
 def _apply_fn(p: UpdatePayload, fn: SimulationUpdateFunction) -> UpdatePayload:
     """
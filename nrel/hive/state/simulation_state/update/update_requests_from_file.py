@@ -5,7 +5,7 @@ import functools as ft
 import logging
 from csv import DictReader
 from pathlib import Path
-from typing import NamedTuple, Tuple, Optional, Iterator, Dict
+from typing import NamedTuple, Tuple, Optional, Iterator, Dict, Sequence, TYPE_CHECKING
 
 from returns.result import Failure
 
@@ -16,8 +16,13 @@ from nrel.hive.runner.environment import Environment
 from nrel.hive.state.simulation_state import simulation_state_ops
 from nrel.hive.state.simulation_state.simulation_state import SimulationState
 from nrel.hive.state.simulation_state.update.simulation_update import SimulationUpdateFunction
+from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.iterators import DictReaderStepper
 
+if TYPE_CHECKING:
+    from nrel.hive.model.entity_position import EntityPosition
+    from nrel.hive.model.roadnetwork.roadnetwork import RoadNetwork
+
 log = logging.getLogger(__name__)
 
 
@@ -25,10 +30,16 @@ log = logging.getLogger(__name__)
 class UpdateRequestsFromFile(SimulationUpdateFunction):
     """
     loads requests from a file, which is assumed to be sorted by Request
+
+    the files it was built from are kept so that it can be reset to read them again
+    from the start.
     """
 
     reader: DictReaderStepper
     rate_structure: RequestRateStructure
+    request_file: Optional[str] = None
+    rate_structure_file: Optional[str] = None
+    lazy_file_reading: bool = False
 
     @classmethod
     def build(
@@ -77,7 +88,33 @@ class UpdateRequestsFromFile(SimulationUpdateFunction):
                 reader_iter, "departure_time", parser=SimTime.build
             )
 
-        return UpdateRequestsFromFile(reader=stepper, rate_structure=rate_structure)
+        return UpdateRequestsFromFile(
+            reader=stepper,
+            rate_structure=rate_structure,
+            request_file=request_file,
+            rate_structure_file=rate_structure_file,
+            lazy_file_reading=lazy_file_reading,
+        )
+
+    def reset(self) -> UpdateRequestsFromFile:
+        """
+        builds a new UpdateRequestsFromFile which reads the request file from the start
+
+        :return: the new update function
+        :raises: SimulationStateError if this update function was not built from a file
+        """
+        if self.request_file is None:
+            raise SimulationStateError(
+                "cannot reset an UpdateRequestsFromFile which was not built from a request file"
+            )
+        return UpdateRequestsFromFile.build(
+            self.request_file,
+            self.rate_structure_file,
+            lazy_file_reading=self.lazy_file_reading,
+        )
+
+    def close(self):
+        self.reader.close()
 
     def update(
         self, sim_state: SimulationState, env: Environment
@@ -91,14 +128,9 @@ class UpdateRequestsFromFile(SimulationUpdateFunction):
         :return: sim state plus new requests
         """
 
-        current_sim_time = sim_state.sim_time
-
-        def stop_condition(value: int) -> bool:
-            stop = value < current_sim_time
-            return stop
-
+        rows = self._read_rows(sim_state.sim_time)
         result = update_requests_from_iterator(
-            self.reader.read_until_stop_condition(stop_condition),
+            iter(rows),
             sim_state,
             env=env,
             rate_structure=self.rate_structure,
@@ -106,6 +138,53 @@ class UpdateRequestsFromFile(SimulationUpdateFunction):
 
         return result, None
 
+    def update_many(
+        self, simulation_states: Tuple[SimulationState, ...], env: Environment
+    ) -> Tuple[Tuple[SimulationState, ...], Optional[UpdateRequestsFromFile]]:
+        """
+        adds the requests from file to several simulations at the same sim time, reading
+        the file once and snapping the requests once for each road network
+
+        :param simulation_states: the sim states, all at the same sim time
+        :param env: the static environment variables
+        :return: each sim state plus new requests
+        """
+        if len(simulation_states) == 0:
+            return (), None
+        rows = self._read_rows(simulation_states[0].sim_time)
+        snapped_by_network: Dict[int, Tuple] = {}
+        results = []
+        for sim_state in simulation_states:
+            road_network = sim_state.road_network
+            snapped = snapped_by_network.get(id(road_network))
+            if snapped is None:
+                snapped = _snap_rows(rows, road_network)
+                snapped_by_network[id(road_network)] = snapped
+            results.append(_add_snapped_rows(snapped, sim_state, env, self.rate_structure))
+        return tuple(results), None
+
+    def _read_rows(self, current_sim_time: SimTime) -> Tuple[Dict[str, str], ...]:
+        """
+        consumes the rows of the requests which depart before the sim time
+        """
+
+        def stop_condition(value: int) -> bool:
+            stop = value < current_sim_time
+            return stop
+
+        return tuple(self.reader.read_until_stop_condition(stop_condition))
+
+    def next_event_time(self, sim_state: SimulationState, env: Environment) -> Optional[SimTime]:
+        """
+        the next request is added on the first time step after its departure time
+
+        :param sim_state: the current sim state
+        :param env: the static environment variables
+        :return: the time the next request is added, or None if all requests have been added
+        """
+        departure_time = self.reader.peek()
+        return SimTime(departure_time + 1) if departure_time is not None else None
+
 
 def update_requests_from_iterator(
     it: Iterator[Dict[str, str]],
@@ -124,78 +203,114 @@ def update_requests_from_iterator(
     :return: sim state plus new requests
     """
 
-    def _update(
-        sim: SimulationState,
-        row: Dict[str, str],
-        env: Environment,
-        rate_structure: RequestRateStructure,
-    ) -> SimulationState:
-        """
-        takes one row, attempts to parse it as a Request, and attempts to add it to the simulation
+    # stream in all Requests that occur before the sim time of the provided SimulationState,
+    # snapping the origins and destinations of the whole batch to the road network at once
+    snapped = _snap_rows(list(it), initial_sim_state.road_network)
+    return _add_snapped_rows(snapped, initial_sim_state, env, rate_structure)
 
 
-        :param sim: latest SimulationState
-        :param row: one row as loaded via DictReader
-        :param env: the simulation environment
-        :param rate_structure: the rate structure for requests in the simulation
-        :return: the updated sim and updated reporting
-        """
-        error, req = Request.from_row(row, env, sim.road_network)
-        this_req_cancel_time = (
-            req.departure_time + env.config.sim.request_cancel_time_seconds if req else None
-        )
-        if error:
+def _snap_rows(
+    rows: Sequence[Dict[str, str]], road_network: RoadNetwork
+) -> Tuple[Tuple[Dict[str, str], Optional[EntityPosition], Optional[EntityPosition]], ...]:
+    """
+    snaps the origin and destination of each request row to the road network
+
+    :param rows: the request rows
+    :param road_network: the road network to snap to
+    :return: each row along with its origin and destination positions
+    """
+    origins = road_network.positions_from_rows(rows, "o_lat", "o_lon")
+    destinations = road_network.positions_from_rows(rows, "d_lat", "d_lon")
+    return tuple(zip(rows, origins, destinations))
+
+
+def _add_snapped_rows(
+    snapped: Tuple[Tuple[Dict[str, str], Optional[EntityPosition], Optional[EntityPosition]], ...],
+    initial_sim_state: SimulationState,
+    env: Environment,
+    rate_structure: RequestRateStructure,
+) -> SimulationState:
+    """
+    adds the requests of some rows already snapped to the road network
+
+    :param snapped: each request row along with its origin and destination positions
+    :param initial_sim_state: the current sim state
+    :param env: the simulation environment
+    :param rate_structure: the rate structure for requests in the simulation
+    :return: sim state plus new requests
+    """
+    return ft.reduce(
+        ft.partial(_add_row, env=env, rate_structure=rate_structure),
+        snapped,
+        initial_sim_state,
+    )
+
+
+def _add_row(
+    sim: SimulationState,
+    row_and_positions: Tuple[Dict[str, str], Optional[EntityPosition], Optional[EntityPosition]],
+    env: Environment,
+    rate_structure: RequestRateStructure,
+) -> SimulationState:
+    """
+    takes one row, attempts to parse it as a Request, and attempts to add it to the simulation
+
+
+    :param sim: latest SimulationState
+    :param row_and_positions: one row as loaded via DictReader, with its origin and destination
+                              already snapped to the road network
+    :param env: the simulation environment
+    :param rate_structure: the rate structure for requests in the simulation
+    :return: the updated sim and updated reporting
+    """
+    row, origin_position, destination_position = row_and_positions
+    error, req = Request.from_row(row, env, sim.road_network, origin_position, destination_position)
+    this_req_cancel_time = (
+        req.departure_time + env.config.sim.request_cancel_time_seconds if req else None
+    )
+    if error:
+        log.error(error)
+        return sim
+    elif not req:
+        log.error(f"an unexpected error occurred with request row: {row}")
+        return sim
+    elif this_req_cancel_time <= sim.sim_time:
+        # cannot add request that should already be cancelled
+        current_time = sim.sim_time
+        warning = f"request {req.id} with cancel_time {this_req_cancel_time} cannot be added at time {current_time}"
+        log.warning(warning)
+        return sim
+    elif len(env.fleet_ids) > 0 and len(req.membership.memberships) == 0:
+        warning = f"request {req.id} is missing membership and will not be be added"
+        log.warning(warning)
+        return sim
+    elif len(env.fleet_ids) == 0 and len(req.membership.memberships) > 0:
+        warning = f"request {req.id} has membership but there is no fleets file. This request will not be added"
+        log.warning(warning)
+        return sim
+    else:
+        req_updated = req.assign_value(rate_structure, sim.road_network)
+        sim_or_error = simulation_state_ops.add_request_safe(sim, req_updated)
+        if isinstance(sim, Failure):
+            error = sim_or_error.failure()
             log.error(error)
             return sim
-        elif not req:
-            log.error(f"an unexpected error occurred with request row: {row}")
-            return sim
-        elif this_req_cancel_time <= sim.sim_time:
-            # cannot add request that should already be cancelled
-            current_time = sim.sim_time
-            warning = f"request {req.id} with cancel_time {this_req_cancel_time} cannot be added at time {current_time}"
-            log.warning(warning)
-            return sim
-        elif len(env.fleet_ids) > 0 and len(req.membership.memberships) == 0:
-            warning = f"request {req.id} is missing membership and will not be be added"
-            log.warning(warning)
-            return sim
-        elif len(env.fleet_ids) == 0 and len(req.membership.memberships) > 0:
-            warning = f"request {req.id} has membership but there is no fleets file. This request will not be added"
-            log.warning(warning)
-            return sim
         else:
-            req_updated = req.assign_value(rate_structure, sim.road_network)
-            sim_or_error = simulation_state_ops.add_request_safe(sim, req_updated)
-            if isinstance(sim, Failure):
-                error = sim_or_error.failure()
-                log.error(error)
+            # successfully added request
+            sim_updated = sim_or_error.unwrap()
+            req_in_sim = sim_updated.requests.get(req.id)
+            if not req_in_sim:
+                warning = (
+                    f"adding new request {req.id} to sim succeeded but now request is not found"
+                )
+                log.warning(warning)
                 return sim
             else:
-                # successfully added request
-                sim_updated = sim_or_error.unwrap()
-                req_in_sim = sim_updated.requests.get(req.id)
-                if not req_in_sim:
-                    warning = (
-                        f"adding new request {req.id} to sim succeeded but now request is not found"
-                    )
-                    log.warning(warning)
-                    return sim
-                else:
-                    dep_t = req_in_sim.departure_time
-                    report_data = {
-                        "request_id": req.id,
-                        "departure_time": str(dep_t),
-                        "fleet_id": str(req.membership),
-                    }
-                    env.reporter.file_report(Report(ReportType.ADD_REQUEST_EVENT, report_data))
-                    return sim_updated
-
-    # stream in all Requests that occur before the sim time of the provided SimulationState
-    updated_sim = ft.reduce(
-        ft.partial(_update, env=env, rate_structure=rate_structure),
-        it,
-        initial_sim_state,
-    )
-
-    return updated_sim
+                dep_t = req_in_sim.departure_time
+                report_data = {
+                    "request_id": req.id,
+                    "departure_time": str(dep_t),
+                    "fleet_id": str(req.membership),
+                }
+                env.reporter.file_report(Report(ReportType.ADD_REQUEST_EVENT, report_data))
+                return sim_updated
@@ -64,6 +64,19 @@ class UpdateRequestsSampling(SimulationUpdateFunction):
 
         return UpdateRequestsSampling(request_iterator=stepper, rate_structure=rate_structure)
 
+    def reset(self) -> UpdateRequestsSampling:
+        """
+        builds a new UpdateRequestsSampling which injects the sampled requests from the start
+
+        :return: the new update function
+        """
+        stepper = ObjectIterator(
+            items=self.request_iterator.items,
+            step_attr_name=self.request_iterator.step_attr_name,
+            stop_condition=lambda dt: dt < 0,
+        )
+        return UpdateRequestsSampling(request_iterator=stepper, rate_structure=self.rate_structure)
+
     def update(
         self, sim_state: SimulationState, env: Environment
     ) -> Tuple[SimulationState, Optional[UpdateRequestsSampling]]:
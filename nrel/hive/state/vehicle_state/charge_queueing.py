@@ -6,6 +6,7 @@ from typing import NamedTuple, Tuple, Optional, TYPE_CHECKING
 from uuid import uuid4
 
 from nrel.hive.model.sim_time import SimTime
+from nrel.hive.model.vehicle.mechatronics.powercurve import powercurve_ops
 from nrel.hive.runner.environment import Environment
 from nrel.hive.state.simulation_state import simulation_state_ops
 from nrel.hive.state.vehicle_state.charging_station import ChargingStation
@@ -16,6 +17,7 @@ from nrel.hive.state.vehicle_state.vehicle_state import (
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import VehicleId, StationId, ChargerId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -23,7 +25,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class ChargeQueueing(VehicleState):
     """
     A vehicle tracks it's own place in a queue (Stations do not know about queues), and what guarantees
@@ -94,7 +96,31 @@ class ChargeQueueing(VehicleState):
             msg = f"vehicle doesn't have access to station; context: {context}"
             return SimulationStateError(msg), None
         else:
-            err1, updated_station = station.enqueue_for_charger(self.charger_id)
+            mechatronics = env.mechatronics.get(vehicle.mechatronics_id)
+            charger_err, charger = station.get_charger_instance(self.charger_id)
+            if mechatronics is None:
+                msg = f"unknown mechatronics id {vehicle.mechatronics_id}; context: {context}"
+                return SimulationStateError(msg), None
+            elif charger_err is not None:
+                return charger_err, None
+            elif charger is None:
+                return None, None
+
+            # track how long this vehicle is expected to charge once it reaches a charger
+            charge_duration = powercurve_ops.time_to_full(
+                vehicle,
+                mechatronics,
+                charger,
+                env.config.dispatcher.ideal_fastcharge_soc_limit,
+                sim.sim_timestep_duration_seconds,
+            )
+            err1, enqueued_station = station.enqueue_for_charger(self.charger_id)
+            if err1 is None and enqueued_station is not None:
+                err1, updated_station = enqueued_station.add_enqueued_vehicle(
+                    self.charger_id, self.vehicle_id, charge_duration, sim.sim_time
+                )
+            else:
+                updated_station = enqueued_station
             if err1 is not None:
                 return err1, None
             elif updated_station is None:
@@ -138,7 +164,13 @@ class ChargeQueueing(VehicleState):
                 None,
             )
         else:
-            error, updated_station = station.dequeue_for_charger(self.charger_id)
+            error, dequeued_station = station.dequeue_for_charger(self.charger_id)
+            if error is None and dequeued_station is not None:
+                error, updated_station = dequeued_station.remove_enqueued_vehicle(
+                    self.charger_id, self.vehicle_id, sim.sim_time
+                )
+            else:
+                updated_station = dequeued_station
             if error is not None:
                 return error, None
             elif updated_station is None:
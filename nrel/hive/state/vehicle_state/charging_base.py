@@ -15,6 +15,7 @@ from nrel.hive.state.vehicle_state.vehicle_state_ops import charge
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import BaseId, VehicleId, ChargerId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -23,7 +24,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class ChargingBase(VehicleState):
     """
     a vehicle is charging at a base with a specific charger_id type
@@ -5,6 +5,7 @@ import logging
 from typing import Tuple, Optional, NamedTuple, TYPE_CHECKING
 import uuid
 
+from nrel.hive.model.vehicle.mechatronics.powercurve import powercurve_ops
 from nrel.hive.runner.environment import Environment
 from nrel.hive.state.simulation_state import simulation_state_ops
 from nrel.hive.state.vehicle_state.idle import Idle
@@ -16,6 +17,7 @@ from nrel.hive.state.vehicle_state.vehicle_state_ops import charge
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import StationId, VehicleId, ChargerId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -24,7 +26,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class ChargingStation(VehicleState):
     """
     a vehicle is charging at a station with a specific charger_id type
@@ -113,7 +115,26 @@ class ChargingStation(VehicleState):
             msg = f"vehicle {vehicle.id} of type {vehicle.mechatronics_id} can't use charger {charger.id}"
             return SimulationStateError(msg), None
         else:
-            error, updated_station = station.checkout_charger(self.charger_id)
+            error, checked_out_station = station.checkout_charger(self.charger_id)
+            if error is not None:
+                return error, None
+            elif checked_out_station is None:
+                return None, None
+
+            # track when this vehicle is expected to release the charger
+            charge_duration = powercurve_ops.time_to_full(
+                vehicle,
+                mechatronics,
+                charger,
+                env.config.dispatcher.ideal_fastcharge_soc_limit,
+                sim.sim_timestep_duration_seconds,
+            )
+            error, updated_station = checked_out_station.add_charging_vehicle(
+                self.charger_id,
+                self.vehicle_id,
+                sim.sim_time + charge_duration,
+                sim.sim_time,
+            )
             if error is not None:
                 return error, None
             elif updated_station is None:
@@ -164,7 +185,13 @@ class ChargingStation(VehicleState):
                 None,
             )
         else:
-            error, updated_station = station.return_charger(self.charger_id)
+            error, returned_station = station.return_charger(self.charger_id)
+            if error is None and returned_station is not None:
+                error, updated_station = returned_station.remove_charging_vehicle(
+                    self.charger_id, self.vehicle_id, sim.sim_time
+                )
+            else:
+                updated_station = returned_station
             if error:
                 response = SimulationStateError(
                     f"failure returning charger during ChargingStation.exit for vehicle {self.vehicle_id} at station {self.station_id}"
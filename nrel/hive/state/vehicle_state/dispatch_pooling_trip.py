@@ -28,6 +28,7 @@ from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util import TupleOps
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import RequestId, VehicleId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -35,7 +36,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class DispatchPoolingTrip(VehicleState):
     vehicle_id: VehicleId
     # this trip plan contains all phases, including the initial pickup
@@ -20,6 +20,7 @@ from nrel.hive.state.vehicle_state.vehicle_state import (
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import StationId, VehicleId, ChargerId
+from nrel.hive.util.slots import SLOTS
 
 log = logging.getLogger(__name__)
 
@@ -27,7 +28,7 @@ if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class DispatchStation(VehicleState):
     vehicle_id: VehicleId
     station_id: StationId
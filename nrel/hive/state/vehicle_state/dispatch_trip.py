@@ -26,6 +26,7 @@ from nrel.hive.state.vehicle_state.vehicle_state import (
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import RequestId, VehicleId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -33,7 +34,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class DispatchTrip(VehicleState):
     vehicle_id: VehicleId
     request_id: RequestId
@@ -182,7 +183,7 @@ class DispatchTrip(VehicleState):
                     boarded_requests=immutables.Map({request.id: request}),
                     departure_times=immutables.Map({request.id: departure_time}),
                     routes=(route,),
-                    num_passengers=len(request.passengers),
+                    num_passengers=request.num_passengers,
                 )
                 if pooling_trip
                 else ServicingTrip.build(
@@ -12,12 +12,13 @@ from nrel.hive.state.vehicle_state.vehicle_state import (
 )
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.typealiases import VehicleId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class OutOfService(VehicleState):
     vehicle_id: VehicleId
 
@@ -37,6 +38,10 @@ class OutOfService(VehicleState):
     def vehicle_state_type(cls) -> VehicleStateType:
         return VehicleStateType.OUT_OF_SERVICE
 
+    @property
+    def is_dormant(self) -> bool:
+        return True
+
     def update(
         self, sim: SimulationState, env: Environment
     ) -> Tuple[Optional[Exception], Optional[SimulationState]]:
@@ -18,12 +18,13 @@ from nrel.hive.state.vehicle_state.vehicle_state import (
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import VehicleId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Repositioning(VehicleState):
     vehicle_id: VehicleId
     route: Route
@@ -14,6 +14,7 @@ from nrel.hive.state.vehicle_state.vehicle_state import (
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import VehicleId, BaseId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -21,7 +22,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class ReserveBase(VehicleState):
     vehicle_id: VehicleId
     base_id: BaseId
@@ -36,6 +37,10 @@ class ReserveBase(VehicleState):
     def vehicle_state_type(cls) -> VehicleStateType:
         return VehicleStateType.RESERVE_BASE
 
+    @property
+    def is_dormant(self) -> bool:
+        return True
+
     def update(
         self, sim: SimulationState, env: Environment
     ) -> Tuple[Optional[Exception], Optional[SimulationState]]:
@@ -107,7 +107,7 @@ def complete_trip_phase(
             else:
                 # add this request to the boarded vehicles
                 updated_boarded_requests = vehicle_state.boarded_requests.set(request.id, request)
-                updated_num_passengers = vehicle_state.num_passengers + len(request.passengers)
+                updated_num_passengers = vehicle_state.num_passengers + request.num_passengers
                 updated_departure_times = vehicle_state.departure_times.set(
                     request.id, sim.sim_time
                 )
@@ -146,7 +146,7 @@ def complete_trip_phase(
             else:
                 # remove this request from the boarded vehicles
                 updated_boarded_requests = vehicle_state.boarded_requests.delete(request.id)
-                updated_num_passengers = vehicle_state.num_passengers - len(request.passengers)
+                updated_num_passengers = vehicle_state.num_passengers - request.num_passengers
                 updated_vehicle_state = replace(
                     vehicle_state,
                     trip_plan=updated_trip_plan,
@@ -26,6 +26,7 @@ from nrel.hive.state.vehicle_state.vehicle_state_ops import move
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util import SimulationStateError, TupleOps
 from nrel.hive.util.typealiases import RequestId, VehicleId
+from nrel.hive.util.slots import SLOTS
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -33,7 +34,7 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class ServicingPoolingTrip(VehicleState):
     """
     a pooling trip is in service, for the given trips in the given trip_order.
@@ -148,7 +149,7 @@ class ServicingPoolingTrip(VehicleState):
                     self,
                     boarded_requests=immutables.Map({first_req_id: first_req}),
                     departure_times=immutables.Map({first_req_id: sim.sim_time}),
-                    num_passengers=len(first_req.passengers),
+                    num_passengers=first_req.num_passengers,
                     trip_plan=remaining_trip_plan,
                 )
                 result = VehicleState.apply_new_vehicle_state(
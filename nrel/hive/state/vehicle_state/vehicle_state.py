@@ -11,6 +11,7 @@ from nrel.hive.state.simulation_state import simulation_state_ops
 from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 from nrel.hive.util.exception import SimulationStateError, StateTransitionError
 from nrel.hive.util.typealiases import VehicleId
+from nrel.hive.util.slots import SLOTS
 
 import logging
 
@@ -23,7 +24,7 @@ log = logging.getLogger(__name__)
 VehicleStateInstanceId = UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Mixin:
     vehicle_id: VehicleId
     instance_id: VehicleStateInstanceId
@@ -40,6 +41,8 @@ class VehicleStateABC(ABC):
     state cannot be entered/exited under this circumstance.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def vehicle_state_type(cls) -> VehicleStateType:
@@ -50,6 +53,17 @@ class VehicleStateABC(ABC):
         """
         pass
 
+    @property
+    def is_dormant(self) -> bool:
+        """
+        a dormant state has no terminal condition and an update which leaves the simulation
+        unchanged. vehicles in a dormant state are left out of the step loop until some other
+        operation, such as an instruction, moves them into a state which is not dormant.
+
+        :return: True if updating this state is a no-op
+        """
+        return False
+
     def __repr__(self) -> str:
         return super().__repr__()
 
@@ -223,3 +237,5 @@ class VehicleStateABC(ABC):
 
 class VehicleState(Mixin, VehicleStateABC):
     """ """
+
+    __slots__ = ()
@@ -15,6 +15,7 @@ from nrel.hive.state.vehicle_state.out_of_service import OutOfService
 from nrel.hive.util.exception import SimulationStateError
 from nrel.hive.util.typealiases import StationId, ChargerId
 from nrel.hive.util.typealiases import VehicleId
+from nrel.hive.util.units import Ratio
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -146,6 +147,32 @@ def _go_out_of_service_on_empty(
     return next_state.enter(sim, env)
 
 
+def _record_low_soc(
+    sim: SimulationState, env: Environment, soc_before: Ratio, soc_after: Ratio
+) -> SimulationState:
+    """
+    records the sim time at which a moving vehicle fell below any LOW_SOC wake threshold,
+    so that scheduled instruction generators can test for the event without visiting vehicles
+
+    :param sim: the simulation state
+    :param env: the simulation environment
+    :param soc_before: the state of charge of the vehicle before it moved
+    :param soc_after: the state of charge of the vehicle after it moved
+    :return: the simulation state with any crossed thresholds recorded
+    """
+    crossed = [
+        threshold
+        for threshold in env.config.dispatcher.low_soc_thresholds()
+        if soc_after < threshold <= soc_before
+    ]
+    if not crossed:
+        return sim
+    low_soc_times = sim.low_soc_times
+    for threshold in crossed:
+        low_soc_times = low_soc_times.set(threshold, sim.sim_time)
+    return sim._replace(low_soc_times=low_soc_times)
+
+
 def move(
     sim: SimulationState, env: Environment, vehicle_id: VehicleId
 ) -> Tuple[Optional[Exception], Optional[SimulationState]]:
@@ -226,6 +253,13 @@ def move(
         report = vehicle_move_event(sim, vehicle, updated_vehicle, traverse_result, env)
         env.reporter.file_report(report)
 
+        sim = _record_low_soc(
+            sim,
+            env,
+            mechatronics.fuel_source_soc(vehicle),
+            mechatronics.fuel_source_soc(less_energy_vehicle),
+        )
+
     error, moved_sim = simulation_state_ops.modify_vehicle(sim, updated_vehicle)
     if error:
         response = SimulationStateError(
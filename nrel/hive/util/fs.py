@@ -1,12 +1,25 @@
+import importlib
 from pathlib import Path
 from typing import Optional, Union
 
-import pkg_resources
 import yaml
 
 from nrel.hive.config.global_config import GlobalConfig
 
 
+def resource_filename(package: str, resource: str) -> str:
+    """
+    finds a file packaged with hive, in place of pkg_resources.resource_filename, which is
+    slow to import
+
+    :param package: the package holding the file, such as nrel.hive.resources.defaults
+    :param resource: the file name
+    :return: the path to the file
+    """
+    module = importlib.import_module(package)
+    return str(Path(next(iter(module.__path__))).joinpath(resource))
+
+
 def global_hive_config_search() -> GlobalConfig:
     """
     searches for the global hive config, and if found, loads it. if not, loads the default from nrel.hive.resources
@@ -29,7 +42,7 @@ def global_hive_config_search() -> GlobalConfig:
             return None
 
     # load the default file to be merged with any found files
-    default_global_config_file_path = pkg_resources.resource_filename(
+    default_global_config_file_path = resource_filename(
         "nrel.hive.resources.defaults", ".hive.yaml"
     )
     with Path(default_global_config_file_path).open() as df:
@@ -93,9 +106,7 @@ def construct_asset_path(
         return result
     except FileNotFoundError:
         # try the resources directory fallback
-        fallback = pkg_resources.resource_filename(
-            f"nrel.hive.resources.{resources_subdirectory}", str(file)
-        )
+        fallback = resource_filename(f"nrel.hive.resources.{resources_subdirectory}", str(file))
         if Path(fallback).is_file():
             return fallback
         else:
@@ -152,15 +163,13 @@ def find_scenario(user_provided_scenario: str) -> Path:
     absolute_path = Path(user_provided_scenario).absolute()
     relative_path = Path.cwd().joinpath(user_provided_scenario)
     den_path = Path(
-        pkg_resources.resource_filename(
+        resource_filename(
             "nrel.hive.resources.scenarios.denver_downtown",
             user_provided_scenario,
         )
     )
     nyc_path = Path(
-        pkg_resources.resource_filename(
-            "nrel.hive.resources.scenarios.manhattan", user_provided_scenario
-        )
+        resource_filename("nrel.hive.resources.scenarios.manhattan", user_provided_scenario)
     )
 
     print(den_path)
@@ -0,0 +1,169 @@
+"""
+integer h3 cells and batch operations over numpy arrays of them.
+
+a GeoId is the hex string form of a 64-bit h3 index. cells held as integers hash and
+compare faster and pack into numpy arrays, so batch operations convert once at the
+boundary with to_cells and to_geoids and work on uint64 arrays in between.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence, Tuple
+
+import h3.api.basic_int as h3_int
+import numpy as np
+
+from nrel.hive.util.exception import H3Error
+from nrel.hive.util.typealiases import GeoId, H3Cell, H3Resolution
+
+# the bit layout of an h3 index: the resolution sits in bits 52-55, followed by one
+# 3-bit digit per resolution from 1 to 15, where the digits below the resolution are 7
+MAX_H3_RESOLUTION = 15
+_RESOLUTION_OFFSET = 52
+_RESOLUTION_MASK = np.uint64(0xF << _RESOLUTION_OFFSET)
+_DIGIT_BITS = 3
+
+
+def to_cell(geoid: GeoId) -> H3Cell:
+    """
+    :param geoid: an h3 geoid
+    :return: the cell as an integer
+    """
+    return int(geoid, 16)
+
+
+def to_geoid(cell: H3Cell) -> GeoId:
+    """
+    :param cell: an h3 cell as an integer
+    :return: the geoid of the cell
+    """
+    return format(cell, "x")
+
+
+def to_cells(geoids: Iterable[GeoId]) -> np.ndarray:
+    """
+    :param geoids: h3 geoids
+    :return: the cells as a uint64 array
+    """
+    return np.array([int(g, 16) for g in geoids], dtype=np.uint64)
+
+
+def to_geoids(cells: np.ndarray) -> Tuple[GeoId, ...]:
+    """
+    :param cells: an array of h3 cells
+    :return: the geoid of each cell
+    """
+    return tuple(format(c, "x") for c in cells.tolist())
+
+
+def cell_resolutions(cells: np.ndarray) -> np.ndarray:
+    """
+    :param cells: an array of h3 cells
+    :return: the resolution of each cell
+    """
+    resolutions = (cells & _RESOLUTION_MASK) >> np.uint64(_RESOLUTION_OFFSET)
+    return resolutions.astype(np.int8)
+
+
+def cell_parents(cells: np.ndarray, resolution: H3Resolution) -> np.ndarray:
+    """
+    finds the parent of each cell by rewriting the bits of the index, without calling h3
+
+    :param cells: an array of h3 cells
+    :param resolution: the resolution of the parents
+    :return: the parent of each cell
+    :raises: H3Error if the resolution is finer than the resolution of any cell
+    """
+    if not 0 <= resolution <= MAX_H3_RESOLUTION:
+        raise H3Error(f"invalid h3 resolution {resolution}")
+    cells = np.asarray(cells, dtype=np.uint64)
+    if len(cells) > 0 and cell_resolutions(cells).min() < resolution:
+        raise H3Error(f"cannot find parents at resolution {resolution} of coarser cells")
+
+    unused_digits = np.uint64((1 << ((MAX_H3_RESOLUTION - resolution) * _DIGIT_BITS)) - 1)
+    resolution_bits = np.uint64(resolution << _RESOLUTION_OFFSET)
+    return (cells & ~_RESOLUTION_MASK) | resolution_bits | unused_digits
+
+
+def cell_lat_lon(cells: np.ndarray) -> np.ndarray:
+    """
+    finds the center of each cell, calling h3 once per distinct cell
+
+    :param cells: an array of h3 cells
+    :return: the latitude (column 0) and longitude (column 1) in degrees of each cell center
+    """
+    unique_cells, inverse = np.unique(np.asarray(cells, dtype=np.uint64), return_inverse=True)
+    centers = np.array(
+        [h3_int.h3_to_geo(c) for c in unique_cells.tolist()], dtype=np.float64
+    ).reshape(-1, 2)
+    return centers[inverse.reshape(-1)]
+
+
+def grid_distance_matrix(origins: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+    """
+    computes the h3 grid distance between every origin and every destination.
+
+    each cell is placed once in the local ij coordinates of the first origin, so that every
+    distance is found with array arithmetic instead of a call to h3 per pair. where the
+    cells are too far apart for one set of local coordinates, such as across a pentagon,
+    each pair is measured by h3 instead.
+
+    :param origins: an array of h3 cells
+    :param destinations: an array of h3 cells at the same resolution as the origins
+    :return: the grid distance from each origin (row) to each destination (column)
+    :raises: H3Error if two cells are too far apart to compute a grid distance
+    """
+    origins = np.asarray(origins, dtype=np.uint64)
+    destinations = np.asarray(destinations, dtype=np.uint64)
+    if len(origins) == 0 or len(destinations) == 0:
+        return np.zeros((len(origins), len(destinations)), dtype=np.int64)
+
+    try:
+        anchor = int(origins[0])
+        origin_ij = _local_ij(anchor, origins.tolist())
+        destination_ij = _local_ij(anchor, destinations.tolist())
+    except ValueError:
+        return _pairwise_grid_distance_matrix(origins.tolist(), destinations.tolist())
+
+    # as ijk coordinates, (di, dj, 0) is normalized by removing its smallest component;
+    # the grid distance is then its largest component
+    di = destination_ij[np.newaxis, :, 0] - origin_ij[:, np.newaxis, 0]
+    dj = destination_ij[np.newaxis, :, 1] - origin_ij[:, np.newaxis, 1]
+    zero = np.zeros_like(di)
+    return np.maximum(np.maximum(di, dj), zero) - np.minimum(np.minimum(di, dj), zero)
+
+
+def grid_distances(origins: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+    """
+    computes the h3 grid distance between each origin and the destination at the same index
+
+    :param origins: an array of h3 cells
+    :param destinations: an array of h3 cells, as long as the origins
+    :return: the grid distance of each pair
+    :raises: H3Error if two cells are too far apart to compute a grid distance
+    """
+    if len(origins) != len(destinations):
+        raise ValueError(f"found {len(origins)} origins but {len(destinations)} destinations")
+    try:
+        distances = [
+            h3_int.h3_distance(o, d)
+            for o, d in zip(np.asarray(origins).tolist(), np.asarray(destinations).tolist())
+        ]
+    except ValueError as e:
+        raise H3Error(str(e)) from e
+    return np.array(distances, dtype=np.int64)
+
+
+def _local_ij(anchor: H3Cell, cells: Sequence[H3Cell]) -> np.ndarray:
+    ij = [h3_int.experimental_h3_to_local_ij(anchor, c) for c in cells]
+    return np.array(ij, dtype=np.int64).reshape(-1, 2)
+
+
+def _pairwise_grid_distance_matrix(
+    origins: Sequence[H3Cell], destinations: Sequence[H3Cell]
+) -> np.ndarray:
+    try:
+        distances = [[h3_int.h3_distance(o, d) for d in destinations] for o in origins]
+    except ValueError as e:
+        raise H3Error(str(e)) from e
+    return np.array(distances, dtype=np.int64)
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 from math import radians, cos, sin, asin, sqrt, ceil
-from typing import Any, Dict, Optional, TYPE_CHECKING, FrozenSet, Iterable, Callable, Tuple
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    TYPE_CHECKING,
+    FrozenSet,
+    Iterable,
+    Callable,
+    Sequence,
+    Tuple,
+)
 
 import h3
 import immutables
+import numpy as np
 
+from nrel.hive.util import h3_cell_ops
 from nrel.hive.util.exception import H3Error
 from nrel.hive.util.typealiases import EntityId, GeoId
 from nrel.hive.util.units import Kilometers, Seconds, SECONDS_TO_HOURS
@@ -201,6 +213,34 @@ class H3Ops:
 
         return 2 * avg_earth_radius_km * asin(sqrt(d))
 
+    @classmethod
+    def great_circle_distance_matrix(
+        cls, origins: Sequence[GeoId], destinations: Sequence[GeoId]
+    ) -> np.ndarray:
+        """
+        computes the distance between every origin and every destination in one vectorized step
+
+
+        :param origins: the origin geoids
+        :param destinations: the destination geoids
+        :return: the haversine distance in kilometers from each origin (row) to each destination (column)
+        """
+        avg_earth_radius_km = 6371
+
+        if len(origins) == 0 or len(destinations) == 0:
+            return np.zeros((len(origins), len(destinations)))
+
+        a = np.radians(h3_cell_ops.cell_lat_lon(h3_cell_ops.to_cells(origins)))
+        b = np.radians(h3_cell_ops.cell_lat_lon(h3_cell_ops.to_cells(destinations)))
+        lat1, lon1 = a[:, 0:1], a[:, 1:2]
+        lat2, lon2 = b[:, 0], b[:, 1]
+
+        lat = lat2 - lat1
+        lon = lon2 - lon1
+        d = np.sin(lat * 0.5) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(lon * 0.5) ** 2
+
+        return 2 * avg_earth_radius_km * np.arcsin(np.sqrt(np.clip(d, 0.0, 1.0)))
+
     @classmethod
     def point_along_link(cls, link: LinkTraversal, available_time_seconds: Seconds) -> GeoId:
         """
@@ -33,6 +33,7 @@ class ObjectIterator:
         step_attr_name: str,
         stop_condition: Callable,
     ):
+        self.items = items
         self._iterator = iter(items)
         self.step_attr_name = step_attr_name
         self.stop_condition = stop_condition
@@ -81,7 +82,7 @@ class DictReaderIterator:
         parser: Callable,
     ):
         self.reader = reader
-        self.history = None
+        self.history: Optional[Dict[str, str]] = None
         self.step_column_name = step_column_name
         self.stop_condition = stop_condition
         self.parser = parser
@@ -89,6 +90,22 @@ class DictReaderIterator:
     def update_stop_condition(self, stop_condition: Callable):
         self.stop_condition = stop_condition
 
+    def peek(self) -> Optional[Any]:
+        """
+        parses the step value of the next row without consuming it
+
+        :return: the next step value, or None if the reader is exhausted
+        """
+        if not self.history:
+            try:
+                self.history = next(self.reader)
+            except StopIteration:
+                return None
+        value = self.parser(self.history[self.step_column_name])
+        if isinstance(value, Exception):
+            raise value
+        return value
+
     def __iter__(self):
         return self
 
@@ -220,6 +237,14 @@ class DictReaderStepper:
         self._iterator.update_stop_condition(stop_condition)
         return self._iterator
 
+    def peek(self) -> Optional[Any]:
+        """
+        looks ahead at the step column value of the next row that has not been read
+
+        :return: the next value, or None if all rows have been read
+        """
+        return self._iterator.peek()
+
     def close(self):
         if self._file:
             self._file.close()
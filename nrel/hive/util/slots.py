@@ -0,0 +1,16 @@
+"""
+the keyword arguments which give a dataclass __slots__, as in @dataclass(frozen=True, **SLOTS).
+
+an instance of a slotted class holds its fields in fixed slots instead of a __dict__ of its
+own, which is most of the memory of a small record such as a vehicle or a request. for an
+instance to go without a __dict__, every class it inherits from must declare __slots__ too,
+which is an empty tuple for the abstract base classes.
+
+dataclasses only generate __slots__ from python 3.10; before then, SLOTS is empty and these
+classes are plain frozen dataclasses.
+"""
+
+import sys
+from typing import Dict
+
+SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
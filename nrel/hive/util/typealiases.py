@@ -27,6 +27,7 @@ GeoId = str  # h3 geohash
 LinkId = str  # road network link
 RouteStepPointer = int
 H3Resolution = int
+H3Cell = int  # h3 geohash as a 64-bit integer
 H3Line = Tuple[GeoId, ...]
 GeoFenceSet = FrozenSet[GeoId]
 
@@ -0,0 +1,50 @@
+import random
+from typing import NamedTuple
+from unittest import TestCase
+
+from nrel.hive.dispatcher.instruction_generator.anytime_assignment_ops import (
+    AnytimePhase,
+    find_anytime_assignment,
+)
+from nrel.hive.dispatcher.instruction_generator.assignment_ops import find_assignment
+from nrel.hive.dispatcher.instruction_generator.time_budget import TimeBudget
+
+
+class MockEntity(NamedTuple):
+    id: str
+    position: float
+
+
+def _cost(a: MockEntity, b: MockEntity) -> float:
+    return abs(a.position - b.position)
+
+
+class TestAnytimeAssignmentOps(TestCase):
+    def test_refines_to_optimal_with_time(self):
+        rng = random.Random(0)
+        assignees = tuple(MockEntity(f"a{i}", rng.random()) for i in range(30))
+        targets = tuple(MockEntity(f"t{i}", rng.random()) for i in range(20))
+
+        result = find_anytime_assignment(assignees, targets, _cost, TimeBudget.start(60))
+        expected = find_assignment(assignees, targets, _cost)
+
+        self.assertEqual(result.phase, AnytimePhase.OPTIMAL)
+        self.assertAlmostEqual(result.solution.solution_cost, expected.solution_cost)
+        self.assertLessEqual(result.solution.solution_cost, result.greedy_cost + 1e-9)
+        self.assertFalse(result.over_budget)
+
+    def test_expired_budget_matches_first_target(self):
+        assignees = (MockEntity("far", 10.0), MockEntity("near", 1.5))
+        targets = (MockEntity("first", 1.0), MockEntity("second", 2.0))
+
+        result = find_anytime_assignment(assignees, targets, _cost, TimeBudget.start(0))
+
+        self.assertEqual(result.phase, AnytimePhase.PARTIAL_GREEDY)
+        self.assertEqual(result.solution.solution, (("near", "first"),))
+        self.assertAlmostEqual(result.greedy_cost, 0.5)
+
+    def test_empty(self):
+        result = find_anytime_assignment((), (MockEntity("t", 0.0),), _cost, TimeBudget.start(1))
+
+        self.assertEqual(result.solution.solution, ())
+        self.assertEqual(result.phase, AnytimePhase.OPTIMAL)
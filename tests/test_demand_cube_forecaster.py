@@ -0,0 +1,62 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from nrel.hive.dispatcher.forecaster.demand_cube_forecaster import DemandCubeForecaster
+from nrel.hive.resources.mock_lobster import *
+
+
+class TestDemandCubeForecaster(TestCase):
+    def test_build_from_requests(self):
+        req_file = resource_filename(
+            "nrel.hive.resources.scenarios.denver_downtown.requests",
+            "denver_demo_requests.csv",
+        )
+        forecaster = DemandCubeForecaster.build_from_requests(
+            req_file, sim_h3_search_resolution=7, bin_duration_seconds=600
+        )
+
+        with open(req_file) as f:
+            n_requests = len(f.readlines()) - 1
+        total = forecaster.demand_by_cell(0, 10**9).sum()
+        self.assertEqual(total, n_requests, "every request should be in the cube")
+        self.assertEqual(forecaster.start_time, 120, "first departure is at 00:02:00")
+
+        for cell in forecaster.cells:
+            self.assertEqual(h3.h3_get_resolution(cell), 7, "cells should be search cells")
+
+    def test_build_from_forecast(self):
+        near = h3.h3_to_parent(h3.geo_to_h3(39.7539, -104.974, 15), 7)
+        with tempfile.TemporaryDirectory() as tmp:
+            forecast_file = Path(tmp).joinpath("forecast.csv")
+            forecast_file.write_text(
+                "sim_time,requests,lat,lon\n"
+                "0,2,39.7539,-104.974\n"
+                "600,3,39.7539,-104.974\n"
+                "600,5,39.80,-104.90\n"
+                "1800,7,39.7539,-104.974\n"
+            )
+            forecaster = DemandCubeForecaster.build_from_forecast(
+                str(forecast_file), sim_h3_search_resolution=7, bin_duration_seconds=600
+            )
+
+        self.assertEqual(forecaster.demand_in_cell(near, 0, 600), 2)
+        self.assertEqual(forecaster.demand_in_cell(near, 0, 1200), 5)
+        self.assertEqual(forecaster.demand_in_cell(near, 300, 900), 5, "partial bins are covered")
+        self.assertEqual(forecaster.demand_in_cell(near, 1200, 1800), 0)
+        self.assertEqual(forecaster.demand_in_cell(near, 1800, 10**9), 7)
+        self.assertEqual(forecaster.demand_in_cell("unknown", 0, 1800), 0)
+        self.assertEqual(forecaster.demand_by_cell(600, 1200).sum(), 8)
+
+        sim = mock_sim(sim_time=600)
+        _, forecast = forecaster.generate_forecast(sim)
+        self.assertEqual(forecast.value, 15, "should forecast the next 30 minutes")
+        self.assertEqual(forecast.spatial_distribution.get(near), 10)
+        self.assertEqual(len(forecast.spatial_distribution), 2)
+
+    def test_missing_columns(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            forecast_file = Path(tmp).joinpath("forecast.csv")
+            forecast_file.write_text("sim_time,requests\n0,2\n")
+            with self.assertRaises(IOError):
+                DemandCubeForecaster.build_from_forecast(str(forecast_file), 7)
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from pkg_resources import resource_filename
+from nrel.hive.util.fs import resource_filename
 
 from nrel.hive.model.sim_time import SimTime
 from nrel.hive.util.iterators import *
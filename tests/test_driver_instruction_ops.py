@@ -1,6 +1,9 @@
 from unittest import TestCase
 
-from nrel.hive.state.driver_state.driver_instruction_ops import human_go_home
+from nrel.hive.state.driver_state.driver_instruction_ops import (
+    human_go_home,
+    human_look_for_requests,
+)
 from nrel.hive.resources.mock_lobster import *
 
 
@@ -38,3 +41,28 @@ class TestDriverInstructionOps(TestCase):
         self.assertIsInstance(result, DispatchStationInstruction)
         self.assertEqual(result.station_id, station.id)
         self.assertEqual(result.vehicle_id, veh.id)
+
+    def test_human_look_for_requests_spreads_drivers(self):
+        west = mock_vehicle(vehicle_id="west", lat=39.7, lon=-105.0)
+        east = mock_vehicle(vehicle_id="east", lat=39.7, lon=-104.8)
+        dense = tuple(mock_request(f"d{i}", o_lat=39.7, o_lon=-105.0) for i in range(3))
+        sparse = tuple(mock_request(f"s{i}", o_lat=39.7, o_lon=-104.8) for i in range(2))
+        sim = mock_sim(vehicles=(west, east))
+        for req in dense + sparse:
+            sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+
+        west_instruction = human_look_for_requests(west, sim)
+        east_instruction = human_look_for_requests(east, sim)
+
+        self.assertIsInstance(west_instruction, RepositionInstruction)
+        self.assertIsInstance(east_instruction, RepositionInstruction)
+        self.assertNotEqual(
+            west_instruction.destination,
+            east_instruction.destination,
+            "each driver should head for the dense cell nearest to them",
+        )
+
+    def test_human_look_for_requests_no_requests(self):
+        veh = mock_vehicle()
+        sim = mock_sim(vehicles=(veh,))
+        self.assertIsNone(human_look_for_requests(veh, sim))
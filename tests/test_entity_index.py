@@ -0,0 +1,158 @@
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from nrel.hive.resources.mock_lobster import *
+from nrel.hive.state.simulation_state.entity_arrays import (
+    membership_bits,
+    request_arrays,
+    station_arrays,
+    vehicle_arrays,
+)
+from nrel.hive.state.simulation_state.entity_index import EntityIndex
+from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
+from nrel.hive.util import h3_cell_ops
+
+
+class TestEntityIndex(TestCase):
+    def test_add(self):
+        index = EntityIndex().add("a").add("b").add("a")
+
+        self.assertEqual(index.index_of("a"), 0)
+        self.assertEqual(index.index_of("b"), 1)
+        self.assertEqual(index.index_of("c"), -1)
+        self.assertEqual(index.index_of(None), -1)
+        self.assertEqual(index.entity_id(1), "b")
+        self.assertEqual(index.size, 2, "adding an entity twice should not use another slot")
+
+    def test_remove_reuses_slots(self):
+        index = EntityIndex().add("a").add("b").add("c").remove("a").remove("c")
+
+        self.assertIsNone(index.entity_id(0))
+        self.assertEqual(index.index_of("b"), 1)
+
+        index = index.add("d").add("e").add("f")
+
+        self.assertEqual(index.index_of("d"), 2, "should reuse the most recently released slot")
+        self.assertEqual(index.index_of("e"), 0)
+        self.assertEqual(index.index_of("f"), 3)
+        self.assertEqual(index.size, 4)
+        np.testing.assert_array_equal(index.indices_of(["f", "x", "b"]), [3, -1, 1])
+
+    def test_many_released_slots(self):
+        index = EntityIndex()
+        for i in range(5000):
+            index = index.add(f"r{i}")
+        for i in range(5000):
+            index = index.remove(f"r{i}")
+
+        self.assertEqual(len(index.free), 5000)
+        self.assertEqual(pickle.loads(pickle.dumps(index)), index)
+        self.assertEqual(index.add("a").index_of("a"), 4999)
+
+    def test_remove_missing(self):
+        index = EntityIndex().add("a")
+
+        self.assertIs(index.remove("b"), index)
+
+    def test_changed_slots(self):
+        index = EntityIndex().add("a").add("b").add("c").track()
+        self.assertEqual(list(index.changed_slots(0)), [0, 1, 2], "tracked from every slot")
+
+        version = index.version
+        index = index.touch("a").remove("b").touch("a").touch("missing")
+
+        self.assertEqual(list(index.changed_slots(version)), [1, 0])
+        self.assertEqual(list(index.changed_slots(0)), [2, 1, 0])
+        self.assertEqual(list(index.changed_slots(index.version)), [])
+
+    def test_untracked_changes_are_not_recorded(self):
+        index = EntityIndex().add("a").add("b").remove("b")
+
+        self.assertIs(index.touch("a"), index)
+        self.assertEqual(index.version, 0)
+        self.assertEqual(len(index.changes), 0)
+
+    def test_simulation_state_ops_keep_index(self):
+        sim = mock_sim(
+            vehicles=(mock_vehicle(vehicle_id="v0"), mock_vehicle(vehicle_id="v1")),
+            stations=(mock_station(station_id="s0"),),
+            bases=(mock_base(base_id="b0"),),
+        )
+        sim = simulation_state_ops.add_request_safe(sim, mock_request(request_id="r0")).unwrap()
+
+        self.assertEqual(sim.v_index.index_of("v1"), 1)
+        self.assertEqual(sim.s_index.index_of("s0"), 0)
+        self.assertEqual(sim.b_index.index_of("b0"), 0)
+        self.assertEqual(sim.r_index.index_of("r0"), 0)
+
+        sim = simulation_state_ops.remove_vehicle_safe(sim, "v0").unwrap()
+        sim = simulation_state_ops.remove_request_safe(sim, "r0").unwrap()
+        sim = simulation_state_ops.remove_station_safe(sim, "s0").unwrap()
+        sim = simulation_state_ops.remove_base_safe(sim, "b0").unwrap()
+
+        self.assertEqual(sim.v_index.index_of("v0"), -1)
+        self.assertEqual(sim.v_index.index_of("v1"), 1, "should keep the slot of other vehicles")
+        self.assertEqual(sim.r_index.index_of("r0"), -1)
+        self.assertEqual(sim.s_index.index_of("s0"), -1)
+        self.assertEqual(sim.b_index.index_of("b0"), -1)
+
+        # modifying a vehicle keeps its slot
+        vehicle = sim.vehicles["v1"]
+        updated = vehicle.modify_vehicle_state(ChargingStation.build("v1", "s0", "l1_test"))
+        sim = simulation_state_ops.modify_vehicle_safe(sim, updated).unwrap()
+        self.assertEqual(sim.v_index.index_of("v1"), 1)
+
+
+class TestEntityArrays(TestCase):
+    def test_membership_bits(self):
+        bits = membership_bits(frozenset(["b", "a", None]))
+
+        self.assertEqual(bits, {"a": 1, "b": 2})
+
+    def test_vehicle_arrays(self):
+        member = Membership.single_membership(DefaultIds.mock_membership_id())
+        sim = mock_sim(
+            vehicles=(
+                mock_vehicle(vehicle_id="v0"),
+                mock_vehicle(vehicle_id="v1", soc=0.5, membership=member),
+                mock_vehicle(vehicle_id="v2"),
+            ),
+            stations=(mock_station(station_id="s0"),),
+        )
+        sim = simulation_state_ops.remove_vehicle_safe(sim, "v0").unwrap()
+        env = mock_env()
+
+        arrays = vehicle_arrays(sim, env)
+
+        slot = sim.v_index.index_of("v1")
+        np.testing.assert_array_equal(arrays.present, [False, True, True])
+        self.assertAlmostEqual(arrays.soc[slot], 0.5)
+        self.assertEqual(arrays.geoid[slot], h3_cell_ops.to_cell(sim.vehicles["v1"].geoid))
+        self.assertEqual(arrays.vehicle_state[slot], VehicleStateType.IDLE.value)
+        self.assertEqual(arrays.station[slot], -1)
+        self.assertEqual(arrays.membership[slot], 1)
+        self.assertEqual(arrays.membership[sim.v_index.index_of("v2")], 0)
+
+    def test_request_and_station_arrays(self):
+        sim = mock_sim(
+            vehicles=(mock_vehicle(vehicle_id="v0"),),
+            stations=(mock_station(station_id="s0"),),
+        )
+        request = mock_request(request_id="r0", passengers=2).assign_dispatched_vehicle(
+            "v0", sim.sim_time
+        )
+        sim = simulation_state_ops.add_request_safe(sim, request).unwrap()
+        env = mock_env()
+
+        requests = request_arrays(sim, env)
+        stations = station_arrays(sim, env)
+
+        self.assertEqual(requests.dispatched_vehicle[0], 0)
+        self.assertEqual(requests.origin[0], h3_cell_ops.to_cell(request.origin))
+        self.assertEqual(requests.destination[0], h3_cell_ops.to_cell(request.destination))
+        self.assertEqual(requests.passengers[0], 2)
+        self.assertTrue(stations.present[0])
+        self.assertGreater(stations.total_chargers[0], 0)
+        self.assertEqual(stations.available_chargers[0], stations.total_chargers[0])
@@ -6,7 +6,7 @@ from unittest import TestCase
 import yaml
 
 from nrel.hive.config.global_config import GlobalConfig
-from nrel.hive.util.fs import global_hive_config_search
+from nrel.hive.util.fs import global_hive_config_search, resource_filename
 
 
 class TestDictReaderStepper(TestCase):
@@ -15,6 +15,7 @@ class TestDictReaderStepper(TestCase):
         self.assertIsInstance(result, GlobalConfig, "should be a GlobalConfig class instance")
 
     def test_global_hive_config_search_finds_parent(self):
+        self.addCleanup(os.chdir, os.getcwd())
         with tempfile.TemporaryDirectory() as parent:
             root_path = Path(parent)
             parent_hive_file = root_path.joinpath(".hive.yaml")
@@ -36,3 +37,7 @@ class TestDictReaderStepper(TestCase):
                     result.log_run,
                     "should also contain keys from the default config",
                 )
+
+    def test_resource_filename(self):
+        result = Path(resource_filename("nrel.hive.resources.defaults", "hive_config.yaml"))
+        self.assertTrue(result.is_file(), "should find the default hive config")
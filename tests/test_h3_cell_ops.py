@@ -0,0 +1,117 @@
+import random
+from unittest import TestCase
+
+import h3
+import numpy as np
+
+from nrel.hive.dispatcher.instruction_generator import assignment_ops
+from nrel.hive.util import h3_cell_ops
+from nrel.hive.util.exception import H3Error
+from nrel.hive.util.h3_ops import H3Ops
+from nrel.hive.resources.mock_lobster import *
+
+
+def _random_geoids(n: int, resolution: int = 15, seed: int = 0) -> Tuple[str, ...]:
+    rng = random.Random(seed)
+    return tuple(
+        h3.geo_to_h3(39.75 + rng.uniform(-0.2, 0.2), -104.99 + rng.uniform(-0.2, 0.2), resolution)
+        for _ in range(n)
+    )
+
+
+class TestH3CellOps(TestCase):
+    def test_to_cells_round_trip(self):
+        geoids = _random_geoids(50)
+        cells = h3_cell_ops.to_cells(geoids)
+
+        self.assertEqual(cells.dtype, np.uint64)
+        self.assertEqual(h3_cell_ops.to_geoids(cells), geoids)
+        self.assertEqual(h3_cell_ops.to_geoid(h3_cell_ops.to_cell(geoids[0])), geoids[0])
+
+    def test_cell_parents(self):
+        geoids = _random_geoids(50)
+        cells = h3_cell_ops.to_cells(geoids)
+
+        for resolution in (0, 6, 9, 15):
+            parents = h3_cell_ops.to_geoids(h3_cell_ops.cell_parents(cells, resolution))
+            expected = tuple(h3.h3_to_parent(g, resolution) for g in geoids)
+            self.assertEqual(parents, expected, f"parents at resolution {resolution}")
+
+        self.assertTrue(np.all(h3_cell_ops.cell_resolutions(cells) == 15))
+
+    def test_cell_parents_of_coarser_cells(self):
+        cells = h3_cell_ops.to_cells(_random_geoids(5, resolution=7))
+
+        with self.assertRaises(H3Error):
+            h3_cell_ops.cell_parents(cells, 9)
+
+    def test_cell_lat_lon(self):
+        geoids = _random_geoids(20)
+        # repeated cells share one lookup
+        cells = h3_cell_ops.to_cells(geoids + geoids[:5])
+
+        lat_lon = h3_cell_ops.cell_lat_lon(cells)
+
+        expected = np.array([h3.h3_to_geo(g) for g in geoids + geoids[:5]])
+        np.testing.assert_allclose(lat_lon, expected)
+
+    def test_grid_distance_matrix(self):
+        origins = _random_geoids(30, seed=1)
+        destinations = _random_geoids(40, seed=2)
+
+        distances = h3_cell_ops.grid_distance_matrix(
+            h3_cell_ops.to_cells(origins), h3_cell_ops.to_cells(destinations)
+        )
+
+        expected = np.array([[h3.h3_distance(o, d) for d in destinations] for o in origins])
+        np.testing.assert_array_equal(distances, expected)
+
+    def test_grid_distances(self):
+        origins = _random_geoids(30, seed=1)
+        destinations = _random_geoids(30, seed=2)
+
+        distances = h3_cell_ops.grid_distances(
+            h3_cell_ops.to_cells(origins), h3_cell_ops.to_cells(destinations)
+        )
+
+        expected = [h3.h3_distance(o, d) for o, d in zip(origins, destinations)]
+        np.testing.assert_array_equal(distances, expected)
+
+    def test_grid_distance_matrix_too_far_apart(self):
+        cells = h3_cell_ops.to_cells([h3.geo_to_h3(10, 10, 15), h3.geo_to_h3(-40, 170, 15)])
+
+        with self.assertRaises(H3Error):
+            h3_cell_ops.grid_distance_matrix(cells, cells)
+
+    def test_great_circle_distance_matrix(self):
+        origins = _random_geoids(10, seed=1)
+        destinations = _random_geoids(12, seed=2)
+
+        distances = H3Ops.great_circle_distance_matrix(origins, destinations)
+
+        for i, o in enumerate(origins):
+            for j, d in enumerate(destinations):
+                self.assertAlmostEqual(distances[i, j], H3Ops.great_circle_distance(o, d))
+
+    def test_find_assignment_with_h3_distance_cost_table(self):
+        vehicles = tuple(
+            mock_vehicle_from_geoid(vehicle_id=f"v{i}", geoid=g)
+            for i, g in enumerate(_random_geoids(15, seed=1))
+        )
+        requests = tuple(
+            mock_request_from_geoids(request_id=f"r{i}", origin=g, destination=g)
+            for i, g in enumerate(_random_geoids(10, seed=2))
+        )
+
+        expected = assignment_ops.find_assignment(
+            vehicles, requests, assignment_ops.h3_distance_cost
+        )
+        result = assignment_ops.find_assignment(
+            vehicles,
+            requests,
+            assignment_ops.h3_distance_cost,
+            assignment_ops.h3_distance_cost_table,
+        )
+
+        self.assertEqual(set(result.solution), set(expected.solution))
+        self.assertEqual(result.solution_cost, expected.solution_cost)
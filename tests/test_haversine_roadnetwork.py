@@ -39,3 +39,13 @@ class TestHaversineRoadNetwork(TestCase):
             places=1,
             msg="Route should be approx. 1.1km",
         )
+
+    def test_positions_from_geoids(self):
+        network = mock_network()
+        geoids = [h3.geo_to_h3(39.7481388, -104.9935966, 15), h3.geo_to_h3(39.76, -104.98, 15)]
+
+        positions = network.positions_from_geoids(geoids)
+
+        self.assertEqual(
+            [p.geoid for p in positions], geoids, "haversine positions should not move"
+        )
@@ -0,0 +1,52 @@
+import tempfile
+import threading
+from multiprocessing import Pipe
+from pathlib import Path
+from unittest import TestCase
+
+from nrel.hive.app.hive_cosim_client import HiveCosimClient
+from nrel.hive.app.hive_cosim_server import CosimServer
+from nrel.hive.resources.mock_lobster import *
+from nrel.hive.runner.runner_payload import RunnerPayload
+
+
+class TestHiveCosimServer(TestCase):
+    def test_client_and_server(self):
+        sim = mock_sim(
+            vehicles=(mock_vehicle("v1", soc=0.5), mock_vehicle("v2")),
+            stations=(mock_station(),),
+        )
+        output_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(output_directory.cleanup)
+        config = mock_config().set_scenario_output_directory(Path(output_directory.name))
+        env = mock_env(config).set_reporter(Reporter())
+        server = CosimServer(RunnerPayload(sim, env, mock_update()))
+        client_connection, server_connection = Pipe()
+        thread = threading.Thread(target=server.serve_connection, args=(server_connection,))
+        thread.start()
+        try:
+            client = HiveCosimClient(client_connection)
+            result = client.crank(3)
+            self.assertEqual(result.sim_time, 3 * sim.sim_timestep_duration_seconds)
+            self.assertEqual(result.time_steps, 3)
+
+            observation = client.observe()
+            ids = client.entity_ids()
+            self.assertEqual(observation.vehicles["present"].sum(), 2)
+            v1 = ids["vehicles"].index("v1")
+            self.assertAlmostEqual(observation.vehicles["soc"][v1], 0.5, places=2)
+            self.assertEqual(ids["stations"], (DefaultIds.mock_station_id(),))
+
+            times, load = client.station_load()
+            self.assertEqual(len(times), 3)
+            self.assertEqual(load.shape, (3, server.station_load_kw.shape[1]))
+
+            with self.assertRaises(RuntimeError):
+                client.crank(time_steps="many")
+
+            client.close()
+        finally:
+            client_connection.close()
+            thread.join()
+            server.close()
+        self.assertFalse(server.running)
@@ -1,7 +1,13 @@
 from unittest import TestCase
 
 from nrel.hive.resources.mock_lobster import *
+from nrel.hive.model.vehicle.schedules.time_range_schedule import TimeRangeSchedule
+from nrel.hive.state.simulation_state.simulation_state_ops import tick
+from nrel.hive.state.simulation_state.update.step_simulation_ops import (
+    perform_driver_state_updates,
+)
 from nrel.hive.util.fp import throw_or_return
+from nrel.hive.util.time_helpers import read_time_string
 
 
 def on_schedule(a, b):
@@ -143,6 +149,47 @@ class TestHumanDriverState(TestCase):
             veh_updated = updated_sim.vehicles.get(veh.id)
             self.assertIsInstance(veh_updated.driver_state, HumanAvailable)
 
+    def test_driver_updates_at_shift_change(self):
+        nine_am = 3600 * 9
+        schedule = TimeRangeSchedule(read_time_string("09:00:00"), read_time_string("17:00:00"))
+        state = mock_human_driver(available=False, schedule_id="nine_to_five")
+        veh = mock_vehicle(driver_state=state)
+        sim = mock_sim(vehicles=(veh,), sim_time=nine_am - 120)
+        env = mock_env(schedules={"nine_to_five": schedule})
+
+        sim = perform_driver_state_updates(sim, env)
+        self.assertEqual(
+            sim.driver_update_queue.update_times.get(veh.id),
+            nine_am,
+            "the driver should next be updated when the shift begins",
+        )
+
+        sim = perform_driver_state_updates(tick(sim), env)
+        veh_updated = sim.vehicles.get(veh.id)
+        self.assertIsInstance(veh_updated.driver_state, HumanUnavailable, "shift hasn't begun")
+
+        sim = perform_driver_state_updates(tick(sim), env)
+        veh_updated = sim.vehicles.get(veh.id)
+        self.assertIsInstance(veh_updated.driver_state, HumanAvailable, "shift has begun")
+        self.assertEqual(
+            sim.driver_update_queue.update_times.get(veh.id),
+            3600 * 17,
+            "the driver should next be updated when the shift ends",
+        )
+
+    def test_driver_updates_every_step_with_custom_schedule(self):
+        state = mock_human_driver(available=False, schedule_id="off")
+        veh = mock_vehicle(driver_state=state)
+        sim = mock_sim(vehicles=(veh,))
+        env = mock_env(schedules=test_schedules)
+
+        sim = perform_driver_state_updates(sim, env)
+        self.assertEqual(
+            sim.driver_update_queue.update_times.get(veh.id),
+            sim.sim_time + sim.sim_timestep_duration_seconds,
+            "a schedule function without transition times is checked every time step",
+        )
+
     def test_go_home_instruction(self):
         # vehicle and base/station are at different locations
         state = mock_human_driver(available=False, schedule_id="off")
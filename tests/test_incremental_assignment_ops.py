@@ -0,0 +1,83 @@
+import random
+from typing import NamedTuple
+from unittest import TestCase
+
+from nrel.hive.dispatcher.instruction_generator.assignment_ops import find_assignment
+from nrel.hive.dispatcher.instruction_generator.incremental_assignment_ops import (
+    IncrementalAssignmentState,
+    find_incremental_assignment,
+)
+
+
+class MockEntity(NamedTuple):
+    id: str
+    geoid: str
+
+
+def _cost(a: MockEntity, b: MockEntity) -> float:
+    x, y = int(a.geoid), int(b.geoid)
+    if (x + y) % 11 == 0:
+        return float("inf")
+    return float((x * 7919 + y * 104729) % 100)
+
+
+class TestIncrementalAssignmentOps(TestCase):
+    def test_matches_find_assignment_through_churn(self):
+        rng = random.Random(0)
+
+        def _entity(prefix: str, index: int) -> MockEntity:
+            return MockEntity(f"{prefix}{index}", str(rng.randint(0, 1000)))
+
+        for trial in range(50):
+            assignees = tuple(_entity("a", i) for i in range(rng.randint(0, 20)))
+            targets = tuple(_entity("t", i) for i in range(rng.randint(0, 20)))
+            state = IncrementalAssignmentState()
+            for step in range(8):
+                expected = find_assignment(assignees, targets, _cost)
+                solution, state = find_incremental_assignment(assignees, targets, _cost, state)
+
+                self.assertAlmostEqual(solution.solution_cost, expected.solution_cost)
+                self.assertEqual(len(solution.solution), len(expected.solution))
+                self.assertEqual(
+                    len({a for a, _ in solution.solution}),
+                    len({t for _, t in solution.solution}),
+                    "each assignee and target should be used at most once",
+                )
+
+                # some entities leave, some move, and some arrive
+                assignees = tuple(
+                    a if rng.random() < 0.8 else a._replace(geoid=str(rng.randint(0, 1000)))
+                    for a in assignees
+                    if rng.random() < 0.9
+                ) + tuple(_entity(f"a{step}_", i) for i in range(rng.randint(0, 4)))
+                targets = tuple(t for t in targets if rng.random() < 0.85) + tuple(
+                    _entity(f"t{step}_", i) for i in range(rng.randint(0, 4))
+                )
+
+    def test_reuses_costs_of_unmoved_pairs(self):
+        assignees = tuple(MockEntity(f"a{i}", str(i)) for i in range(10))
+        targets = tuple(MockEntity(f"t{i}", str(100 + i)) for i in range(10))
+        calls = []
+
+        def _counted_cost(a: MockEntity, b: MockEntity) -> float:
+            calls.append((a.id, b.id))
+            return _cost(a, b)
+
+        _, state = find_incremental_assignment(assignees, targets, _counted_cost)
+        self.assertEqual(len(calls), 100)
+
+        calls.clear()
+        moved = (assignees[0]._replace(geoid="50"),) + assignees[1:]
+        new_targets = targets + (MockEntity("t_new", "200"),)
+        solution, _ = find_incremental_assignment(moved, new_targets, _counted_cost, state)
+
+        self.assertEqual(len(calls), 11 + 9, "only the moved row and new column should be costed")
+        self.assertAlmostEqual(
+            solution.solution_cost, find_assignment(moved, new_targets, _cost).solution_cost
+        )
+
+    def test_empty(self):
+        solution, state = find_incremental_assignment((), (MockEntity("t", "1"),), _cost)
+
+        self.assertEqual(solution.solution, ())
+        self.assertEqual(state, IncrementalAssignmentState())
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from pkg_resources import resource_filename
+from nrel.hive.util.fs import resource_filename
 
 from nrel.hive.initialization.initialize_ops import process_fleet_file
 
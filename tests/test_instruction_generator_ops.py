@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from nrel.hive.dispatcher.instruction_generator.instruction_generator_ops import (
+    assign_vehicles_to_chargers,
     instruct_vehicles_to_dispatch_to_station,
 )
 from nrel.hive.dispatcher.instruction_generator.charging_search_type import ChargingSearchType
@@ -73,3 +74,31 @@ class TestInstructionGenerators(TestCase):
         )
 
         self.assertEqual(len(instructions), 0, "should not have generated any instructions")
+
+    def test_assign_vehicles_to_chargers_bounds_queue_slots(self):
+        v_geoid = h3.geo_to_h3(39.0, -104.0, 15)
+        vehicles = tuple(
+            mock_vehicle_from_geoid(vehicle_id=f"v{i}", geoid=v_geoid, soc=0.01) for i in range(9)
+        )
+        near = mock_station_from_geoid(
+            station_id="near",
+            geoid=h3.geo_to_h3(39.01, -104.0, 15),
+            chargers={mock_dcfc_charger_id(): 2},
+        )
+        far = mock_station_from_geoid(
+            station_id="far",
+            geoid=h3.geo_to_h3(39.1, -104.0, 15),
+            chargers={mock_dcfc_charger_id(): 1},
+        )
+        sim = mock_sim(h3_location_res=15, h3_search_res=5, vehicles=vehicles, stations=(near, far))
+
+        candidates, instructions, searched = assign_vehicles_to_chargers(
+            vehicles, 100, 20, sim, mock_env()
+        )
+
+        self.assertEqual(len(candidates), 9)
+        self.assertEqual(len(instructions), 9, "there should be a slot for every vehicle")
+        by_station = [i.station_id for i in instructions]
+        # each charger has its available plugs and ceil(9 / 2) = 5 queue slots
+        self.assertEqual(by_station.count("near"), 7, "the near charger fills its slots")
+        self.assertEqual(by_station.count("far"), 2)
@@ -1,5 +1,12 @@
 from unittest import TestCase
 
+from nrel.hive.dispatcher.instruction_generator.assignment_algorithm import AssignmentAlgorithm
+from nrel.hive.dispatcher.instruction_generator.charging_search_type import ChargingSearchType
+from nrel.hive.dispatcher.instruction_generator.instruction_generator_schedule import (
+    InstructionGeneratorSchedule,
+    WakeEvent,
+)
+from nrel.hive.reporting.report_type import ReportType
 from nrel.hive.resources.mock_lobster import *
 
 
@@ -47,6 +54,45 @@ class TestInstructionGenerators(TestCase):
             "Should have picked closest vehicle",
         )
 
+    def test_dispatcher_incremental_assignment(self):
+        config = mock_config().dispatcher._replace(
+            assignment_algorithm=AssignmentAlgorithm.INCREMENTAL
+        )
+        dispatcher = Dispatcher(config)
+
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        near_to_somewhere = h3.geo_to_h3(39.754, -104.975, 15)
+        far_from_somewhere = h3.geo_to_h3(39.755, -104.976, 15)
+
+        req = mock_request_from_geoids(origin=somewhere, fleet_id=DefaultIds.mock_membership_id())
+        close_veh = mock_vehicle_from_geoid(
+            vehicle_id="close_veh",
+            geoid=near_to_somewhere,
+            membership=mock_membership(),
+        )
+        far_veh = mock_vehicle_from_geoid(
+            vehicle_id="far_veh",
+            geoid=far_from_somewhere,
+            membership=mock_membership(),
+        )
+        sim = mock_sim(
+            h3_location_res=9,
+            h3_search_res=9,
+            vehicles=(close_veh, far_veh),
+        )
+        sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+
+        updated_dispatcher, instructions = dispatcher.generate_instructions(sim, mock_env())
+
+        self.assertEqual(len(instructions), 1, "should have dispatched one vehicle")
+        self.assertEqual(instructions[0].vehicle_id, close_veh.id, "should pick closest vehicle")
+        self.assertEqual(len(updated_dispatcher.assignment_states), 1, "should keep solver state")
+        self.assertEqual(updated_dispatcher, dispatcher, "solver state should not affect equality")
+
+        _, repeat_instructions = updated_dispatcher.generate_instructions(sim, mock_env())
+
+        self.assertEqual(repeat_instructions, instructions, "warm start should find same match")
+
     def test_dispatcher_no_vehicles(self):
         dispatcher = Dispatcher(mock_config().dispatcher)
 
@@ -96,6 +142,121 @@ class TestInstructionGenerators(TestCase):
             "Should have instructed vehicle to dispatch to station",
         )
 
+    def test_dispatcher_time_budget(self):
+        budgets = immutables.Map({"Dispatcher": 0.0})
+        config = mock_config()
+        config = config._replace(
+            dispatcher=config.dispatcher._replace(instruction_generator_time_budgets=budgets)
+        )
+        env = mock_env(config).set_reporter(Reporter())
+        dispatcher = Dispatcher(config.dispatcher)
+
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        somewhere_else = h3.geo_to_h3(39.755, -104.976, 15)
+        req1 = mock_request_from_geoids(
+            request_id="r1", origin=somewhere, fleet_id=DefaultIds.mock_membership_id()
+        )
+        req2 = mock_request_from_geoids(
+            request_id="r2", origin=somewhere_else, fleet_id=DefaultIds.mock_membership_id()
+        )
+        vehicles = tuple(
+            mock_vehicle_from_geoid(
+                vehicle_id=f"v{i}", geoid=somewhere, membership=mock_membership()
+            )
+            for i in range(2)
+        )
+        sim = mock_sim(h3_location_res=9, h3_search_res=9, vehicles=vehicles)
+        sim = simulation_state_ops.add_request_safe(sim, req1).unwrap()
+        sim = simulation_state_ops.add_request_safe(sim, req2).unwrap()
+
+        _, instructions = dispatcher.generate_instructions(sim, env)
+
+        self.assertEqual(len(instructions), 1, "an expired budget should only match one request")
+        reports = [
+            r
+            for r in env.reporter.reports
+            if r.report_type == ReportType.INSTRUCTION_GENERATOR_BUDGET_EVENT
+        ]
+        self.assertEqual(len(reports), 1, "should report the budget once per fleet")
+        self.assertEqual(reports[0].report["phase"], "partial_greedy")
+        self.assertEqual(reports[0].report["assignments"], "1")
+
+    def test_charging_fleet_manager_time_budget(self):
+        budgets = immutables.Map({"ChargingFleetManager": 0.0})
+        for search_type in (
+            ChargingSearchType.SHORTEST_TIME_TO_CHARGE,
+            ChargingSearchType.NEAREST_SHORTEST_QUEUE,
+        ):
+            with self.subTest(search_type=search_type):
+                config = mock_config()
+                config = config._replace(
+                    dispatcher=config.dispatcher._replace(
+                        instruction_generator_time_budgets=budgets,
+                        charging_search_type=search_type,
+                    )
+                )
+                env = mock_env(config).set_reporter(Reporter())
+                charging_fleet_manager = ChargingFleetManager(config.dispatcher)
+
+                somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+                somewhere_else = h3.geo_to_h3(39.75, -104.976, 15)
+                sim = mock_sim(
+                    h3_location_res=9,
+                    h3_search_res=9,
+                    vehicles=(
+                        mock_vehicle_from_geoid(vehicle_id="low", geoid=somewhere, soc=0.01),
+                        mock_vehicle_from_geoid(vehicle_id="lower", geoid=somewhere, soc=0.005),
+                    ),
+                    stations=(mock_station_from_geoid(geoid=somewhere_else),),
+                )
+
+                _, instructions = charging_fleet_manager.generate_instructions(sim, env)
+
+                self.assertEqual(len(instructions), 1, "an expired budget should only search once")
+                self.assertEqual(
+                    instructions[0].vehicle_id, "lower", "should search lowest range first"
+                )
+                reports = [
+                    r
+                    for r in env.reporter.reports
+                    if r.report_type == ReportType.INSTRUCTION_GENERATOR_BUDGET_EVENT
+                ]
+                self.assertEqual(reports[0].report["vehicles_searched"], "1")
+                self.assertEqual(reports[0].report["vehicles_total"], "2")
+
+    def test_charging_fleet_manager_spreads_vehicles_across_chargers(self):
+        charging_fleet_manager = ChargingFleetManager(mock_config().dispatcher)
+
+        v_geoid = h3.geo_to_h3(39.0, -104.0, 15)
+        vehicles = tuple(
+            mock_vehicle_from_geoid(vehicle_id=f"v{i}", geoid=v_geoid, soc=0.01) for i in range(2)
+        )
+        near = mock_station_from_geoid(
+            station_id="near",
+            geoid=h3.geo_to_h3(39.01, -104.0, 15),
+            chargers={mock_dcfc_charger_id(): 1},
+        )
+        far = mock_station_from_geoid(
+            station_id="far",
+            geoid=h3.geo_to_h3(39.015, -104.0, 15),
+            chargers={mock_dcfc_charger_id(): 1},
+        )
+        sim = mock_sim(
+            h3_location_res=15,
+            h3_search_res=5,
+            vehicles=vehicles,
+            stations=(near, far),
+        )
+
+        _, instructions = charging_fleet_manager.generate_instructions(sim, mock_env())
+
+        self.assertEqual(len(instructions), 2, "both vehicles should be sent to charge")
+        self.assertEqual(
+            {i.station_id for i in instructions},
+            {"near", "far"},
+            "the second vehicle should not queue for the one plug at the nearer station",
+        )
+
     def test_charging_fleet_manager_queues(self):
         charging_fleet_manager = ChargingFleetManager(mock_config().dispatcher)
 
@@ -157,3 +318,89 @@ class TestInstructionGenerators(TestCase):
             s2.id,
             "should have instructed vehicle to go to s2",
         )
+
+    def test_schedule_is_scheduled(self):
+        schedule = InstructionGeneratorSchedule(update_interval_seconds=600, offset_seconds=60)
+
+        self.assertFalse(schedule.is_scheduled(0, None), "should not run before the offset")
+        self.assertTrue(schedule.is_scheduled(60, None), "should run at the offset")
+        self.assertFalse(schedule.is_scheduled(600, 60), "should wait for the next interval")
+        self.assertTrue(schedule.is_scheduled(660, 60), "should run once the interval begins")
+        self.assertTrue(schedule.is_scheduled(700, 60), "should run late if the step was missed")
+
+    def test_schedule_from_dict(self):
+        schedule = InstructionGeneratorSchedule.from_dict({"wake_on": ["new_requests"]}, 600)
+
+        self.assertEqual(schedule.update_interval_seconds, 600, "should use the default interval")
+        self.assertEqual(schedule.wake_on, frozenset([WakeEvent.NEW_REQUESTS]))
+        with self.assertRaises(NameError):
+            InstructionGeneratorSchedule.from_dict({"wake_on": ["sometimes"]}, 600)
+
+    def test_step_simulation_skips_unscheduled_generators(self):
+        config = mock_config()
+        schedules = immutables.Map({"Dispatcher": InstructionGeneratorSchedule(600)})
+        config = config._replace(
+            dispatcher=config.dispatcher._replace(instruction_generator_schedules=schedules)
+        )
+        env = mock_env(config)
+        step = StepSimulation.from_tuple(mock_instruction_generators(config))
+        sim = mock_sim(vehicles=(mock_vehicle(),))
+
+        sim, step = step.update(sim, env)
+        sim, step = step.update(sim, env)
+
+        self.assertEqual(step.instruction_generator_last_run["Dispatcher"], 0)
+        self.assertEqual(
+            step.instruction_generator_last_run["ChargingFleetManager"],
+            60,
+            "unscheduled generators should run every time step",
+        )
+        self.assertEqual(step.instruction_generator_order, ("ChargingFleetManager", "Dispatcher"))
+
+    def test_step_simulation_wakes_on_new_requests(self):
+        config = mock_config()
+        schedule = InstructionGeneratorSchedule(600, wake_on=frozenset([WakeEvent.NEW_REQUESTS]))
+        config = config._replace(
+            dispatcher=config.dispatcher._replace(
+                instruction_generator_schedules=immutables.Map({"Dispatcher": schedule})
+            )
+        )
+        env = mock_env(config)
+        step = StepSimulation.from_tuple(mock_instruction_generators(config))
+        sim, step = step.update(mock_sim(), env)
+
+        sim = simulation_state_ops.add_request_safe(sim, mock_request(departure_time=60)).unwrap()
+        sim, step = step.update(sim, env)
+
+        self.assertEqual(
+            step.instruction_generator_last_run["Dispatcher"],
+            60,
+            "a new request should wake the dispatcher",
+        )
+
+    def test_schedule_is_woken_from_recorded_signals(self):
+        schedule = InstructionGeneratorSchedule(
+            600,
+            wake_on=frozenset([WakeEvent.NEW_REQUESTS, WakeEvent.LOW_SOC]),
+            low_soc_threshold=0.2,
+        )
+        env = mock_env()
+        sim = mock_sim(sim_time=120)
+
+        self.assertFalse(schedule.is_woken(sim, env, 60), "nothing happened since the last run")
+        self.assertTrue(
+            schedule.is_woken(sim._replace(last_request_added_time=120), env, 60),
+            "a request added since the last run should wake the generator",
+        )
+        self.assertFalse(
+            schedule.is_woken(sim._replace(last_request_added_time=60), env, 60),
+            "a request added before the last run was already seen",
+        )
+        self.assertTrue(
+            schedule.is_woken(sim._replace(low_soc_times=immutables.Map({0.2: 60})), env, 60),
+            "a vehicle which fell below the threshold after the last run should wake the generator",
+        )
+        self.assertFalse(
+            schedule.is_woken(sim._replace(low_soc_times=immutables.Map({0.5: 60})), env, 60),
+            "only this schedule's threshold should wake the generator",
+        )
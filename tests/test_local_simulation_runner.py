@@ -1,8 +1,13 @@
+from datetime import time
 from unittest import TestCase
+from unittest.mock import patch
 
+from nrel.hive.model.vehicle.schedules.time_range_schedule import TimeRangeSchedule
+from nrel.hive.reporting.handler.handler import Handler
 from nrel.hive.runner import LocalSimulationRunner
 from nrel.hive.runner import RunnerPayload
 from nrel.hive.state.simulation_state.update.cancel_requests import CancelRequests
+from nrel.hive.state.vehicle_state.reserve_base import ReserveBase
 from nrel.hive.resources.mock_lobster import *
 
 
@@ -76,3 +81,84 @@ class TestLocalSimulationRunner(TestCase):
             None,
             "we should not be able to step a simulation that has exceeded end_time",
         )
+
+    def _run_fixed_and_event_driven(self, sim, env):
+        update = Update(
+            tuple([CancelRequests()]),
+            StepSimulation.from_tuple(mock_instruction_generators(env.config)),
+        )
+        fixed = LocalSimulationRunner.run(RunnerPayload(sim, env, update))
+
+        event_config = env.config._replace(sim=env.config.sim._replace(event_driven=True))
+        event_env = env._replace(config=event_config)
+        with patch.object(
+            Update, "apply_update", autospec=True, side_effect=Update.apply_update
+        ) as u:
+            event_driven = LocalSimulationRunner.run(RunnerPayload(sim, event_env, update))
+        return fixed, event_driven, u.call_count
+
+    def test_run_event_driven(self):
+        config = mock_config(end_time=7200, timestep_duration_seconds=60)
+        env = mock_env(config)
+        sim = mock_sim(vehicles=(mock_vehicle(),), bases=(mock_base(stall_count=5),))
+
+        fixed, event_driven, steps_applied = self._run_fixed_and_event_driven(sim, env)
+
+        vehicle = fixed.s.vehicles[DefaultIds.mock_vehicle_id()]
+        event_vehicle = event_driven.s.vehicles[DefaultIds.mock_vehicle_id()]
+        self.assertIsInstance(vehicle.vehicle_state, ReserveBase, "vehicle should time out to base")
+        self.assertEqual(event_driven.s.sim_time, fixed.s.sim_time)
+        self.assertEqual(event_vehicle.position, vehicle.position)
+        self.assertEqual(event_vehicle.energy, vehicle.energy)
+        self.assertEqual(event_vehicle.vehicle_state.__class__, vehicle.vehicle_state.__class__)
+        self.assertLess(steps_applied, 7200 // 60, "should have skipped quiet time steps")
+
+    def test_run_event_driven_wakes_on_schedule_change(self):
+        config = mock_config(end_time=7200, timestep_duration_seconds=60)
+        env = mock_env(config, schedules={"late": TimeRangeSchedule(time(1), time(23))})
+        vehicle = mock_vehicle(
+            vehicle_state=ReserveBase.build(
+                DefaultIds.mock_vehicle_id(), DefaultIds.mock_base_id()
+            ),
+            driver_state=mock_human_driver(available=False, schedule_id="late"),
+        )
+        sim = mock_sim(vehicles=(vehicle,), bases=(mock_base(stall_count=5),))
+
+        fixed, event_driven, steps_applied = self._run_fixed_and_event_driven(sim, env)
+
+        vehicle = fixed.s.vehicles[DefaultIds.mock_vehicle_id()]
+        event_vehicle = event_driven.s.vehicles[DefaultIds.mock_vehicle_id()]
+        self.assertTrue(vehicle.driver_state.available, "driver should have started their shift")
+        self.assertEqual(event_vehicle.driver_state.__class__, vehicle.driver_state.__class__)
+        self.assertEqual(event_vehicle.vehicle_state.__class__, vehicle.vehicle_state.__class__)
+        self.assertEqual(event_vehicle.position, vehicle.position)
+        self.assertLess(steps_applied, 7200 // 60, "should have skipped quiet time steps")
+
+    def test_run_event_driven_reports_skipped_time_steps(self):
+        class SimTimeHandler(Handler):
+            def __init__(self):
+                self.sim_times = []
+
+            def handle(self, reports, runner_payload):
+                self.sim_times.append(runner_payload.s.sim_time)
+
+            def close(self, runner_payload):
+                pass
+
+        config = mock_config(end_time=7200, timestep_duration_seconds=60)
+        sim = mock_sim(vehicles=(mock_vehicle(),), bases=(mock_base(stall_count=5),))
+        update = Update(
+            tuple([CancelRequests()]),
+            StepSimulation.from_tuple(mock_instruction_generators(config)),
+        )
+        handled = []
+        for event_driven in (False, True):
+            handler = SimTimeHandler()
+            reporter = Reporter()
+            reporter.add_handler(handler)
+            event_config = config._replace(sim=config.sim._replace(event_driven=event_driven))
+            env = mock_env(event_config)._replace(reporter=reporter)
+            LocalSimulationRunner.run(RunnerPayload(sim, env, update))
+            handled.append(handler.sim_times)
+
+        self.assertEqual(handled[1], handled[0], "should report every skipped time step")
@@ -0,0 +1,136 @@
+from unittest import TestCase
+
+from nrel.hive.runner.observation import (
+    SimulationObserver,
+    VEHICLE_OBSERVATION_DTYPE,
+    attach_observation_buffer,
+)
+from nrel.hive.resources.mock_lobster import *
+from nrel.hive.state.vehicle_state.charging_station import ChargingStation
+from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
+from nrel.hive.util.exception import SimulationStateError
+
+
+class TestObservation(TestCase):
+    def test_observe(self):
+        station = mock_station()
+        charging = ChargingStation.build("v2", station.id, mock_dcfc_charger_id())
+        sim = mock_sim(
+            vehicles=(
+                mock_vehicle("v1", soc=0.5),
+                mock_vehicle("v2", soc=0.25, vehicle_state=charging, total_seats=4),
+            ),
+            stations=(station,),
+        )
+        sim = simulation_state_ops.add_request_safe(sim, mock_request("r1", passengers=2)).unwrap()
+        env = mock_env()
+
+        observer = SimulationObserver()
+        obs = observer.observe(sim, env)
+
+        self.assertEqual(obs.vehicles.dtype, VEHICLE_OBSERVATION_DTYPE)
+        v1 = observer.vehicles.index_of("v1")
+        v2 = observer.vehicles.index_of("v2")
+        self.assertAlmostEqual(obs.vehicles["soc"][v1], 0.5)
+        self.assertAlmostEqual(obs.vehicles["soc"][v2], 0.25)
+        self.assertEqual(obs.vehicles["vehicle_state"][v1], VehicleStateType.IDLE.value)
+        self.assertEqual(obs.vehicles["vehicle_state"][v2], VehicleStateType.CHARGING_STATION.value)
+        self.assertEqual(obs.vehicles["station_index"][v1], -1)
+        self.assertEqual(obs.vehicles["station_index"][v2], observer.stations.index_of(station.id))
+        self.assertEqual(obs.vehicles["available_seats"][v2], 4)
+        self.assertAlmostEqual(obs.vehicles["lat"][v1], 39.7539, places=4)
+        self.assertEqual(
+            obs.stations["total_chargers"][0],
+            sum(cs.total_chargers for cs in station.state.values()),
+        )
+        self.assertEqual(obs.requests["passengers"][0], 2)
+        self.assertEqual(obs.requests["vehicle_index"][0], -1)
+
+    def test_indices_are_stable(self):
+        sim = mock_sim(vehicles=(mock_vehicle("v1"), mock_vehicle("v2"), mock_vehicle("v3")))
+        env = mock_env()
+        observer = SimulationObserver(vehicle_capacity=1)
+        observer.observe(sim, env)
+        v1 = observer.vehicles.index_of("v1")
+        v3 = observer.vehicles.index_of("v3")
+
+        sim = simulation_state_ops.remove_vehicle_safe(sim, "v1").unwrap()
+        obs = observer.observe(sim, env)
+        self.assertEqual(observer.vehicles.index_of("v3"), v3, "index should not change")
+        self.assertEqual(obs.vehicles["present"].sum(), 2)
+
+        sim = simulation_state_ops.add_vehicle_safe(sim, mock_vehicle("v4", soc=0.1)).unwrap()
+        obs = observer.observe(sim, env)
+        self.assertEqual(observer.vehicles.index_of("v4"), v1, "should reuse the vacant index")
+        self.assertEqual(observer.vehicles.entity_id(v1), "v4")
+        self.assertAlmostEqual(obs.vehicles["soc"][v1], 0.1)
+        self.assertEqual(obs.vehicles["present"].sum(), 3)
+
+    def test_only_changed_rows_are_rewritten(self):
+        sim = mock_sim(vehicles=(mock_vehicle("v1"), mock_vehicle("v2")))
+        env = mock_env()
+        observer = SimulationObserver()
+        obs = observer.observe(sim, env)
+        v1 = observer.vehicles.index_of("v1")
+        v2 = observer.vehicles.index_of("v2")
+
+        # a row is only rewritten when the entity is replaced in the simulation state
+        obs.vehicles["balance"][v1] = -1
+        obs.vehicles["balance"][v2] = -1
+        updated = mock_vehicle("v2")
+        sim = simulation_state_ops.modify_vehicle_safe(sim, updated).unwrap()
+        obs = observer.observe(sim, env)
+        self.assertEqual(obs.vehicles["balance"][v1], -1)
+        self.assertEqual(obs.vehicles["balance"][v2], 0)
+
+    def test_only_changed_rows_are_rewritten_when_tracked(self):
+        sim = mock_sim(vehicles=(mock_vehicle("v1"), mock_vehicle("v2"), mock_vehicle("v3")))
+        sim = simulation_state_ops.track_entity_changes(sim)
+        env = mock_env()
+        observer = SimulationObserver()
+        obs = observer.observe(sim, env)
+        v1 = observer.vehicles.index_of("v1")
+        v2 = observer.vehicles.index_of("v2")
+
+        obs.vehicles["balance"][v1] = -1
+        obs.vehicles["balance"][v2] = -1
+        sim = simulation_state_ops.modify_vehicle_safe(sim, mock_vehicle("v2")).unwrap()
+        sim = simulation_state_ops.remove_vehicle_safe(sim, "v3").unwrap()
+        sim = simulation_state_ops.add_vehicle_safe(sim, mock_vehicle("v4", soc=0.1)).unwrap()
+        self.assertTrue(sim.v_index.tracked)
+        obs = observer.observe(sim, env)
+
+        self.assertEqual(obs.vehicles["balance"][v1], -1, "unchanged rows are not rewritten")
+        self.assertEqual(obs.vehicles["balance"][v2], 0)
+        self.assertAlmostEqual(obs.vehicles["soc"][observer.vehicles.index_of("v4")], 0.1)
+        self.assertEqual(obs.vehicles["present"].sum(), 3)
+
+    def test_observe_another_simulation(self):
+        env = mock_env()
+        observer = SimulationObserver()
+        observer.observe(mock_sim(vehicles=(mock_vehicle("v1"), mock_vehicle("v2"))), env)
+
+        # the same vehicle in a different simulation, at a different slot
+        sim = mock_sim(vehicles=(mock_vehicle("v2", soc=0.1),))
+        obs = observer.observe(sim, env)
+        self.assertEqual(observer.vehicles.index_of("v2"), 0)
+        self.assertEqual(obs.vehicles["present"].sum(), 1)
+        self.assertAlmostEqual(obs.vehicles["soc"][0], 0.1)
+
+    def test_shared_memory(self):
+        sim = mock_sim(vehicles=(mock_vehicle("v1", soc=0.5),))
+        env = mock_env()
+        observer = SimulationObserver(vehicle_capacity=1, shared_memory=True)
+        try:
+            observer.observe(sim, env)
+            name = observer.shared_memory_names["vehicles"]
+            shm, vehicles = attach_observation_buffer(name, VEHICLE_OBSERVATION_DTYPE, 1)
+            self.assertAlmostEqual(vehicles["soc"][0], 0.5)
+            del vehicles
+            shm.close()
+
+            sim = simulation_state_ops.add_vehicle_safe(sim, mock_vehicle("v2")).unwrap()
+            with self.assertRaises(SimulationStateError):
+                observer.observe(sim, env)
+        finally:
+            observer.close()
@@ -0,0 +1,101 @@
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from nrel.hive.app.compile_network import compile_road_network
+from nrel.hive.initialization.initialize_simulation import osm_init_function
+from nrel.hive.model.roadnetwork.osm.osm_compact_roadnetwork import OSMCompactRoadNetwork
+from nrel.hive.model.roadnetwork.route import route_distance_km, route_travel_time_seconds
+from nrel.hive.resources.mock_lobster import *
+
+
+class TestOSMCompactRoadNetwork(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.osm_network = mock_osm_network()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.file = Path(cls.directory.name) / "network.npz"
+        road_network_file = resource_filename(
+            "nrel.hive.resources.scenarios.denver_downtown.road_network",
+            "downtown_denver_network.json",
+        )
+        compile_road_network(road_network_file, cls.file)
+        cls.network = OSMCompactRoadNetwork.from_file(cls.file)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_from_file_is_memory_mapped(self):
+        arrays = self.network.arrays
+
+        self.assertFalse(arrays.link_dst.flags.writeable, "arrays should be read-only")
+        self.assertFalse(arrays.link_dst.flags.owndata, "arrays should view the mapped file")
+        self.assertEqual(arrays.link_count, self.osm_network.link_helper.link_count)
+        self.assertEqual(self.network.sim_h3_resolution, self.osm_network.sim_h3_resolution)
+        self.assertEqual(self.network.default_speed_kmph, self.osm_network.default_speed_kmph)
+        self.assertTrue(
+            np.shares_memory(self.network.links_spatial_lookup.data, arrays.link_midpoints),
+            "spatial index should be built over the mapped link midpoints",
+        )
+
+    def test_link_from_link_id(self):
+        for link_id, link in self.osm_network.link_helper.links.items():
+            self.assertEqual(self.network.link_from_link_id(link_id), link)
+
+        self.assertIsNone(self.network.link_from_link_id("1-2"), "link should not exist")
+
+    def test_route(self):
+        o_lat, o_lon = (39.7481388, -104.9935966)
+        d_lat, d_lon = (39.7613596, -104.981728)
+        origin = h3.geo_to_h3(o_lat, o_lon, 15)
+        destination = h3.geo_to_h3(d_lat, d_lon, 15)
+
+        origin_position = self.network.position_from_geoid(origin)
+        destination_position = self.network.position_from_geoid(destination)
+        route = self.network.route(origin_position, destination_position)
+        osm_route = self.osm_network.route(origin_position, destination_position)
+
+        self.assertEqual(origin_position, self.osm_network.position_from_geoid(origin))
+        self.assertEqual(route[0].start, origin_position.geoid, "should start at the origin")
+        self.assertEqual(route[-1].end, destination_position.geoid, "should end at destination")
+        self.assertAlmostEqual(
+            route_travel_time_seconds(route),
+            route_travel_time_seconds(osm_route),
+            msg="should find a route as fast as the networkx shortest path",
+        )
+        self.assertAlmostEqual(
+            self.network.distance_by_geoid_km(origin, destination),
+            route_distance_km(route),
+        )
+
+    def test_osm_init_function_loads_compiled_network(self):
+        input_config = {
+            "vehicles_file": "denver_demo_vehicles.csv",
+            "requests_file": "denver_demo_requests.csv",
+            "bases_file": "denver_demo_bases.csv",
+            "stations_file": "denver_demo_stations.csv",
+            "mechatronics_file": "mechatronics.yaml",
+            "road_network_file": str(self.file),
+        }
+        config = mock_config(input_config=input_config)
+
+        sim, _ = osm_init_function(config, mock_sim(), mock_env(config))
+
+        self.assertIsInstance(sim.road_network, OSMCompactRoadNetwork)
+
+    def test_osm_init_function_rejects_other_default_speed(self):
+        input_config = {
+            "vehicles_file": "denver_demo_vehicles.csv",
+            "requests_file": "denver_demo_requests.csv",
+            "bases_file": "denver_demo_bases.csv",
+            "stations_file": "denver_demo_stations.csv",
+            "mechatronics_file": "mechatronics.yaml",
+            "road_network_file": str(self.file),
+        }
+        config = mock_config(input_config=input_config)
+        config = config._replace(network=config.network._replace(default_speed_kmph=25.0))
+
+        with self.assertRaises(ValueError):
+            osm_init_function(config, mock_sim(), mock_env(config))
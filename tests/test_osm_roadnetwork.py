@@ -51,3 +51,45 @@ class TestOSMRoadNetwork(TestCase):
             route[-1].end,
             "route should end at destination GeoId (stationary road network location)",
         )
+
+    def test_positions_from_geoids(self):
+        network = mock_osm_network()
+        coordinates = [
+            (39.7481388, -104.9935966),
+            (39.7613596, -104.981728),
+            (39.7539, -104.9866),
+        ]
+        geoids = [h3.geo_to_h3(lat, lon, network.sim_h3_resolution) for lat, lon in coordinates]
+
+        positions = network.positions_from_geoids(geoids)
+
+        self.assertEqual(len(positions), len(geoids))
+        for geoid, position in zip(geoids, positions):
+            self.assertEqual(position, network.position_from_geoid(geoid))
+            self.assertEqual(position.link_id, network.link_from_geoid(geoid).link_id)
+
+    def test_position_from_geoid_projects_onto_link(self):
+        network = mock_osm_network()
+        link = next(iter(network.link_helper.links.values()))
+        start_lat, start_lon = h3.h3_to_geo(link.start)
+        end_lat, end_lon = h3.h3_to_geo(link.end)
+        midpoint = h3.geo_to_h3(
+            (start_lat + end_lat) / 2, (start_lon + end_lon) / 2, network.sim_h3_resolution
+        )
+
+        position = network.position_from_geoid(midpoint)
+
+        self.assertEqual(position.geoid, midpoint, "a geoid on the link should not move")
+
+    def test_positions_from_rows(self):
+        network = mock_osm_network()
+        rows = [
+            {"lat": "39.7481388", "lon": "-104.9935966"},
+            {"lat": "not a number", "lon": "-104.9935966"},
+            {"lon": "-104.981728"},
+        ]
+
+        positions = network.positions_from_rows(rows)
+
+        expected = network.position_from_geoid(h3.geo_to_h3(39.7481388, -104.9935966, 15))
+        self.assertEqual(positions, (expected, None, None))
@@ -95,3 +95,16 @@ class TestRequest(TestCase):
         error, request = Request.from_row(row, env, network)
         self.assertIsNone(request)
         self.assertIsInstance(error, TimeParseError)
+
+    def test_passengers_derived_from_request(self):
+        req = self.request.add_membership("fleet_1")
+        passengers = req.passengers
+
+        self.assertEqual(req.num_passengers, 2)
+        self.assertEqual(tuple(p.id for p in passengers), ("test-0", "test-1"))
+        for passenger in passengers:
+            self.assertEqual(passenger.origin, req.origin)
+            self.assertEqual(passenger.destination, req.destination)
+            self.assertEqual(passenger.departure_time, req.departure_time)
+            self.assertEqual(passenger.membership, req.membership)
+            self.assertIsNone(passenger.vehicle_id)
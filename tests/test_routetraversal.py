@@ -1,6 +1,8 @@
 from unittest import TestCase
 
+from nrel.hive.model.roadnetwork.compact_route import CompactRoute
 from nrel.hive.model.roadnetwork.linktraversal import traverse_up_to
+from nrel.hive.model.roadnetwork.route import route_distance_km
 from nrel.hive.model.roadnetwork.routetraversal import traverse
 from nrel.hive.resources.mock_lobster import *
 
@@ -31,6 +33,63 @@ class TestRouteTraversal(TestCase):
         self.assertEqual(len(result.remaining_route), 2, "should have 2 links remaining")
         self.assertEqual(len(result.experienced_route), 2, "should have traversed 2 links")
 
+    def test_traverse_slices_untraversed_links(self):
+        links = mock_route()
+        _, result = traverse(route_estimate=links, duration_seconds=hours_to_seconds(0.5))
+
+        self.assertEqual(len(result.experienced_route), 1, "should have traversed part of 1 link")
+        self.assertEqual(result.remaining_route[1:], links[1:], "should keep untraversed links")
+        self.assertEqual(result.remaining_route[0].start, result.experienced_route[0].end)
+        self.assertAlmostEqual(
+            result.traversal_distance_km, result.experienced_route[0].distance_km
+        )
+
+    def test_traverse_steps_match_link_by_link_traversal(self):
+        route = mock_route() * 4
+        step_seconds = hours_to_seconds(0.7)
+
+        # the links experienced when stepping over each link in turn
+        expected = []
+        remaining_links = list(route)
+        while remaining_links:
+            time_left = step_seconds
+            experienced = []
+            while remaining_links and time_left > 0:
+                _, link_result = traverse_up_to(remaining_links.pop(0), time_left)
+                if link_result.traversed is not None:
+                    experienced.append(link_result.traversed)
+                if link_result.remaining is not None:
+                    remaining_links.insert(0, link_result.remaining)
+                time_left = link_result.remaining_time_seconds
+            expected.append(tuple(experienced))
+
+        remaining = route
+        for expected_experience in expected:
+            _, result = traverse(route_estimate=remaining, duration_seconds=step_seconds)
+            self.assertEqual(tuple(result.experienced_route), expected_experience)
+            self.assertAlmostEqual(
+                result.traversal_distance_km, route_distance_km(expected_experience)
+            )
+            remaining = result.remaining_route
+        self.assertEqual(len(remaining), 0, "should have finished the route")
+
+    def test_traverse_shares_the_planned_links(self):
+        route = mock_route()
+        _, first = traverse(route_estimate=route, duration_seconds=hours_to_seconds(0.5))
+        _, second = traverse(
+            route_estimate=first.remaining_route, duration_seconds=hours_to_seconds(1)
+        )
+
+        self.assertIsInstance(second.remaining_route, CompactRoute)
+        self.assertIs(second.remaining_route.links, first.remaining_route.links)
+        untraversed = second.remaining_route[1:]
+        self.assertEqual(untraversed, route[2:], "should compare equal to the tuple")
+        self.assertEqual(hash(untraversed), hash(tuple(route[2:])))
+        self.assertAlmostEqual(
+            route_distance_km(second.remaining_route),
+            route_distance_km(tuple(second.remaining_route)),
+        )
+
     def test_traverse_up_to_split(self):
         links = mock_route()
         test_link = links[0]
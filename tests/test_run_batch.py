@@ -0,0 +1,88 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from nrel.hive.app.run_batch import BatchConfig
+from nrel.hive.initialization.load import load_simulation, load_variant_simulation
+from nrel.hive.runner import LocalSimulationRunner
+from nrel.hive.state.simulation_state.update.charging_price_update import ChargingPriceUpdate
+from nrel.hive.state.simulation_state.update.update_requests_from_file import (
+    UpdateRequestsFromFile,
+)
+from nrel.hive.resources.mock_lobster import *
+
+
+class TestRunBatch(TestCase):
+    def setUp(self):
+        self.output_directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.output_directory.cleanup()
+
+    def _prefix_config(self, end_time: int) -> HiveConfig:
+        config = mock_config(end_time=end_time, timestep_duration_seconds=60)
+        return config.set_scenario_output_directory(Path(self.output_directory.name) / "prefix")
+
+    def test_batch_config_warm_start(self):
+        config = BatchConfig.from_dict(
+            {
+                "scenario_files": ["denver_demo.yaml", "denver_rl_toy.yaml"],
+                "warm_start": {
+                    "scenario_file": "denver_demo.yaml",
+                    "until": "1970-01-01T12:00:00",
+                },
+            }
+        )
+
+        self.assertEqual(len(config.scenario_files), 2)
+        self.assertIsNotNone(config.warm_start)
+        self.assertEqual(config.warm_start.until, 12 * 3600)
+
+    def test_batch_config_without_warm_start(self):
+        config = BatchConfig.from_dict({"scenario_files": ["denver_demo.yaml"]})
+
+        self.assertIsNone(config.warm_start, "warm start should be optional")
+
+    def test_load_variant_simulation(self):
+        prefix_config = self._prefix_config(end_time=3600)
+        prefix = LocalSimulationRunner.run(load_simulation(prefix_config), end_time=1200)
+
+        self.assertEqual(prefix.s.sim_time, 1200, "prefix should stop at the warm start time")
+
+        variant_config = prefix_config._replace(
+            dispatcher=prefix_config.dispatcher._replace(matching_range_km_threshold=1.0)
+        ).set_scenario_output_directory(Path(self.output_directory.name) / "variant")
+        variant = load_variant_simulation(prefix, variant_config)
+
+        self.assertEqual(variant.s, prefix.s, "variant should continue from the prefix state")
+        self.assertEqual(variant.e.config, variant_config, "variant should use its own config")
+        self.assertIsInstance(variant.u.pre_step_update[0], ChargingPriceUpdate)
+        prefix_requests = [
+            fn for fn in prefix.u.pre_step_update if isinstance(fn, UpdateRequestsFromFile)
+        ]
+        variant_requests = [
+            fn for fn in variant.u.pre_step_update if isinstance(fn, UpdateRequestsFromFile)
+        ]
+        self.assertEqual(
+            variant_requests, prefix_requests, "variant should keep the prefix request stream"
+        )
+        generator_configs = [
+            ig.config for ig in variant.u.step_update.instruction_generators.values()
+        ]
+        self.assertTrue(all(c == variant_config.dispatcher for c in generator_configs))
+
+        result = LocalSimulationRunner.run(variant)
+
+        self.assertEqual(result.s.sim_time, 3600, "variant should run to its end time")
+
+    def test_load_variant_simulation_mismatched_inputs(self):
+        prefix_config = self._prefix_config(end_time=600)
+        prefix = LocalSimulationRunner.run(load_simulation(prefix_config), end_time=120)
+
+        for field in ("requests_file", "fleets_file", "schedules_file", "chargers_file"):
+            variant_config = prefix_config._replace(
+                input_config=prefix_config.input_config._replace(**{field: "other.csv"})
+            )
+
+            with self.assertRaises(ValueError, msg=f"{field} should be shared"):
+                load_variant_simulation(prefix, variant_config)
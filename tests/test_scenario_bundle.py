@@ -0,0 +1,90 @@
+import json
+import pickle
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from nrel.hive.initialization.initialize_simulation import initialize
+from nrel.hive.initialization.load import load_simulation
+from nrel.hive.initialization.scenario_bundle import (
+    compile_scenario_bundle,
+    load_scenario_bundle,
+    scenario_bundle_file,
+)
+from nrel.hive.resources.mock_lobster import *
+
+
+class TestScenarioBundle(TestCase):
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        # place the bundle in a temporary scenario directory; the input files keep their paths
+        config = mock_config().suppress_logging()
+        self.config = config._replace(
+            input_config=config.input_config._replace(scenario_directory=self.tempdir.name)
+        )
+
+    def test_load_scenario_bundle(self):
+        bundle_file = compile_scenario_bundle(self.config)
+        self.assertEqual(bundle_file, scenario_bundle_file(self.config))
+
+        result = load_scenario_bundle(self.config)
+        self.assertIsNotNone(result, "should load the bundle")
+        sim, env = result
+        expected_sim, expected_env = initialize(self.config)
+        self.assertEqual(set(sim.vehicles), set(expected_sim.vehicles))
+        self.assertEqual(sim.stations, expected_sim.stations)
+        self.assertEqual(sim.bases, expected_sim.bases)
+        self.assertEqual(sim.sim_time, expected_sim.sim_time)
+        self.assertEqual(set(env.mechatronics), set(expected_env.mechatronics))
+        self.assertEqual(env.chargers, expected_env.chargers)
+        self.assertIs(env.config, self.config, "should use the config of this run")
+
+    def test_load_scenario_bundle_missing(self):
+        self.assertIsNone(load_scenario_bundle(self.config))
+
+    def test_load_scenario_bundle_out_of_date(self):
+        compile_scenario_bundle(self.config)
+        sim_config = self.config.sim._replace(start_time=self.config.sim.start_time + 60)
+        changed_config = self.config._replace(sim=sim_config)
+
+        self.assertIsNone(
+            load_scenario_bundle(changed_config), "should not load a bundle of other sources"
+        )
+
+    def test_load_scenario_bundle_other_hive_version(self):
+        bundle_file = compile_scenario_bundle(self.config)
+        with bundle_file.open("rb") as f:
+            header = json.loads(f.readline())
+            state = f.read()
+        header["hive_version"] = "0.0.0"
+        with bundle_file.open("wb") as f:
+            f.write(json.dumps(header).encode() + b"\n" + state)
+
+        self.assertIsNone(load_scenario_bundle(self.config))
+
+    def test_load_scenario_bundle_not_a_bundle(self):
+        bundle_file = scenario_bundle_file(self.config)
+        bundle_file.write_bytes(b"not a bundle")
+
+        self.assertIsNone(load_scenario_bundle(self.config))
+
+    def test_load_simulation_uses_bundle(self):
+        bundle_file = compile_scenario_bundle(self.config)
+        # rewrite the bundle without a vehicle, which shows whether the bundle was loaded
+        with bundle_file.open("rb") as f:
+            header = f.readline()
+            sim, env = pickle.load(f)
+        with bundle_file.open("wb") as f:
+            f.write(header)
+            pickle.dump((sim._replace(vehicles=sim.vehicles.delete("v1")), env), f)
+
+        self.assertIn("v1", load_simulation(self.config).s.vehicles, "bundles are opt-in")
+
+        config = self.config._replace(
+            global_config=self.config.global_config._replace(use_scenario_bundle=True)
+        )
+        runner_payload = load_simulation(config)
+
+        self.assertNotIn("v1", runner_payload.s.vehicles, "should have loaded the bundle")
+        self.assertEqual(len(runner_payload.s.vehicles), len(sim.vehicles) - 1)
@@ -47,3 +47,35 @@ class TestSchedules(TestCase):
             third_shift_schedule_fn(mock_sim(sim_time=eleven_fifty_nine_fifty_nine), unused)
         )
         # self.assertFalse(third_shift_schedule_fn(mock_sim(sim_time=not_a_time), unused))
+
+    def test_time_range_schedule_next_transition_time(self):
+        schedules_input = """schedule_id,start_time,end_time
+                             first,"09:00:00","17:00:00"
+                             second,"17:00:00","01:00:00"
+                             empty,"09:00:00","09:00:00"
+                             """
+        time_range_schedules = time_range_schedules_from_string(schedules_input)
+        first = time_range_schedules["first"]
+        second = time_range_schedules["second"]
+        day = 86400
+        nine_am, five_pm, one_am = 3600 * 9, 3600 * 17, 3600
+
+        self.assertEqual(first.next_transition_time(0), nine_am)
+        self.assertEqual(first.next_transition_time(nine_am), five_pm, "boundary is in the past")
+        self.assertEqual(first.next_transition_time(five_pm), day + nine_am, "wraps to tomorrow")
+        self.assertEqual(first.next_transition_time(3 * day + 60), 3 * day + nine_am)
+        self.assertEqual(second.next_transition_time(0), one_am)
+        self.assertEqual(second.next_transition_time(one_am + 1), five_pm)
+        self.assertEqual(second.next_transition_time(five_pm + 1), day + one_am)
+        self.assertIsNone(time_range_schedules["empty"].next_transition_time(0), "never changes")
+
+        # the schedule should agree with itself before and after each transition
+        unused = DefaultIds.mock_vehicle_id()
+        sim_time = 0
+        for _ in range(6):
+            next_time = second.next_transition_time(sim_time)
+            before = second(mock_sim(sim_time=next_time - 1), unused)
+            after = second(mock_sim(sim_time=next_time), unused)
+            self.assertEqual(second(mock_sim(sim_time=sim_time), unused), before)
+            self.assertNotEqual(before, after, "availability should flip at the transition")
+            sim_time = next_time
@@ -242,6 +242,126 @@ class TestSimulationStateOps(TestCase):
             "there should be no key for this geoid",
         )
 
+    def test_active_vehicles(self):
+        base = mock_base()
+        veh = mock_vehicle()
+        sim = mock_sim(bases=(base,))
+        sim_with_veh = simulation_state_ops.add_vehicle_safe(sim, veh).unwrap()
+
+        self.assertIn(veh.id, sim_with_veh.active_vehicles, "idle vehicle should be active")
+
+        reserve_veh = veh.modify_vehicle_state(ReserveBase.build(veh.id, base.id))
+        _, sim_reserve = simulation_state_ops.modify_vehicle(sim_with_veh, reserve_veh)
+
+        self.assertNotIn(veh.id, sim_reserve.active_vehicles, "reserve base should be dormant")
+
+        _, sim_idle = simulation_state_ops.modify_vehicle(sim_reserve, veh)
+
+        self.assertIn(veh.id, sim_idle.active_vehicles, "vehicle should be active again")
+
+        _, sim_after_remove = simulation_state_ops.remove_vehicle(sim_idle, veh.id)
+
+        self.assertNotIn(veh.id, sim_after_remove.active_vehicles, "vehicle should be removed")
+
+    def test_membership_collections(self):
+        public_veh = mock_vehicle(vehicle_id="public")
+        fleet_a_veh = mock_vehicle(vehicle_id="a", membership=Membership.single_membership("a"))
+        fleet_ab_veh = mock_vehicle(vehicle_id="ab", membership=Membership.from_tuple(("a", "b")))
+        sim = mock_sim(vehicles=(public_veh, fleet_a_veh, fleet_ab_veh))
+
+        def _ids(s: SimulationState, membership: Membership):
+            return sorted(v.id for v in s.get_vehicles(membership=membership))
+
+        self.assertEqual(_ids(sim, Membership.single_membership("a")), ["a", "ab", "public"])
+        self.assertEqual(_ids(sim, Membership.single_membership("b")), ["ab", "public"])
+        self.assertEqual(_ids(sim, Membership.from_tuple(("a", "b"))), ["a", "ab", "public"])
+        self.assertEqual(_ids(sim, Membership()), ["public"])
+
+        moved_veh = fleet_a_veh.set_membership(("b",))
+        sim_moved = simulation_state_ops.modify_vehicle_safe(sim, moved_veh).unwrap()
+
+        self.assertEqual(_ids(sim_moved, Membership.single_membership("a")), ["ab", "public"])
+        self.assertEqual(_ids(sim_moved, Membership.single_membership("b")), ["a", "ab", "public"])
+
+        sim_removed = simulation_state_ops.remove_vehicle_safe(sim_moved, "ab").unwrap()
+        sim_removed = simulation_state_ops.remove_vehicle_safe(sim_removed, "a").unwrap()
+
+        self.assertEqual(_ids(sim_removed, Membership.single_membership("b")), ["public"])
+        self.assertNotIn("b", sim_removed.v_membership, "empty memberships should be dropped")
+
+    def test_request_membership_collection(self):
+        req = mock_request(fleet_id="a")
+        sim = simulation_state_ops.add_request_safe(mock_sim(), req).unwrap()
+
+        self.assertEqual(
+            len(sim.get_requests(membership=Membership.single_membership("a"))),
+            1,
+            "request should be found by its membership",
+        )
+        self.assertEqual(
+            len(sim.get_requests(membership=Membership.single_membership("b"))),
+            0,
+            "request should not be found by another membership",
+        )
+
+        sim_removed = simulation_state_ops.remove_request_safe(sim, req.id).unwrap()
+
+        self.assertEqual(len(sim_removed.r_membership), 0, "request should be removed")
+
+    def test_request_search_density(self):
+        near = (mock_request("r1"), mock_request("r2"))
+        far = (
+            mock_request("r3", o_lat=39.80, o_lon=-104.90),
+            mock_request("r4", o_lat=39.80, o_lon=-104.90),
+        )
+        sim = mock_sim()
+        for req in near + far:
+            sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+
+        near_cell = h3.h3_to_parent(near[0].geoid, sim.sim_h3_search_resolution)
+        far_cell = h3.h3_to_parent(far[0].geoid, sim.sim_h3_search_resolution)
+        self.assertEqual(
+            sim.r_search_density.top_k(2, far[0].geoid),
+            ((far_cell, 2), (near_cell, 2)),
+            "both cells should hold two requests, the nearest first",
+        )
+        self.assertEqual(
+            sim.r_search_density.nearest_densest(far[0].geoid),
+            far_cell,
+            "ties should go to the nearest cell",
+        )
+        self.assertIsNotNone(sim.r_search_density.position(far_cell), "should snap the cell")
+
+        sim = simulation_state_ops.remove_request_safe(sim, "r3").unwrap()
+        self.assertEqual(
+            sim.r_search_density.top_k(2, far[0].geoid),
+            ((near_cell, 2), (far_cell, 1)),
+            "the far cell should have lost a request",
+        )
+        self.assertEqual(sim.r_search_density.nearest_densest(far[0].geoid), near_cell)
+
+        for req_id in ("r1", "r2", "r4"):
+            sim = simulation_state_ops.remove_request_safe(sim, req_id).unwrap()
+        self.assertIsNone(sim.r_search_density.nearest_densest(far[0].geoid), "no requests")
+        self.assertEqual(sim.r_search_density.max_count, 0)
+
+    def test_request_search_density_nearest_ties(self):
+        # a row of cells holding one request each, so every cell ties at the max count
+        lons = tuple(-105.0 + 0.05 * i for i in range(12))
+        reqs = tuple(
+            mock_request(f"r{i}", o_lat=39.7, o_lon=lon, d_lat=39.7, d_lon=lon + 0.01)
+            for i, lon in enumerate(lons)
+        )
+        sim = mock_sim()
+        for req in reqs:
+            sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+
+        cells = tuple(h3.h3_to_parent(r.geoid, sim.sim_h3_search_resolution) for r in reqs)
+        top = sim.r_search_density.top_k(3, reqs[8].geoid)
+        self.assertEqual(tuple(cell for cell, _ in top), (cells[8], cells[7], cells[9]))
+        self.assertEqual(sim.r_search_density.nearest_densest(reqs[0].geoid), cells[0])
+        self.assertEqual(sim.r_search_density.nearest_densest(reqs[11].geoid), cells[11])
+
     def test_pop_vehicle(self):
         veh = mock_vehicle()
         sim = mock_sim()
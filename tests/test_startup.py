@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+import time
+from unittest import TestCase
+
+# dependencies which should only be imported on the code paths which need them
+HEAVY_MODULES = ("pandas", "scipy", "networkx", "osmnx", "pkg_resources", "tqdm")
+
+# generous, so that the test only fails if a heavy import is added to the startup path
+STARTUP_SECONDS_LIMIT = 1.0
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+
+
+def _loaded_modules(statement: str) -> list:
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    return json.loads(_run_python(code).stdout.splitlines()[-1])
+
+
+class TestStartup(TestCase):
+    def test_import_hive_is_lazy(self):
+        loaded = _loaded_modules("import nrel.hive")
+        heavy = [m for m in HEAVY_MODULES if m in loaded]
+        self.assertEqual(heavy, [], "importing hive should not import heavy dependencies")
+
+    def test_run_cli_is_lazy(self):
+        loaded = _loaded_modules("import nrel.hive.app.run")
+        heavy = [m for m in HEAVY_MODULES if m in loaded]
+        self.assertEqual(heavy, [], "the hive command line should not import heavy dependencies")
+
+    def test_load_haversine_scenario_is_lazy(self):
+        loaded = _loaded_modules("from nrel.hive.initialization.load import load_simulation")
+        for module in ("pandas", "scipy", "networkx", "osmnx"):
+            self.assertNotIn(module, loaded, f"{module} should only be imported when used")
+
+    def test_cli_help_startup_time(self):
+        # python's own startup is measured first, so that only hive's import time is limited
+        start = time.perf_counter()
+        _run_python("pass")
+        python_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "nrel.hive.app.run", "--help"],
+            capture_output=True,
+            check=True,
+            timeout=60,
+        )
+        hive_seconds = time.perf_counter() - start - python_seconds
+
+        self.assertLess(
+            hive_seconds,
+            STARTUP_SECONDS_LIMIT,
+            f"hive --help should return quickly, took {hive_seconds:.2f} seconds",
+        )
@@ -181,6 +181,40 @@ class TestStation(TestCase):
         self.assertIsNone(dequeue_2, "should not be able to dequeue with empty queue (error)")
         self.assertIsNotNone(err3, "should have an error")
 
+    def test_estimate_wait_seconds(self):
+        station = mock_station(chargers={mock_dcfc_charger_id(): 2})
+        charger_id = mock_dcfc_charger_id()
+
+        _, s1 = station.add_charging_vehicle(charger_id, "v1", release_time=100, sim_time=0)
+        self.assertEqual(s1.estimate_wait_seconds(charger_id, 0), 0, "one charger is free")
+
+        _, s2 = s1.add_charging_vehicle(charger_id, "v2", release_time=300, sim_time=0)
+        _, s3 = s2.add_enqueued_vehicle(charger_id, "v3", charge_duration=500, sim_time=0)
+        _, s4 = s3.add_enqueued_vehicle(charger_id, "v4", charge_duration=50, sim_time=0)
+
+        # v3 takes v1's charger at 100 (free at 600), v4 takes v2's charger at 300 (free at 350)
+        self.assertEqual(s4.estimate_wait_seconds(charger_id, 0), 350)
+        self.assertEqual(s4.estimate_wait_seconds(charger_id, 200), 150)
+
+        # past the projected release times, v1 and v2 are still charging, so they are projected
+        # to be released now, v3 and v4 take their chargers, and v4 is done 50 seconds later
+        self.assertEqual(s4.estimate_wait_seconds(charger_id, 400), 50)
+
+        # v3 leaves the queue, so v4 takes v1's charger at 100 and is done at 150
+        _, s5 = s4.remove_enqueued_vehicle(charger_id, "v3", sim_time=0)
+        self.assertEqual(s5.estimate_wait_seconds(charger_id, 0), 150)
+
+        # v2 stops charging early, so v4 takes its charger at 10 and is done at 60
+        _, s6 = s5.remove_charging_vehicle(charger_id, "v2", sim_time=10)
+        self.assertEqual(s6.estimate_wait_seconds(charger_id, 10), 50)
+
+        self.assertIsNone(s6.estimate_wait_seconds(mock_l1_charger_id(), 10))
+
+        # every charger is occupied past its projected release time with no queue
+        _, occupied = s2.checkout_charger(charger_id)
+        _, occupied = occupied.checkout_charger(charger_id)
+        self.assertEqual(occupied.estimate_wait_seconds(charger_id, 400, 60), 60)
+
     def test_set_membership(self):
         source = """station_id,lat,lon,charger_id,charger_count,on_shift_access
                          s1,37,122,DCFC,10,true
@@ -1,4 +1,6 @@
 from unittest import TestCase
+from unittest.mock import patch
+
 from nrel.hive.state.simulation_state.update.step_simulation_ops import (
     perform_vehicle_state_updates,
 )
@@ -35,3 +37,22 @@ class TestStepSimulationOps(TestCase):
             60,
             "vehicle 2 should have idled for 1 time step (60 s)",
         )
+
+    def test_step_vehicle_skips_dormant_vehicles(self):
+        base = mock_base()
+        idle_vehicle = mock_vehicle(vehicle_id="1")
+        reserve_vehicle = mock_vehicle(
+            vehicle_id="2", vehicle_state=ReserveBase.build("2", base.id)
+        )
+        sim = mock_sim(vehicles=(idle_vehicle, reserve_vehicle), bases=(base,))
+        env = mock_env()
+
+        self.assertIn("1", sim.active_vehicles, "idle vehicle should be active")
+        self.assertNotIn("2", sim.active_vehicles, "reserve base vehicle should be dormant")
+
+        with patch.object(ReserveBase, "update", autospec=True) as reserve_update:
+            sim = perform_vehicle_state_updates(sim, env)
+
+        reserve_update.assert_not_called()
+        self.assertEqual(sim.vehicles["1"].vehicle_state.idle_duration, 60)
+        self.assertEqual(sim.vehicles["2"], reserve_vehicle, "dormant vehicle should not change")
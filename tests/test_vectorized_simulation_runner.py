@@ -0,0 +1,136 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from nrel.hive.initialization.load import load_simulation
+from nrel.hive.runner import LocalSimulationRunner, RunnerPayload
+from nrel.hive.runner.vectorized_simulation_runner import VectorizedSimulationRunner
+from nrel.hive.state.simulation_state.update.simulation_update import SimulationUpdateFunction
+from nrel.hive.state.simulation_state.update.step_simulation import StepSimulation
+from nrel.hive.state.simulation_state.update.update_requests_from_file import (
+    UpdateRequestsFromFile,
+)
+from nrel.hive.resources.mock_lobster import *
+
+
+class CountingUpdate(SimulationUpdateFunction):
+    """
+    counts the time steps it is applied to, and whether it was reset or closed
+    """
+
+    def __init__(self, resets: int = 0):
+        self.steps = 0
+        self.resets = resets
+        self.closed = False
+
+    def update(self, simulation_state, env):
+        self.steps += 1
+        return simulation_state, None
+
+    def reset(self):
+        return CountingUpdate(self.resets + 1)
+
+    def close(self):
+        self.closed = True
+
+
+class TestVectorizedSimulationRunner(TestCase):
+    def setUp(self):
+        self.output_directory = tempfile.TemporaryDirectory()
+        self.config = mock_config(end_time=1800, timestep_duration_seconds=60)
+
+    def tearDown(self):
+        self.output_directory.cleanup()
+
+    def _load(self, name: str) -> RunnerPayload:
+        output_directory = Path(self.output_directory.name) / name
+        return load_simulation(self.config.set_scenario_output_directory(output_directory))
+
+    def test_matches_local_runner(self):
+        expected = LocalSimulationRunner.run(self._load("local"))
+
+        runner = VectorizedSimulationRunner(self._load("vectorized"), num_envs=3)
+        done = runner.done
+        while not done:
+            observations, done = runner.step()
+
+        def _summary(sim):
+            # vehicle states hold a unique instance id, so compare their outcomes instead
+            vehicles = {
+                v.id: (v.balance, v.energy, v.vehicle_state.vehicle_state_type)
+                for v in sim.vehicles.values()
+            }
+            return vehicles, set(sim.requests.keys())
+
+        self.assertEqual(runner.sim_time, expected.s.sim_time)
+        for payload, observation in zip(runner.payloads, observations):
+            self.assertEqual(_summary(payload.s), _summary(expected.s))
+            self.assertEqual(observation.sim_time, expected.s.sim_time)
+            self.assertEqual(observation.vehicles["present"].sum(), len(expected.s.vehicles))
+
+        with self.assertRaises(SimulationStateError):
+            runner.step()
+
+        initial_observations = runner.reset()
+        self.assertEqual(runner.sim_time, self.config.sim.start_time)
+        self.assertEqual(len(initial_observations), 3)
+        _, done = runner.step()
+        self.assertFalse(done)
+
+    def test_instructions(self):
+        # without a dispatcher, so that the instruction is not overridden
+        payload = self._load("vectorized")
+        payload = payload._replace(u=payload.u._replace(step_update=StepSimulation.from_tuple(())))
+        runner = VectorizedSimulationRunner(payload, num_envs=2)
+        sim, env = runner.payloads[0].s, runner.payloads[0].e
+        vehicle = min(
+            (v for v in sim.vehicles.values() if v.driver_state.schedule_id is None),
+            key=lambda v: v.id,
+        )
+        mechatronics = env.mechatronics[vehicle.mechatronics_id]
+        station_id, charger_id = min(
+            (s.id, cs.id)
+            for s in sim.stations.values()
+            for cs in s.state.values()
+            if mechatronics.valid_charger(cs.charger)
+        )
+        vehicle_id = vehicle.id
+        instruction = DispatchStationInstruction(vehicle_id, station_id, charger_id)
+
+        runner.step(((instruction,), ()))
+
+        states = [p.s.vehicles[vehicle_id].vehicle_state for p in runner.payloads]
+        self.assertEqual(getattr(states[0], "station_id", None), station_id)
+        self.assertIsNone(getattr(states[1], "station_id", None), "only one copy was instructed")
+
+        with self.assertRaises(ValueError):
+            runner.step(((),))
+
+    def test_reset_keeps_custom_pre_step_updates(self):
+        payload = self._load("vectorized")
+        custom = CountingUpdate()
+        payload = payload._replace(
+            u=payload.u._replace(pre_step_update=payload.u.pre_step_update + (custom,))
+        )
+        runner = VectorizedSimulationRunner(payload, num_envs=2)
+        self.assertIs(runner.pre_step_update[-1], custom)
+
+        runner.step()
+        self.assertEqual(custom.steps, 2, "applied once to each copy")
+        requests_update = next(
+            fn for fn in runner.pre_step_update if isinstance(fn, UpdateRequestsFromFile)
+        )
+
+        runner.reset()
+        self.assertTrue(custom.closed, "the replaced update should be closed")
+        reset_custom = runner.pre_step_update[-1]
+        self.assertIsInstance(reset_custom, CountingUpdate)
+        self.assertEqual(reset_custom.resets, 1)
+        reset_requests_update = next(
+            fn for fn in runner.pre_step_update if isinstance(fn, UpdateRequestsFromFile)
+        )
+        self.assertIsNot(reset_requests_update, requests_update)
+        self.assertEqual(reset_requests_update.request_file, requests_update.request_file)
+
+        runner.close()
+        self.assertTrue(reset_custom.closed)
@@ -1,6 +1,11 @@
 from csv import DictReader
-from unittest import TestCase
+import pickle
+import sys
+from unittest import TestCase, skipIf
 
+import immutables
+
+from nrel.hive.model.energy.single_energy import SingleEnergy
 from nrel.hive.resources.mock_lobster import *
 
 
@@ -53,3 +58,31 @@ class TestVehicle(TestCase):
             frozenset(["fleet_1", "fleet_3"]),
             "should have membership for fleet_1 and fleet_3",
         )
+
+    def test_single_energy(self):
+        vehicle = mock_vehicle(soc=0.5)
+        energy = vehicle.energy
+
+        self.assertIsInstance(energy, SingleEnergy)
+        self.assertEqual(energy, immutables.Map({EnergyType.ELECTRIC: 25.0}))
+        self.assertEqual(hash(energy), hash(immutables.Map({EnergyType.ELECTRIC: 25.0})))
+        self.assertEqual(energy[EnergyType.ELECTRIC], 25.0)
+        self.assertEqual(dict(energy.items()), {EnergyType.ELECTRIC: 25.0})
+        self.assertIsNone(energy.get(EnergyType.GASOLINE))
+        self.assertNotIn(EnergyType.GASOLINE, energy)
+        with self.assertRaises(KeyError):
+            energy[EnergyType.GASOLINE]
+
+    @skipIf(sys.version_info < (3, 10), "dataclasses generate __slots__ from python 3.10")
+    def test_slotted(self):
+        vehicle = mock_vehicle()
+        request = mock_request()
+        for entity in (
+            vehicle,
+            vehicle.energy,
+            vehicle.vehicle_state,
+            vehicle.driver_state,
+            request,
+        ):
+            self.assertFalse(hasattr(entity, "__dict__"), f"{type(entity).__name__} has a __dict__")
+            self.assertEqual(pickle.loads(pickle.dumps(entity)), entity)
@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+from nrel.hive.reporting.handler.vehicle_charge_events_handler import VehicleChargeEventsHandler
+from nrel.hive.reporting.reporter import Report
+from nrel.hive.reporting.report_type import ReportType
+from nrel.hive.resources.mock_lobster import *
+from nrel.hive.runner.runner_payload import RunnerPayload
+
+
+def _charge_event(vehicle_id, station_id, sim_time_end, energy, units="kilowatt_hours"):
+    return Report(
+        ReportType.VEHICLE_CHARGE_EVENT,
+        {
+            "vehicle_id": vehicle_id,
+            "station_id": station_id,
+            "sim_time_start": sim_time_end - 60,
+            "sim_time_end": sim_time_end,
+            "energy": energy,
+            "energy_units": units,
+        },
+    )
+
+
+class TestVehicleChargeEventsHandler(TestCase):
+    def _payload(self, sim_time: int) -> RunnerPayload:
+        sim = mock_sim(
+            sim_time=sim_time,
+            vehicles=tuple(mock_vehicle(vehicle_id=v) for v in ("v1", "v2", "v3")),
+            stations=tuple(mock_station(station_id=s) for s in ("s1", "s2")),
+        )
+        return RunnerPayload(sim, mock_env(), mock_update())
+
+    def test_events_and_station_load(self):
+        handler = VehicleChargeEventsHandler()
+        handler.handle(
+            [
+                _charge_event("v1", "s1", 60, 1.0),
+                _charge_event("v2", "s1", 60, 0.5),
+                _charge_event("v3", "s2", 60, 0.1, units="gallons_of_gasoline"),
+            ],
+            self._payload(60),
+        )
+        handler.handle([_charge_event("v1", "s2", 120, 2.0)], self._payload(120))
+
+        events = handler.get_event_arrays()
+        self.assertEqual(len(events["energy"]), 4)
+        self.assertEqual(handler.vehicle_ids[events["vehicle_index"][3]], "v1")
+        self.assertEqual(handler.station_ids[events["station_index"][3]], "s2")
+
+        times, load = handler.get_station_load()
+        s1, s2 = handler.station_ids.index("s1"), handler.station_ids.index("s2")
+        self.assertEqual(times.tolist(), [0, 60])
+        self.assertAlmostEqual(load[0, s1], 90.0, msg="1.5 kWh over a minute is 90 kW")
+        self.assertAlmostEqual(load[0, s2], 0.0, msg="gasoline is not an electric load")
+        self.assertAlmostEqual(load[1, s2], 120.0)
+
+        df = handler.get_events()
+        self.assertEqual(df["vehicle_id"].tolist(), ["v1", "v2", "v3", "v1"])
+        self.assertEqual(df["units"].tolist()[2], "gallons_of_gasoline")
+
+        sim = simulation_state_ops.remove_vehicle_safe(self._payload(180).s, "v3").unwrap()
+        handler.handle([_charge_event("v3", "s1", 180, 1.0)], self._payload(180)._replace(s=sim))
+        self.assertEqual(handler.get_event_arrays()["vehicle_index"][-1], -1, "v3 has left")
+
+        handler.clear()
+        self.assertEqual(len(handler.get_events()), 0)
+        self.assertEqual(len(handler.get_station_load()[0]), 0)
+
+    def test_ring_buffer_overwrites_oldest(self):
+        handler = VehicleChargeEventsHandler(event_capacity=3, time_step_capacity=2)
+        for t in range(60, 300, 60):
+            handler.handle([_charge_event("v1", "s1", t, t / 60)], self._payload(t))
+
+        events = handler.get_event_arrays()
+        self.assertEqual(events["energy"].tolist(), [2.0, 3.0, 4.0])
+        times, load = handler.get_station_load()
+        self.assertEqual(times.tolist(), [120, 180], "times are the start of each time step")
+        self.assertEqual(load[:, 0].tolist(), [180.0, 240.0])
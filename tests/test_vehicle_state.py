@@ -40,6 +40,33 @@ class TestVehicleState(TestCase):
             "should have claimed the only DCFC charger_id",
         )
 
+    def test_charging_station_tracks_wait_estimate(self):
+        vehicle = mock_vehicle(soc=0.5)
+        queued_vehicle = mock_vehicle(vehicle_id="v2", soc=0.5)
+        station = mock_station()
+        charger = mock_dcfc_charger_id()
+        sim = mock_sim(vehicles=(vehicle, queued_vehicle), stations=(station,))
+        env = mock_env()
+
+        err1, sim1 = ChargingStation.build(vehicle.id, station.id, charger).enter(sim, env)
+        self.assertIsNone(err1, "test invariant failed")
+        charge_time = sim1.stations.get(station.id).estimate_wait_seconds(charger, sim1.sim_time)
+        self.assertGreater(charge_time, 0, "should wait for the charging vehicle")
+
+        queue_state = ChargeQueueing.build(queued_vehicle.id, station.id, charger, 0)
+        err2, sim2 = queue_state.enter(sim1, env)
+        self.assertIsNone(err2, "test invariant failed")
+        queue_time = sim2.stations.get(station.id).estimate_wait_seconds(charger, sim2.sim_time)
+        self.assertEqual(queue_time, 2 * charge_time, "should also wait for the queued vehicle")
+
+        err3, sim3 = queue_state.exit(Idle.build(queued_vehicle.id), sim2, env)
+        charging_state = sim3.vehicles.get(vehicle.id).vehicle_state
+        err4, sim4 = charging_state.exit(Idle.build(vehicle.id), sim3, env)
+        self.assertIsNone(err3, "should have no errors")
+        self.assertIsNone(err4, "should have no errors")
+        wait_time = sim4.stations.get(station.id).estimate_wait_seconds(charger, sim4.sim_time)
+        self.assertEqual(wait_time, 0, "the charger should be free")
+
     def test_charging_station_bad_membership(self):
         vehicle = mock_vehicle(membership=Membership.single_membership("uber"))
         station = mock_station(membership=Membership.single_membership("lyft"))
@@ -2,6 +2,10 @@ from unittest import TestCase
 
 from returns.result import Success
 
+from nrel.hive.dispatcher.instruction_generator.instruction_generator_schedule import (
+    InstructionGeneratorSchedule,
+    WakeEvent,
+)
 from nrel.hive.state.vehicle_state import vehicle_state_ops
 from nrel.hive.resources.mock_lobster import *
 
@@ -42,6 +46,37 @@ class TestVehicleStateOps(TestCase):
             "link start location should not be the same",
         )
 
+    def test_move_records_low_soc_crossing(self):
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        somewhere_else = h3.geo_to_h3(39.7579, -104.978, 15)
+        sim = mock_sim(sim_time=60, sim_timestep_duration_seconds=10)
+        somewhere_link = sim.road_network.position_from_geoid(somewhere)
+        somewhere_else_link = sim.road_network.position_from_geoid(somewhere_else)
+        route = sim.road_network.route(somewhere_link, somewhere_else_link)
+        state = Repositioning.build(DefaultIds.mock_vehicle_id(), route)
+        vehicle = mock_vehicle_from_geoid(geoid=somewhere, vehicle_state=state, soc=0.5)
+        sim_with_veh = simulation_state_ops.add_vehicle_safe(sim, vehicle).unwrap()
+        schedule = InstructionGeneratorSchedule(
+            600, wake_on=frozenset([WakeEvent.LOW_SOC]), low_soc_threshold=0.5
+        )
+        config = mock_config()
+        config = config._replace(
+            dispatcher=config.dispatcher._replace(
+                instruction_generator_schedules=immutables.Map({"ChargingFleetManager": schedule})
+            )
+        )
+        env = mock_env(config)
+
+        error, move_sim = vehicle_state_ops.move(sim_with_veh, env, vehicle.id)
+        if error:
+            self.fail(error)
+
+        self.assertEqual(
+            move_sim.low_soc_times.get(0.5),
+            60,
+            "should record the time the vehicle fell below the threshold",
+        )
+
     def test_charge(self):
         state = ChargingBase.build(
             DefaultIds.mock_vehicle_id(),